@@ -15,7 +15,9 @@ ULTRA-BATCH OPTIMIZATIONS (v2.0):
 import asyncio
 import logging
 from typing import Dict, List, Any, Optional, Set, Tuple
-from api.birdeye_connector import BirdeyeAPI
+from api.birdeye_connector import BirdeyeAPI, BIRDEYE_API_NAMESPACE
+from core_local.cache_engine import CacheEngine, get_shared_cache_engine, make_cache_key, endpoint_cache_key
+from core_local.popularity_sketch import PopularitySketch
 import time
 from utils.structured_logger import get_structured_logger
 import hashlib
@@ -29,35 +31,30 @@ class EnhancedCacheManager:
     and cross-session persistence for maximum API call reduction.
     """
     
-    def __init__(self):
-        # Multi-tier caching with adaptive TTL
-        self.price_cache = TTLCache(maxsize=5000, ttl=30)      # 30 seconds (high volatility)
-        self.metadata_cache = TTLCache(maxsize=2000, ttl=300)  # 5 minutes (medium volatility)
-        self.trending_cache = TTLCache(maxsize=200, ttl=180)   # 3 minutes (trending data)
-        self.security_cache = TTLCache(maxsize=1000, ttl=3600) # 1 hour (security data changes slowly)
-        self.historical_cache = TTLCache(maxsize=500, ttl=1800) # 30 minutes (historical data)
+    def __init__(self, engine: Optional[CacheEngine] = None, popularity: Optional[PopularitySketch] = None):
+        # Single per-entry-TTL store shared with the other cache managers;
+        # each entry gets its own adaptive TTL instead of a fixed tier TTL
+        self.engine = engine if engine is not None else get_shared_cache_engine()
         
         # Performance tracking
         self.cache_hits = 0
         self.cache_misses = 0
         self.cache_bypasses = 0  # For time-sensitive requests
         
-        # Predictive caching tracking
-        self.token_popularity = {}  # Track which tokens are requested frequently
-        self.prefetch_queue = set()  # Tokens queued for prefetching
+        # Predictive caching tracking (fixed-memory, decaying counts)
+        self.token_popularity = popularity if popularity is not None else PopularitySketch()  # Request frequency
+        self.prefetch_queue = set()  # Tokens queued for prefetching (bounded to max_prefetch_queue)
+        self.max_prefetch_queue = 256
         self.last_prefetch_time = time.time()
         
         # Cross-session token persistence (tokens that appear in multiple scans)
-        self.persistent_tokens = set()  # Tokens that appear consistently
-        self.token_appearance_count = {}
+        self.token_appearance_count = PopularitySketch(width=2048, top_k=256)
         
         self.logger = logging.getLogger("EnhancedCacheManager")
 
     def _generate_cache_key(self, endpoint: str, params: dict) -> str:
-        """Generate consistent cache keys."""
-        sorted_params = sorted(params.items()) if params else []
-        key_data = f"{endpoint}:{json.dumps(sorted_params, sort_keys=True)}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+        """Generate canonical cache keys (shared with the Birdeye connector)."""
+        return endpoint_cache_key(BIRDEYE_API_NAMESPACE, endpoint, params)
 
     def _get_adaptive_ttl(self, endpoint: str, token_address: str = None) -> int:
         """
@@ -76,8 +73,8 @@ class EnhancedCacheManager:
         ttl = base_ttl.get(endpoint_type, 300)
         
         # Adaptive TTL based on token popularity
-        if token_address and token_address in self.token_popularity:
-            popularity = self.token_popularity[token_address]
+        if token_address:
+            popularity = self.token_popularity.estimate(token_address)
             if popularity >= 5:  # Very popular token
                 ttl = int(ttl * 1.5)  # 50% longer TTL
             elif popularity >= 3:  # Popular token
@@ -102,21 +99,19 @@ class EnhancedCacheManager:
     async def get_cached_data(self, endpoint: str, params: dict = None, token_address: str = None):
         """Get cached data with intelligent cache selection."""
         key = self._generate_cache_key(endpoint, params or {})
-        endpoint_type = self._classify_endpoint(endpoint)
         
         # Track token popularity for adaptive caching
         if token_address:
-            self.token_popularity[token_address] = self.token_popularity.get(token_address, 0) + 1
+            self.token_popularity.record(token_address)
         
-        # Select appropriate cache
-        cache = self._select_cache(endpoint_type)
-        cached_data = cache.get(key)
+        cached_data = self.engine.get(key)
         
         if cached_data:
             self.cache_hits += 1
             
             # Add to prefetch queue if it's a popular token
-            if token_address and self.token_popularity.get(token_address, 0) >= 3:
+            if (token_address and len(self.prefetch_queue) < self.max_prefetch_queue
+                    and self.token_popularity.estimate(token_address) >= 3):
                 self.prefetch_queue.add(token_address)
             
             return cached_data
@@ -127,34 +122,14 @@ class EnhancedCacheManager:
     async def set_cached_data(self, endpoint: str, params: dict, data: any, token_address: str = None):
         """Set cached data with adaptive TTL."""
         key = self._generate_cache_key(endpoint, params or {})
-        endpoint_type = self._classify_endpoint(endpoint)
         
-        # Get adaptive TTL
+        # Adaptive TTL is applied per entry
         ttl = self._get_adaptive_ttl(endpoint, token_address)
-        
-        # Select appropriate cache and set with adaptive TTL
-        cache = self._select_cache(endpoint_type)
-        
-        # For TTLCache, we need to create a new cache with the desired TTL
-        # This is a simplified approach - in production, you might use a more sophisticated cache
-        cache[key] = data
+        self.engine.set(key, data, ttl=ttl)
         
         # Track persistent tokens (tokens that appear in multiple requests)
         if token_address:
-            self.token_appearance_count[token_address] = self.token_appearance_count.get(token_address, 0) + 1
-            if self.token_appearance_count[token_address] >= 3:
-                self.persistent_tokens.add(token_address)
-
-    def _select_cache(self, endpoint_type: str):
-        """Select the appropriate cache based on endpoint type."""
-        cache_mapping = {
-            'price': self.price_cache,
-            'overview': self.metadata_cache,
-            'trending': self.trending_cache,
-            'security': self.security_cache,
-            'historical': self.historical_cache
-        }
-        return cache_mapping.get(endpoint_type, self.metadata_cache)
+            self.token_appearance_count.record(token_address)
 
     async def predictive_prefetch(self, token_addresses: List[str]):
         """
@@ -169,7 +144,7 @@ class EnhancedCacheManager:
         # Prioritize persistent tokens and popular tokens
         priority_tokens = []
         for addr in token_addresses:
-            if addr in self.persistent_tokens or self.token_popularity.get(addr, 0) >= 2:
+            if self._is_persistent(addr) or self.token_popularity.estimate(addr) >= 2:
                 priority_tokens.append(addr)
         
         # If no priority tokens, use the most recent tokens
@@ -183,13 +158,13 @@ class EnhancedCacheManager:
                 await self._prefetch_batch_data("multi_price", priority_tokens[:20])
                 
                 # Phase 2: Metadata for top persistent tokens (second priority)
-                top_persistent = [addr for addr in priority_tokens if addr in self.persistent_tokens][:15]
+                top_persistent = [addr for addr in priority_tokens if self._is_persistent(addr)][:15]
                 if not top_persistent:
                     top_persistent = priority_tokens[:15]  # Fallback to priority tokens
                 await self._prefetch_batch_data("metadata", top_persistent)
                 
                 # Phase 3: Token overviews for most popular tokens (third priority)
-                popular_tokens = [addr for addr in priority_tokens if self.token_popularity.get(addr, 0) >= 3][:10]
+                popular_tokens = [addr for addr in priority_tokens if self.token_popularity.estimate(addr) >= 3][:10]
                 if popular_tokens:
                     await self._prefetch_batch_data("token_overview", popular_tokens)
                 
@@ -254,25 +229,24 @@ class EnhancedCacheManager:
             'cache_misses': self.cache_misses,
             'total_requests': total_requests,
             'persistent_tokens': len(self.persistent_tokens),
-            'popular_tokens': len([addr for addr, count in self.token_popularity.items() if count >= 3]),
+            'popular_tokens': len(self.token_popularity.hottest(self.token_popularity.top_k, min_count=3)),
             'prefetch_queue_size': len(self.prefetch_queue),
-            'cache_sizes': {
-                'price_cache': len(self.price_cache),
-                'metadata_cache': len(self.metadata_cache),
-                'trending_cache': len(self.trending_cache),
-                'security_cache': len(self.security_cache),
-                'historical_cache': len(self.historical_cache)
-            }
+            'cache_entries': len(self.engine)
         }
 
+    @property
+    def persistent_tokens(self) -> Set[str]:
+        """Tokens currently seen in at least 3 cached responses"""
+        return {addr for addr, _ in self.token_appearance_count.hottest(self.token_appearance_count.top_k, min_count=3)}
+
+    def _is_persistent(self, token_address: str) -> bool:
+        return self.token_appearance_count.estimate(token_address) >= 3
+
     def cleanup_expired_popularity(self, max_age_hours: int = 24):
-        """Clean up old token popularity data to prevent memory bloat."""
-        # This is a simplified cleanup - in production you'd track timestamps
-        if len(self.token_popularity) > 1000:  # Arbitrary limit
-            # Keep only the most popular tokens
-            sorted_tokens = sorted(self.token_popularity.items(), key=lambda x: x[1], reverse=True)
-            self.token_popularity = dict(sorted_tokens[:500])  # Keep top 500
-            self.logger.info("Cleaned up token popularity data")
+        """Age out token popularity data (memory is fixed; this decays the counts)."""
+        self.token_popularity.decay()
+        self.token_appearance_count.decay()
+        self.logger.info("Decayed token popularity data")
 
 class FixedCacheManager:
     def __init__(self):
@@ -426,7 +400,7 @@ class BatchAPIManager:
                 uncached_addresses = []
                 
                 for address in batch_addresses:
-                    cache_key = f"price_{address}"
+                    cache_key = make_cache_key(BIRDEYE_API_NAMESPACE, "price", address)
                     cached_data = self.cache_manager.get(cache_key)
                     if cached_data:
                         cached_results[address] = cached_data
@@ -442,7 +416,7 @@ class BatchAPIManager:
                         for address in uncached_addresses:
                             if address in data:
                                 # Cache individual results
-                                cache_key = f"price_{address}"
+                                cache_key = make_cache_key(BIRDEYE_API_NAMESPACE, "price", address)
                                 self.cache_manager.set(cache_key, data[address], ttl=30)  # 30s TTL for prices
                                 all_price_data[address] = data[address]
                 
@@ -485,7 +459,7 @@ class BatchAPIManager:
                 if price_data:
                     results_dict[address] = price_data
                     # Cache individual result
-                    cache_key = f"price_{address}"
+                    cache_key = make_cache_key(BIRDEYE_API_NAMESPACE, "price", address)
                     self.cache_manager.set(cache_key, price_data, ttl=30)
             except Exception as e:
                 self.logger.warning(f"Individual price fallback failed for {address}: {e}")
@@ -526,7 +500,7 @@ class BatchAPIManager:
                 uncached_addresses = []
                 
                 for address in batch_addresses:
-                    cache_key = f"metadata_{address}"
+                    cache_key = make_cache_key(BIRDEYE_API_NAMESPACE, "metadata_single", address)
                     cached_data = self.cache_manager.get(cache_key)
                     if cached_data:
                         cached_results[address] = cached_data
@@ -542,7 +516,7 @@ class BatchAPIManager:
                         for address in uncached_addresses:
                             if address in data:
                                 # Cache individual results
-                                cache_key = f"metadata_{address}"
+                                cache_key = make_cache_key(BIRDEYE_API_NAMESPACE, "metadata_single", address)
                                 self.cache_manager.set(cache_key, data[address], ttl=300)
                                 all_metadata[address] = data[address]
                 
@@ -586,7 +560,7 @@ class BatchAPIManager:
                 if metadata:
                     results_dict[address] = metadata
                     # Cache individual result
-                    cache_key = f"metadata_{address}"
+                    cache_key = make_cache_key(BIRDEYE_API_NAMESPACE, "metadata_single", address)
                     self.cache_manager.set(cache_key, metadata, ttl=300)
             except Exception as e:
                 self.logger.warning(f"Individual fallback failed for {address}: {e}")
@@ -2421,16 +2395,14 @@ class BatchAPIManager:
         return security_data 
 
     def log_cache_performance(self):
-        hit_rate = self.cache_manager.get_cache_hit_rate()
-        total_keys = (len(self.cache_manager.price_cache) + 
-                      len(self.cache_manager.metadata_cache) + 
-                      len(self.cache_manager.trending_cache))
+        cache_stats = self.cache_manager.get_stats()
+        hit_rate = cache_stats['hit_rate']
         self.logger.info(f"CACHE PERFORMANCE:")
         self.logger.info(f"  Cache Hit Rate: {hit_rate:.2f}%")
-        self.logger.info(f"  Total Cache Keys: {total_keys}")
-        self.logger.info(f"  Cache Hits: {self.cache_manager.cache_hits}")
-        self.logger.info(f"  Cache Misses: {self.cache_manager.cache_misses}")
-        if hit_rate < 30 and (self.cache_manager.cache_hits + self.cache_manager.cache_misses) > 100:
+        self.logger.info(f"  Total Cache Keys: {cache_stats['total_keys']}")
+        self.logger.info(f"  Cache Hits: {cache_stats['hits']}")
+        self.logger.info(f"  Cache Misses: {cache_stats['misses']}")
+        if hit_rate < 30 and (cache_stats['hits'] + cache_stats['misses']) > 100:
             self.logger.warning(f"⚠️ LOW CACHE HIT RATE: {hit_rate:.2f}% - Consider debugging cache issues")
 
     async def parallel_discovery_with_intelligent_merging(self, max_tokens: int = 100) -> List[Dict[str, Any]]:
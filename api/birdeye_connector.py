@@ -10,6 +10,7 @@ from dataclasses import dataclass
 
 from core.cache_manager import CacheManager
 from services.rate_limiter_service import RateLimiterService
+from services.token_symbol_index import get_shared_token_symbol_index
 from utils.exceptions import APIConnectionError, APIDataError, APIError
 from utils.enhanced_structured_logger import create_enhanced_logger, APICallType
 from utils.structured_logger import get_structured_logger
@@ -812,13 +813,20 @@ class BirdeyeAPI:
             self.logger.error(f"⏰ Timeout error for BirdEye {endpoint}: {e}")
             raise APIConnectionError(api_name=self.API_DOMAIN, message=f"Request timeout: {e}")
 
-    async def get_token_overview(self, token_address: str) -> Optional[Dict[str, Any]]:
+    async def get_token_overview(self, token_address: str, refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a token overview (price, liquidity, volume, ...), cached per token.
+
+        Args:
+            token_address: Token address
+            refresh: Skip the cached entry and fetch anew; a failed refresh leaves the cached entry in place
+        """
         # Check if token should be excluded
         if self._should_skip_token(token_address):
             return None
             
         cache_key = f"{BIRDEYE_API_NAMESPACE}_overview_{token_address}"
-        cached_data = self.cache_manager.get(cache_key)
+        cached_data = None if refresh else self.cache_manager.get(cache_key)
         if cached_data is not None:
             self._track_cache_hit(cache_key)
             self.logger.debug(f"Cache hit for Birdeye token_overview: {cache_key}")
@@ -876,25 +884,30 @@ class BirdeyeAPI:
                             self.logger.warning(f"[API] Error calculating transaction volume for {token_address}: {e}")
                     
                     self.cache_manager.set(cache_key, actual_overview, ttl=self.default_ttl)
+                    get_shared_token_symbol_index().record_tokens([{**actual_overview, 'address': token_address}])
                     return actual_overview
                     
                 # If actual_overview is not a dict, or if the initial check failed
                 self.logger.warning(f"[API] Token overview for {token_address} data field issue. Data type: {type(actual_overview)}, Response: {str(response_data)[:300]}")
-                self.cache_manager.set(cache_key, None, ttl=self.error_ttl)
+                if not refresh:
+                    self.cache_manager.set(cache_key, None, ttl=self.error_ttl)
                 return None
                 
             # Handles cases where response_data is None, not a dict, or success is false
             self.logger.warning(f"[API] Failed to get valid token overview for {token_address}. Response: {str(response_data)[:300]}")
-            self.cache_manager.set(cache_key, None, ttl=self.error_ttl)
+            if not refresh:
+                self.cache_manager.set(cache_key, None, ttl=self.error_ttl)
             return None
             
         except APIError as e:
             self.logger.error(f"[API] APIError in get_token_overview for {token_address}: {e}")
-            self.cache_manager.set(cache_key, None, ttl=self.error_ttl)
+            if not refresh:
+                self.cache_manager.set(cache_key, None, ttl=self.error_ttl)
             return None
         except RetryError as e_retry:
             self.logger.error(f"[API] Retries exhausted for Birdeye get_token_overview for {token_address}: {e_retry.last_attempt.exception()}")
-            self.cache_manager.set(cache_key, None, ttl=self.error_ttl)
+            if not refresh:
+                self.cache_manager.set(cache_key, None, ttl=self.error_ttl)
             return None
 
     async def get_token_creation_info(self, token_address: str) -> Optional[Dict[str, Any]]:
@@ -1233,6 +1246,9 @@ class BirdeyeAPI:
                                 # Cache individual entries with 30-minute TTL since metadata is relatively stable
                                 self.cache_manager.set(f"{BIRDEYE_API_NAMESPACE}_overview_{address}", data, ttl=1800)
                         
+                        get_shared_token_symbol_index().record_tokens(
+                            {**data, 'address': address} for address, data in batch_data.items() if isinstance(data, dict)
+                        )
                         self.logger.info(f"✅ Batch API success: {len(batch_data)}/{len(uncached_tokens)} tokens fetched via batch endpoint")
                     else:
                         self.logger.warning(f"⚠️ Batch metadata call returned no data for {len(uncached_tokens)} tokens")
@@ -2271,6 +2287,17 @@ class BirdeyeAPI:
             self.cache_manager.set(cache_key, {}, ttl=self.error_ttl)
             return {}
 
+    def _get_availability_checker(self):
+        """Get the shared DataAvailabilityChecker (created on first use)"""
+        if getattr(self, '_availability_checker', None) is None:
+            try:
+                from services.adaptive_rate_limiter import DataAvailabilityChecker
+            except ImportError:
+                # Fallback if availability checker not available
+                return None
+            self._availability_checker = DataAvailabilityChecker(self, self.cache_manager)
+        return self._availability_checker
+
     async def get_ohlcv_data(self, token_address: str, time_frame: str = '1m', limit: int = 60) -> Optional[List[Dict[str, Any]]]:
         """
         Get OHLCV (Open, High, Low, Close, Volume) data for a token using the working v3 endpoint.
@@ -2289,18 +2316,17 @@ class BirdeyeAPI:
             return []
             
         # Quick data availability check to avoid expensive calls
-        try:
-            from services.adaptive_rate_limiter import DataAvailabilityChecker
-            availability_checker = DataAvailabilityChecker(self, self.cache_manager)
-            availability_info = await availability_checker.check_data_availability(token_address)
+        # (profiles are shared across timeframes and cycles, so probes only run for unknown tokens)
+        availability_checker = self._get_availability_checker()
+        if availability_checker is not None:
+            availability_info = await availability_checker.check_data_availability(
+                token_address, time_frame=None if time_frame == 'auto' else time_frame
+            )
             
             if availability_info.get("skip_ohlcv", True):
                 reason = availability_info.get("reason", "no_trading_data")
                 self.logger.debug(f"⏭️ Skipping OHLCV for {token_address}: {reason}")
                 return []
-        except ImportError:
-            # Fallback if availability checker not available
-            pass
             
         # Normalize time_frame format for v3 endpoint
         normalized_time_frame = time_frame
@@ -2393,6 +2419,9 @@ class BirdeyeAPI:
         # Try primary v3 endpoint first
         success = False
         ohlcv_data = []
+        fetched_time_frame = normalized_time_frame
+        # Resolutions the API answered with no candles (failed requests prove nothing)
+        empty_time_frames = set()
         
         try:
             self.logger.debug(f"Trying v3 OHLCV endpoint with timeframe {normalized_time_frame}, time_from={time_from}, time_to={time_to}")
@@ -2412,6 +2441,8 @@ class BirdeyeAPI:
                         success = True
                     else:
                         self.logger.debug(f"v3 endpoint returned empty items array for {token_address} with {normalized_time_frame}")
+                        if isinstance(ohlcv_data, list):
+                            empty_time_frames.add(normalized_time_frame)
                 else:
                     self.logger.debug(f"v3 endpoint returned unexpected data structure: {type(data_content)}")
             else:
@@ -2456,7 +2487,10 @@ class BirdeyeAPI:
                             if isinstance(ohlcv_data, list) and len(ohlcv_data) > 0:
                                 self.logger.info(f"✅ Successfully fetched {len(ohlcv_data)} OHLCV candles using fallback timeframe {fallback_tf}")
                                 success = True
+                                fetched_time_frame = fallback_tf
                                 break
+                            if isinstance(ohlcv_data, list):
+                                empty_time_frames.add(fallback_tf)
                 
                 except Exception as e:
                     self.logger.debug(f"Fallback timeframe {fallback_tf} also failed: {e}")
@@ -2489,6 +2523,14 @@ class BirdeyeAPI:
         # Cache results (even if empty) to avoid repeated failed calls
         self.cache_manager.set(cache_key, ohlcv_data, ttl=self.default_ttl)
         
+        # Passively refresh the token's availability profile for the requested resolution
+        if availability_checker is not None:
+            for empty_time_frame in empty_time_frames:
+                if not (success and empty_time_frame == fetched_time_frame):
+                    availability_checker.record_ohlcv_result(token_address, empty_time_frame, [])
+            if success:
+                availability_checker.record_ohlcv_result(token_address, fetched_time_frame, ohlcv_data)
+        
         if success and ohlcv_data:
             self.logger.info(f"🎯 OHLCV data fetched successfully for {token_address}: {len(ohlcv_data)} candles")
         else:
@@ -3197,6 +3239,8 @@ class BirdeyeAPI:
                 self.logger.error(f"Unknown endpoint version: {endpoint_version}")
                 return {"success": False, "data": {"tokens": []}}
             
+            get_shared_token_symbol_index().record_tokens(tokens)
+            
             # Return in standardized format
             standardized = {
                 "success": True,
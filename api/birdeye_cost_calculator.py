@@ -2,6 +2,8 @@ import math
 from typing import Dict, List, Optional
 import logging
 
+from core_local.cu_ledger import CULedger, get_shared_cu_ledger
+
 class BirdEyeCostCalculator:
     """
     Calculate BirdEye API costs using their official batch cost formula:
@@ -33,8 +35,10 @@ class BirdEyeCostCalculator:
         '/defi/v3/pair/overview/multiple': {'base_cu': 20, 'n_max': 20},
     }
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(self, logger: Optional[logging.Logger] = None, ledger: Optional[CULedger] = None):
         self.logger = logger or logging.getLogger(__name__)
+        # Daily usage goes to the shared CU ledger; session_costs stay per calculator
+        self.ledger = ledger or get_shared_cu_ledger()
         self.session_costs = {
             'total_compute_units': 0,
             'total_http_requests': 0,
@@ -110,6 +114,8 @@ class BirdEyeCostCalculator:
         else:
             cost = self.get_individual_cost(endpoint) * num_tokens
         
+        self.ledger.add('birdeye', cost, endpoint)
+        
         # Track session costs
         self.session_costs['total_compute_units'] += cost
         self.session_costs['total_http_requests'] += 1
@@ -12,9 +12,16 @@ import logging
 import asyncio
 from typing import Dict, Any, Optional, List, Set, Union
 from core_local.cache_manager import CacheManager as CoreCacheManager
+from core_local.cache_engine import make_cache_key
 
 logger = logging.getLogger(__name__)
 
+# TTL strategy data types whose canonical cache key uses a shorter name
+CANONICAL_DATA_TYPES = {
+    'token_overview': 'overview',
+    'token_security': 'security',
+}
+
 class EnhancedAPICacheManager(CoreCacheManager):
     """
     Enhanced cache manager specifically designed for API data with intelligent 
@@ -146,6 +153,11 @@ class EnhancedAPICacheManager(CoreCacheManager):
             if data_type in key_lower:
                 return ttl
         
+        # Canonical keys use short data type names (birdeye_overview_<address>)
+        for data_type, key_type in CANONICAL_DATA_TYPES.items():
+            if f"_{key_type}_" in key_lower:
+                return self.ttl_strategies[data_type]
+        
         # Check for specific patterns
         if 'error' in key_lower or 'fail' in key_lower:
             return self.ttl_strategies['error']
@@ -435,10 +447,12 @@ class EnhancedAPICacheManager(CoreCacheManager):
         
         for address in token_addresses:
             for data_type in priority_data_types:
-                cache_key = self.create_compound_key("birdeye", data_type, address)
+                # Canonical key, i.e. the same entry the Birdeye connector reads
+                key_type = CANONICAL_DATA_TYPES.get(data_type, data_type)
+                cache_key = make_cache_key("birdeye", key_type, address)
                 
                 # Check if already cached
-                if self.get(cache_key) is None:
+                if not self.engine.contains(cache_key):
                     # Add to warming queue (would be processed by background task)
                     self.logger.debug(f"Queuing for cache warming: {cache_key}")
                     warm_count += 1
@@ -452,16 +466,34 @@ class EnhancedAPICacheManager(CoreCacheManager):
         Args:
             key: Cache key
             value: Value to cache
-            ttl: Time-to-live in seconds (uses default if None)
+            ttl: Time-to-live in seconds (intelligent TTL for the key's data type if None)
             ttl_seconds: Alternative parameter name for ttl (for backward compatibility)
             namespace: Cache namespace
         """
         # ttl_seconds takes precedence if both are provided
         effective_ttl = ttl_seconds if ttl_seconds is not None else ttl
         
-        # Use the parent class set method with the proper parameter name
+        # Without an explicit TTL the entry gets the TTL strategy for its data type
+        if effective_ttl is None:
+            effective_ttl = self.get_intelligent_ttl(key)
+        
         super().set(key, value, ttl=effective_ttl)
     
+    def get(self, key: str, default: Any = None, scan_id: Optional[str] = None, namespace: str = "api") -> Any:
+        """
+        Get a value from the cache if it exists and hasn't expired.
+        
+        Args:
+            key: Cache key
+            default: Default value if key not found or expired
+            scan_id: Optional scan ID for logging
+            namespace: Cache namespace (keys are already namespaced, kept for API compatibility)
+            
+        Returns:
+            Cached value or default
+        """
+        return super().get(key, default=default, scan_id=scan_id)
+    
     async def cleanup(self) -> None:
         """
         Cleanup cache resources (async method for compatibility).
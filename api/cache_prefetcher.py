@@ -0,0 +1,176 @@
+"""
+Popularity-driven cache prefetcher
+
+Keeps the shared cache warm for the tokens the detector keeps coming back to.
+The hottest tokens in a ``PopularitySketch`` have their Birdeye overview and
+price entries refreshed shortly before they expire (prices in multi-price
+batches, overviews through concurrent overview calls), so the next detection
+cycle finds them cached instead of waiting on them.
+Entries are only overwritten by a successful fetch; a failed refresh leaves
+the current entry to serve until it expires.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Any, Optional
+
+from api.birdeye_connector import BIRDEYE_API_NAMESPACE
+from core_local.cache_engine import CacheEngine, make_cache_key
+from core_local.popularity_sketch import PopularitySketch
+
+
+class CachePrefetcher:
+    """
+    Background refresher for the hottest tokens' overview/price cache entries.
+    """
+
+    def __init__(
+        self,
+        batch_api_manager,
+        sketch: PopularitySketch,
+        logger: Optional[logging.Logger] = None,
+        hot_tokens: int = 30,
+        min_popularity: int = 2,
+        interval: float = 20.0,
+        refresh_ahead: Optional[Dict[str, float]] = None,
+        batch_size: int = 50
+    ):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            batch_api_manager: BatchAPIManager whose Birdeye API fetches the refreshed data
+            sketch: Popularity sketch recording token appearances
+            logger: Logger instance
+            hot_tokens: Number of hottest tokens kept warm
+            min_popularity: Minimum estimated appearances before a token is prefetched
+            interval: Seconds between refresh passes
+            refresh_ahead: Per data type, refresh entries with less TTL left than this (seconds)
+            batch_size: Tokens per batch request
+        """
+        self.batch_api_manager = batch_api_manager
+        self.birdeye_api = batch_api_manager.birdeye_api
+        self.sketch = sketch
+        self.logger = logger or logging.getLogger(__name__)
+        self.hot_tokens = hot_tokens
+        self.min_popularity = min_popularity
+        self.interval = interval
+        self.refresh_ahead = refresh_ahead or {'overview': 120, 'price': 10}
+        # TTLs of refreshed entries (same as the connector's get_token_overview and multi-price paths)
+        self.ttls = {'overview': getattr(self.birdeye_api, 'default_ttl', 300), 'price': 30}
+        self.batch_size = batch_size
+
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {
+            'passes': 0,
+            'overviews_refreshed': 0,
+            'prices_refreshed': 0,
+            'errors': 0
+        }
+
+    @property
+    def engine(self) -> CacheEngine:
+        return self.birdeye_api.cache_manager.engine
+
+    def _due_for_refresh(self, tokens: List[str], data_type: str) -> List[str]:
+        """Tokens whose cache entry is missing or about to expire"""
+        ahead = self.refresh_ahead.get(data_type, 0)
+        due = []
+        for token in tokens:
+            remaining = self.engine.ttl_remaining(make_cache_key(BIRDEYE_API_NAMESPACE, data_type, token))
+            if remaining is None or remaining < ahead:
+                due.append(token)
+        return due
+
+    async def refresh_once(self) -> Dict[str, int]:
+        """
+        Run one refresh pass over the hottest tokens.
+
+        Returns:
+            Number of overview and price entries refreshed
+        """
+        hot = [token for token, _ in self.sketch.hottest(self.hot_tokens, min_count=self.min_popularity)]
+        refreshed = {'overview': 0, 'price': 0}
+        if not hot:
+            return refreshed
+
+        for data_type in ('price', 'overview'):
+            due = self._due_for_refresh(hot, data_type)
+            for i in range(0, len(due), self.batch_size):
+                batch = due[i:i + self.batch_size]
+                try:
+                    results = await self._fetch_batch(data_type, batch)
+                    for token in batch:
+                        data = results.get(token)
+                        if data:
+                            self.birdeye_api.cache_manager.set(
+                                make_cache_key(BIRDEYE_API_NAMESPACE, data_type, token), data, ttl=self.ttls[data_type]
+                            )
+                            refreshed[data_type] += 1
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    self.logger.debug(f"Prefetch of {data_type} for {len(batch)} tokens failed: {e}")
+
+        self.stats['passes'] += 1
+        self.stats['overviews_refreshed'] += refreshed['overview']
+        self.stats['prices_refreshed'] += refreshed['price']
+        if refreshed['overview'] or refreshed['price']:
+            self.logger.debug(f"🔮 Prefetched {refreshed['overview']} overviews, {refreshed['price']} prices for {len(hot)} hot tokens")
+        return refreshed
+
+    async def _fetch_batch(self, data_type: str, batch: List[str]) -> Dict[str, Any]:
+        """
+        Fetch fresh data for a batch, bypassing the per-token cache entries being refreshed.
+
+        Prices come from the multi-price endpoint, whose composite cache entry is
+        dropped first (it is only useful for this exact batch and would otherwise
+        answer with the old data). Overviews need the full ``/defi/token_overview``
+        (the batch metadata endpoint has no price, liquidity or volume), fetched
+        concurrently with ``refresh`` so failures keep the current entries.
+        """
+        if data_type == 'price':
+            self.engine.delete(make_cache_key(BIRDEYE_API_NAMESPACE, 'multi_price', ','.join(batch)))
+            results = await self.birdeye_api.get_multi_price(batch)
+            return results if isinstance(results, dict) else {}
+
+        overviews = await asyncio.gather(
+            *(self.birdeye_api.get_token_overview(token, refresh=True) for token in batch),
+            return_exceptions=True
+        )
+        return {
+            token: overview for token, overview in zip(batch, overviews)
+            if isinstance(overview, dict)
+        }
+
+    async def run(self) -> None:
+        """Refresh the hottest tokens until cancelled"""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.refresh_once()
+            except Exception as e:
+                self.stats['errors'] += 1
+                self.logger.debug(f"Prefetch pass failed: {e}")
+
+    def start(self) -> None:
+        """Start the background refresh task if it is not already running"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop the background refresh task"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get prefetcher statistics"""
+        return {
+            **self.stats,
+            'running': self._task is not None and not self._task.done(),
+            'sketch': self.sketch.get_stats()
+        }
@@ -10,6 +10,9 @@ import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 
+from core_local.cu_ledger import get_shared_cu_ledger
+from utils.http_client_manager import HTTPClientFactory
+
 
 class MoralisAPI:
     """
@@ -41,15 +44,10 @@ class MoralisAPI:
             'last_request_time': 0
         }
         
-        # Rate limiting for 40,000 CU/day limit
+        # Rate limiting for 40,000 CU/day limit, counted in the shared CU ledger
         self.daily_cu_limit = 40000
-        self.cu_usage = {
-            'date': datetime.now().strftime('%Y-%m-%d'),
-            'used_cu': 0,
-            'requests_today': 0,
-            'bonding_requests': 0,
-            'graduated_requests': 0
-        }
+        self.cu_ledger = get_shared_cu_ledger()
+        self.cu_ledger.set_budget('moralis', self.daily_cu_limit, {'warning': 0.75, 'critical': 0.90, 'emergency': 1.0})
         
         # Session for connection pooling - Create immediately to avoid NoneType errors
         self.session = None
@@ -79,7 +77,9 @@ class MoralisAPI:
     async def _ensure_session(self):
         """Ensure session is created when needed"""
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(
+            # Closing this session keeps the pooled Moralis connections alive
+            self.session = HTTPClientFactory.create_session(
+                'moralis',
                 headers=self._session_headers,
                 timeout=aiohttp.ClientTimeout(total=30)
             )
@@ -102,43 +102,19 @@ class MoralisAPI:
     
     def _check_rate_limit(self, estimated_cu: int = 1) -> bool:
         """Check if request would exceed daily CU limit"""
-        today = datetime.now().strftime('%Y-%m-%d')
-        
-        # Reset counter if new day
-        if self.cu_usage['date'] != today:
-            self.cu_usage = {
-                'date': today,
-                'used_cu': 0,
-                'requests_today': 0,
-                'bonding_requests': 0,
-                'graduated_requests': 0
-            }
-            self.logger.info(f"🔄 Daily CU usage reset for {today}")
+        used_cu = self.cu_ledger.used_today('moralis')
         
         # Check if adding this request would exceed limit
-        if self.cu_usage['used_cu'] + estimated_cu > self.daily_cu_limit:
-            remaining = self.daily_cu_limit - self.cu_usage['used_cu']
+        if used_cu + estimated_cu > self.daily_cu_limit:
+            remaining = self.daily_cu_limit - used_cu
             self.logger.warning(f"🚨 Rate limit check failed: Need {estimated_cu} CU, only {remaining} remaining")
             return False
         
         return True
     
     def _update_cu_usage(self, cu_used: int, endpoint_type: str = 'general'):
-        """Update CU usage tracking"""
-        self.cu_usage['used_cu'] += cu_used
-        self.cu_usage['requests_today'] += 1
-        
-        if endpoint_type == 'bonding':
-            self.cu_usage['bonding_requests'] += 1
-        elif endpoint_type == 'graduated':
-            self.cu_usage['graduated_requests'] += 1
-        
-        # Log usage milestones
-        usage_pct = (self.cu_usage['used_cu'] / self.daily_cu_limit) * 100
-        if usage_pct >= 90:
-            self.logger.warning(f"🚨 CU usage at {usage_pct:.1f}% ({self.cu_usage['used_cu']}/{self.daily_cu_limit})")
-        elif usage_pct >= 75:
-            self.logger.warning(f"⚠️ CU usage at {usage_pct:.1f}% ({self.cu_usage['used_cu']}/{self.daily_cu_limit})")
+        """Update CU usage tracking (75%/90% milestones are alerted once by the ledger watcher)"""
+        self.cu_ledger.add('moralis', cu_used, endpoint_type)
     
     async def _make_request(self, endpoint: str, params: Optional[Dict] = None, use_solana_gateway: bool = False, estimated_cu: int = 1) -> Optional[Dict]:
         """Make authenticated request to Moralis API with performance tracking and rate limiting"""
@@ -579,18 +555,20 @@ class MoralisAPI:
     
     def get_cu_usage_stats(self) -> Dict:
         """Get CU (Compute Units) usage statistics for rate limiting"""
-        usage_pct = (self.cu_usage['used_cu'] / self.daily_cu_limit) * 100
-        remaining_cu = self.daily_cu_limit - self.cu_usage['used_cu']
+        used_cu = self.cu_ledger.used_today('moralis')
+        usage_pct = (used_cu / self.daily_cu_limit) * 100
+        remaining_cu = self.daily_cu_limit - used_cu
+        requests_by_type = self.cu_ledger.operations_today('moralis')
         
         return {
-            'date': self.cu_usage['date'],
-            'used_cu': self.cu_usage['used_cu'],
+            'date': self.cu_ledger.today,
+            'used_cu': used_cu,
             'daily_limit': self.daily_cu_limit,
             'remaining_cu': remaining_cu,
             'usage_percentage': usage_pct,
-            'requests_today': self.cu_usage['requests_today'],
-            'bonding_requests': self.cu_usage['bonding_requests'],
-            'graduated_requests': self.cu_usage['graduated_requests'],
+            'requests_today': self.cu_ledger.requests_today('moralis'),
+            'bonding_requests': requests_by_type.get('bonding', 0),
+            'graduated_requests': requests_by_type.get('graduated', 0),
             'rate_limit_status': 'CRITICAL' if usage_pct >= 90 else ('WARNING' if usage_pct >= 75 else 'OK')
         }
     
@@ -12,6 +12,9 @@ from datetime import datetime
 import time
 from tenacity import retry, stop_after_attempt, wait_exponential, RetryError, retry_if_exception_type
 
+from utils.http_client_manager import HTTPClientFactory
+from utils.json_stream import stream_response_array
+
 try:
     from utils.enhanced_structured_logger import create_enhanced_logger, APICallType
     HAS_ENHANCED_LOGGING = True
@@ -81,7 +84,7 @@ class RaydiumConnector:
         }
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        self.session = HTTPClientFactory.create_session('raydium')
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -114,8 +117,16 @@ class RaydiumConnector:
         wait=wait_exponential(multiplier=1, min=4, max=10),
         retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError))
     )
-    async def _make_tracked_request(self, endpoint: str, timeout: int = 60, use_v2_fallback: bool = True) -> Optional[Any]:
-        """Make rate-limited API request with tracking and v2 fallback"""
+    async def _make_tracked_request(self, endpoint: str, timeout: int = 60, use_v2_fallback: bool = True,
+                                    array_path: Optional[tuple] = None, limit: Optional[int] = None) -> Optional[Any]:
+        """
+        Make rate-limited API request with tracking and v2 fallback.
+        
+        With ``array_path`` the body is streamed as a list instead of parsed whole:
+        elements of the top-level array (v2) or of the array at ``array_path``
+        (v3 ``{"data": {"data": [...]}}``) are decoded as they arrive, and reading
+        stops after ``limit`` elements.
+        """
         
         # Use RateLimiterService if available, otherwise fall back to simple rate limiting
         if self.rate_limiter:
@@ -156,7 +167,7 @@ class RaydiumConnector:
                         )
                     
                     try:
-                        return await response.json()
+                        return await self._read_json(response, array_path, limit)
                     except json.JSONDecodeError as json_err:
                         logger.error(f"❌ Raydium v3 JSON decode error for {endpoint}: {json_err}")
                         
@@ -212,7 +223,7 @@ class RaydiumConnector:
                         self.successful_calls += 1
                         logger.info(f"✅ Raydium v2 fallback success: {endpoint}")
                         try:
-                            return await response.json()
+                            return await self._read_json(response, array_path, limit)
                         except json.JSONDecodeError as json_err:
                             logger.error(f"❌ Raydium v2 JSON decode error for {endpoint}: {json_err}")
                             return None
@@ -236,6 +247,13 @@ class RaydiumConnector:
         self.failed_calls += 1
         return None
     
+    @staticmethod
+    async def _read_json(response, array_path: Optional[tuple], limit: Optional[int]) -> Any:
+        """Parse a response body whole, or stream just the list at ``array_path``"""
+        if array_path is None:
+            return await response.json()
+        return await stream_response_array(response, limit=limit, path=array_path)
+    
     async def get_pools(self, limit: Optional[int] = 50000) -> List[Dict]:
         """Get Raydium pools using v3 API with v2 fallback"""
         cache_key = f"raydium_v3_pools_{limit or 'all'}"
@@ -250,8 +268,9 @@ class RaydiumConnector:
                 logger.debug(f"Cache get failed: {e}")
         
         # Try v3 endpoint first, fallback to v2
-        data = await self._make_tracked_request(self.v3_endpoints['pools'], use_v2_fallback=True)
-        pools = data if data else []
+        data = await self._make_tracked_request(
+            self.v3_endpoints['pools'], use_v2_fallback=True, array_path=('data', 'data'), limit=limit
+        )
         
         # Handle different response structures between v2 and v3
         if isinstance(data, dict):
@@ -292,7 +311,9 @@ class RaydiumConnector:
                 logger.debug(f"Cache get failed: {e}")
         
         # Try v3 endpoint first, fallback to v2
-        data = await self._make_tracked_request(self.v3_endpoints['pairs'], use_v2_fallback=True)
+        data = await self._make_tracked_request(
+            self.v3_endpoints['pairs'], use_v2_fallback=True, array_path=('data', 'data'), limit=limit
+        )
         
         # Handle different response structures between v2 and v3
         if isinstance(data, dict):
@@ -0,0 +1,179 @@
+"""
+Batched Solana JSON-RPC client.
+
+Packs many RPC calls into JSON-RPC batch requests and account reads into
+``getMultipleAccounts`` calls, so reading N accounts costs about N/100 round
+trips instead of N. Requests go through pooled ``solana_rpc`` connections from
+``HTTPClientFactory`` and are hedged across endpoints ordered by health with
+``HedgedRequester``.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+
+from utils.hedged_requests import AllEndpointsFailed, HedgedRequester
+from utils.http_client_manager import HTTPClientFactory
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RPC_ENDPOINTS = (
+    "https://api.mainnet-beta.solana.com",
+    "https://solana-api.projectserum.com",
+    "https://rpc.ankr.com/solana",
+)
+
+# Solana RPC limits getMultipleAccounts to 100 keys per call
+MAX_ACCOUNTS_PER_CALL = 100
+
+RpcCall = Tuple[str, List[Any]]  # (method, params)
+
+
+class SolanaRPCClient:
+    """Solana JSON-RPC client with request batching and endpoint health scoring"""
+
+    def __init__(
+        self,
+        endpoints: Sequence[str] = DEFAULT_RPC_ENDPOINTS,
+        request_timeout: float = 5.0,
+        max_batch_size: int = 50,
+        hedge_delay: float = 1.0
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            endpoints: RPC endpoints in preference order
+            request_timeout: Timeout for one HTTP round trip
+            max_batch_size: Calls packed into a single JSON-RPC batch request
+            hedge_delay: Delay before hedging to the next endpoint until latencies are learned
+        """
+        self.endpoints = list(dict.fromkeys(endpoints))
+        self.request_timeout = request_timeout
+        self.max_batch_size = max_batch_size
+        self.health = HedgedRequester(default_hedge_delay=hedge_delay, max_hedge_delay=request_timeout)
+        self.stats = {
+            'round_trips': 0,
+            'calls': 0,
+            'accounts_requested': 0,
+            'call_errors': 0,
+            'failed_batches': 0
+        }
+
+    async def call(self, method: str, params: Optional[List[Any]] = None) -> Optional[Any]:
+        """Make a single RPC call; returns its result or None"""
+        results = await self.batch([(method, params or [])])
+        return results[0]
+
+    async def batch(self, calls: Sequence[RpcCall]) -> List[Optional[Any]]:
+        """
+        Make many RPC calls in as few round trips as possible.
+
+        Returns:
+            One result per call, in order (None for calls that errored)
+        """
+        results: List[Optional[Any]] = [None] * len(calls)
+        chunks = [
+            list(range(start, min(start + self.max_batch_size, len(calls))))
+            for start in range(0, len(calls), self.max_batch_size)
+        ]
+        chunk_results = await asyncio.gather(
+            *(self._send_batch([calls[index] for index in chunk]) for chunk in chunks)
+        )
+        for chunk, values in zip(chunks, chunk_results):
+            for index, value in zip(chunk, values):
+                results[index] = value
+        return results
+
+    async def get_multiple_accounts(
+        self,
+        addresses: Sequence[str],
+        encoding: str = "base64",
+        commitment: str = "confirmed"
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Read many accounts with batched ``getMultipleAccounts`` calls.
+
+        Returns:
+            address -> ``{"context": ..., "value": account-or-None}`` (the
+            ``getAccountInfo`` result shape); addresses whose call failed are omitted
+        """
+        unique = list(dict.fromkeys(address for address in addresses if address))
+        self.stats['accounts_requested'] += len(unique)
+        groups = [unique[start:start + MAX_ACCOUNTS_PER_CALL] for start in range(0, len(unique), MAX_ACCOUNTS_PER_CALL)]
+        options = {"encoding": encoding, "commitment": commitment}
+
+        results = await self.batch([("getMultipleAccounts", [group, options]) for group in groups])
+
+        accounts: Dict[str, Optional[Dict[str, Any]]] = {}
+        for group, result in zip(groups, results):
+            if not isinstance(result, dict) or not isinstance(result.get('value'), list):
+                continue
+            context = result.get('context')
+            for address, value in zip(group, result['value']):
+                accounts[address] = {"context": context, "value": value}
+        return accounts
+
+    async def _send_batch(self, calls: List[RpcCall]) -> List[Optional[Any]]:
+        """Send one JSON-RPC batch, hedged across healthy endpoints"""
+        payload = [
+            {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+            for request_id, (method, params) in enumerate(calls)
+        ]
+        self.stats['calls'] += len(calls)
+        session = HTTPClientFactory.get_shared_session('solana_rpc')
+        timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+
+        async def attempt(endpoint: str, url: str) -> Optional[List[Dict[str, Any]]]:
+            self.stats['round_trips'] += 1
+            async with session.post(url, json=payload, timeout=timeout) as response:
+                if response.status != 200:
+                    logger.debug(f"RPC endpoint {endpoint} returned HTTP {response.status}")
+                    return None
+                body = await response.json(content_type=None)
+            # Endpoints that reject batching answer with a single error object
+            return body if isinstance(body, list) else None
+
+        try:
+            _, responses = await self.health.race([(endpoint, endpoint) for endpoint in self.endpoints], attempt)
+        except AllEndpointsFailed:
+            self.stats['failed_batches'] += 1
+            logger.debug(f"RPC batch of {len(calls)} calls failed on every endpoint")
+            return [None] * len(calls)
+
+        by_id = {item.get('id'): item for item in responses if isinstance(item, dict)}
+        results: List[Optional[Any]] = []
+        for request_id in range(len(calls)):
+            item = by_id.get(request_id)
+            if item is None or 'error' in item:
+                self.stats['call_errors'] += 1
+                results.append(None)
+            else:
+                results.append(item.get('result'))
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics and endpoint health"""
+        return {
+            **self.stats,
+            'calls_per_round_trip': self.stats['calls'] / max(1, self.stats['round_trips']),
+            'endpoints': self.health.get_stats()['endpoints']
+        }
+
+
+_shared_clients: Dict[Tuple[str, ...], SolanaRPCClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_rpc_client(endpoints: Sequence[str] = DEFAULT_RPC_ENDPOINTS) -> SolanaRPCClient:
+    """Get the process-wide client for an endpoint list, so endpoint health is shared"""
+    key = tuple(dict.fromkeys(endpoints))
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = SolanaRPCClient(key)
+            _shared_clients[key] = client
+    return client
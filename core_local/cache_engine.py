@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Unified cache engine shared by all cache managers.
+
+``CacheManager``, ``EnhancedAPICacheManager`` and the batch manager's
+``EnhancedCacheManager`` used to keep their own stores, key formats and TTL
+rules, so the same Birdeye response could be stored several times under
+different keys. They now all sit on one ``CacheEngine``:
+
+- every entry carries its own expiry time (no fixed-TTL tiers)
+- expired entries are purged through a lazy min-heap instead of full scans
+- size is bounded with LRU eviction
+- keys follow one canonical scheme: ``<namespace>_<data_type>_<identifier>``
+  (e.g. ``birdeye_overview_<address>``), built with ``make_cache_key``;
+  raw endpoint responses live under ``<namespace>_raw_...`` (``endpoint_cache_key``)
+  because they are stored unprocessed
+"""
+
+import time
+import json
+import heapq
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# Birdeye endpoints mapped to the data type used in canonical cache keys
+ENDPOINT_DATA_TYPES = {
+    "/defi/token_overview": "overview",
+    "/defi/price": "price",
+    "/defi/multi_price": "multi_price",
+    "/defi/token_security": "security",
+    "/defi/token_creation_info": "token_creation_info",
+    "/defi/v3/token/meta-data/single": "metadata_single",
+    "/defi/v3/token/meta-data/multiple": "metadata_multiple",
+    "/defi/v3/ohlcv": "ohlcv",
+    "/defi/txs/token": "transactions",
+    "/defi/token_trending": "trending_tokens",
+    "/defi/v2/tokens/top_traders": "top_traders",
+}
+
+_MISSING = object()
+
+
+def make_cache_key(namespace: str, data_type: str, *identifiers: Any) -> str:
+    """
+    Build a canonical cache key.
+
+    Args:
+        namespace: Data source namespace (e.g. ``birdeye``)
+        data_type: Kind of data cached (e.g. ``overview``, ``price``)
+        identifiers: Token address and any other distinguishing parts
+
+    Returns:
+        Key of the form ``<namespace>_<data_type>_<id1>_<id2>...``
+    """
+    parts = [namespace, data_type]
+    parts.extend(str(identifier) for identifier in identifiers if identifier is not None and identifier != "")
+    return "_".join(parts)
+
+
+def endpoint_cache_key(namespace: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build the canonical cache key for a raw endpoint request.
+
+    Keys are ``<namespace>_raw_<data_type>_<address or params hash>``. The
+    ``raw`` segment keeps them apart from the connector's keys for the same
+    token (``birdeye_overview_<address>``), which hold the unwrapped ``data``
+    payload rather than the whole response.
+    """
+    data_type = ENDPOINT_DATA_TYPES.get(endpoint)
+    if data_type is None:
+        data_type = endpoint.strip("/").replace("/", "_").replace("-", "_") or "root"
+    params = params or {}
+    if set(params) == {"address"}:
+        return make_cache_key(namespace, "raw", data_type, params["address"])
+    if not params:
+        return make_cache_key(namespace, "raw", data_type)
+    digest = hashlib.md5(json.dumps(sorted(params.items()), sort_keys=True, default=str).encode()).hexdigest()
+    return make_cache_key(namespace, "raw", data_type, digest)
+
+
+class CacheEngine:
+    """
+    In-memory cache with per-entry TTL and LRU bound.
+
+    Entries are kept in insertion/access order for LRU eviction; expiry times
+    are also pushed on a min-heap so expired entries can be purged without
+    scanning the whole cache. Heap entries made stale by overwrites or deletes
+    are skipped lazily.
+    """
+
+    def __init__(self, max_entries: int = 50000, default_ttl: int = 300):
+        """
+        Initialize the cache engine.
+
+        Args:
+            max_entries: Maximum number of live entries before LRU eviction
+            default_ttl: TTL in seconds used when a caller does not give one
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._lock = threading.RLock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "expirations": 0,
+            "evictions": 0
+        }
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a live value, or ``default`` when missing or expired"""
+        value, _ = self.get_with_expiry(key)
+        return default if value is _MISSING else value
+
+    def get_with_expiry(self, key: str) -> Tuple[Any, Optional[float]]:
+        """Get ``(value, expires_at)``; value is a private sentinel on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return _MISSING, None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self.stats["expirations"] += 1
+                self.stats["misses"] += 1
+                return _MISSING, None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return value, expires_at
+
+    def contains(self, key: str) -> bool:
+        """Check for a live entry without touching hit/miss stats or LRU order"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] > time.time()
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value with its own TTL (seconds)"""
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            self.stats["sets"] += 1
+            if len(self._entries) > self.max_entries:
+                self.purge_expired()
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.stats["evictions"] += 1
+            elif len(self._expiry_heap) > 2 * self.max_entries:
+                # Keep the heap from growing with stale entries from overwrites
+                self._compact_heap()
+
+    def ttl_remaining(self, key: str) -> Optional[float]:
+        """Seconds until a live entry expires, or None if it is not cached"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            remaining = entry[0] - time.time()
+            return remaining if remaining > 0 else None
+
+    def delete(self, key: str) -> bool:
+        """Remove an entry; returns True if it existed"""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove all entries whose key starts with ``prefix``"""
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> int:
+        """Remove all entries; returns the number removed"""
+        with self._lock:
+            size = len(self._entries)
+            self._entries.clear()
+            self._expiry_heap = []
+            return size
+
+    def purge_expired(self) -> int:
+        """Remove expired entries using the expiry heap"""
+        now = time.time()
+        purged = 0
+        with self._lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= now:
+                expires_at, key = heapq.heappop(heap)
+                entry = self._entries.get(key)
+                # Only drop the entry if this heap record is still its current expiry
+                if entry is not None and entry[0] == expires_at:
+                    del self._entries[key]
+                    purged += 1
+            self.stats["expirations"] += purged
+        return purged
+
+    def _compact_heap(self) -> None:
+        self._expiry_heap = [(expires_at, key) for key, (expires_at, _) in self._entries.items()]
+        heapq.heapify(self._expiry_heap)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get engine statistics"""
+        total = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": (self.stats["hits"] / total) * 100 if total > 0 else 0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries
+        }
+
+
+_shared_engine: Optional[CacheEngine] = None
+_shared_engine_lock = threading.Lock()
+
+
+def get_shared_cache_engine() -> CacheEngine:
+    """Get the process-wide cache engine all cache managers share by default"""
+    global _shared_engine
+    if _shared_engine is None:
+        with _shared_engine_lock:
+            if _shared_engine is None:
+                _shared_engine = CacheEngine()
+    return _shared_engine
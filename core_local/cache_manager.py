@@ -9,13 +9,14 @@ import logging
 import json
 import hashlib
 from pathlib import Path
-from typing import Any, Optional, Union, Dict, Tuple
+from typing import Any, Optional, Union, Dict, Set, Tuple
 from functools import wraps
 
 from cachetools import TTLCache
 # Removed REDIS related imports for now to simplify, can be added back if Redis is a firm requirement.
 
 from core_local.config_manager import ConfigManager
+from core_local.cache_engine import CacheEngine, get_shared_cache_engine
 from utils.structured_logger import get_structured_logger
 
 logger = logging.getLogger(__name__)
@@ -23,19 +24,27 @@ logger = logging.getLogger(__name__)
 class CacheManager:
     """
     Cache manager with TTL support for optimizing API calls.
-    Provides in-memory caching with configurable expiration times.
+    Provides in-memory caching with per-entry expiration times.
+    
+    Entries live in a ``CacheEngine`` which, by default, is shared by every
+    cache manager in the process, so data cached under a canonical key
+    (see ``make_cache_key``) is stored once however many managers use it.
+    ``clear()`` only removes the entries this manager wrote.
     """
     
-    def __init__(self, ttl_default: int = 300):
+    def __init__(self, ttl_default: int = 300, engine: Optional[CacheEngine] = None):
         """
         Initialize the cache manager.
         
         Args:
             ttl_default: Default TTL in seconds (5 minutes)
+            engine: Cache engine to store entries in (shared engine if None)
         """
-        self.cache: Dict[str, Dict[str, Any]] = {}
+        self.engine = engine if engine is not None else get_shared_cache_engine()
         self.ttl_default = ttl_default
         self.stats = {'hits': 0, 'misses': 0}
+        # Keys written through this manager, so clear() leaves other managers' entries alone
+        self._keys: Set[str] = set()
         self.logger = get_structured_logger('CacheManager')
 
     def get(self, key: str, default: Any = None, scan_id: Optional[str] = None) -> Any:
@@ -50,15 +59,11 @@ class CacheManager:
         Returns:
             Cached value or default
         """
-        entry = self.cache.get(key)
-        now = time.time()
-        if entry and now - entry['timestamp'] < entry['ttl']:
+        value, expires_at = self.engine.get_with_expiry(key)
+        if expires_at is not None:
             self.stats['hits'] += 1
-            self.logger.info({"event": "cache_get", "result": "hit", "key": key, "scan_id": scan_id, "ttl": entry['ttl'], "timestamp": entry['timestamp']})
-            return entry['data']
-        if entry:
-            self.logger.info({"event": "cache_expiry", "key": key, "scan_id": scan_id, "ttl": entry['ttl'], "timestamp": entry['timestamp']})
-            del self.cache[key]
+            self.logger.info({"event": "cache_get", "result": "hit", "key": key, "scan_id": scan_id, "ttl_remaining": round(expires_at - time.time(), 1)})
+            return value
         self.stats['misses'] += 1
         self.logger.info({"event": "cache_get", "result": "miss", "key": key, "scan_id": scan_id})
         return default
@@ -73,12 +78,13 @@ class CacheManager:
             ttl: Time-to-live in seconds (uses default if None)
             scan_id: Optional scan ID for logging
         """
-        self.cache[key] = {
-            'data': value,
-            'timestamp': time.time(),
-            'ttl': ttl if ttl is not None else self.ttl_default
-        }
-        self.logger.info({"event": "cache_set", "key": key, "scan_id": scan_id, "ttl": ttl if ttl is not None else self.ttl_default})
+        effective_ttl = ttl if ttl is not None else self.ttl_default
+        self.engine.set(key, value, ttl=effective_ttl)
+        self._keys.add(key)
+        if len(self._keys) > self.engine.max_entries:
+            # Forget keys the engine has already expired or evicted
+            self._keys = {k for k in self._keys if self.engine.contains(k)}
+        self.logger.info({"event": "cache_set", "key": key, "scan_id": scan_id, "ttl": effective_ttl})
         
     def invalidate(self, key: str, scan_id: Optional[str] = None) -> bool:
         """
@@ -91,12 +97,31 @@ class CacheManager:
         Returns:
             True if key was found and invalidated, False otherwise
         """
-        if key in self.cache:
+        self._keys.discard(key)
+        if self.engine.delete(key):
             self.logger.info({"event": "cache_invalidate", "key": key, "scan_id": scan_id})
-            del self.cache[key]
             return True
         return False
     
+    def delete(self, key: str) -> bool:
+        """Alias for invalidate()"""
+        return self.invalidate(key)
+
+    def get_with_ttl(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Get a cached value together with its remaining TTL.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (value, remaining_ttl_seconds) or None if not cached
+        """
+        value, expires_at = self.engine.get_with_expiry(key)
+        if expires_at is None:
+            return None
+        return value, expires_at - time.time()
+
     def invalidate_pattern(self, pattern: str) -> int:
         """
         Invalidate all cache entries that start with the given pattern.
@@ -107,23 +132,18 @@ class CacheManager:
         Returns:
             Number of invalidated entries
         """
-        invalidated = 0
-        for key in list(self.cache.keys()):
-            if key.startswith(pattern):
-                del self.cache[key]
-                invalidated += 1
-        return invalidated
+        return self.engine.delete_prefix(pattern)
     
     def clear(self) -> int:
         """
-        Clear the entire cache.
+        Clear the entries this manager wrote (other managers sharing the engine keep theirs).
         
         Returns:
             Number of cleared entries
         """
-        size = len(self.cache)
-        self.cache = {}
-        return size
+        cleared = sum(1 for key in self._keys if self.engine.delete(key))
+        self._keys.clear()
+        return cleared
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -138,7 +158,7 @@ class CacheManager:
             'hits': self.stats['hits'],
             'misses': self.stats['misses'],
             'hit_rate': hit_rate,
-            'total_keys': len(self.cache)
+            'total_keys': len(self.engine)
         }
         self.logger.info({"event": "cache_stats", **stats})
         return stats
@@ -154,8 +174,8 @@ class CacheManager:
             Size of the cache in bytes
         """
         import sys
-        size = sys.getsizeof(self.cache)
-        self.logger.info({"event": "cache_size", "size_bytes": size, "total_keys": len(self.cache), "scan_id": scan_id})
+        size = sys.getsizeof(self.engine._entries)
+        self.logger.info({"event": "cache_size", "size_bytes": size, "total_keys": len(self.engine), "scan_id": scan_id})
         return size
 
     def get_cache_stats(self) -> Dict[str, Any]:
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Compute-unit ledger shared by all metered API providers.
+
+Birdeye, Moralis and the CU budget monitor used to keep separate CU counters,
+each formatting datetimes, logging and (for the budget monitor) spawning an
+alert task on every call. ``CULedger`` is the single place usage is recorded:
+
+- ``add`` only bumps counters in the current hour bucket; the date and hour
+  keys are recomputed once per hour, not per call
+- hourly buckets are checkpointed periodically through
+  ``AppendOnlyHistoryStore``, so a restart loses at most one checkpoint
+  interval instead of the whole day
+- one watcher task checkpoints and raises budget threshold alerts,
+  edge-triggered: each level fires once per provider per day when crossed
+"""
+
+import time
+import atexit
+import asyncio
+import inspect
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from core_local.history_store import AppendOnlyHistoryStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEDGER_FILE = Path("data/cu_usage_history/cu_ledger.json")
+
+DEFAULT_THRESHOLDS = {
+    'warning': 0.80,
+    'critical': 0.95,
+    'emergency': 1.0
+}
+
+AlertListener = Callable[[str, str, Dict[str, Any]], Union[None, Awaitable[None]]]
+
+
+class CULedger:
+    """Per-provider, per-hour CU counters with periodic append-only checkpoints"""
+
+    def __init__(
+        self,
+        ledger_file: Optional[Path] = None,
+        checkpoint_interval: float = 5.0,
+        retention_days: int = 7,
+        compact_after: int = 2000,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize the ledger.
+
+        Args:
+            ledger_file: Snapshot file (a ``.journal.jsonl`` file is kept beside it)
+            checkpoint_interval: Seconds between watcher checkpoints and alert checks
+            retention_days: Days of hourly buckets kept on disk
+            compact_after: Journal records to accumulate before compacting
+            clock: Time source (injectable for tests)
+        """
+        self.ledger_file = Path(ledger_file or DEFAULT_LEDGER_FILE)
+        self.ledger_file.parent.mkdir(parents=True, exist_ok=True)
+        self.store = AppendOnlyHistoryStore(self.ledger_file, "hours", compact_after=compact_after)
+        self.history: Dict[str, Any] = {"hours": {}}
+        self.checkpoint_interval = checkpoint_interval
+        self.retention_days = retention_days
+        self._clock = clock
+
+        self.budgets: Dict[str, Dict[str, Any]] = {}
+        self._listeners: List[AlertListener] = []
+        self._alerted: Dict[str, int] = {}  # provider -> index of the highest level fired today
+
+        # Current hour window; buckets are opened lazily per provider
+        self._day = ""
+        self._hour = ""
+        self._hour_ends_at = 0.0
+        self._current: Dict[str, Tuple[str, Dict[str, Any]]] = {}  # provider -> (key, bucket)
+        self._day_totals: Dict[str, int] = {}
+        self._day_requests: Dict[str, int] = {}
+        self._dirty: Set[str] = set()
+
+        self._watcher: Optional[asyncio.Task] = None
+        self.stats = {
+            'increments': 0,
+            'checkpoints': 0,
+            'alerts_fired': 0
+        }
+
+    def load(self) -> int:
+        """
+        Load checkpointed buckets and rebuild today's totals.
+
+        Returns:
+            CUs already recorded today across providers
+        """
+        try:
+            self.history = self.store.load()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load CU ledger {self.ledger_file}, starting empty: {e}")
+            self.history = {"hours": {}}
+        self._roll_hour(self._clock(), force=True)
+        return sum(self._day_totals.values())
+
+    @property
+    def hours(self) -> Dict[str, Dict[str, Any]]:
+        return self.history["hours"]
+
+    def _roll_hour(self, now: float, force: bool = False) -> None:
+        """Move to the hour containing ``now``; rebuild day totals when the date changes"""
+        local = time.localtime(now)
+        self._hour = time.strftime('%Y-%m-%d %H', local)
+        self._hour_ends_at = now - (local.tm_min * 60 + local.tm_sec + now % 1) + 3600
+        self._current = {}
+
+        day = self._hour[:10]
+        if day == self._day and not force:
+            return
+        self._day = day
+        self._alerted = {}
+        self._day_totals = {}
+        self._day_requests = {}
+        for key, bucket in self.hours.items():
+            provider, hour = key.rsplit('|', 1)
+            if hour.startswith(day):
+                self._day_totals[provider] = self._day_totals.get(provider, 0) + bucket['cus']
+                self._day_requests[provider] = self._day_requests.get(provider, 0) + bucket['requests']
+        self._prune(local)
+
+    def _prune(self, local: time.struct_time) -> None:
+        """Drop buckets older than the retention window"""
+        cutoff = time.strftime('%Y-%m-%d', time.localtime(time.mktime(local) - self.retention_days * 86400))
+        for key in [key for key in self.hours if key.rsplit('|', 1)[1][:10] < cutoff]:
+            del self.hours[key]
+            self.store.mark_deleted(key)
+            self._dirty.discard(key)
+
+    def _open_bucket(self, provider: str) -> Tuple[str, Dict[str, Any]]:
+        key = f"{provider}|{self._hour}"
+        entry = (key, self.hours.setdefault(key, {'cus': 0, 'requests': 0, 'ops': {}}))
+        self._current[provider] = entry
+        return entry
+
+    def add(self, provider: str, cus: int, operation: Optional[str] = None) -> int:
+        """
+        Record CU usage.
+
+        Args:
+            provider: Metered provider (e.g. ``birdeye``, ``moralis``)
+            cus: Compute units consumed
+            operation: Optional operation name counted per request
+
+        Returns:
+            Provider's CU total for today
+        """
+        now = self._clock()
+        if now >= self._hour_ends_at:
+            self._roll_hour(now)
+
+        key, bucket = self._current.get(provider) or self._open_bucket(provider)
+        bucket['cus'] += cus
+        bucket['requests'] += 1
+        if operation:
+            ops = bucket['ops']
+            ops[operation] = ops.get(operation, 0) + 1
+        self._dirty.add(key)
+
+        total = self._day_totals.get(provider, 0) + cus
+        self._day_totals[provider] = total
+        self._day_requests[provider] = self._day_requests.get(provider, 0) + 1
+        self.stats['increments'] += 1
+
+        if self._watcher is None:
+            self._start_watcher()
+        return total
+
+    def used_today(self, provider: str) -> int:
+        """Provider's CU total for today"""
+        now = self._clock()
+        if now >= self._hour_ends_at:
+            self._roll_hour(now)
+        return self._day_totals.get(provider, 0)
+
+    def requests_today(self, provider: str) -> int:
+        """Provider's recorded request count for today"""
+        self.used_today(provider)
+        return self._day_requests.get(provider, 0)
+
+    def hourly_usage(self, provider: str) -> Dict[str, int]:
+        """Today's CU usage per hour (``YYYY-MM-DD HH`` keys)"""
+        self.used_today(provider)
+        prefix = f"{provider}|{self._day}"
+        return {key.rsplit('|', 1)[1]: bucket['cus'] for key, bucket in self.hours.items() if key.startswith(prefix)}
+
+    def operations_today(self, provider: str) -> Dict[str, int]:
+        """Today's request counts per operation"""
+        self.used_today(provider)
+        prefix = f"{provider}|{self._day}"
+        counts: Dict[str, int] = {}
+        for key, bucket in self.hours.items():
+            if key.startswith(prefix):
+                for operation, count in bucket['ops'].items():
+                    counts[operation] = counts.get(operation, 0) + count
+        return counts
+
+    @property
+    def today(self) -> str:
+        """Current ledger date (``YYYY-MM-DD``)"""
+        self.used_today("")
+        return self._day
+
+    def set_budget(self, provider: str, daily_budget: int, thresholds: Optional[Dict[str, float]] = None) -> None:
+        """
+        Set a provider's daily budget and alert thresholds.
+
+        Args:
+            provider: Metered provider
+            daily_budget: Daily CU budget
+            thresholds: Alert level -> fraction of the budget (defaults to 80/95/100%)
+        """
+        levels = sorted((thresholds or DEFAULT_THRESHOLDS).items(), key=lambda item: item[1])
+        self.budgets[provider] = {'daily_budget': daily_budget, 'levels': levels}
+
+    def add_alert_listener(self, listener: AlertListener) -> None:
+        """Call ``listener(provider, level, status)`` (sync or async) when a threshold is crossed"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remaining(self, provider: str) -> Optional[int]:
+        """CUs left in the provider's daily budget (None without a budget)"""
+        budget = self.budgets.get(provider)
+        if budget is None:
+            return None
+        return budget['daily_budget'] - self.used_today(provider)
+
+    def checkpoint(self) -> int:
+        """
+        Append changed buckets to the ledger journal.
+
+        Returns:
+            Number of buckets written
+        """
+        if not self._dirty and not self.store.get_stats()['pending_changes']:
+            return 0
+        written = len(self._dirty)
+        for key in self._dirty:
+            self.store.mark_dirty(key)
+        self._dirty.clear()
+        try:
+            self.store.save(self.history)
+            self.stats['checkpoints'] += 1
+        except OSError as e:
+            logger.error(f"CU ledger checkpoint failed: {e}")
+        return written
+
+    async def check_alerts(self) -> List[Dict[str, Any]]:
+        """
+        Fire alerts for thresholds crossed since the last check.
+
+        Each level fires once per provider per day; when usage jumps several
+        levels at once only the highest one is reported.
+
+        Returns:
+            The alerts fired
+        """
+        fired = []
+        for provider, budget in self.budgets.items():
+            used = self.used_today(provider)
+            daily_budget = budget['daily_budget']
+            crossed = -1
+            for index, (_, fraction) in enumerate(budget['levels']):
+                if used >= daily_budget * fraction:
+                    crossed = index
+            if crossed <= self._alerted.get(provider, -1):
+                continue
+
+            self._alerted[provider] = crossed
+            level = budget['levels'][crossed][0]
+            status = {
+                'provider': provider,
+                'level': level,
+                'date': self._day,
+                'used': used,
+                'daily_budget': daily_budget,
+                'usage_percentage': used / daily_budget if daily_budget else 0.0,
+                'timestamp': self._clock()
+            }
+            fired.append(status)
+            self.stats['alerts_fired'] += 1
+            logger.warning(f"CU budget {level} for {provider}: {used:,}/{daily_budget:,} CUs ({status['usage_percentage']:.1%})")
+
+            for listener in self._listeners:
+                try:
+                    result = listener(provider, level, status)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    logger.error(f"CU alert listener failed: {e}")
+        return fired
+
+    def _start_watcher(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Not in an event loop; checkpoint() can be called directly
+        self._watcher = loop.create_task(self._watch())
+        self._watcher.add_done_callback(self._watcher_stopped)
+
+    def _watcher_stopped(self, task: asyncio.Task) -> None:
+        if self._watcher is task:
+            self._watcher = None
+
+    async def _watch(self) -> None:
+        """The single watcher: periodic checkpoint plus threshold checks"""
+        try:
+            while True:
+                await asyncio.sleep(self.checkpoint_interval)
+                self.checkpoint()
+                await self.check_alerts()
+        finally:
+            # Loop shutdown cancels us; keep what was counted since the last tick
+            self.checkpoint()
+
+    async def stop(self) -> None:
+        """Stop the watcher and write a final checkpoint"""
+        watcher = self._watcher
+        if watcher is not None:
+            watcher.cancel()
+            await asyncio.gather(watcher, return_exceptions=True)
+        self.checkpoint()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get ledger statistics and today's per-provider usage"""
+        self.used_today("")
+        return {
+            **self.stats,
+            'date': self._day,
+            'used_today': dict(self._day_totals),
+            'requests_today': dict(self._day_requests),
+            'pending_buckets': len(self._dirty),
+            'watcher_running': self._watcher is not None,
+            'store': self.store.get_stats()
+        }
+
+
+_shared_ledgers: Dict[Path, CULedger] = {}
+_shared_ledgers_lock = threading.Lock()
+
+
+def get_shared_cu_ledger(ledger_file: Optional[Path] = None) -> CULedger:
+    """
+    Get the process-wide ledger for a file, loading it on first use.
+
+    Every connector records into the same ledger so budgets see all usage;
+    it is checkpointed once more at interpreter exit.
+    """
+    path = Path(ledger_file or DEFAULT_LEDGER_FILE).resolve()
+    with _shared_ledgers_lock:
+        ledger = _shared_ledgers.get(path)
+        if ledger is None:
+            ledger = CULedger(path)
+            ledger.load()
+            atexit.register(ledger.checkpoint)
+            _shared_ledgers[path] = ledger
+    return ledger
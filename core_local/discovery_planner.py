@@ -0,0 +1,274 @@
+"""
+Discovery Planner
+
+Plans the Birdeye token list queries needed by a set of discovery strategies.
+
+Strategies that sort the token list the same way are served by a single fused
+query whose server-side filters are the loosest of the group (the minimum of
+each ``min_*`` threshold). Each strategy's own, stricter filters are then
+applied locally over the shared result. Because the fused result keeps the
+server's sort order, a locally filtered list is exactly the prefix the
+strategy would have received from its own query; when a strategy ends up
+short, the planner fetches further pages of the fused query.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
+
+from api.birdeye_connector import BirdeyeAPI
+
+# Birdeye v3 token list page size limit
+MAX_PAGE_SIZE = 100
+
+# Filters get_token_list applies when a strategy does not set them
+DEFAULT_SERVER_FILTERS = {
+    "min_liquidity": 1000000,
+    "min_volume_24h_usd": 100000,
+    "min_holder": None,
+    "min_trade_24h_count": None,
+}
+
+# Token list fields that back each server-side filter (v3 name first, then v1/legacy names)
+FILTER_FIELDS = {
+    "min_liquidity": ("liquidity",),
+    "min_volume_24h_usd": ("volume_24h_usd", "v24hUSD", "volume24h"),
+    "min_holder": ("holder", "holders"),
+    "min_trade_24h_count": ("trade_24h_count", "trade24h", "txns24h"),
+}
+
+
+@dataclass
+class StrategyDiscoverySpec:
+    """Token list requirements of a single strategy."""
+    strategy_name: str
+    sort_by: str
+    sort_type: str
+    limit: int
+    filters: Dict[str, Optional[float]]
+
+
+@dataclass
+class DiscoveryQuery:
+    """A fused token list query serving one or more strategies."""
+    sort_by: str
+    sort_type: str
+    page_size: int
+    filters: Dict[str, Optional[float]]
+    members: List[StrategyDiscoverySpec] = field(default_factory=list)
+
+    def to_api_kwargs(self, offset: int = 0) -> Dict[str, Any]:
+        """Build get_token_list keyword arguments for one page of this query."""
+        return {
+            "sort_by": self.sort_by,
+            "sort_type": self.sort_type,
+            "limit": self.page_size,
+            "offset": offset,
+            **self.filters,
+        }
+
+
+class DiscoveryPlanner:
+    """
+    Computes the minimal set of token list queries covering a set of strategies,
+    fetches them once and splits the results back out per strategy.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, max_pages: int = 3):
+        """
+        Initialize the discovery planner.
+
+        Args:
+            logger: Logger instance
+            max_pages: Maximum pages fetched per fused query to fill short strategies
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.max_pages = max_pages
+        self.stats = {
+            "plans": 0,
+            "strategies_planned": 0,
+            "queries_planned": 0,
+            "pages_fetched": 0,
+        }
+
+    def build_spec(self, strategy) -> StrategyDiscoverySpec:
+        """Build the discovery spec for a strategy from its API parameters."""
+        params = strategy.get_discovery_parameters()
+        sort_by = params.pop("sort_by", "volume_24h_usd")
+        sort_type = params.pop("sort_type", "desc")
+        limit = min(params.pop("limit", 20), MAX_PAGE_SIZE)
+
+        filters = dict(DEFAULT_SERVER_FILTERS)
+        for key, value in params.items():
+            if key in FILTER_FIELDS:
+                filters[key] = value
+
+        return StrategyDiscoverySpec(
+            strategy_name=strategy.name,
+            sort_by=sort_by,
+            sort_type=sort_type,
+            limit=limit,
+            filters=filters,
+        )
+
+    def plan(self, strategies: List[Any]) -> List[DiscoveryQuery]:
+        """
+        Group strategies by sort order and fuse each group into one query.
+
+        Args:
+            strategies: Strategy instances due to run
+
+        Returns:
+            List of fused discovery queries
+        """
+        groups: Dict[Tuple[str, str], List[StrategyDiscoverySpec]] = {}
+        for strategy in strategies:
+            spec = self.build_spec(strategy)
+            groups.setdefault((spec.sort_by, spec.sort_type), []).append(spec)
+
+        queries = []
+        for (sort_by, sort_type), members in groups.items():
+            fused_filters: Dict[str, Optional[float]] = {}
+            for key in FILTER_FIELDS:
+                values = [member.filters.get(key) for member in members]
+                # Any member without the filter means the fused query cannot apply it
+                fused_filters[key] = None if any(v is None for v in values) else min(values)
+
+            loosened = any(self._needs_local_filter(member, fused_filters) for member in members)
+            page_size = MAX_PAGE_SIZE if loosened else max(member.limit for member in members)
+
+            queries.append(DiscoveryQuery(
+                sort_by=sort_by,
+                sort_type=sort_type,
+                page_size=page_size,
+                filters=fused_filters,
+                members=members,
+            ))
+
+        self.stats["plans"] += 1
+        self.stats["strategies_planned"] += len(strategies)
+        self.stats["queries_planned"] += len(queries)
+        self.logger.info(f"🧭 Discovery plan: {len(strategies)} strategies → {len(queries)} token list queries")
+        return queries
+
+    @staticmethod
+    def _needs_local_filter(spec: StrategyDiscoverySpec, fused_filters: Dict[str, Optional[float]]) -> bool:
+        """Check whether a strategy's filters are stricter than the fused query's."""
+        for key, value in spec.filters.items():
+            if value is None:
+                continue
+            fused = fused_filters.get(key)
+            if fused is None or value > fused:
+                return True
+        return False
+
+    @staticmethod
+    def _token_value(token: Dict[str, Any], key: str) -> Optional[float]:
+        """Read the token field backing a filter, trying each known field name."""
+        for field_name in FILTER_FIELDS[key]:
+            value = token.get(field_name)
+            if value is not None:
+                return value
+        return None
+
+    def select_for_strategy(
+        self,
+        spec: StrategyDiscoverySpec,
+        query: DiscoveryQuery,
+        tokens: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply a strategy's own filters locally over a fused query result.
+
+        Only filters stricter than the fused query are re-checked; a token
+        missing the backing field cannot be proven to pass and is dropped.
+
+        Args:
+            spec: Strategy discovery spec
+            query: Fused query the tokens came from
+            tokens: Fused query result, in server sort order
+
+        Returns:
+            Up to ``spec.limit`` tokens the strategy's own query would have returned
+        """
+        checks = []
+        for key, value in spec.filters.items():
+            if value is None:
+                continue
+            fused = query.filters.get(key)
+            if fused is None or value > fused:
+                checks.append((key, value))
+
+        selected = []
+        for token in tokens:
+            passed = True
+            for key, threshold in checks:
+                token_value = self._token_value(token, key)
+                if token_value is None or token_value < threshold:
+                    passed = False
+                    break
+            if passed:
+                selected.append(token)
+                if len(selected) >= spec.limit:
+                    break
+        return selected
+
+    async def _fetch_query(self, birdeye_api: BirdeyeAPI, query: DiscoveryQuery) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch one fused query, paging until every member is filled or the list runs out."""
+        tokens: List[Dict[str, Any]] = []
+        selections: Dict[str, List[Dict[str, Any]]] = {}
+
+        for page in range(self.max_pages):
+            result = await birdeye_api.get_token_list(**query.to_api_kwargs(offset=page * query.page_size))
+            self.stats["pages_fetched"] += 1
+
+            if not (result and isinstance(result, dict) and result.get("success") is True and "data" in result):
+                if page == 0:
+                    message = result.get("message", "No error message") if isinstance(result, dict) else result
+                    self.logger.warning(f"Discovery query {query.sort_by} failed: {message}")
+                break
+
+            page_tokens = result.get("data", {}).get("tokens", [])
+            tokens.extend(page_tokens)
+
+            selections = {
+                member.strategy_name: self.select_for_strategy(member, query, tokens)
+                for member in query.members
+            }
+            all_filled = all(len(selections[m.strategy_name]) >= m.limit for m in query.members)
+            if all_filled or len(page_tokens) < query.page_size:
+                break
+
+        for member in query.members:
+            selections.setdefault(member.strategy_name, [])
+        return selections
+
+    async def fetch(self, birdeye_api: BirdeyeAPI, queries: List[DiscoveryQuery]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch all planned queries concurrently.
+
+        Args:
+            birdeye_api: Birdeye API instance
+            queries: Planned discovery queries
+
+        Returns:
+            Mapping of strategy name to its selected tokens (shared dict objects);
+            strategies whose query failed are left out
+        """
+        results = await asyncio.gather(
+            *(self._fetch_query(birdeye_api, query) for query in queries),
+            return_exceptions=True
+        )
+
+        strategy_tokens: Dict[str, List[Dict[str, Any]]] = {}
+        for query, result in zip(queries, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Discovery query {query.sort_by} failed: {result}")
+                continue
+            strategy_tokens.update(result)
+        return strategy_tokens
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get planner statistics."""
+        return dict(self.stats)
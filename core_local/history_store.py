@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Append-only history persistence for strategy tracking data.
+
+Strategy token histories and scheduler execution histories used to be rewritten
+in full (``json.dump(..., indent=2)``) after every execution. This module keeps
+a compact JSON snapshot plus an append-only journal of changed records:
+
+- ``save`` appends one line per changed record (O(changes), not O(history))
+- ``load`` reads the snapshot and replays the journal
+- the journal is folded back into the snapshot once it grows past a threshold
+
+It also provides ``TokenActivityIndex``, an in-memory secondary index used to
+answer "promising" and "expired" queries without scanning every token.
+"""
+
+import os
+import json
+import heapq
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AppendOnlyHistoryStore:
+    """
+    Snapshot + append-only journal persistence for a keyed history collection.
+
+    The persisted history is a dict with one keyed collection (e.g. ``tokens``
+    or ``executions``) and any number of scalar metadata keys
+    (e.g. ``last_execution_time``). The snapshot file keeps the legacy JSON
+    format so existing history files load unchanged.
+    """
+
+    def __init__(
+        self,
+        snapshot_file: Path,
+        collection_key: str,
+        compact_after: int = 1000
+    ):
+        """
+        Initialize the history store.
+
+        Args:
+            snapshot_file: Path of the JSON snapshot file
+            collection_key: Name of the keyed collection inside the history dict
+            compact_after: Journal records to accumulate before compacting
+        """
+        self.snapshot_file = Path(snapshot_file)
+        self.journal_file = self.snapshot_file.with_suffix(".journal.jsonl")
+        self.collection_key = collection_key
+        self.compact_after = compact_after
+
+        self._dirty: Set[str] = set()
+        self._deleted: Set[str] = set()
+        self._journal_records = 0
+        # Set when load() met a torn journal line; the next save rewrites the snapshot
+        # instead of appending onto the fragment
+        self._journal_damaged = False
+        # Single worker so async writes land in the order they were prepared
+        self._writer: Optional[ThreadPoolExecutor] = None
+        # Identity of the collection we are tracking; a replaced dict forces a full snapshot
+        self._tracked_collection_id: Optional[int] = None
+
+        self.stats = {
+            "appends": 0,
+            "records_appended": 0,
+            "compactions": 0
+        }
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Load history from the snapshot and replay the journal.
+
+        Returns:
+            History dictionary (raises on a corrupted snapshot, like ``json.load``)
+        """
+        history: Dict[str, Any] = {}
+        if self.snapshot_file.exists():
+            with open(self.snapshot_file, 'r') as f:
+                history = json.load(f)
+            if not isinstance(history, dict):
+                raise ValueError(f"History snapshot {self.snapshot_file} is not a JSON object")
+
+        collection = history.get(self.collection_key)
+        if not isinstance(collection, dict):
+            collection = {}
+            history[self.collection_key] = collection
+
+        self._journal_records = 0
+        self._journal_damaged = False
+        if self.journal_file.exists():
+            with open(self.journal_file, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final line from a crash mid-append - everything before it is valid
+                        logger.warning(f"Skipping truncated journal record in {self.journal_file}")
+                        self._journal_damaged = True
+                        continue
+                    self._apply_record(history, collection, record)
+                    self._journal_records += 1
+
+        self._dirty.clear()
+        self._deleted.clear()
+        self._tracked_collection_id = id(collection)
+        return history
+
+    def _apply_record(self, history: Dict[str, Any], collection: Dict[str, Any], record: Dict[str, Any]) -> None:
+        """Apply a single journal record to the in-memory history"""
+        op = record.get("op")
+        if op == "put":
+            collection[record["k"]] = record["v"]
+        elif op == "del":
+            collection.pop(record["k"], None)
+        elif op == "meta":
+            history.update(record.get("v", {}))
+
+    def mark_dirty(self, key: str) -> None:
+        """Record that an entry was created or updated"""
+        self._deleted.discard(key)
+        self._dirty.add(key)
+
+    def mark_deleted(self, key: str) -> None:
+        """Record that an entry was removed"""
+        self._dirty.discard(key)
+        self._deleted.add(key)
+
+    def save(self, history: Dict[str, Any]) -> None:
+        """
+        Persist changes since the last save.
+
+        Appends changed records to the journal, or writes a full snapshot when
+        the journal is due for compaction, was damaged, or the collection was
+        replaced wholesale. Raises on I/O errors so callers can log them.
+
+        Args:
+            history: Current history dictionary
+        """
+        self._write_pending(self._prepare(history))
+
+    async def save_async(self, history: Dict[str, Any]) -> None:
+        """
+        Persist changes without blocking the event loop on file I/O.
+
+        Records are serialized on the calling thread, so the loop may keep
+        mutating the history while the worker thread writes them.
+        """
+        pending = self._prepare(history)
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-store")
+        await asyncio.get_running_loop().run_in_executor(self._writer, self._write_pending, pending)
+
+    def compact(self, history: Dict[str, Any]) -> None:
+        """Write a full compact snapshot atomically and truncate the journal"""
+        self._write_pending(self._prepare_snapshot(history))
+
+    def _prepare(self, history: Dict[str, Any]) -> Tuple[str, str, int, Set[str], Set[str]]:
+        """
+        Serialize the pending changes and take them off the dirty sets.
+
+        Returns:
+            (kind, payload, record count, dirty keys, deleted keys) for ``_write_pending``
+        """
+        collection = history.get(self.collection_key, {})
+        if (id(collection) != self._tracked_collection_id
+                or self._journal_damaged
+                or not self.snapshot_file.exists()
+                or self._journal_records >= self.compact_after):
+            return self._prepare_snapshot(history)
+
+        meta = {k: v for k, v in history.items() if k != self.collection_key}
+        lines = []
+        for key in self._dirty:
+            if key in collection:
+                lines.append(json.dumps({"op": "put", "k": key, "v": collection[key]}, separators=(',', ':')))
+        for key in self._deleted:
+            lines.append(json.dumps({"op": "del", "k": key}, separators=(',', ':')))
+        lines.append(json.dumps({"op": "meta", "v": meta}, separators=(',', ':')))
+
+        pending = ("journal", "\n".join(lines) + "\n", len(lines), self._dirty, self._deleted)
+        self._journal_records += len(lines)
+        self._dirty, self._deleted = set(), set()
+        return pending
+
+    def _prepare_snapshot(self, history: Dict[str, Any]) -> Tuple[str, str, int, Set[str], Set[str]]:
+        pending = ("snapshot", json.dumps(history, separators=(',', ':')), 0, self._dirty, self._deleted)
+        self._journal_records = 0
+        self._journal_damaged = False
+        self._tracked_collection_id = id(history.get(self.collection_key, {}))
+        self._dirty, self._deleted = set(), set()
+        return pending
+
+    def _write_pending(self, pending: Tuple[str, str, int, Set[str], Set[str]]) -> None:
+        """Write prepared changes (runs on a worker thread for ``save_async``)"""
+        kind, payload, records, dirty, deleted = pending
+        try:
+            if kind == "snapshot":
+                tmp_file = self.snapshot_file.with_suffix(".tmp")
+                with open(tmp_file, 'w') as f:
+                    f.write(payload)
+                    f.flush()
+                os.replace(tmp_file, self.snapshot_file)
+
+                # Journal contents are now part of the snapshot
+                with open(self.journal_file, 'w'):
+                    pass
+            else:
+                with open(self.journal_file, 'a') as f:
+                    f.write(payload)
+                    f.flush()
+        except Exception:
+            # Keep the changes pending, and rewrite the snapshot next time in case a partial
+            # line was left behind
+            self._dirty |= dirty - self._deleted
+            self._deleted |= deleted - self._dirty
+            self._journal_damaged = True
+            raise
+
+        if kind == "snapshot":
+            self.stats["compactions"] += 1
+        else:
+            self.stats["appends"] += 1
+            self.stats["records_appended"] += records
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics"""
+        return {
+            **self.stats,
+            "journal_records": self._journal_records,
+            "pending_changes": len(self._dirty) + len(self._deleted)
+        }
+
+
+class TokenActivityIndex:
+    """
+    Secondary index over a token history collection.
+
+    Tokens are bucketed by consecutive appearance count and kept in a min-heap
+    by ``last_seen``, so promising-token and expiry queries only touch the
+    matching tokens instead of scanning the whole history.
+    """
+
+    def __init__(self):
+        self._counts: Dict[str, int] = {}
+        self._buckets: Dict[int, Set[str]] = {}
+        self._last_seen: Dict[str, int] = {}
+        self._expiry_heap: List[Tuple[int, str]] = []
+        self._indexed_collection_id: Optional[int] = None
+
+    def is_current(self, tokens: Dict[str, Any]) -> bool:
+        """Check whether the index was built for this collection object"""
+        return self._indexed_collection_id == id(tokens)
+
+    def rebuild(self, tokens: Dict[str, Any]) -> None:
+        """Rebuild the index from a full collection"""
+        self._counts.clear()
+        self._buckets.clear()
+        self._last_seen.clear()
+        self._expiry_heap = []
+        for address, history in tokens.items():
+            self.update(address, history)
+        self._indexed_collection_id = id(tokens)
+
+    def update(self, address: str, history: Dict[str, Any]) -> None:
+        """Index (or re-index) a single token"""
+        count = history.get("consecutive_appearances", 0)
+        previous = self._counts.get(address)
+        if previous != count:
+            if previous is not None:
+                bucket = self._buckets.get(previous)
+                if bucket is not None:
+                    bucket.discard(address)
+                    if not bucket:
+                        del self._buckets[previous]
+            self._buckets.setdefault(count, set()).add(address)
+            self._counts[address] = count
+
+        last_seen = history.get("last_seen", 0)
+        if self._last_seen.get(address) != last_seen:
+            self._last_seen[address] = last_seen
+            heapq.heappush(self._expiry_heap, (last_seen, address))
+
+    def remove(self, address: str) -> None:
+        """Drop a token from the index (heap entries are discarded lazily)"""
+        count = self._counts.pop(address, None)
+        if count is not None:
+            bucket = self._buckets.get(count)
+            if bucket is not None:
+                bucket.discard(address)
+                if not bucket:
+                    del self._buckets[count]
+        self._last_seen.pop(address, None)
+
+    def promising(self, min_appearances: int) -> List[str]:
+        """Get tokens with at least ``min_appearances`` consecutive appearances"""
+        result: List[str] = []
+        for count, addresses in self._buckets.items():
+            if count >= min_appearances:
+                result.extend(addresses)
+        return result
+
+    def expired(self, cutoff: int) -> List[str]:
+        """Pop and return tokens whose ``last_seen`` is older than ``cutoff``"""
+        expired: List[str] = []
+        heap = self._expiry_heap
+        while heap and heap[0][0] < cutoff:
+            last_seen, address = heapq.heappop(heap)
+            # Skip stale heap entries left behind by later updates or removals
+            if self._last_seen.get(address) == last_seen:
+                expired.append(address)
+        return expired
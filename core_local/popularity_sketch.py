@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Fixed-memory token popularity tracking.
+
+``PopularitySketch`` is a count-min sketch with periodic halving (the
+TinyLFU "reset" scheme): counts are approximate, never underestimated
+before a decay, and memory does not grow with the number of distinct tokens
+seen. A small bounded candidate table remembers the currently hottest
+tokens so they can be enumerated, e.g. to drive cache prefetching.
+"""
+
+import hashlib
+import threading
+from array import array
+from typing import Iterable, List, Tuple, Dict, Any
+
+
+class PopularitySketch:
+    """
+    Approximate, decaying frequency counts for tokens.
+
+    Counts are halved every ``sample_size`` recorded events, so a token that
+    stops appearing fades out over a few periods instead of staying popular
+    forever.
+    """
+
+    def __init__(self, width: int = 4096, depth: int = 4, top_k: int = 256, sample_size: int = 0):
+        """
+        Initialize the sketch.
+
+        Args:
+            width: Counters per row (rounded up to a power of two)
+            depth: Number of hash rows
+            top_k: Number of hottest tokens remembered for enumeration
+            sample_size: Events between decays (defaults to 10 x width)
+        """
+        self.width = 1 << max(width - 1, 1).bit_length()
+        self.depth = depth
+        self.top_k = top_k
+        self.sample_size = sample_size or 10 * self.width
+        self._mask = self.width - 1
+        self._rows = [array('I', bytes(4 * self.width)) for _ in range(depth)]
+        self._candidates: Dict[str, int] = {}
+        self._events = 0
+        self._lock = threading.Lock()
+        self.stats = {"recorded": 0, "decays": 0}
+
+    def _indexes(self, token: str) -> List[int]:
+        # Stable across processes (hash() of a str depends on PYTHONHASHSEED); the rows
+        # use double hashing h1 + i * h2 over one 128-bit digest
+        digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) & self._mask for i in range(self.depth)]
+
+    def record(self, token: str, count: int = 1) -> int:
+        """
+        Record occurrences of a token.
+
+        Uses conservative update (only the minimal counters are raised), which
+        keeps overestimation from hash collisions low.
+
+        Returns:
+            The token's new estimated count
+        """
+        with self._lock:
+            indexes = self._indexes(token)
+            current = min(row[index] for row, index in zip(self._rows, indexes))
+            target = current + count
+            for row, index in zip(self._rows, indexes):
+                if row[index] < target:
+                    row[index] = target
+
+            self._track_candidate(token, target)
+            self._events += count
+            self.stats["recorded"] += count
+            if self._events >= self.sample_size:
+                self._decay_locked()
+            return target
+
+    def record_many(self, tokens: Iterable[str]) -> None:
+        """Record one occurrence of each distinct token (e.g. once per cycle)"""
+        for token in dict.fromkeys(tokens):
+            if token:
+                self.record(token)
+
+    def estimate(self, token: str) -> int:
+        """Get the estimated count for a token"""
+        indexes = self._indexes(token)
+        return min(row[index] for row, index in zip(self._rows, indexes))
+
+    def hottest(self, n: int, min_count: int = 1) -> List[Tuple[str, int]]:
+        """Get up to ``n`` of the hottest tokens as ``(token, estimate)`` pairs"""
+        with self._lock:
+            ranked = sorted(
+                ((token, self.estimate(token)) for token in self._candidates),
+                key=lambda item: item[1],
+                reverse=True
+            )
+        return [(token, count) for token, count in ranked[:n] if count >= min_count]
+
+    def decay(self) -> None:
+        """Halve all counts"""
+        with self._lock:
+            self._decay_locked()
+
+    def _decay_locked(self) -> None:
+        for row in self._rows:
+            for i, value in enumerate(row):
+                if value:
+                    row[i] = value >> 1
+        self._candidates = {token: count >> 1 for token, count in self._candidates.items() if count >> 1}
+        self._events = 0
+        self.stats["decays"] += 1
+
+    def _track_candidate(self, token: str, count: int) -> None:
+        candidates = self._candidates
+        if token in candidates or len(candidates) < self.top_k:
+            candidates[token] = count
+            return
+        # Replace the coldest candidate only if the new token is hotter
+        coldest = min(candidates, key=candidates.get)
+        if count > candidates[coldest]:
+            del candidates[coldest]
+            candidates[token] = count
+
+    def __contains__(self, token: str) -> bool:
+        return token in self._candidates
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get sketch statistics"""
+        return {
+            **self.stats,
+            "tracked_candidates": len(self._candidates),
+            "width": self.width,
+            "depth": self.depth,
+            "memory_bytes": self.width * self.depth * 4
+        }
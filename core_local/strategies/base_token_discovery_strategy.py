@@ -17,6 +17,7 @@ from typing import Dict, List, Any, Optional, Set, Tuple
 
 from api.birdeye_connector import BirdeyeAPI
 from api.rugcheck_connector import RugCheckConnector
+from core_local.history_store import AppendOnlyHistoryStore, TokenActivityIndex
 from services.logger_setup import LoggerSetup
 from utils.structured_logger import get_structured_logger
 
@@ -29,6 +30,10 @@ class BaseTokenDiscoveryStrategy:
     using the Birdeye API's token list endpoint with different parameters.
     """
     
+    # Whether execute_with_tokens consumes batch-enriched tokens; the scheduler
+    # only enriches shared discovery tokens selected by strategies that do
+    uses_shared_enrichment = True
+    
     def __init__(
         self,
         name: str,
@@ -76,6 +81,8 @@ class BaseTokenDiscoveryStrategy:
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.storage_file = self.storage_dir / f"{name.lower().replace(' ', '_')}_results.json"
+        self.history_store = AppendOnlyHistoryStore(self.storage_file, collection_key="tokens")
+        self.history_index = TokenActivityIndex()
         
         # Load history or initialize empty
         self.token_history = self.load_history()
@@ -158,41 +165,9 @@ class BaseTokenDiscoveryStrategy:
                 self.structured_logger.info({"event": "strategy_run_end", "strategy": self.name, "scan_id": scan_id, "tokens_found": len(tokens), "timestamp": int(time.time())})
                 self.logger.info(f"Strategy {self.name} found {len(tokens)} tokens")
                 
-                # Filter out major tokens to save processing time
-                from services.early_token_detection import filter_major_tokens
-                tokens = filter_major_tokens(tokens)
-                self.logger.info(f"Strategy {self.name} after major token filtering: {len(tokens)} tokens")
-                
-                # ENHANCED: Use batch operations for enrichment with cost tracking
-                if self.rate_limit_config["enable_cost_tracking"]:
-                    enrichment_start_time = time.time()
-                    
-                # ENHANCED: Batch enrich with all data sources simultaneously
-                tokens = await self._batch_enrich_all_data(tokens, birdeye_api)
-                
-                processed_tokens = await self.process_results(tokens, birdeye_api, scan_id=scan_id)
-                
-                # ENHANCED: Apply enhanced scoring
-                processed_tokens = await self._apply_enhanced_scoring(processed_tokens)
-                
-                # Track execution metrics
-                execution_time = time.time() - execution_start_time
-                final_api_calls = getattr(birdeye_api, 'api_call_count', 0)
-                api_calls_used = final_api_calls - initial_api_calls
-                
-                # Update cost metrics
-                self._update_cost_metrics(api_calls_used, len(tokens), execution_time)
-                
-                self.last_execution_time = int(time.time())
-                self.token_history["last_execution_time"] = self.last_execution_time
-                
-                self.save_history()
-                
-                # Log performance metrics
-                self.logger.info(f"✅ Strategy {self.name} completed in {execution_time:.2f}s, "
-                               f"API calls: {api_calls_used}, Efficiency: {self.cost_metrics['batch_efficiency_ratio']:.2%}")
-                
-                return processed_tokens
+                return await self._process_discovered_tokens(
+                    tokens, birdeye_api, scan_id, execution_start_time, initial_api_calls
+                )
             elif result and isinstance(result, dict) and result.get("success") is False:
                 self.structured_logger.warning({"event": "strategy_error", "strategy": self.name, "scan_id": scan_id, "error": result.get('message', 'No error message')})
                 self.logger.warning(f"Strategy {self.name} API call failed: {result.get('message', 'No error message')}")
@@ -207,6 +182,107 @@ class BaseTokenDiscoveryStrategy:
             self.logger.error(f"Error executing strategy {self.name}: {e}")
             return []
     
+    async def execute_with_tokens(
+        self,
+        tokens: List[Dict[str, Any]],
+        birdeye_api: BirdeyeAPI,
+        scan_id: Optional[str] = None,
+        already_enriched: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute the strategy on tokens fetched by a shared discovery query.
+        
+        Used by the StrategyScheduler discovery planner, which issues one token list
+        query per group of compatible strategies and enriches the union once.
+        
+        Args:
+            tokens: Token list entries matching this strategy's API parameters
+            birdeye_api: Initialized Birdeye API instance
+            scan_id: Optional scan ID for structured logging
+            already_enriched: Skip batch enrichment when the caller already enriched the tokens
+            
+        Returns:
+            List of token data dictionaries
+        """
+        execution_start_time = time.time()
+        self.logger.info(f"Executing {self.name} strategy on {len(tokens)} shared discovery tokens")
+        
+        try:
+            initial_api_calls = getattr(birdeye_api, 'api_call_count', 0)
+            return await self._process_discovered_tokens(
+                tokens, birdeye_api, scan_id, execution_start_time, initial_api_calls,
+                already_enriched=already_enriched
+            )
+        except Exception as e:
+            self.structured_logger.error({"event": "strategy_error", "strategy": self.name, "scan_id": scan_id, "error": str(e)})
+            self.logger.error(f"Error executing strategy {self.name}: {e}")
+            return []
+    
+    def get_discovery_parameters(self) -> Dict[str, Any]:
+        """
+        Get the token list parameters this strategy needs from discovery.
+        
+        Returns:
+            Copy of the strategy's API parameters
+        """
+        return self.api_parameters.copy()
+    
+    async def _process_discovered_tokens(
+        self,
+        tokens: List[Dict[str, Any]],
+        birdeye_api: BirdeyeAPI,
+        scan_id: Optional[str],
+        execution_start_time: float,
+        initial_api_calls: int,
+        already_enriched: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Filter, enrich, process and score discovered tokens, then persist history.
+        
+        Args:
+            tokens: Token list entries from discovery
+            birdeye_api: Birdeye API instance
+            scan_id: Optional scan ID for structured logging
+            execution_start_time: Start time of this execution
+            initial_api_calls: API call counter value at the start of this execution
+            already_enriched: Skip batch enrichment when tokens are already enriched
+            
+        Returns:
+            Processed token data
+        """
+        # Filter out major tokens to save processing time
+        from services.early_token_detection import filter_major_tokens
+        tokens = filter_major_tokens(tokens)
+        self.logger.info(f"Strategy {self.name} after major token filtering: {len(tokens)} tokens")
+        
+        # ENHANCED: Batch enrich with all data sources simultaneously
+        if not already_enriched:
+            tokens = await self._batch_enrich_all_data(tokens, birdeye_api)
+        
+        processed_tokens = await self.process_results(tokens, birdeye_api, scan_id=scan_id)
+        
+        # ENHANCED: Apply enhanced scoring
+        processed_tokens = await self._apply_enhanced_scoring(processed_tokens)
+        
+        # Track execution metrics
+        execution_time = time.time() - execution_start_time
+        final_api_calls = getattr(birdeye_api, 'api_call_count', 0)
+        api_calls_used = final_api_calls - initial_api_calls
+        
+        # Update cost metrics
+        self._update_cost_metrics(api_calls_used, len(tokens), execution_time)
+        
+        self.last_execution_time = int(time.time())
+        self.token_history["last_execution_time"] = self.last_execution_time
+        
+        await self.save_history_async()
+        
+        # Log performance metrics
+        self.logger.info(f"✅ Strategy {self.name} completed in {execution_time:.2f}s, "
+                       f"API calls: {api_calls_used}, Efficiency: {self.cost_metrics['batch_efficiency_ratio']:.2%}")
+        
+        return processed_tokens
+    
     async def process_results(self, tokens: List[Dict[str, Any]], birdeye_api: BirdeyeAPI, scan_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Process the results from the API call, apply RugCheck filtering, and track token appearances.
@@ -289,6 +365,8 @@ class BaseTokenDiscoveryStrategy:
         Returns:
             Token history dictionary
         """
+        self._ensure_history_index()
+        
         # Initialize if this is a new token
         if token_address not in self.token_history.get("tokens", {}):
             self.token_history["tokens"][token_address] = {
@@ -298,6 +376,8 @@ class BaseTokenDiscoveryStrategy:
                 "last_seen": timestamp,
                 "last_data": token_data
             }
+            self.history_index.update(token_address, self.token_history["tokens"][token_address])
+            self.history_store.mark_dirty(token_address)
             return self.token_history["tokens"][token_address]
             
         # Update existing token
@@ -320,9 +400,18 @@ class BaseTokenDiscoveryStrategy:
         # Keep only the last 10 appearances to save space
         if len(token_history["appearances"]) > 10:
             token_history["appearances"] = token_history["appearances"][-10:]
+        
+        self.history_index.update(token_address, token_history)
+        self.history_store.mark_dirty(token_address)
             
         return token_history
     
+    def _ensure_history_index(self) -> None:
+        """Rebuild the token activity index if the token collection was replaced."""
+        tokens = self.token_history.setdefault("tokens", {})
+        if not self.history_index.is_current(tokens):
+            self.history_index.rebuild(tokens)
+    
     def get_promising_tokens(self) -> List[str]:
         """
         Get tokens that have appeared in enough consecutive runs to be considered promising.
@@ -330,13 +419,8 @@ class BaseTokenDiscoveryStrategy:
         Returns:
             List of promising token addresses
         """
-        promising = []
-        
-        for address, history in self.token_history.get("tokens", {}).items():
-            if history.get("consecutive_appearances", 0) >= self.min_consecutive_appearances:
-                promising.append(address)
-                
-        return promising
+        self._ensure_history_index()
+        return self.history_index.promising(self.min_consecutive_appearances)
     
     def load_history(self) -> Dict[str, Any]:
         """
@@ -345,32 +429,33 @@ class BaseTokenDiscoveryStrategy:
         Returns:
             Dictionary with token tracking data
         """
-        if not self.storage_file.exists():
-            return {"tokens": {}, "last_execution_time": 0}
-            
         try:
-            with open(self.storage_file, 'r') as f:
-                history = json.load(f)
-                
-            # Ensure the structure is correct
-            if not isinstance(history, dict):
-                history = {"tokens": {}, "last_execution_time": 0}
-            if "tokens" not in history:
-                history["tokens"] = {}
+            history = self.history_store.load()
             if "last_execution_time" not in history:
                 history["last_execution_time"] = 0
-                
+            
+            self.history_index.rebuild(history["tokens"])
             return history
             
         except Exception as e:
             self.logger.error(f"Error loading history for {self.name}: {e}")
-            return {"tokens": {}, "last_execution_time": 0}
+            history = {"tokens": {}, "last_execution_time": 0}
+            self.history_index.rebuild(history["tokens"])
+            return history
     
     def save_history(self) -> None:
-        """Save token tracking history to storage."""
+        """Save token tracking history to storage (appends only the changed tokens)."""
         try:
-            with open(self.storage_file, 'w') as f:
-                json.dump(self.token_history, f, indent=2)
+            self.history_store.save(self.token_history)
+                
+        except Exception as e:
+            self.logger.error(f"Error saving history for {self.name}: {e}")
+    
+    async def save_history_async(self) -> None:
+        """Save token tracking history, writing from a worker thread to keep the event loop free."""
+        try:
+            # The store serializes on the loop, so tokens updated meanwhile cannot race the write
+            await self.history_store.save_async(self.token_history)
                 
         except Exception as e:
             self.logger.error(f"Error saving history for {self.name}: {e}")
@@ -385,15 +470,13 @@ class BaseTokenDiscoveryStrategy:
         current_time = int(time.time())
         max_age_seconds = max_age_days * 24 * 60 * 60
         
-        tokens_to_remove = []
-        
-        for address, history in self.token_history.get("tokens", {}).items():
-            last_seen = history.get("last_seen", 0)
-            if (current_time - last_seen) > max_age_seconds:
-                tokens_to_remove.append(address)
+        self._ensure_history_index()
+        tokens_to_remove = self.history_index.expired(current_time - max_age_seconds)
                 
         for address in tokens_to_remove:
             del self.token_history["tokens"][address]
+            self.history_index.remove(address)
+            self.history_store.mark_deleted(address)
             
         if tokens_to_remove:
             self.logger.info(f"Removed {len(tokens_to_remove)} expired tokens from {self.name}")
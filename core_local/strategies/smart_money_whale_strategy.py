@@ -30,6 +30,9 @@ class SmartMoneyWhaleStrategy(BaseTokenDiscoveryStrategy):
     - Prioritizes tokens with confluent whale + smart money activity
     """
     
+    # Whale analysis fetches its own trader data and ignores batch enrichment
+    uses_shared_enrichment = False
+    
     def __init__(self, logger: Optional[logging.Logger] = None):
         """Initialize the Smart Money Whale Strategy."""
         super().__init__(
@@ -118,41 +121,48 @@ class SmartMoneyWhaleStrategy(BaseTokenDiscoveryStrategy):
             initial_tokens = await self._get_initial_token_universe(birdeye_api)
             self.logger.info(f"🎯 Initial token universe: {len(initial_tokens)} tokens")
             
-            if not initial_tokens:
-                self.logger.warning("No tokens in initial universe")
-                return []
-            
-            # Step 2: Filter by whale activity
-            whale_active_tokens = await self._filter_by_whale_activity(initial_tokens, birdeye_api, scan_id)
-            self.logger.info(f"🐋 Whale-active tokens: {len(whale_active_tokens)} tokens")
-            
-            # Step 3: Filter by smart money activity  
-            smart_money_tokens = await self._filter_by_smart_money_activity(whale_active_tokens, birdeye_api, scan_id)
-            self.logger.info(f"🧠 Smart money active tokens: {len(smart_money_tokens)} tokens")
-            
-            # Step 4: Apply confluence analysis (tokens with both whale + smart money)
-            confluence_tokens = await self._apply_confluence_analysis(smart_money_tokens, birdeye_api, scan_id)
-            self.logger.info(f"🎯 High-confluence tokens: {len(confluence_tokens)} tokens")
-            
-            # Step 5: Final processing and ranking
-            processed_tokens = await self.process_results(confluence_tokens, birdeye_api, scan_id)
-            
-            # Step 6: Rank by combined whale + smart money signals
-            final_tokens = await self._rank_by_whale_smart_money_signals(processed_tokens)
-            
-            execution_time = time.time() - execution_start_time
-            self.logger.info(f"✅ {self.name} completed in {execution_time:.2f}s - {len(final_tokens)} high-conviction tokens")
+            return await self._run_whale_smart_money_pipeline(initial_tokens, birdeye_api, scan_id, execution_start_time)
             
-            self.structured_logger.info({
-                "event": "smart_money_whale_strategy_complete",
+        except Exception as e:
+            self.structured_logger.error({
+                "event": "smart_money_whale_strategy_error",
                 "strategy": self.name,
                 "scan_id": scan_id,
-                "tokens_found": len(final_tokens),
-                "execution_time": execution_time,
+                "error": str(e),
                 "timestamp": int(time.time())
             })
+            self.logger.error(f"Error executing {self.name}: {e}")
+            return []
+    
+    async def execute_with_tokens(
+        self,
+        tokens: List[Dict[str, Any]],
+        birdeye_api: BirdeyeAPI,
+        scan_id: Optional[str] = None,
+        already_enriched: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute the Smart Money Whale Strategy on tokens from a shared discovery query.
+        
+        Args:
+            tokens: Token list entries matching this strategy's API parameters
+            birdeye_api: Initialized Birdeye API instance
+            scan_id: Optional scan ID for structured logging
+            already_enriched: Unused - whale analysis fetches its own trader data
+            
+        Returns:
+            List of tokens with high whale and smart money activity
+        """
+        execution_start_time = time.time()
+        self.logger.info(f"🐋🧠 Executing {self.name} on {len(tokens)} shared discovery tokens")
+        
+        try:
+            await self._initialize_whale_smart_money_services(birdeye_api)
+            
+            initial_tokens = self._prepare_token_universe(tokens)
+            self.logger.info(f"🎯 Initial token universe: {len(initial_tokens)} tokens")
             
-            return final_tokens
+            return await self._run_whale_smart_money_pipeline(initial_tokens, birdeye_api, scan_id, execution_start_time)
             
         except Exception as e:
             self.structured_logger.error({
@@ -165,6 +175,56 @@ class SmartMoneyWhaleStrategy(BaseTokenDiscoveryStrategy):
             self.logger.error(f"Error executing {self.name}: {e}")
             return []
     
+    def get_discovery_parameters(self) -> Dict[str, Any]:
+        """Get the token list parameters, with the same hard cap used by _get_initial_token_universe."""
+        params = self.api_parameters.copy()
+        params["limit"] = min(params.get("limit", 100), 20)
+        return params
+    
+    async def _run_whale_smart_money_pipeline(
+        self,
+        initial_tokens: List[Dict[str, Any]],
+        birdeye_api: BirdeyeAPI,
+        scan_id: Optional[str],
+        execution_start_time: float
+    ) -> List[Dict[str, Any]]:
+        """Run the whale -> smart money -> confluence -> ranking pipeline on a token universe."""
+        if not initial_tokens:
+            self.logger.warning("No tokens in initial universe")
+            return []
+        
+        # Step 2: Filter by whale activity
+        whale_active_tokens = await self._filter_by_whale_activity(initial_tokens, birdeye_api, scan_id)
+        self.logger.info(f"🐋 Whale-active tokens: {len(whale_active_tokens)} tokens")
+        
+        # Step 3: Filter by smart money activity  
+        smart_money_tokens = await self._filter_by_smart_money_activity(whale_active_tokens, birdeye_api, scan_id)
+        self.logger.info(f"🧠 Smart money active tokens: {len(smart_money_tokens)} tokens")
+        
+        # Step 4: Apply confluence analysis (tokens with both whale + smart money)
+        confluence_tokens = await self._apply_confluence_analysis(smart_money_tokens, birdeye_api, scan_id)
+        self.logger.info(f"🎯 High-confluence tokens: {len(confluence_tokens)} tokens")
+        
+        # Step 5: Final processing and ranking
+        processed_tokens = await self.process_results(confluence_tokens, birdeye_api, scan_id)
+        
+        # Step 6: Rank by combined whale + smart money signals
+        final_tokens = await self._rank_by_whale_smart_money_signals(processed_tokens)
+        
+        execution_time = time.time() - execution_start_time
+        self.logger.info(f"✅ {self.name} completed in {execution_time:.2f}s - {len(final_tokens)} high-conviction tokens")
+        
+        self.structured_logger.info({
+            "event": "smart_money_whale_strategy_complete",
+            "strategy": self.name,
+            "scan_id": scan_id,
+            "tokens_found": len(final_tokens),
+            "execution_time": execution_time,
+            "timestamp": int(time.time())
+        })
+        
+        return final_tokens
+    
     async def _initialize_whale_smart_money_services(self, birdeye_api: BirdeyeAPI):
         """Initialize whale and smart money services."""
         try:
@@ -212,18 +272,7 @@ class SmartMoneyWhaleStrategy(BaseTokenDiscoveryStrategy):
             
             if result and result.get("success") and "data" in result:
                 tokens = result.get("data", {}).get("tokens", [])
-                
-                # OPTIMIZATION: Pre-filter tokens before expensive whale analysis
-                # Only analyze tokens that are likely to have whale activity
-                filtered_tokens = self._pre_filter_tokens_for_whale_activity(tokens)
-                
-                self.logger.info(f"🎯 Pre-filtered {len(tokens)} → {len(filtered_tokens)} tokens for whale analysis")
-                
-                # Filter out major tokens to focus on opportunities
-                from services.early_token_detection import filter_major_tokens
-                filtered_tokens = filter_major_tokens(filtered_tokens)
-                
-                return filtered_tokens
+                return self._prepare_token_universe(tokens)
             
             return []
             
@@ -231,22 +280,36 @@ class SmartMoneyWhaleStrategy(BaseTokenDiscoveryStrategy):
             self.logger.error(f"Error getting initial token universe: {e}")
             return []
     
+    def _prepare_token_universe(self, tokens: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Pre-filter a raw token list down to the whale analysis universe."""
+        # OPTIMIZATION: Pre-filter tokens before expensive whale analysis
+        # Only analyze tokens that are likely to have whale activity
+        filtered_tokens = self._pre_filter_tokens_for_whale_activity(tokens)
+        
+        self.logger.info(f"🎯 Pre-filtered {len(tokens)} → {len(filtered_tokens)} tokens for whale analysis")
+        
+        # Filter out major tokens to focus on opportunities
+        from services.early_token_detection import filter_major_tokens
+        return filter_major_tokens(filtered_tokens)
+    
     async def _filter_by_whale_activity(self, tokens: List[Dict[str, Any]], birdeye_api: BirdeyeAPI, scan_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Filter tokens by whale activity using whale/shark tracker."""
         whale_active_tokens = []
         
         self.logger.info(f"🐋 Analyzing whale activity for {len(tokens)} tokens")
         
+        # Analyze whale/shark movements for all tokens concurrently
+        whale_analyses = await self._whale_shark_tracker.batch_analyze_whale_shark_movements(
+            [token.get("address") for token in tokens], priority_level="normal"
+        )
+        
         for token in tokens:
             try:
                 token_address = token.get("address")
                 if not token_address:
                     continue
                 
-                # Analyze whale/shark movements
-                whale_analysis = await self._whale_shark_tracker.analyze_whale_shark_movements(
-                    token_address, priority_level="normal"
-                )
+                whale_analysis = whale_analyses.get(token_address, {})
                 
                 # Check if token meets whale activity criteria
                 if self._meets_whale_activity_criteria(whale_analysis, token):
@@ -277,16 +340,18 @@ class SmartMoneyWhaleStrategy(BaseTokenDiscoveryStrategy):
         
         self.logger.info(f"🧠 Analyzing smart money activity for {len(tokens)} tokens")
         
+        # Analyze smart money activity in one batch (reuses whale data - no additional API calls!)
+        smart_money_analyses = await self._smart_money_detector.batch_analyze_smart_money(
+            [token.get("address") for token in tokens], priority_level="normal"
+        )
+        
         for token in tokens:
             try:
                 token_address = token.get("address")
                 if not token_address:
                     continue
                 
-                # Analyze smart money activity (reuses whale data - no additional API calls!)
-                smart_money_analysis = await self._smart_money_detector.analyze_smart_money(
-                    token_address, priority_level="normal"
-                )
+                smart_money_analysis = smart_money_analyses.get(token_address, {})
                 
                 # Check if token meets smart money criteria
                 if self._meets_smart_money_criteria(smart_money_analysis, token):
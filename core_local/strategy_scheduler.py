@@ -31,6 +31,8 @@ from core.token_discovery_strategies import (
     LiquidityGrowthStrategy,
     HighTradingActivityStrategy
 )
+from core_local.discovery_planner import DiscoveryPlanner
+from core_local.history_store import AppendOnlyHistoryStore
 from services.logger_setup import LoggerSetup
 from utils.structured_logger import get_structured_logger
 
@@ -86,6 +88,9 @@ class StrategyScheduler:
         # Initialize strategies
         self.strategies = self._initialize_strategies(strategy_configs)
         
+        # Plans one shared token list fetch for all strategies
+        self.discovery_planner = DiscoveryPlanner(logger=self.logger)
+        
         # Keep track of the last check time to avoid frequent rechecks
         self.last_schedule_check = 0
         self.schedule_check_interval = 60  # Check schedule every 60 seconds
@@ -143,6 +148,15 @@ class StrategyScheduler:
                 
         return strategies
     
+    @property
+    def executions_file(self) -> Path:
+        """Path of the execution history snapshot file."""
+        return self.execution_store.snapshot_file
+    
+    @executions_file.setter
+    def executions_file(self, path: Path) -> None:
+        self.execution_store = AppendOnlyHistoryStore(Path(path), collection_key="executions")
+    
     def _load_execution_history(self) -> Dict[str, Any]:
         """
         Load execution history from storage.
@@ -150,18 +164,8 @@ class StrategyScheduler:
         Returns:
             Dictionary with execution history data
         """
-        if not self.executions_file.exists():
-            return {"executions": {}, "last_check_time": 0}
-            
         try:
-            with open(self.executions_file, 'r') as f:
-                history = json.load(f)
-                
-            # Ensure the structure is correct
-            if not isinstance(history, dict):
-                history = {"executions": {}, "last_check_time": 0}
-            if "executions" not in history:
-                history["executions"] = {}
+            history = self.execution_store.load()
             if "last_check_time" not in history:
                 history["last_check_time"] = 0
                 
@@ -172,10 +176,9 @@ class StrategyScheduler:
             return {"executions": {}, "last_check_time": 0}
     
     def _save_execution_history(self) -> None:
-        """Save execution history to storage."""
+        """Save execution history to storage (appends only the changed executions)."""
         try:
-            with open(self.executions_file, 'w') as f:
-                json.dump(self.execution_history, f, indent=2)
+            self.execution_store.save(self.execution_history)
                 
         except Exception as e:
             self.logger.error(f"Error saving execution history: {e}")
@@ -229,6 +232,7 @@ class StrategyScheduler:
             "strategies_run": [strategy.name for strategy in self.strategies],
             "tokens_found": len(self.combined_results)
         }
+        self.execution_store.mark_dirty(hour_key)
         
         self._save_execution_history()
         self.logger.info(f"Marked execution complete for {hour_key}")
@@ -258,9 +262,10 @@ class StrategyScheduler:
         })
         self.logger.info("Running scheduled token discovery strategies")
         all_results = []
+        planned_results = await self._run_planned_discovery(scan_id)
         for strategy in self.strategies:
             try:
-                strategy_results = await strategy.execute(self.birdeye_api)
+                strategy_results = planned_results.get(strategy.name, [])
                 self.structured_logger.info({
                     "event": "strategy_run",
                     "scan_id": scan_id,
@@ -375,6 +380,7 @@ class StrategyScheduler:
                 
         for execution_key in executions_to_remove:
             del self.execution_history["executions"][execution_key]
+            self.execution_store.mark_deleted(execution_key)
             
         if executions_to_remove:
             self.logger.info(f"Removed {len(executions_to_remove)} expired executions from history")
@@ -456,37 +462,15 @@ class StrategyScheduler:
             
         self.logger.info("🔄 Running scheduled strategies with cross-strategy data sharing")
         
-        # STEP 1: Collect all potential tokens from all strategies in parallel
-        self.logger.info("📊 Phase 1: Parallel token discovery across all strategies")
-        
-        # Run all strategy discovery calls in parallel
-        discovery_tasks = []
-        for strategy in self.strategies:
-            task = asyncio.create_task(
-                self._safe_strategy_discovery(strategy, scan_id),
-                name=f"discovery_{strategy.name}"
-            )
-            discovery_tasks.append((strategy, task))
+        # STEP 1: Shared discovery - one fused token list fetch and one enrichment pass
+        self.logger.info("📊 Phase 1: Shared token discovery across all strategies")
         
-        # Collect all discovered tokens
+        strategy_tokens = await self._run_planned_discovery(scan_id)
         all_discovered_tokens = []
-        strategy_tokens = {}
-        
-        for strategy, task in discovery_tasks:
-            try:
-                tokens = await task
-                strategy_tokens[strategy.name] = tokens
-                all_discovered_tokens.extend(tokens)
-                self.logger.info(f"  • {strategy.name}: {len(tokens)} tokens discovered")
-            except Exception as e:
-                self.structured_logger.error({
-                    "event": "strategy_discovery_error",
-                    "scan_id": scan_id,
-                    "strategy": strategy.name,
-                    "error": str(e)
-                })
-                self.logger.error(f"  • {strategy.name}: Discovery failed - {e}")
-                strategy_tokens[strategy.name] = []
+        for strategy in self.strategies:
+            tokens = strategy_tokens.get(strategy.name, [])
+            all_discovered_tokens.extend(tokens)
+            self.logger.info(f"  • {strategy.name}: {len(tokens)} tokens discovered")
         
         # STEP 2: Create shared data pool for common tokens
         unique_addresses = list(set(token.get('address') for token in all_discovered_tokens if token.get('address')))
@@ -549,8 +533,108 @@ class StrategyScheduler:
         
         return all_results
     
+    async def _run_planned_discovery(self, scan_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Run all strategies off a shared discovery fetch.
+        
+        The discovery planner fuses the strategies' token list queries, each
+        strategy's filters are applied locally over the shared result, and the
+        union of tokens selected by strategies that use enrichment is enriched
+        exactly once before every strategy processes its own copy. Strategies
+        whose shared query, or the shared enrichment, fails run their own
+        discovery instead.
+        
+        Returns:
+            Mapping of strategy name to processed tokens
+        """
+        try:
+            queries = self.discovery_planner.plan(self.strategies)
+            selected = await self.discovery_planner.fetch(self.birdeye_api, queries)
+        except Exception as e:
+            self.structured_logger.error({
+                "event": "shared_discovery_error",
+                "scan_id": scan_id,
+                "error": str(e)
+            })
+            self.logger.error(f"Shared discovery failed, running strategies individually: {e}")
+            results = await asyncio.gather(*(self._safe_strategy_discovery(strategy, scan_id) for strategy in self.strategies))
+            return {strategy.name: result for strategy, result in zip(self.strategies, results)}
+        
+        # Union of tokens selected by strategies that consume enrichment, keyed by address
+        enriching_strategies = [
+            strategy for strategy in self.strategies
+            if getattr(strategy, "uses_shared_enrichment", True) and strategy.name in selected
+        ]
+        union: Dict[str, Dict[str, Any]] = {}
+        for strategy in enriching_strategies:
+            for token in selected[strategy.name]:
+                address = token.get("address")
+                if address and address not in union:
+                    union[address] = token
+        
+        from services.early_token_detection import filter_major_tokens
+        union_tokens = filter_major_tokens(list(union.values()))
+        
+        self.structured_logger.info({
+            "event": "shared_discovery_fetch",
+            "scan_id": scan_id,
+            "queries": len(queries),
+            "strategies": len(self.strategies),
+            "union_tokens": len(union_tokens),
+            "timestamp": int(time.time())
+        })
+        self.logger.info(f"🧭 Shared discovery: {len(queries)} queries, {len(union_tokens)} unique tokens to enrich")
+        
+        enrichment_failed = False
+        union = {}
+        if union_tokens:
+            try:
+                # Enrichment is strategy-independent - run it once on the union
+                enriched = await enriching_strategies[0]._batch_enrich_all_data(union_tokens, self.birdeye_api)
+                union = {token.get("address"): token for token in enriched if token.get("address")}
+            except Exception as e:
+                enrichment_failed = True
+                self.structured_logger.error({
+                    "event": "shared_enrichment_error",
+                    "scan_id": scan_id,
+                    "error": str(e)
+                })
+                self.logger.error(f"Shared enrichment failed, enriching strategies run individually: {e}")
+        
+        async def run_strategy(strategy) -> List[Dict[str, Any]]:
+            # Strategies whose shared query or enrichment failed fetch on their own
+            enriched = getattr(strategy, "uses_shared_enrichment", True)
+            if strategy.name not in selected or (enriched and enrichment_failed):
+                return await self._safe_strategy_discovery(strategy, scan_id)
+            
+            # Strategies annotate tokens in place, so each gets its own copies
+            if enriched:
+                tokens = [
+                    dict(union[token["address"]])
+                    for token in selected.get(strategy.name, [])
+                    if token.get("address") in union
+                ]
+            else:
+                tokens = [dict(token) for token in selected.get(strategy.name, [])]
+            try:
+                return await strategy.execute_with_tokens(
+                    tokens, self.birdeye_api, scan_id=scan_id, already_enriched=enriched
+                )
+            except Exception as e:
+                self.structured_logger.error({
+                    "event": "strategy_discovery_error",
+                    "scan_id": scan_id,
+                    "strategy": strategy.name,
+                    "error": str(e)
+                })
+                self.logger.error(f"Strategy {strategy.name} discovery failed: {e}")
+                return []
+        
+        results = await asyncio.gather(*(run_strategy(strategy) for strategy in self.strategies))
+        return {strategy.name: result for strategy, result in zip(self.strategies, results)}
+    
     async def _safe_strategy_discovery(self, strategy, scan_id: str) -> List[Dict[str, Any]]:
-        """Safely execute strategy discovery with error handling."""
+        """Run one strategy's own discovery (the shared-fetch fallback) with error handling."""
         try:
             return await strategy.execute(self.birdeye_api, scan_id=scan_id)
         except Exception as e:
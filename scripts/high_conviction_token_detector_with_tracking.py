@@ -414,6 +414,7 @@ class EnhancedHighConvictionDetector(HighConvictionTokenDetector):
             # Cleanup
             if hasattr(self, 'birdeye_api'):
                 await self.birdeye_api.close()
+            self.position_tracker.close()
             self.logger.info("👋 Enhanced detector daemon shutdown complete")
 
 async def main():
@@ -176,6 +176,9 @@ class PositionMonitor:
             if i + batch_size < len(active_positions):
                 await asyncio.sleep(2)
         
+        # Persist this cycle's queued price updates before sleeping until the next one
+        self.position_tracker.flush()
+        
         # Log cycle summary
         cycle_duration = time.time() - cycle_start
         self.last_check_time = int(time.time())
@@ -293,6 +296,9 @@ class PositionMonitor:
             if hasattr(self.birdeye_api, 'close'):
                 await self.birdeye_api.close()
             
+            # Write any queued position updates and close the database
+            self.position_tracker.close()
+            
             # Log shutdown summary
             uptime_hours = (time.time() - self.session_start_time) / 3600
             
@@ -537,6 +543,9 @@ class PositionMonitor:
             if i + batch_size < len(active_positions):
                 await asyncio.sleep(2)
         
+        # Persist this cycle's queued price updates before sleeping until the next one
+        self.position_tracker.flush()
+        
         # Log cycle summary
         cycle_duration = time.time() - cycle_start
         self.last_check_time = int(time.time())
@@ -654,6 +663,9 @@ class PositionMonitor:
             if hasattr(self.birdeye_api, 'close'):
                 await self.birdeye_api.close()
             
+            # Write any queued position updates and close the database
+            self.position_tracker.close()
+            
             # Log shutdown summary
             uptime_hours = (time.time() - self.session_start_time) / 3600
             
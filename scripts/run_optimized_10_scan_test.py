@@ -304,14 +304,9 @@ class OptimizedScanTestSession:
                     # Log scan results
                     self._log_scan_results(scan_num, scan_results)
                     
-                    # NEW: Update CU budget monitor after each scan
+                    # Birdeye CUs reach the budget monitor through the shared CU ledger as calls are made
                     scan_cus = scan_results.get('compute_units', 0)
                     if scan_cus > 0:
-                        self.cu_budget_monitor.add_cu_usage(
-                            cus_used=scan_cus,
-                            operation=f"optimized_scan_{scan_num}",
-                            scan_id=f"scan_{scan_num}"
-                        )
                         budget_status = self.cu_budget_monitor.get_budget_status()
                         
                         # Log budget status
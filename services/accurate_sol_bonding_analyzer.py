@@ -13,6 +13,8 @@ import json
 import base64
 from typing import Dict, List, Any, Optional
 
+from api.solana_rpc_client import get_shared_rpc_client
+
 class AccurateSolBondingAnalyzer:
     """
     🎯 ACCURATE SOL BONDING CURVE ANALYZER
@@ -30,6 +32,8 @@ class AccurateSolBondingAnalyzer:
             "https://rpc.ankr.com/solana"
         ]
         self.current_rpc = 0
+        # Shared batched client: warm pooled connections and endpoint health across analyzers
+        self.rpc_client = get_shared_rpc_client(self.rpc_endpoints)
         
         # SOL Configuration
         self.SOL_MINT = 'So11111111111111111111111111111111111111112'
@@ -50,6 +54,7 @@ class AccurateSolBondingAnalyzer:
             'cache_hits': 0, 
             'successful': 0,
             'failed': 0,
+            'accounts_batched': 0,
             'total_time': 0
         }
         
@@ -59,45 +64,33 @@ class AccurateSolBondingAnalyzer:
         self.logger.info(f"   🚀 Max Concurrent: {self.MAX_CONCURRENT}")
     
     async def _rpc_call(self, method: str, params: List) -> Optional[Dict]:
-        """Make Solana RPC call with failover"""
+        """Make Solana RPC call through the shared client (hedged endpoint failover)"""
         
-        for endpoint in self.rpc_endpoints:
-            try:
-                self.stats['rpc_calls'] += 1
-                
-                async with aiohttp.ClientSession(
-                    timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT)
-                ) as session:
-                    
-                    payload = {
-                        "jsonrpc": "2.0",
-                        "id": 1, 
-                        "method": method,
-                        "params": params
-                    }
-                    
-                    async with session.post(endpoint, json=payload) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            if 'result' in data:
-                                self.stats['successful'] += 1
-                                return data['result']
-                            
-            except Exception as e:
-                self.logger.debug(f"RPC call failed: {e}")
-                continue
-        
-        self.stats['failed'] += 1
-        return None
+        self.stats['rpc_calls'] += 1
+        result = await self.rpc_client.call(method, params)
+        
+        if result is not None:
+            self.stats['successful'] += 1
+        else:
+            self.stats['failed'] += 1
+        return result
     
-    async def get_account_info(self, address: str) -> Optional[Dict]:
-        """Get account info from Solana RPC"""
+    def _cached_account(self, address: str) -> Optional[Dict]:
+        """Get a cached account response if still fresh"""
         
-        # Check cache
         if address in self.cache_times:
             if time.time() - self.cache_times[address] < self.CACHE_TTL:
                 self.stats['cache_hits'] += 1
                 return self.pool_cache.get(address)
+        return None
+    
+    async def get_account_info(self, address: str) -> Optional[Dict]:
+        """Get account info from Solana RPC"""
+        
+        # Check cache
+        cached = self._cached_account(address)
+        if cached is not None:
+            return cached
         
         result = await self._rpc_call("getAccountInfo", [
             address,
@@ -111,6 +104,40 @@ class AccurateSolBondingAnalyzer:
             
         return result
     
+    async def get_multiple_account_info(self, addresses: List[str]) -> Dict[str, Dict]:
+        """
+        Get account info for many addresses with batched getMultipleAccounts calls.
+        
+        Results have the getAccountInfo shape and are cached like it, so later
+        get_account_info calls for these addresses are cache hits.
+        """
+        
+        accounts = {}
+        missing = []
+        for address in dict.fromkeys(addresses):
+            cached = self._cached_account(address)
+            if cached is not None:
+                accounts[address] = cached
+            elif address:
+                missing.append(address)
+        
+        if missing:
+            self.stats['rpc_calls'] += 1
+            fetched = await self.rpc_client.get_multiple_accounts(missing)
+            self.stats['accounts_batched'] += len(fetched)
+            if fetched:
+                self.stats['successful'] += 1
+            else:
+                self.stats['failed'] += 1
+            
+            now = time.time()
+            for address, result in fetched.items():
+                self.pool_cache[address] = result
+                self.cache_times[address] = now
+                accounts[address] = result
+        
+        return accounts
+    
     async def get_token_account_balance(self, token_account: str) -> float:
         """Get precise token account balance"""
         
@@ -273,19 +300,21 @@ class AccurateSolBondingAnalyzer:
             return base_estimate
     
     async def analyze_multiple_pools(self, pools: List[Dict]) -> List[Dict]:
-        """Analyze multiple pools with controlled concurrency"""
+        """Analyze multiple pools from one batched account prefetch"""
         
         self.logger.info(f"🔍 Analyzing {len(pools)} pools with accurate RPC queries...")
         start_time = time.time()
         
-        # Limit concurrency to avoid rate limits
+        # Fetch every pool account up front in batched calls; per-pool analysis then hits the cache
+        await self.get_multiple_account_info([pool.get('pool_id', '') for pool in pools])
+        
+        # Still limit concurrency: if the prefetch failed every pool falls back to its own RPC call
         semaphore = asyncio.Semaphore(self.MAX_CONCURRENT)
         
         async def analyze_with_limit(pool: Dict):
             async with semaphore:
                 return await self.analyze_pool_accurate(pool)
         
-        # Execute analyses in parallel (but limited)
         tasks = [analyze_with_limit(pool) for pool in pools]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
@@ -312,6 +341,8 @@ class AccurateSolBondingAnalyzer:
             'successful_queries': self.stats['successful'],
             'failed_queries': self.stats['failed'],
             'cache_hits': self.stats['cache_hits'],
+            'accounts_batched': self.stats['accounts_batched'],
+            'rpc_client': self.rpc_client.get_stats(),
             'avg_analysis_time': avg_time,
             'total_time': self.stats['total_time'],
             'success_rate_pct': success_rate,
@@ -7,9 +7,9 @@ Improves API request pacing and reduces rate limit hits
 import time
 import logging
 import asyncio
-from typing import Dict, Optional, List
-from dataclasses import dataclass
-from collections import defaultdict, deque
+from typing import Any, Dict, Optional, List
+from dataclasses import dataclass, field
+from collections import defaultdict, deque, OrderedDict
 
 logger = logging.getLogger(__name__)
 
@@ -237,28 +237,143 @@ class AdaptiveRateLimiter:
             logger.info(f"🔄 {domain}: Rate limiter state reset")
 
 
+@dataclass
+class TokenAvailabilityProfile:
+    """Known OHLCV data availability for a single token"""
+    first_trade_time: Optional[float] = None
+    last_trade_time: Optional[float] = None
+    # Resolution -> whether the last OHLCV request at that resolution returned candles
+    candles_by_resolution: Dict[str, bool] = field(default_factory=dict)
+    last_check_time: float = 0.0
+    skip_ohlcv: bool = True
+    reason: str = "unknown"
+    probe_result: Optional[Dict[str, Any]] = None
+
+    def has_candles(self) -> bool:
+        return any(self.candles_by_resolution.values())
+
+
 class DataAvailabilityChecker:
     """
     Quick data availability check to avoid expensive OHLCV calls on tokens without data.
+    
+    Keeps a per-token availability profile that is reused across timeframes and
+    cycles and refreshed passively from OHLCV responses (``record_ohlcv_result``),
+    so the trade/metadata/price probes only run for tokens we know nothing about.
     """
     
-    def __init__(self, birdeye_api, cache_manager):
+    def __init__(
+        self,
+        birdeye_api,
+        cache_manager,
+        positive_ttl: int = 1800,
+        negative_ttl: int = 300,
+        max_profiles: int = 5000
+    ):
         self.birdeye_api = birdeye_api
         self.cache_manager = cache_manager
         self.logger = logging.getLogger(__name__)
+        
+        # Tokens known to have candles stay trusted longer than tokens without data
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.max_profiles = max_profiles
+        self.profiles: "OrderedDict[str, TokenAvailabilityProfile]" = OrderedDict()
+        self.stats = {
+            "profile_hits": 0,
+            "probes": 0,
+            "passive_updates": 0,
+            "evictions": 0
+        }
+    
+    def get_profile(self, token_address: str) -> Optional[TokenAvailabilityProfile]:
+        """Get the availability profile for a token, if one is known"""
+        profile = self.profiles.get(token_address)
+        if profile is not None:
+            self.profiles.move_to_end(token_address)
+        return profile
+    
+    def _get_or_create_profile(self, token_address: str) -> TokenAvailabilityProfile:
+        profile = self.get_profile(token_address)
+        if profile is None:
+            profile = TokenAvailabilityProfile()
+            self.profiles[token_address] = profile
+            while len(self.profiles) > self.max_profiles:
+                self.profiles.popitem(last=False)
+                self.stats["evictions"] += 1
+        return profile
+    
+    def _profile_is_fresh(self, profile: TokenAvailabilityProfile, now: float) -> bool:
+        ttl = self.positive_ttl if profile.has_candles() else self.negative_ttl
+        return now - profile.last_check_time < ttl
+    
+    def _profile_result(self, profile: TokenAvailabilityProfile, time_frame: Optional[str] = None) -> Dict[str, Any]:
+        """Build a check_data_availability result from a known profile"""
+        result = dict(profile.probe_result or {})
+        result.update({
+            "skip_ohlcv": profile.skip_ohlcv,
+            "reason": profile.reason,
+            "first_trade_time": profile.first_trade_time,
+            "last_trade_time": profile.last_trade_time,
+            "candles_by_resolution": dict(profile.candles_by_resolution)
+        })
+        # A resolution recently seen empty is skipped without another OHLCV request
+        if time_frame and profile.candles_by_resolution.get(time_frame) is False:
+            result["skip_ohlcv"] = True
+            result["reason"] = f"no_candles_at_{time_frame}"
+        return result
     
-    async def check_data_availability(self, token_address: str) -> Dict[str, any]:
+    def record_ohlcv_result(self, token_address: str, time_frame: str, candles: Optional[List[Dict[str, Any]]]) -> None:
+        """
+        Passively update a token's profile from an OHLCV response.
+        
+        Args:
+            token_address: Token address
+            time_frame: Resolution the candles were requested at
+            candles: Candles returned (empty or None when no data)
+        """
+        profile = self._get_or_create_profile(token_address)
+        now = time.time()
+        profile.candles_by_resolution[time_frame] = bool(candles)
+        profile.last_check_time = now
+        self.stats["passive_updates"] += 1
+        
+        if not candles:
+            return
+        
+        candle_times = []
+        for candle in candles:
+            if isinstance(candle, dict):
+                candle_time = candle.get("unix_time", candle.get("unixTime"))
+                if candle_time:
+                    candle_times.append(candle_time)
+        if candle_times:
+            first_seen, last_seen = min(candle_times), max(candle_times)
+            if profile.first_trade_time is None or first_seen < profile.first_trade_time:
+                profile.first_trade_time = first_seen
+            if profile.last_trade_time is None or last_seen > profile.last_trade_time:
+                profile.last_trade_time = last_seen
+        profile.skip_ohlcv = False
+        profile.reason = "candles_available"
+    
+    async def check_data_availability(self, token_address: str, time_frame: Optional[str] = None) -> Dict[str, any]:
         """
         Quick check for token data availability before expensive OHLCV calls.
         
+        Args:
+            token_address: Token address
+            time_frame: Optional resolution about to be requested
+        
         Returns:
             Dict with availability info and metadata
         """
-        cache_key = f"data_availability_{token_address}"
-        cached_result = self.cache_manager.get(cache_key)
-        if cached_result:
-            return cached_result
+        now = time.time()
+        profile = self.get_profile(token_address)
+        if profile is not None and self._profile_is_fresh(profile, now):
+            self.stats["profile_hits"] += 1
+            return self._profile_result(profile, time_frame)
         
+        self.stats["probes"] += 1
         result = {
             "has_recent_trades": False,
             "has_sufficient_volume": False,
@@ -302,9 +417,19 @@ class DataAvailabilityChecker:
             self.logger.debug(f"Data availability check failed for {token_address}: {e}")
             result["reason"] = "check_failed"
         
-        # Cache result for 5 minutes
-        self.cache_manager.set(cache_key, result, ttl=300)
-        return result
+        profile = self._get_or_create_profile(token_address)
+        profile.probe_result = result
+        profile.last_check_time = now
+        if not profile.has_candles():
+            profile.skip_ohlcv = result["skip_ohlcv"]
+            profile.reason = result["reason"]
+        if result.get("last_trade_time"):
+            profile.last_trade_time = max(profile.last_trade_time or 0, result["last_trade_time"])
+        return self._profile_result(profile, time_frame)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get profile cache statistics"""
+        return {**self.stats, "profiles": len(self.profiles)}
     
     async def _check_recent_trades(self, token_address: str) -> Optional[Dict]:
         """Check for recent trades using lightweight endpoint"""
@@ -0,0 +1,189 @@
+"""
+Memoization registry for pure token analyzers.
+
+Discovery re-runs the same analyzers every cycle, mostly on tokens whose data
+has not changed since the last cycle. An analyzer registered here declares the
+input fields it reads; its results are memoized per analyzer instance under a
+fingerprint of those fields (plus any other arguments), so an unchanged token
+returns the previous result without re-analysis.
+
+Registered analyzers must be pure in the declared fields. Analyzers that also
+depend on the clock (e.g. token age) declare a TTL. Memoized results are
+shared between callers and must be treated as read-only.
+"""
+
+import time
+import asyncio
+import functools
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable, order-preserving form of a field value"""
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+@dataclass
+class AnalyzerSpec:
+    """Declared inputs and cache policy of a registered analyzer"""
+    name: str
+    fields: Tuple[str, ...]
+    ttl_seconds: Optional[float] = None
+    max_entries: int = 10000
+
+    def fingerprint(self, data: Any) -> Hashable:
+        if not isinstance(data, dict):
+            return _freeze(data)
+        return tuple(_freeze(data.get(field, _MISSING)) for field in self.fields)
+
+
+class AnalyzerRegistry:
+    """Registered analyzers with per-instance LRU result memos (thread-safe)"""
+
+    def __init__(self):
+        self._specs: Dict[str, AnalyzerSpec] = {}
+        # Analyzer name -> analyzer instance -> fingerprint -> (stored_at, result)
+        self._memos: Dict[str, "weakref.WeakKeyDictionary[Any, OrderedDict]"] = {}
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def register(self, spec: AnalyzerSpec) -> AnalyzerSpec:
+        with self._lock:
+            self._specs[spec.name] = spec
+            self._memos.setdefault(spec.name, weakref.WeakKeyDictionary())
+            self.stats.setdefault(spec.name, {'hits': 0, 'misses': 0, 'evictions': 0})
+        return spec
+
+    def get_spec(self, name: str) -> Optional[AnalyzerSpec]:
+        return self._specs.get(name)
+
+    def lookup(self, spec: AnalyzerSpec, owner: Any, key: Hashable) -> Any:
+        """Memoized result, or ``_MISSING``"""
+        with self._lock:
+            memo = self._memos[spec.name].get(owner)
+            entry = memo.get(key, _MISSING) if memo is not None else _MISSING
+            if entry is not _MISSING:
+                stored_at, result = entry
+                if spec.ttl_seconds is None or time.time() - stored_at < spec.ttl_seconds:
+                    memo.move_to_end(key)
+                    self.stats[spec.name]['hits'] += 1
+                    return result
+                del memo[key]
+            self.stats[spec.name]['misses'] += 1
+            return _MISSING
+
+    def store(self, spec: AnalyzerSpec, owner: Any, key: Hashable, result: Any) -> None:
+        with self._lock:
+            memo = self._memos[spec.name].get(owner)
+            if memo is None:
+                memo = OrderedDict()
+                self._memos[spec.name][owner] = memo
+            memo[key] = (time.time(), result)
+            memo.move_to_end(key)
+            while len(memo) > spec.max_entries:
+                memo.popitem(last=False)
+                self.stats[spec.name]['evictions'] += 1
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop memoized results of one analyzer (all when None)"""
+        with self._lock:
+            for analyzer_name, memos in self._memos.items():
+                if name is None or analyzer_name == name:
+                    memos.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-analyzer hit/miss statistics"""
+        with self._lock:
+            stats = {}
+            for name, counters in self.stats.items():
+                lookups = counters['hits'] + counters['misses']
+                stats[name] = {
+                    **counters,
+                    'fields': list(self._specs[name].fields),
+                    'cached_results': sum(len(memo) for memo in self._memos[name].values()),
+                    'hit_rate': counters['hits'] / lookups if lookups else 0.0
+                }
+            return stats
+
+
+_registry = AnalyzerRegistry()
+
+
+def get_analyzer_registry() -> AnalyzerRegistry:
+    """Get the process-wide analyzer registry"""
+    return _registry
+
+
+def memoized_analyzer(name: str, fields: Tuple[str, ...], data_arg: int = 0,
+                      ttl_seconds: Optional[float] = None, max_entries: int = 10000) -> Callable:
+    """
+    Register an analyzer method and memoize it by a fingerprint of the fields it reads.
+
+    Args:
+        name: Registry name of the analyzer
+        fields: Keys of the data dict the analyzer reads
+        data_arg: Position of the data dict among the method's arguments (after self)
+        ttl_seconds: Expire memoized results after this long (for clock-dependent analyzers)
+        max_entries: Results kept per analyzer instance (least recently used are evicted)
+
+    Works for both plain and ``async`` methods. Other positional arguments
+    must be hashable and become part of the memo key.
+    """
+    spec = _registry.register(AnalyzerSpec(name, tuple(fields), ttl_seconds, max_entries))
+
+    def make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[Hashable]:
+        """Memo key, or None when the call cannot be keyed (it then runs uncached)"""
+        if len(args) <= data_arg:
+            return None
+        key = (args[:data_arg] + args[data_arg + 1:], tuple(sorted(kwargs.items())), spec.fingerprint(args[data_arg]))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def decorator(method: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                key = make_key(args, kwargs)
+                if key is None:
+                    return await method(self, *args, **kwargs)
+                result = _registry.lookup(spec, self, key)
+                if result is _MISSING:
+                    result = await method(self, *args, **kwargs)
+                    _registry.store(spec, self, key, result)
+                return result
+            async_wrapper.analyzer_spec = spec
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = make_key(args, kwargs)
+            if key is None:
+                return method(self, *args, **kwargs)
+            result = _registry.lookup(spec, self, key)
+            if result is _MISSING:
+                result = method(self, *args, **kwargs)
+                _registry.store(spec, self, key, result)
+            return result
+        wrapper.analyzer_spec = spec
+        return wrapper
+
+    return decorator
@@ -9,6 +9,8 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import asyncio
 
+from services.bonding_curve_progression import ProgressionTracker
+
 class BondingCurveAnalyzer:
     """Analyzes pump.fun bonding curve progression for optimal entry/exit timing"""
     
@@ -19,8 +21,8 @@ class BondingCurveAnalyzer:
         self.GRADUATION_THRESHOLD = 69000  # $69K market cap for Raydium graduation
         self.SUPPLY_BURN_AMOUNT = 12000    # $12K worth of supply burned at graduation
         
-        # Bonding curve velocity tracking
-        self.token_progressions = {}  # Track market cap over time for each token
+        # Bonding curve velocity tracking: bounded ring buffer per token, inactive/graduated tokens evicted
+        self.token_progressions = ProgressionTracker(capacity=100, graduation_threshold=self.GRADUATION_THRESHOLD)
         
         # Graduation prediction thresholds
         self.GRADUATION_WARNING_THRESHOLD = 55000   # 80% toward graduation
@@ -40,97 +42,50 @@ class BondingCurveAnalyzer:
             self.logger.warning(f"Invalid market_cap value for {token_address}: {current_market_cap}")
             current_market_cap = 0.0
         
-        if token_address not in self.token_progressions:
-            self.token_progressions[token_address] = []
-        
-        self.token_progressions[token_address].append({
-            'timestamp': timestamp,
-            'market_cap': current_market_cap,
-            'graduation_progress': (current_market_cap / self.GRADUATION_THRESHOLD) * 100
-        })
-        
-        # Keep only last 100 data points per token
-        if len(self.token_progressions[token_address]) > 100:
-            self.token_progressions[token_address] = self.token_progressions[token_address][-100:]
+        # Ring buffer keeps the last 100 data points per token
+        self.token_progressions.track(token_address, timestamp, current_market_cap)
     
     def calculate_bonding_curve_velocity(self, token_address: str, hours_lookback: float = 1.0) -> Dict:
         """Calculate how fast a token is moving up the bonding curve"""
-        if token_address not in self.token_progressions:
+        progression = self.token_progressions.get(token_address)
+        if progression is None or len(progression) < 2:
             return {'velocity_per_hour': 0, 'acceleration': 0, 'confidence': 0}
         
-        progression_data = self.token_progressions[token_address]
-        if len(progression_data) < 2:
-            return {'velocity_per_hour': 0, 'acceleration': 0, 'confidence': 0}
-        
-        # Filter to lookback period
-        cutoff_time = time.time() - (hours_lookback * 3600)
-        recent_data = [p for p in progression_data if p['timestamp'] >= cutoff_time]
-        
-        if len(recent_data) < 2:
-            recent_data = progression_data[-2:]  # Use last 2 points
-        
-        # Calculate velocity (market cap growth per hour)
-        time_span_hours = (recent_data[-1]['timestamp'] - recent_data[0]['timestamp']) / 3600
-        if time_span_hours == 0:
-            time_span_hours = 0.1  # Prevent division by zero
+        # Least-squares fit over the lookback period (last 2 points if fewer fall inside it)
+        fit = progression.fit(since=time.time() - (hours_lookback * 3600))
         
-        market_cap_change = recent_data[-1]['market_cap'] - recent_data[0]['market_cap']
-        velocity_per_hour = market_cap_change / time_span_hours
-        
-        # Calculate acceleration (change in velocity)
-        acceleration = 0
-        if len(recent_data) >= 3:
-            mid_point = len(recent_data) // 2
-            early_velocity = (recent_data[mid_point]['market_cap'] - recent_data[0]['market_cap']) / \
-                           ((recent_data[mid_point]['timestamp'] - recent_data[0]['timestamp']) / 3600)
-            late_velocity = (recent_data[-1]['market_cap'] - recent_data[mid_point]['market_cap']) / \
-                          ((recent_data[-1]['timestamp'] - recent_data[mid_point]['timestamp']) / 3600)
-            acceleration = late_velocity - early_velocity
-        
-        # Confidence based on data points and consistency
-        confidence = min(len(recent_data) / 10, 1.0)  # More data = higher confidence
+        # Confidence based on data points
+        confidence = min(fit.data_points / 10, 1.0)  # More data = higher confidence
         
         return {
-            'velocity_per_hour': velocity_per_hour,
-            'acceleration': acceleration,
+            'velocity_per_hour': fit.velocity_per_hour,
+            'acceleration': fit.acceleration,
+            'current_velocity_per_hour': fit.current_velocity_per_hour,
             'confidence': confidence,
-            'data_points': len(recent_data),
-            'time_span_hours': time_span_hours
+            'data_points': fit.data_points,
+            'time_span_hours': fit.time_span_hours
         }
     
     def predict_graduation_timing(self, token_address: str) -> Dict:
         """Predict when a token will reach $69K graduation threshold"""
-        if token_address not in self.token_progressions:
-            return {'predicted_hours': None, 'confidence': 0, 'likelihood': 'UNKNOWN'}
-        
-        progression_data = self.token_progressions[token_address]
-        if not progression_data:
+        progression = self.token_progressions.get(token_address)
+        if progression is None or not len(progression):
             return {'predicted_hours': None, 'confidence': 0, 'likelihood': 'UNKNOWN'}
         
-        current_market_cap = progression_data[-1]['market_cap']
+        _, current_market_cap = progression.latest()
         remaining_to_graduation = self.GRADUATION_THRESHOLD - current_market_cap
         
         if remaining_to_graduation <= 0:
             return {'predicted_hours': 0, 'confidence': 1.0, 'likelihood': 'GRADUATED'}
         
-        # Get velocity analysis
-        velocity_data = self.calculate_bonding_curve_velocity(token_address, hours_lookback=2.0)
-        velocity_per_hour = velocity_data['velocity_per_hour']
+        # Fit over the last 2 hours
+        fit = progression.fit(since=time.time() - 2.0 * 3600)
         
-        if velocity_per_hour <= 0:
+        # Predict graduation time by following the fitted curve (acceleration included)
+        predicted_hours = fit.hours_to_reach(remaining_to_graduation) if fit else None
+        if predicted_hours is None:
             return {'predicted_hours': float('inf'), 'confidence': 0, 'likelihood': 'STALLED'}
         
-        # Predict graduation time based on current velocity
-        predicted_hours = remaining_to_graduation / velocity_per_hour
-        
-        # Factor in acceleration for more accurate prediction
-        if velocity_data['acceleration'] > 0:
-            # Accelerating - graduation will come faster
-            predicted_hours *= 0.8
-        elif velocity_data['acceleration'] < 0:
-            # Decelerating - graduation will take longer
-            predicted_hours *= 1.2
-        
         # Determine likelihood
         if predicted_hours <= 6:
             likelihood = 'IMMINENT'
@@ -143,11 +98,11 @@ class BondingCurveAnalyzer:
         
         return {
             'predicted_hours': predicted_hours,
-            'confidence': velocity_data['confidence'],
+            'confidence': min(fit.data_points / 10, 1.0),
             'likelihood': likelihood,
             'current_market_cap': current_market_cap,
             'remaining_to_graduation': remaining_to_graduation,
-            'velocity_per_hour': velocity_per_hour
+            'velocity_per_hour': fit.velocity_per_hour
         }
     
     def get_bonding_curve_stage(self, market_cap: float) -> Dict:
@@ -290,14 +245,15 @@ class BondingCurveAnalyzer:
     
     def get_analytics_summary(self, token_address: str) -> Dict:
         """Get comprehensive bonding curve analytics for a token"""
-        if token_address not in self.token_progressions:
+        progression = self.token_progressions.get(token_address)
+        if progression is None:
             return {'error': 'Token not being tracked'}
         
-        progression_data = self.token_progressions[token_address]
-        if not progression_data:
+        if not len(progression):
             return {'error': 'No progression data available'}
         
-        current_market_cap = progression_data[-1]['market_cap']
+        first_timestamp, first_market_cap = progression.oldest()
+        last_timestamp, current_market_cap = progression.latest()
         
         # Get all analyses
         stage_info = self.get_bonding_curve_stage(current_market_cap)
@@ -305,9 +261,9 @@ class BondingCurveAnalyzer:
         graduation_prediction = self.predict_graduation_timing(token_address)
         
         # Calculate total progression
-        if len(progression_data) > 1:
-            total_growth = current_market_cap - progression_data[0]['market_cap']
-            total_growth_pct = (total_growth / progression_data[0]['market_cap']) * 100 if progression_data[0]['market_cap'] > 0 else 0
+        if len(progression) > 1:
+            total_growth = current_market_cap - first_market_cap
+            total_growth_pct = (total_growth / first_market_cap) * 100 if first_market_cap > 0 else 0
         else:
             total_growth = 0
             total_growth_pct = 0
@@ -321,8 +277,8 @@ class BondingCurveAnalyzer:
             'progression_stats': {
                 'total_growth_dollars': total_growth,
                 'total_growth_percent': total_growth_pct,
-                'data_points_tracked': len(progression_data),
-                'tracking_duration_hours': (progression_data[-1]['timestamp'] - progression_data[0]['timestamp']) / 3600
+                'data_points_tracked': len(progression),
+                'tracking_duration_hours': (last_timestamp - first_timestamp) / 3600
             },
             'alerts': self.generate_graduation_alerts(token_address, current_market_cap)
         } 
\ No newline at end of file
@@ -0,0 +1,291 @@
+"""
+Bounded bonding-curve progression tracking.
+
+Each tracked token keeps its market-cap observations in a fixed-capacity
+numpy ring buffer together with the power sums a least-squares fit needs
+(sum of x, x^2, x^3, x^4, y, xy, x^2y with x in hours). Appending updates the
+sums in constant time, so velocity (linear fit slope), acceleration (quadratic
+fit curvature) and graduation ETA are read in closed form without rebuilding
+lists. The sums are recomputed exactly from the buffer each time it wraps,
+which bounds floating-point drift at amortized O(1) cost.
+
+``ProgressionTracker`` owns the buffers and evicts tokens that stopped
+updating or graduated, so monitoring thousands of tokens stays bounded.
+"""
+
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterator, Optional, Set, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ProgressionFit:
+    """Least-squares fit of market cap against time (hours)"""
+    data_points: int
+    time_span_hours: float
+    velocity_per_hour: float          # Linear fit slope
+    acceleration: float               # Quadratic fit second derivative ($/hour^2)
+    current_velocity_per_hour: float  # Quadratic fit slope at the latest observation
+
+    def hours_to_reach(self, remaining: float) -> Optional[float]:
+        """
+        Hours until the market cap grows by ``remaining`` following the fitted curve.
+
+        Uses the quadratic fit anchored at the latest observation, falling back
+        to the linear slope when the curve never gets there; None if neither does.
+        """
+        half_acceleration = self.acceleration / 2
+        velocity = self.current_velocity_per_hour
+        discriminant = velocity * velocity + 4 * half_acceleration * remaining
+        if discriminant >= 0 and (velocity != 0 or half_acceleration != 0):
+            # Roots of half_acceleration*t^2 + velocity*t - remaining, in the cancellation-free form
+            q = -(velocity + (discriminant ** 0.5 if velocity >= 0 else -discriminant ** 0.5)) / 2
+            roots = [-remaining / q if q else None, q / half_acceleration if half_acceleration else None]
+            positive = [root for root in roots if root is not None and root > 0]
+            if positive:
+                return min(positive)
+        if self.velocity_per_hour > 0:
+            return remaining / self.velocity_per_hour
+        return None
+
+
+class ProgressionBuffer:
+    """Fixed-capacity ring buffer of (timestamp, market cap) with incremental fit sums"""
+
+    __slots__ = ("capacity", "timestamps", "market_caps", "count", "_next", "_origin", "_sums", "_appends_since_rebuild")
+
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.market_caps = np.zeros(capacity, dtype=np.float64)
+        self.count = 0
+        self._next = 0
+        self._origin = 0.0
+        # [n, Sx, Sx2, Sx3, Sx4, Sy, Sxy, Sx2y]
+        self._sums = np.zeros(8, dtype=np.float64)
+        self._appends_since_rebuild = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    @staticmethod
+    def _terms(x: float, y: float) -> np.ndarray:
+        x2 = x * x
+        return np.array((1.0, x, x2, x2 * x, x2 * x2, y, x * y, x2 * y))
+
+    def append(self, timestamp: float, market_cap: float) -> None:
+        """Add an observation, overwriting the oldest once full (O(1))"""
+        if self.count == 0:
+            self._origin = timestamp
+        if self.count == self.capacity:
+            oldest = self._next
+            self._sums -= self._terms((self.timestamps[oldest] - self._origin) / 3600, self.market_caps[oldest])
+        else:
+            self.count += 1
+
+        self.timestamps[self._next] = timestamp
+        self.market_caps[self._next] = market_cap
+        self._next = (self._next + 1) % self.capacity
+        self._sums += self._terms((timestamp - self._origin) / 3600, market_cap)
+
+        self._appends_since_rebuild += 1
+        if self._appends_since_rebuild >= self.capacity:
+            self._rebuild_sums()
+
+    def _ordered(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Observations oldest first"""
+        if self.count < self.capacity:
+            return self.timestamps[:self.count], self.market_caps[:self.count]
+        order = np.r_[self._next:self.capacity, 0:self._next]
+        return self.timestamps[order], self.market_caps[order]
+
+    def _rebuild_sums(self) -> None:
+        """Recompute the sums exactly, re-based on the oldest observation"""
+        timestamps, market_caps = self._ordered()
+        self._origin = float(timestamps[0])
+        self._sums = self._power_sums((timestamps - self._origin) / 3600, market_caps)
+        self._appends_since_rebuild = 0
+
+    @staticmethod
+    def _power_sums(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        x2 = x * x
+        return np.array((len(x), x.sum(), x2.sum(), (x2 * x).sum(), (x2 * x2).sum(),
+                         y.sum(), (x * y).sum(), (x2 * y).sum()), dtype=np.float64)
+
+    def latest(self) -> Tuple[float, float]:
+        """(timestamp, market cap) of the newest observation"""
+        index = (self._next - 1) % self.capacity
+        return float(self.timestamps[index]), float(self.market_caps[index])
+
+    def oldest(self) -> Tuple[float, float]:
+        """(timestamp, market cap) of the oldest observation kept"""
+        index = self._next if self.count == self.capacity else 0
+        return float(self.timestamps[index]), float(self.market_caps[index])
+
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        timestamps, market_caps = self._ordered()
+        return iter(zip(timestamps.tolist(), market_caps.tolist()))
+
+    def fit(self, since: Optional[float] = None) -> Optional[ProgressionFit]:
+        """
+        Fit the observations at or after ``since`` (all when None).
+
+        The running sums are used when the whole buffer is inside the window;
+        otherwise the window's suffix (at most ``capacity`` points) is summed
+        directly. Falls back to the last two observations when fewer than two
+        fall inside the window.
+
+        Returns:
+            Fit, or None with fewer than two observations
+        """
+        if self.count < 2:
+            return None
+        oldest_time, _ = self.oldest()
+        if since is None or oldest_time >= since:
+            sums, origin = self._sums, self._origin
+            first_time = oldest_time
+        else:
+            timestamps, market_caps = self._ordered()
+            start = int(np.searchsorted(timestamps, since, side="left"))
+            start = min(start, self.count - 2)
+            origin = float(timestamps[start])
+            sums = self._power_sums((timestamps[start:] - origin) / 3600, market_caps[start:])
+            first_time = origin
+        latest_time, _ = self.latest()
+        return self._solve(sums, (latest_time - origin) / 3600, (latest_time - first_time) / 3600)
+
+    @staticmethod
+    def _solve(sums: np.ndarray, latest_x: float, time_span_hours: float) -> ProgressionFit:
+        n, sx, sx2, sx3, sx4, sy, sxy, sx2y = sums
+        velocity = 0.0
+        denominator = n * sx2 - sx * sx
+        if denominator > 1e-12:
+            velocity = (n * sxy - sx * sy) / denominator
+
+        acceleration = 0.0
+        current_velocity = velocity
+        if n >= 3:
+            normal = np.array(((sx4, sx3, sx2), (sx3, sx2, sx), (sx2, sx, n)))
+            # Conditioning rather than the determinant: short time spans make every entry tiny
+            if np.linalg.cond(normal) < 1e12:
+                a, b, _ = np.linalg.solve(normal, np.array((sx2y, sxy, sy)))
+                # Curvature that moves the fitted curve by less than rounding error over the span is noise
+                if abs(a) * max(time_span_hours, 1.0) ** 2 < 1e-9 * (abs(sy) / n + 1):
+                    a, b = 0.0, velocity
+                acceleration = 2 * a
+                current_velocity = 2 * a * latest_x + b
+
+        return ProgressionFit(
+            data_points=int(round(n)),
+            time_span_hours=time_span_hours,
+            velocity_per_hour=float(velocity),
+            acceleration=float(acceleration),
+            current_velocity_per_hour=float(current_velocity)
+        )
+
+
+class ProgressionTracker:
+    """Per-token progression buffers with automatic eviction of inactive and graduated tokens"""
+
+    def __init__(
+        self,
+        capacity: int = 100,
+        max_tokens: int = 10000,
+        inactive_after_seconds: float = 6 * 3600,
+        graduated_grace_seconds: float = 600,
+        graduation_threshold: float = 69000
+    ):
+        """
+        Args:
+            capacity: Observations kept per token
+            max_tokens: Tokens tracked at most (least recently updated are evicted first)
+            inactive_after_seconds: Evict tokens without an update for this long
+            graduated_grace_seconds: Keep graduated tokens this long after graduating
+            graduation_threshold: Market cap at which a token graduates
+        """
+        self.capacity = capacity
+        self.max_tokens = max_tokens
+        self.inactive_after_seconds = inactive_after_seconds
+        self.graduated_grace_seconds = graduated_grace_seconds
+        self.graduation_threshold = graduation_threshold
+
+        # Least recently updated first, so inactive tokens are evicted from the front
+        self._buffers: "OrderedDict[str, ProgressionBuffer]" = OrderedDict()
+        self._last_update: Dict[str, float] = {}
+        self._graduated: Deque[Tuple[float, str]] = deque()
+        self._graduated_tokens: Set[str] = set()
+        self.stats = {
+            'evicted_inactive': 0,
+            'evicted_graduated': 0,
+            'evicted_capacity': 0
+        }
+
+    def __contains__(self, token_address: str) -> bool:
+        return token_address in self._buffers
+
+    def __getitem__(self, token_address: str) -> ProgressionBuffer:
+        return self._buffers[token_address]
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def get(self, token_address: str) -> Optional[ProgressionBuffer]:
+        return self._buffers.get(token_address)
+
+    def track(self, token_address: str, timestamp: float, market_cap: float, now: Optional[float] = None) -> ProgressionBuffer:
+        """Record an observation (O(1) amortized, including eviction)"""
+        now = now if now is not None else time.time()
+        buffer = self._buffers.get(token_address)
+        if buffer is None:
+            buffer = ProgressionBuffer(self.capacity)
+            self._buffers[token_address] = buffer
+        else:
+            self._buffers.move_to_end(token_address)
+        buffer.append(timestamp, market_cap)
+        self._last_update[token_address] = now
+
+        if market_cap >= self.graduation_threshold and token_address not in self._graduated_tokens:
+            self._graduated_tokens.add(token_address)
+            self._graduated.append((now, token_address))
+
+        self.evict(now)
+        return buffer
+
+    def evict(self, now: Optional[float] = None) -> int:
+        """Evict inactive, graduated and over-capacity tokens; returns how many were evicted"""
+        now = now if now is not None else time.time()
+        evicted = 0
+
+        # Least recently updated tokens sit at the front
+        while self._buffers:
+            token_address = next(iter(self._buffers))
+            if now - self._last_update[token_address] < self.inactive_after_seconds and len(self._buffers) <= self.max_tokens:
+                break
+            reason = 'evicted_capacity' if len(self._buffers) > self.max_tokens else 'evicted_inactive'
+            self._remove(token_address)
+            self.stats[reason] += 1
+            evicted += 1
+
+        while self._graduated and now - self._graduated[0][0] >= self.graduated_grace_seconds:
+            _, token_address = self._graduated.popleft()
+            if token_address in self._buffers:
+                self._remove(token_address)
+                self.stats['evicted_graduated'] += 1
+                evicted += 1
+            self._graduated_tokens.discard(token_address)
+        return evicted
+
+    def _remove(self, token_address: str) -> None:
+        self._buffers.pop(token_address, None)
+        self._last_update.pop(token_address, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tracker statistics"""
+        return {
+            **self.stats,
+            'tracked_tokens': len(self._buffers),
+            'graduated_pending_eviction': len(self._graduated_tokens)
+        }
@@ -11,11 +11,9 @@ import logging
 import time
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
-import json
-import os
 
+from core_local.cu_ledger import CULedger, get_shared_cu_ledger
 from services.telegram_alerter import TelegramAlerter
-from utils.structured_logger import get_structured_logger
 
 
 class CUBudgetMonitor:
@@ -28,21 +26,28 @@ class CUBudgetMonitor:
     - 95% threshold critical alerts
     - Hourly usage rate monitoring
     - Projected daily usage warnings
+    
+    Usage is read from the shared CU ledger, which the Birdeye cost calculator
+    records into automatically; thresholds are checked by the ledger's watcher.
     """
     
-    def __init__(self, daily_budget_cus: int = 100000, alert_enabled: bool = True):
+    def __init__(self, daily_budget_cus: int = 100000, alert_enabled: bool = True,
+                 provider: str = 'birdeye', ledger: Optional[CULedger] = None):
         """
         Initialize CU budget monitor.
         
         Args:
             daily_budget_cus: Daily CU budget limit
             alert_enabled: Whether to send alerts
+            provider: Ledger provider whose usage is budgeted
+            ledger: CU ledger (defaults to the process-wide ledger)
         """
         self.daily_budget_cus = daily_budget_cus
         self.alert_enabled = alert_enabled
+        self.provider = provider
+        self.ledger = ledger or get_shared_cu_ledger()
         
         self.logger = logging.getLogger(__name__)
-        self.structured_logger = get_structured_logger('CUBudgetMonitor')
         
         # Alert thresholds
         self.thresholds = {
@@ -51,21 +56,11 @@ class CUBudgetMonitor:
             'emergency': 1.0    # 100% threshold
         }
         
-        # Usage tracking
-        self.daily_usage = {
-            'date': datetime.now().strftime('%Y-%m-%d'),
-            'total_cus': 0,
-            'hourly_usage': {},
-            'alerts_sent': [],
-            'last_reset': time.time()
-        }
-        
-        # Alert cooldown (prevent spam)
-        self.alert_cooldown = {
-            'warning': 3600,    # 1 hour
-            'critical': 1800,   # 30 minutes
-            'emergency': 600    # 10 minutes
-        }
+        # Alerts sent today (the ledger fires each threshold level once per day)
+        self.alerts_sent: List[Dict[str, Any]] = []
+        self.ledger.set_budget(provider, daily_budget_cus, self.thresholds)
+        if alert_enabled:
+            self.ledger.add_alert_listener(self._on_threshold_crossed)
         
         # Telegram alerter for notifications
         self.telegram_alerter = None
@@ -77,113 +72,44 @@ class CUBudgetMonitor:
         
         self.logger.info(f"CU Budget Monitor initialized with daily budget: {daily_budget_cus:,} CUs")
     
+    @property
+    def daily_usage(self) -> Dict[str, Any]:
+        """Today's usage in the legacy tracking format"""
+        today = self.ledger.today
+        if self.alerts_sent and self.alerts_sent[-1]['date'] != today:
+            self.alerts_sent = []
+        return {
+            'date': today,
+            'total_cus': self.ledger.used_today(self.provider),
+            'hourly_usage': self.ledger.hourly_usage(self.provider),
+            'alerts_sent': self.alerts_sent
+        }
+    
     def add_cu_usage(self, cus_used: int, operation: str = "unknown", scan_id: Optional[str] = None):
         """
-        Add CU usage to daily tracking.
+        Add CU usage that no connector records into the ledger itself.
         
         Args:
             cus_used: Number of CUs used
             operation: Description of the operation
             scan_id: Optional scan identifier
         """
-        current_date = datetime.now().strftime('%Y-%m-%d')
-        current_hour = datetime.now().strftime('%Y-%m-%d %H')
-        
-        # Reset daily usage if new day
-        if current_date != self.daily_usage['date']:
-            self._reset_daily_usage(current_date)
-        
-        # Add to daily total
-        self.daily_usage['total_cus'] += cus_used
-        
-        # Add to hourly tracking
-        if current_hour not in self.daily_usage['hourly_usage']:
-            self.daily_usage['hourly_usage'][current_hour] = 0
-        self.daily_usage['hourly_usage'][current_hour] += cus_used
-        
-        # Log usage
-        self.structured_logger.info({
-            "event": "cu_usage_added",
-            "cus_used": cus_used,
-            "total_daily_cus": self.daily_usage['total_cus'],
-            "operation": operation,
-            "scan_id": scan_id,
-            "timestamp": int(time.time())
-        })
-        
-        # Check if we need to send alerts
-        asyncio.create_task(self._check_budget_alerts())
+        self.ledger.add(self.provider, cus_used, operation)
     
-    def _reset_daily_usage(self, new_date: str):
-        """Reset daily usage tracking for new day."""
-        self.logger.info(f"Resetting daily CU usage tracking for {new_date}")
-        
-        # Save previous day's data if needed
-        self._save_daily_usage_history()
-        
-        # Reset tracking
-        self.daily_usage = {
-            'date': new_date,
-            'total_cus': 0,
-            'hourly_usage': {},
-            'alerts_sent': [],
-            'last_reset': time.time()
-        }
-    
-    def _save_daily_usage_history(self):
-        """Save daily usage history to file."""
-        try:
-            history_dir = "data/cu_usage_history"
-            os.makedirs(history_dir, exist_ok=True)
-            
-            filename = f"{history_dir}/cu_usage_{self.daily_usage['date']}.json"
-            with open(filename, 'w') as f:
-                json.dump(self.daily_usage, f, indent=2)
-                
-            self.logger.info(f"Saved daily CU usage history to {filename}")
-        except Exception as e:
-            self.logger.error(f"Failed to save daily usage history: {e}")
-    
-    async def _check_budget_alerts(self):
-        """Check if budget alerts need to be sent."""
-        if not self.alert_enabled:
+    async def _on_threshold_crossed(self, provider: str, alert_level: str, status: Dict[str, Any]):
+        """Ledger listener: send and record a budget alert"""
+        if provider != self.provider or alert_level not in self.thresholds:
             return
         
-        usage_percentage = self.daily_usage['total_cus'] / self.daily_budget_cus
-        current_time = time.time()
+        await self._send_budget_alert(alert_level, status['usage_percentage'])
         
-        # Determine alert level
-        alert_level = None
-        if usage_percentage >= self.thresholds['emergency']:
-            alert_level = 'emergency'
-        elif usage_percentage >= self.thresholds['critical']:
-            alert_level = 'critical'
-        elif usage_percentage >= self.thresholds['warning']:
-            alert_level = 'warning'
-        
-        if alert_level:
-            # Check if we've already sent this alert recently
-            last_alert = self._get_last_alert_time(alert_level)
-            if current_time - last_alert < self.alert_cooldown[alert_level]:
-                return  # Still in cooldown
-            
-            # Send alert
-            await self._send_budget_alert(alert_level, usage_percentage)
-            
-            # Record alert
-            self.daily_usage['alerts_sent'].append({
-                'level': alert_level,
-                'timestamp': current_time,
-                'usage_percentage': usage_percentage,
-                'total_cus': self.daily_usage['total_cus']
-            })
-    
-    def _get_last_alert_time(self, alert_level: str) -> float:
-        """Get timestamp of last alert for given level."""
-        for alert in reversed(self.daily_usage['alerts_sent']):
-            if alert['level'] == alert_level:
-                return alert['timestamp']
-        return 0.0  # No previous alert
+        self.alerts_sent.append({
+            'level': alert_level,
+            'date': status['date'],
+            'timestamp': status['timestamp'],
+            'usage_percentage': status['usage_percentage'],
+            'total_cus': status['used']
+        })
     
     async def _send_budget_alert(self, alert_level: str, usage_percentage: float):
         """Send budget alert via Telegram and logging."""
@@ -230,9 +156,11 @@ class CUBudgetMonitor:
             except Exception as e:
                 self.logger.error(f"Failed to send Telegram budget alert: {e}")
     
-    def _calculate_projected_daily_usage(self) -> Optional[int]:
+    def _calculate_projected_daily_usage(self, hourly_usage: Optional[Dict[str, int]] = None) -> Optional[int]:
         """Calculate projected daily usage based on current hourly rate."""
-        if not self.daily_usage['hourly_usage']:
+        if hourly_usage is None:
+            hourly_usage = self.daily_usage['hourly_usage']
+        if not hourly_usage:
             return None
         
         current_hour = datetime.now().hour
@@ -240,8 +168,8 @@ class CUBudgetMonitor:
             return None  # Too early to project
         
         # Calculate average hourly usage
-        total_hourly_usage = sum(self.daily_usage['hourly_usage'].values())
-        hours_elapsed = len(self.daily_usage['hourly_usage'])
+        total_hourly_usage = sum(hourly_usage.values())
+        hours_elapsed = len(hourly_usage)
         
         if hours_elapsed == 0:
             return None
@@ -253,20 +181,21 @@ class CUBudgetMonitor:
     
     def get_budget_status(self) -> Dict[str, Any]:
         """Get current budget status."""
-        usage_percentage = self.daily_usage['total_cus'] / self.daily_budget_cus
-        projected_usage = self._calculate_projected_daily_usage()
+        daily_usage = self.daily_usage
+        usage_percentage = daily_usage['total_cus'] / self.daily_budget_cus
+        projected_usage = self._calculate_projected_daily_usage(daily_usage['hourly_usage'])
         
         return {
-            'date': self.daily_usage['date'],
+            'date': daily_usage['date'],
             'daily_budget_cus': self.daily_budget_cus,
-            'total_cus_used': self.daily_usage['total_cus'],
-            'cus_remaining': self.daily_budget_cus - self.daily_usage['total_cus'],
+            'total_cus_used': daily_usage['total_cus'],
+            'cus_remaining': self.daily_budget_cus - daily_usage['total_cus'],
             'usage_percentage': usage_percentage,
             'projected_daily_usage': projected_usage,
             'projected_percentage': projected_usage / self.daily_budget_cus if projected_usage else None,
             'alert_level': self._get_current_alert_level(usage_percentage),
-            'hourly_usage': self.daily_usage['hourly_usage'],
-            'alerts_sent_today': len(self.daily_usage['alerts_sent'])
+            'hourly_usage': daily_usage['hourly_usage'],
+            'alerts_sent_today': len(daily_usage['alerts_sent'])
         }
     
     def _get_current_alert_level(self, usage_percentage: float) -> Optional[str]:
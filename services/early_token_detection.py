@@ -28,7 +28,7 @@ from services.rate_limiter_service import RateLimiterService
 from services.logger_setup import LoggerSetup
 from services.short_timeframe_analyzer import ShortTimeframeAnalyzer
 from core.config_manager import ConfigManager
-from services.pump_dump_detector import EnhancedPumpDumpDetector
+from services.pump_dump_detector import EnhancedPumpDumpDetector, PumpDumpResult
 from services.relative_strength_analyzer import RelativeStrengthAnalyzer
 from services.strategic_coordination_analyzer import StrategicCoordinationAnalyzer
 from services.trend_confirmation_analyzer import TrendConfirmationAnalyzer
@@ -1096,20 +1096,30 @@ class EarlyTokenDetector:
             # Use ultra-batch complete analysis (2-3 API calls vs 10-20 per token)
             ultra_batch_data = await self.batch_manager.ultra_batch_complete_analysis(token_addresses)
             
-            # Build comprehensive analysis for each token
-            analyzed_tokens = []
+            # Reshape ultra-batch data for the existing analysis methods
+            candidates = []
             for token in tokens:
                 token_address = token.get('address')
                 if not token_address or token_address not in ultra_batch_data:
                     continue
-                
-                # Get ultra-batch data for this token
-                token_ultra_data = ultra_batch_data[token_address]
-                
-                # Build comprehensive analysis using ultra-batch data
-                analyzed_token = await self._build_token_analysis_ultra(
-                    token, token_ultra_data, basic_metrics, security_data
-                )
+                full_data = self._ultra_full_data(token, ultra_batch_data[token_address], security_data)
+                if full_data is not None:
+                    candidates.append((token, full_data))
+            
+            # Screen every candidate for pump/dump patterns in one batch
+            pump_dump_results = self._screen_pump_dump_batch(candidates)
+            
+            # Build comprehensive analysis for each token
+            analyzed_tokens = []
+            for token, full_data in candidates:
+                try:
+                    analyzed_token = await self._build_token_analysis(
+                        token, full_data, basic_metrics, security_data,
+                        pump_dump_result=pump_dump_results.get(token['address'])
+                    )
+                except Exception as e:
+                    self.logger.error(f"Error building ultra-batch analysis for {token.get('symbol', 'Unknown')}: {e}")
+                    continue
                 
                 if analyzed_token:
                     analyzed_tokens.append(analyzed_token)
@@ -1133,8 +1143,7 @@ class EarlyTokenDetector:
         """
         Individual token analysis (fallback method).
         """
-        analyzed_tokens = []
-        
+        candidates = []
         for token in tokens:
             address = token.get('address')
             if not address:
@@ -1142,10 +1151,22 @@ class EarlyTokenDetector:
             
             try:
                 # Use data manager to get all required data efficiently
-                full_data = await self.data_manager.get_full_analysis_data(address)
-                
+                candidates.append((token, await self.data_manager.get_full_analysis_data(address)))
+            except Exception as e:
+                self.logger.error(f"Error in individual analysis for {address}: {e}")
+        
+        # Screen every candidate for pump/dump patterns in one batch
+        pump_dump_results = self._screen_pump_dump_batch(candidates)
+        
+        analyzed_tokens = []
+        for token, full_data in candidates:
+            address = token['address']
+            try:
                 # Build comprehensive token analysis
-                analysis_result = await self._build_token_analysis(token, full_data, basic_metrics, security_data)
+                analysis_result = await self._build_token_analysis(
+                    token, full_data, basic_metrics, security_data,
+                    pump_dump_result=pump_dump_results.get(address)
+                )
                 
                 if analysis_result:
                     analyzed_tokens.append(analysis_result)
@@ -1157,15 +1178,12 @@ class EarlyTokenDetector:
         
         return analyzed_tokens
 
-    async def _build_token_analysis_ultra(self, token: Dict, ultra_data: Dict, basic_metrics: Dict, security_data: Dict) -> Optional[Dict[str, Any]]:
+    def _ultra_full_data(self, token: Dict, ultra_data: Dict, security_data: Dict) -> Optional[Dict[str, Any]]:
         """
-        Build comprehensive token analysis from ultra-batched data.
-        
-        This optimized version uses pre-fetched ultra-batched data instead of making
-        individual API calls during analysis.
+        Reshape one token's ultra-batched data into the ``full_data`` structure
+        used by ``_build_token_analysis`` (no individual API calls needed).
         """
         address = token.get('address')
-        symbol = token.get('symbol', 'Unknown')
         
         try:
             # Extract data from ultra-batch results
@@ -1179,8 +1197,7 @@ class EarlyTokenDetector:
             if not security_info and address in security_data:
                 security_info = security_data[address]
             
-            # Build full_data structure for existing analysis methods
-            full_data = {
+            return {
                 'overview': overview_data,
                 'price_data': price_data,
                 'security': security_info,
@@ -1190,13 +1207,49 @@ class EarlyTokenDetector:
                 'top_traders': []    # May not be available in ultra-batch
             }
             
-            # Use the existing comprehensive analysis method
-            return await self._build_token_analysis(token, full_data, basic_metrics, security_data)
-            
         except Exception as e:
-            self.logger.error(f"Error building ultra-batch analysis for {symbol}: {e}")
+            self.logger.error(f"Error building ultra-batch analysis for {token.get('symbol', 'Unknown')}: {e}")
             return None
     
+    def _pump_dump_input(self, token: Dict, full_data: Dict) -> Dict[str, Any]:
+        """Token metrics in the shape ``EnhancedPumpDumpDetector`` expects"""
+        overview = full_data.get('overview') or {}
+        volume = overview.get('volume', {})
+        trading_data = full_data.get('trading_data')
+        return {
+            'token_symbol': token.get('symbol', 'Unknown'),
+            'price_change_1h_percent': overview.get('priceChange1h', 0),
+            'price_change_4h_percent': overview.get('priceChange4h', 0),
+            'price_change_24h_percent': overview.get('priceChange24h', 0),
+            'volume_24h': volume.get('h24', 0),
+            'volume_1h': volume.get('h1', 0),
+            'volume_4h': volume.get('h4', 0),
+            'market_cap': overview.get('marketCap', 0),
+            'unique_trader_count': len(full_data.get('top_traders', []) or []),
+            'trade_count_24h': trading_data.get('trade_metrics', {}).get('total_trades_24h', 0) if trading_data else 0,
+            'creation_time': token.get('creation_time')
+        }
+    
+    def _screen_pump_dump_batch(self, candidates: List[Tuple[Dict, Dict]]) -> Dict[str, PumpDumpResult]:
+        """
+        Run pump/dump analysis once over all (token, full_data) candidates.
+        
+        Returns:
+            Results by token address (empty if the batch failed, so each token
+            falls back to its own analysis)
+        """
+        screened = [(token, full_data) for token, full_data in candidates if full_data.get('overview')]
+        if not screened:
+            return {}
+        try:
+            results = self.pump_dump_detector.analyze_batch(
+                [self._pump_dump_input(token, full_data) for token, full_data in screened]
+            )
+        except Exception as e:
+            self.logger.warning(f"Batch pump/dump analysis failed, analyzing tokens individually: {e}")
+            return {}
+        return {token['address']: result for (token, _), result in zip(screened, results)}
+    
     def _analyze_social_media_presence(self, overview_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze social media presence and calculate bonus scoring.
@@ -1359,9 +1412,13 @@ class EarlyTokenDetector:
         
         return True  # Default to valid for unknown platforms
     
-    async def _build_token_analysis(self, token: Dict, full_data: Dict, basic_metrics: Dict, security_data: Dict) -> Optional[Dict[str, Any]]:
+    async def _build_token_analysis(self, token: Dict, full_data: Dict, basic_metrics: Dict, security_data: Dict,
+                                    pump_dump_result: Optional[PumpDumpResult] = None) -> Optional[Dict[str, Any]]:
         """
         Build comprehensive token analysis from collected data.
+        
+        ``pump_dump_result`` is the token's entry from a batch pump/dump screen;
+        without one the token is analyzed on its own.
         """
         address = token.get('address')
         symbol = token.get('symbol', 'Unknown')
@@ -1409,20 +1466,13 @@ class EarlyTokenDetector:
         
         # Get enhanced pump/dump analysis for token result
         try:
-            token_analysis_data = {
-                'token_symbol': symbol,
-                'price_change_1h_percent': price_change_1h,
-                'price_change_4h_percent': price_change_4h,
-                'price_change_24h_percent': price_change_24h,
-                'volume_24h': volume_24h,
-                'volume_1h': volume_1h,
-                'volume_4h': overview.get('volume', {}).get('h4', 0),
-                'market_cap': market_cap,
-                'unique_trader_count': len(top_traders),
-                'trade_count_24h': trading_data.get('trade_metrics', {}).get('total_trades_24h', 0) if trading_data else 0,
-                'creation_time': token.get('creation_time')
-            }
-            enhanced_pump_dump_analysis = self.pump_dump_detector.analyze_token(token_analysis_data)
+            if pump_dump_result is not None:
+                pump_dump_result.log_diagnostics(self.pump_dump_detector.logger)
+                enhanced_pump_dump_analysis = pump_dump_result.analysis
+            else:
+                enhanced_pump_dump_analysis = self.pump_dump_detector.analyze_token(
+                    self._pump_dump_input(token, full_data)
+                )
         except Exception as e:
             self.logger.warning(f"Could not get enhanced pump/dump analysis for result: {e}")
             # enhanced_pump_dump_analysis remains None
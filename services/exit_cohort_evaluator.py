@@ -0,0 +1,224 @@
+"""
+Cohort-vectorized exit signal evaluation.
+
+Positions are grouped by token. Market factors (current data, momentum,
+whale activity, technical levels) are computed once per distinct token, and
+the per-position parts - entry comparisons, support breaks, hold time and
+price targets - are applied to all positions in one numpy pass. Scores match
+``ExitSignalDetector.analyze_position`` while API work scales with the number
+of distinct tokens instead of the number of positions.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from services.position_tracker import Position
+
+FACTOR_NAMES = (
+    "volume_degradation",
+    "price_momentum",
+    "whale_activity",
+    "community_sentiment",
+    "technical_indicators",
+)
+
+
+@dataclass
+class TokenMarketFactors:
+    """Market-side exit inputs shared by every position in a token"""
+    token_address: str
+    current_data: Dict[str, Any]
+    price: Optional[float]
+    volume_24h: float
+    holders: float
+    momentum_score: float
+    whale_activity_score: float
+    rsi_score: float
+    recent_support: Optional[float]
+
+
+def _current_volume_24h(current_data: Dict[str, Any]) -> float:
+    volume = current_data.get('volume', {})
+    if isinstance(volume, dict):
+        return float(volume.get('h24', 0) or 0)
+    return float(volume or 0)
+
+
+class ExitCohortEvaluator:
+    """Evaluates exit signals for many positions, grouped by token"""
+
+    def __init__(self, detector, logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            detector: ExitSignalDetector whose data access, weights and thresholds are used
+            logger: Logger instance
+        """
+        self.detector = detector
+        self.logger = logger or detector.logger
+
+    async def evaluate(self, positions: List[Position]) -> List:
+        """
+        Generate exit signals for a batch of positions.
+
+        Returns:
+            One ExitSignal per position, in input order
+        """
+        if not positions:
+            return []
+
+        cohorts: Dict[str, List[int]] = {}
+        for index, position in enumerate(positions):
+            cohorts.setdefault(position.token_address, []).append(index)
+
+        tokens = list(cohorts)
+        results = await asyncio.gather(*(self._token_factors(token) for token in tokens), return_exceptions=True)
+
+        signals: List[Any] = [None] * len(positions)
+        evaluated: List[int] = []
+        token_rows: List[TokenMarketFactors] = []
+        for token, result in zip(tokens, results):
+            for index in cohorts[token]:
+                position = positions[index]
+                if isinstance(result, Exception):
+                    self.logger.error(f"❌ Error analyzing position {position.id}: {result}")
+                    signals[index] = self.detector._create_error_signal(position, str(result))
+                elif result is None:
+                    signals[index] = self.detector._create_no_data_signal(position)
+                else:
+                    if result.price is not None:
+                        self.detector.position_tracker.queue_price_update(position.id, result.price)
+                        position.current_price = result.price
+                    evaluated.append(index)
+                    token_rows.append(result)
+
+        if evaluated:
+            cohort = [positions[index] for index in evaluated]
+            scores, factors = self._score(cohort, token_rows)
+            for row, index in enumerate(evaluated):
+                position_factors = {name: float(factors[name][row]) for name in FACTOR_NAMES}
+                signals[index] = self.detector._generate_exit_signal(positions[index], float(scores[row]), position_factors)
+
+        self.logger.debug(f"🧮 Evaluated {len(positions)} positions across {len(tokens)} tokens")
+        return signals
+
+    async def _token_factors(self, token_address: str) -> Optional[TokenMarketFactors]:
+        """Fetch and score the market side of a token once for its whole cohort"""
+        detector = self.detector
+        detector.enhanced_cache.register_tracked_token(token_address, is_position=True)
+
+        current_data = await detector._get_current_token_data_cached(token_address)
+        if not current_data:
+            return None
+
+        momentum, whale, levels = await asyncio.gather(
+            detector._token_momentum_score(token_address),
+            detector._token_whale_activity_score(token_address),
+            detector._token_technical_levels(token_address),
+        )
+
+        return TokenMarketFactors(
+            token_address=token_address,
+            current_data=current_data,
+            price=current_data.get('price') if 'price' in current_data else None,
+            volume_24h=_current_volume_24h(current_data),
+            holders=float(current_data.get('holders', 0) or 0),
+            momentum_score=min(momentum, 25.0),
+            whale_activity_score=min(whale, 20.0),
+            rsi_score=detector._rsi_score(levels['rsi']) if levels else 0.0,
+            recent_support=levels.get('recent_support') if levels else None,
+        )
+
+    def _score(self, positions: List[Position], tokens: List[TokenMarketFactors]):
+        """Apply per-position modifiers to the token factors in one vectorized pass"""
+        detector = self.detector
+        entry_conditions = [position.get_entry_conditions_dict() for position in positions]
+
+        price = np.array([position.current_price for position in positions], dtype=float)
+        entry_price = np.array([position.entry_price for position in positions], dtype=float)
+        profit_target = np.array([position.profit_target or np.nan for position in positions], dtype=float)
+        stop_loss = np.array([position.stop_loss or np.nan for position in positions], dtype=float)
+        hold_hours = np.array([position.get_hold_time_hours() for position in positions], dtype=float)
+
+        current_volume = np.array([token.volume_24h for token in tokens], dtype=float)
+        entry_volume = np.array([float(conditions.get('volume_24h', 0) or 0) for conditions in entry_conditions])
+        current_holders = np.array([token.holders for token in tokens], dtype=float)
+        entry_holders = np.array([
+            float(conditions.get('holders', token.holders) or 0)
+            for conditions, token in zip(entry_conditions, tokens)
+        ])
+        recent_support = np.array([
+            token.recent_support if token.recent_support is not None else np.nan for token in tokens
+        ], dtype=float)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Volume degradation vs. entry
+            volume_decline = np.where(
+                (entry_volume > 0) & (current_volume > 0),
+                (entry_volume - current_volume) / entry_volume,
+                -np.inf
+            )
+            volume_score = np.select(
+                [volume_decline >= 0.5, volume_decline >= 0.3, volume_decline >= 0.2, volume_decline >= 0.1],
+                [25.0, 15.0, 10.0, 5.0],
+                0.0
+            )
+
+            # Community sentiment: holder change since entry
+            holder_change = np.where(entry_holders > 0, (current_holders - entry_holders) / entry_holders, 0.0)
+            community_score = np.select(
+                [holder_change < -0.1, holder_change < -0.05, holder_change < 0],
+                [15.0, 10.0, 5.0],
+                0.0
+            )
+
+            # Technical: token RSI plus per-position support break
+            support_score = np.select(
+                [price < recent_support * 0.98, price < recent_support],
+                [7.0, 4.0],
+                0.0
+            )
+            technical_score = np.minimum(np.array([token.rsi_score for token in tokens]) + support_score, 15.0)
+
+            factors = {
+                "volume_degradation": volume_score,
+                "price_momentum": np.array([token.momentum_score for token in tokens], dtype=float),
+                "whale_activity": np.array([token.whale_activity_score for token in tokens], dtype=float),
+                "community_sentiment": community_score,
+                "technical_indicators": technical_score,
+            }
+            score = sum(factors[name] * detector.factor_weights.get(name, 0.0) for name in FACTOR_NAMES)
+            score = np.minimum(score, 100.0)
+
+            # Time modifiers against each user's max hold time
+            max_hold = np.array(self._max_hold_hours(positions), dtype=float)
+            score = np.minimum(score + np.select(
+                [hold_hours > max_hold * 0.8, hold_hours > max_hold * 0.6, hold_hours > 4],
+                [15.0, 10.0, 5.0],
+                0.0
+            ), 100.0)
+            score = np.where(hold_hours > max_hold, 100.0, score)
+
+            # Profit targets, stop losses and P&L bias
+            pnl_percent = (price - entry_price) / entry_price * 100
+            pnl_adjustment = np.select(
+                [pnl_percent > 50, pnl_percent > 30, pnl_percent > 0, pnl_percent < -15, pnl_percent < -10],
+                [20.0, 10.0, -5.0, 15.0, 10.0],
+                0.0
+            )
+            forced_exit = (price >= profit_target) | (price <= stop_loss)
+            adjusted = np.where(forced_exit, 100.0, np.minimum(score + pnl_adjustment, 100.0))
+            score = np.where(entry_price > 0, adjusted, score)
+
+        return score, factors
+
+    def _max_hold_hours(self, positions: List[Position]) -> List[float]:
+        """Max hold time per position, looking up each user's preferences once"""
+        limits: Dict[str, float] = {}
+        for user_id in {position.user_id for position in positions}:
+            prefs = self.detector.position_tracker.get_user_preferences(user_id)
+            limits[user_id] = prefs.max_hold_time_hours if prefs else 48
+        return [limits[position.user_id] for position in positions]
@@ -6,10 +6,13 @@ from dataclasses import dataclass
 import json
 import statistics
 
+import numpy as np
+
 from services.position_tracker import Position, PositionTracker
 from api.birdeye_connector import BirdeyeAPI
 from scripts.cross_platform_token_analyzer import CrossPlatformAnalyzer
 from services.enhanced_cache_manager import EnhancedPositionCacheManager
+from services.exit_cohort_evaluator import ExitCohortEvaluator
 
 @dataclass
 class ExitSignal:
@@ -46,6 +49,9 @@ class ExitSignalDetector:
         # Initialize cross-platform analyzer for additional data
         self.cross_platform_analyzer = CrossPlatformAnalyzer(config, logger)
         
+        # Batch evaluator grouping positions by token
+        self.cohort_evaluator = ExitCohortEvaluator(self, self.logger)
+        
         # Exit signal thresholds (configurable)
         self.exit_thresholds = {
             "weak_exit": 40.0,      # Weak exit signal
@@ -78,9 +84,9 @@ class ExitSignalDetector:
             if not current_data:
                 return self._create_no_data_signal(position)
             
-            # Update position with current price
+            # Update position with current price (written in the tracker's next batched flush)
             if 'price' in current_data:
-                self.position_tracker.update_position_price(position.id, current_data['price'])
+                self.position_tracker.queue_price_update(position.id, current_data['price'])
                 position.current_price = current_data['price']
             
             # Calculate individual factor scores using cached data
@@ -148,17 +154,15 @@ class ExitSignalDetector:
         if tokens_needing_data:
             await self._batch_warm_cache(tokens_needing_data)
         
-        # Analyze positions concurrently for better performance
-        tasks = [self.analyze_position(position) for position in active_positions]
-        signals = await asyncio.gather(*tasks, return_exceptions=True)
+        # Evaluate positions by token cohort: market factors once per token, modifiers vectorized
+        try:
+            valid_signals = await self.cohort_evaluator.evaluate(active_positions)
+        except Exception as e:
+            self.logger.error(f"❌ Error evaluating position cohorts: {e}")
+            valid_signals = [self._create_error_signal(position, str(e)) for position in active_positions]
         
-        # Filter out exceptions and return valid signals
-        valid_signals = []
-        for i, signal in enumerate(signals):
-            if isinstance(signal, Exception):
-                self.logger.error(f"❌ Error analyzing position {active_positions[i].id}: {signal}")
-            else:
-                valid_signals.append(signal)
+        # Persist this pass's price updates in a single transaction
+        self.position_tracker.flush()
         
         # Log cache performance
         cache_stats = self.enhanced_cache.get_cache_statistics()
@@ -292,17 +296,21 @@ class ExitSignalDetector:
     
     async def _analyze_price_momentum_cached(self, position: Position, current_data: Dict) -> float:
         """Analyze price momentum reversal with caching optimization"""
+        return await self._token_momentum_score(position.token_address)
+    
+    async def _token_momentum_score(self, token_address: str) -> float:
+        """Price momentum reversal score for a token (shared by every position in it)"""
         try:
             # Check cache for momentum analysis
-            cache_key = f"momentum_analysis_{position.token_address}"
-            cached_analysis = self.enhanced_cache.get_enhanced("position_momentum", position.token_address, cache_key)
+            cache_key = f"momentum_analysis_{token_address}"
+            cached_analysis = self.enhanced_cache.get_enhanced("position_momentum", token_address, cache_key)
             
             if cached_analysis:
-                return cached_analysis.get('momentum_score', 0.0)
+                return min(cached_analysis.get('momentum_score', 0.0), 25.0)
             
             # Get OHLCV data for momentum analysis
             ohlcv_data = await self.birdeye_api.get_ohlcv_data(
-                position.token_address, time_frame='5m', limit=20
+                token_address, time_frame='5m', limit=20
             )
             
             if not ohlcv_data or len(ohlcv_data) < 10:
@@ -353,7 +361,7 @@ class ExitSignalDetector:
                 'volume_ratio': volume_ratio,
                 'timestamp': int(time.time())
             }
-            self.enhanced_cache.set_enhanced("position_momentum", position.token_address, analysis_result, cache_key)
+            self.enhanced_cache.set_enhanced("position_momentum", token_address, analysis_result, cache_key)
             
             self.logger.debug(f"📊 Price momentum score: {score:.1f} (momentum: {momentum:.3f})")
             return min(score, 25.0)  # Cap at maximum
@@ -364,17 +372,21 @@ class ExitSignalDetector:
     
     async def _analyze_whale_activity_cached(self, position: Position, current_data: Dict) -> float:
         """Analyze whale activity changes with caching optimization"""
+        return await self._token_whale_activity_score(position.token_address)
+    
+    async def _token_whale_activity_score(self, token_address: str) -> float:
+        """Whale selling pressure score for a token (shared by every position in it)"""
         try:
             # Check cache for whale activity analysis
-            cache_key = f"whale_activity_analysis_{position.token_address}"
-            cached_analysis = self.enhanced_cache.get_enhanced("position_whale_activity", position.token_address, cache_key)
+            cache_key = f"whale_activity_analysis_{token_address}"
+            cached_analysis = self.enhanced_cache.get_enhanced("position_whale_activity", token_address, cache_key)
             
             if cached_analysis:
-                return cached_analysis.get('whale_activity_score', 0.0)
+                return min(cached_analysis.get('whale_activity_score', 0.0), 20.0)
             
             # Get current top traders
             current_traders = await self.birdeye_api.get_top_traders_optimized(
-                position.token_address, time_frame="1h", sort_by="volume", limit=10
+                token_address, time_frame="1h", sort_by="volume", limit=10
             )
             
             if not current_traders:
@@ -430,7 +442,7 @@ class ExitSignalDetector:
                 'smart_money_sell_ratio': smart_money_sell_ratio,
                 'timestamp': int(time.time())
             }
-            self.enhanced_cache.set_enhanced("position_whale_activity", position.token_address, analysis_result, cache_key)
+            self.enhanced_cache.set_enhanced("position_whale_activity", token_address, analysis_result, cache_key)
             
             self.logger.debug(f"🐋 Whale activity score: {score:.1f} (sell ratio: {sell_ratio:.2f})")
             return min(score, 20.0)  # Cap at maximum
@@ -497,88 +509,86 @@ class ExitSignalDetector:
     
     async def _analyze_technical_indicators_cached(self, position: Position, current_data: Dict) -> float:
         """Analyze technical indicators with caching optimization"""
+        try:
+            levels = await self._token_technical_levels(position.token_address)
+            if not levels:
+                return 0.0
+            
+            score = self._rsi_score(levels['rsi'])
+            
+            # Check for support level breaks
+            recent_support = levels.get('recent_support')
+            current_price = position.current_price
+            
+            if recent_support is not None:
+                # If current price breaks below recent support
+                if current_price < recent_support * 0.98:  # 2% below support
+                    score += 7.0
+                elif current_price < recent_support:
+                    score += 4.0
+            
+            self.logger.debug(f"📈 Technical indicators score: {score:.1f}")
+            return min(score, 15.0)  # Cap at maximum
+            
+        except Exception as e:
+            self.logger.error(f"❌ Error analyzing technical indicators: {e}")
+            return 0.0
+    
+    async def _token_technical_levels(self, token_address: str) -> Optional[Dict[str, Any]]:
+        """RSI and support levels for a token; the support-break check is per position"""
         try:
             # Check cache for technical analysis
-            cache_key = f"technical_analysis_{position.token_address}"
-            cached_analysis = self.enhanced_cache.get_enhanced("position_technical_indicators", position.token_address, cache_key)
+            cache_key = f"technical_analysis_{token_address}"
+            cached_analysis = self.enhanced_cache.get_enhanced("position_technical_indicators", token_address, cache_key)
             
             if cached_analysis:
-                return cached_analysis.get('technical_score', 0.0)
+                return cached_analysis
             
             # Get OHLCV data for technical analysis
             ohlcv_data = await self.birdeye_api.get_ohlcv_data(
-                position.token_address, time_frame='15m', limit=30
+                token_address, time_frame='15m', limit=30
             )
             
             if not ohlcv_data or len(ohlcv_data) < 20:
-                return 0.0
-            
-            score = 0.0
+                return None
             
             # Calculate RSI (Relative Strength Index)
             closes = [float(candle.get('c', 0)) for candle in ohlcv_data[-14:]]
-            if len(closes) >= 14:
-                rsi = self._calculate_rsi(closes)
-                
-                # Overbought conditions (RSI > 70) suggest potential reversal
-                if rsi > 80:
-                    score += 8.0
-                elif rsi > 70:
-                    score += 5.0
+            rsi = self._calculate_rsi(closes)
             
-            # Check for support level breaks
+            # Support from the last 5 periods and the 5 before them
             lows = [float(candle.get('l', 0)) for candle in ohlcv_data[-10:]]
-            current_price = position.current_price
             
-            if lows:
-                recent_support = min(lows[-5:])  # Support from last 5 periods
-                older_support = min(lows[-10:-5])  # Support from previous 5 periods
-                
-                # If current price breaks below recent support
-                if current_price < recent_support * 0.98:  # 2% below support
-                    score += 7.0
-                elif current_price < recent_support:
-                    score += 4.0
-            
-            # Cache the analysis
             analysis_result = {
-                'technical_score': score,
                 'rsi': rsi,
-                'recent_support': recent_support,
-                'older_support': older_support,
+                'recent_support': min(lows[-5:]) if lows else None,
+                'older_support': min(lows[-10:-5]) if len(lows) > 5 else None,
                 'timestamp': int(time.time())
             }
-            self.enhanced_cache.set_enhanced("position_technical_indicators", position.token_address, analysis_result, cache_key)
-            
-            self.logger.debug(f"📈 Technical indicators score: {score:.1f}")
-            return min(score, 15.0)  # Cap at maximum
+            self.enhanced_cache.set_enhanced("position_technical_indicators", token_address, analysis_result, cache_key)
+            return analysis_result
             
         except Exception as e:
             self.logger.error(f"❌ Error analyzing technical indicators: {e}")
-            return 0.0
+            return None
+    
+    @staticmethod
+    def _rsi_score(rsi: float) -> float:
+        """Overbought conditions (RSI > 70) suggest potential reversal"""
+        if rsi > 80:
+            return 8.0
+        if rsi > 70:
+            return 5.0
+        return 0.0
     
     def _calculate_rsi(self, prices: List[float], period: int = 14) -> float:
         """Calculate RSI (Relative Strength Index)"""
         if len(prices) < period + 1:
             return 50.0  # Neutral RSI if not enough data
         
-        gains = []
-        losses = []
-        
-        for i in range(1, len(prices)):
-            change = prices[i] - prices[i-1]
-            if change > 0:
-                gains.append(change)
-                losses.append(0)
-            else:
-                gains.append(0)
-                losses.append(abs(change))
-        
-        if len(gains) < period:
-            return 50.0
-        
-        avg_gain = statistics.mean(gains[-period:])
-        avg_loss = statistics.mean(losses[-period:])
+        changes = np.diff(np.asarray(prices, dtype=float))[-period:]
+        avg_gain = float(np.clip(changes, 0, None).mean())
+        avg_loss = float(np.clip(-changes, 0, None).mean())
         
         if avg_loss == 0:
             return 100.0
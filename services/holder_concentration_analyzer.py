@@ -7,19 +7,21 @@ whale presence, and distribution equality using advanced metrics.
 
 import asyncio
 from typing import Dict, List, Any, Optional, Tuple
-import statistics
-import math
 from datetime import datetime
 
+from services.holder_snapshot_service import HolderSnapshot, get_shared_holder_snapshot_service
+
 class HolderConcentrationAnalyzer:
     """
     Advanced holder concentration analysis with multiple metrics
     """
     
-    def __init__(self, birdeye_api, logger, config: Dict = None):
+    def __init__(self, birdeye_api, logger, config: Dict = None, snapshot_service=None):
         self.birdeye_api = birdeye_api
         self.logger = logger
         self.config = config or {}
+        # Holder lists are shared with the other holder analyzers instead of fetched per analyzer
+        self.snapshot_service = snapshot_service or get_shared_holder_snapshot_service(birdeye_api)
         
         # Configuration defaults
         self.whale_threshold = self.config.get('whale_threshold_percentage', 5.0)  # 5% of supply
@@ -49,23 +51,23 @@ class HolderConcentrationAnalyzer:
         
         try:
             # Get holder data
-            holder_data = await self._fetch_holder_data(token_address)
+            snapshot = await self._fetch_holder_data(token_address)
             
-            if not holder_data:
+            if not snapshot:
                 analysis['errors'].append("No holder data available")
                 return analysis
             
             analysis['holder_data_available'] = True
-            analysis['total_holders'] = len(holder_data)
+            analysis['total_holders'] = snapshot.holder_count
             
             # Calculate distribution metrics
-            analysis['holder_distribution'] = self._calculate_distribution_metrics(holder_data)
+            analysis['holder_distribution'] = self._calculate_distribution_metrics(snapshot)
             
             # Calculate concentration metrics (Gini coefficient, etc.)
-            analysis['concentration_metrics'] = self._calculate_concentration_metrics(holder_data)
+            analysis['concentration_metrics'] = self._calculate_concentration_metrics(snapshot)
             
             # Whale analysis
-            analysis['whale_analysis'] = self._analyze_whales(holder_data)
+            analysis['whale_analysis'] = self._analyze_whales(snapshot)
             
             # Risk assessment
             analysis['risk_assessment'] = self._assess_concentration_risk(analysis)
@@ -85,166 +87,79 @@ class HolderConcentrationAnalyzer:
             
         return analysis
     
-    async def _fetch_holder_data(self, token_address: str) -> Optional[List[Dict]]:
+    async def _fetch_holder_data(self, token_address: str) -> Optional[HolderSnapshot]:
         """
-        Fetch holder data from available endpoints
+        Fetch the shared holder snapshot, falling back to top traders as a holder proxy
         """
         try:
-            # Try to get holder data from token holder endpoint
-            holder_response = await self.birdeye_api.get_token_holder_data(token_address)
-            
-            if holder_response and isinstance(holder_response, dict):
-                holders = holder_response.get('data', {}).get('items', [])
-                if holders:
-                    return holders
-            
-            # Alternative: Try to extract holder info from top traders
-            top_traders = await self.birdeye_api.get_top_traders(token_address)
-            
-            if top_traders and isinstance(top_traders, list):
-                # Convert trader data to holder-like format
-                holder_data = []
-                for trader in top_traders[:100]:  # Top 100 traders as proxy
-                    if isinstance(trader, dict):
-                        holder_data.append({
-                            'address': trader.get('address', ''),
-                            'balance': trader.get('volumeUsd', 0),  # Use volume as proxy for holdings
-                            'percentage': 0  # Will calculate later
-                        })
-                return holder_data
-            
-            return None
+            return await self.snapshot_service.get_snapshot(token_address, trader_fallback=True)
             
         except Exception as e:
             self.logger.warning(f"Error fetching holder data: {e}")
             return None
     
-    def _calculate_distribution_metrics(self, holder_data: List[Dict]) -> Dict[str, Any]:
+    def _calculate_distribution_metrics(self, snapshot: HolderSnapshot) -> Dict[str, Any]:
         """
         Calculate basic distribution metrics
         """
-        if not holder_data:
-            return {}
-        
-        # Extract balances
-        balances = []
-        for holder in holder_data:
-            balance = holder.get('balance', 0)
-            if isinstance(balance, (int, float)) and balance > 0:
-                balances.append(balance)
-        
-        if not balances:
+        if not snapshot or not snapshot.holder_count:
             return {}
         
-        total_supply = sum(balances)
-        sorted_balances = sorted(balances, reverse=True)
-        
-        # Calculate percentages
-        percentages = [(balance / total_supply) * 100 for balance in sorted_balances]
+        stats = snapshot.concentration_stats()
         
         # Distribution metrics
         metrics = {
-            'total_supply_tracked': total_supply,
-            'top_1_percentage': percentages[0] if len(percentages) > 0 else 0,
-            'top_5_percentage': sum(percentages[:5]) if len(percentages) >= 5 else sum(percentages),
-            'top_10_percentage': sum(percentages[:10]) if len(percentages) >= 10 else sum(percentages),
-            'top_50_percentage': sum(percentages[:50]) if len(percentages) >= 50 else sum(percentages),
-            'median_holding_percentage': statistics.median(percentages) if percentages else 0,
-            'mean_holding_percentage': statistics.mean(percentages) if percentages else 0,
-            'holder_count_by_size': self._categorize_holders_by_size(percentages)
+            'total_supply_tracked': snapshot.total_balance,
+            'top_1_percentage': stats['top_pct'][1],
+            'top_5_percentage': stats['top_pct'][5],
+            'top_10_percentage': stats['top_pct'][10],
+            'top_50_percentage': stats['top_pct'][50],
+            'median_holding_percentage': stats['median_pct'],
+            'mean_holding_percentage': stats['mean_pct'],
+            'holder_count_by_size': self._categorize_holders_by_size(snapshot)
         }
         
         return metrics
     
-    def _categorize_holders_by_size(self, percentages: List[float]) -> Dict[str, int]:
+    def _categorize_holders_by_size(self, snapshot: HolderSnapshot) -> Dict[str, int]:
         """
         Categorize holders by their holding size
         """
-        categories = {
-            'whales': 0,        # >5%
-            'large_holders': 0, # 1-5%
-            'medium_holders': 0,# 0.1-1%
-            'small_holders': 0, # 0.01-0.1%
-            'dust_holders': 0   # <0.01%
-        }
+        # Holders at or above each bound (>5%, 1-5%, 0.1-1%, 0.01-0.1%, <0.01%)
+        at_or_above = [snapshot.holders_above(bound)[0] for bound in (5.0, 1.0, 0.1, 0.01)]
         
-        for percentage in percentages:
-            if percentage >= 5.0:
-                categories['whales'] += 1
-            elif percentage >= 1.0:
-                categories['large_holders'] += 1
-            elif percentage >= 0.1:
-                categories['medium_holders'] += 1
-            elif percentage >= 0.01:
-                categories['small_holders'] += 1
-            else:
-                categories['dust_holders'] += 1
-        
-        return categories
+        return {
+            'whales': at_or_above[0],
+            'large_holders': at_or_above[1] - at_or_above[0],
+            'medium_holders': at_or_above[2] - at_or_above[1],
+            'small_holders': at_or_above[3] - at_or_above[2],
+            'dust_holders': snapshot.holder_count - at_or_above[3]
+        }
     
-    def _calculate_concentration_metrics(self, holder_data: List[Dict]) -> Dict[str, Any]:
+    def _calculate_concentration_metrics(self, snapshot: HolderSnapshot) -> Dict[str, Any]:
         """
         Calculate advanced concentration metrics including Gini coefficient
         """
-        if not holder_data:
-            return {}
-        
-        # Extract and sort balances
-        balances = []
-        for holder in holder_data:
-            balance = holder.get('balance', 0)
-            if isinstance(balance, (int, float)) and balance > 0:
-                balances.append(balance)
-        
-        if not balances:
+        if not snapshot or not snapshot.holder_count:
             return {}
         
-        sorted_balances = sorted(balances)
-        n = len(sorted_balances)
-        
-        # Calculate Gini coefficient
-        gini_coefficient = self._calculate_gini_coefficient(sorted_balances)
-        
-        # Calculate Herfindahl-Hirschman Index (HHI)
-        total_supply = sum(sorted_balances)
-        market_shares = [(balance / total_supply) for balance in sorted_balances]
-        hhi = sum(share ** 2 for share in market_shares)
-        
-        # Calculate concentration ratio (CR4 - top 4 holders)
-        sorted_desc = sorted(balances, reverse=True)
-        cr4 = sum(sorted_desc[:4]) / total_supply if len(sorted_desc) >= 4 else 1.0
-        
-        # Calculate Theil index (another inequality measure)
-        mean_balance = statistics.mean(sorted_balances)
-        theil_index = sum((balance / mean_balance) * math.log(balance / mean_balance) 
-                         for balance in sorted_balances if balance > 0) / n
+        # Gini, Herfindahl-Hirschman Index (HHI), CR4 and Theil index from one pass over the sorted balances
+        stats = snapshot.concentration_stats()
+        gini_coefficient = stats['gini']
+        hhi = stats['hhi']
+        cr4 = stats['top_pct'][4] / 100
         
         metrics = {
             'gini_coefficient': gini_coefficient,
             'herfindahl_hirschman_index': hhi,
             'concentration_ratio_4': cr4,
-            'theil_index': theil_index,
+            'theil_index': stats['theil_index'],
             'inequality_interpretation': self._interpret_gini_coefficient(gini_coefficient),
             'concentration_level': self._determine_concentration_level(gini_coefficient, hhi, cr4)
         }
         
         return metrics
     
-    def _calculate_gini_coefficient(self, sorted_balances: List[float]) -> float:
-        """
-        Calculate Gini coefficient for wealth inequality
-        """
-        if not sorted_balances:
-            return 0.0
-        
-        n = len(sorted_balances)
-        cumsum = 0
-        
-        for i, balance in enumerate(sorted_balances):
-            cumsum += balance * (2 * (i + 1) - n - 1)
-        
-        return cumsum / (n * sum(sorted_balances))
-    
     def _interpret_gini_coefficient(self, gini: float) -> str:
         """
         Interpret Gini coefficient value
@@ -299,52 +214,33 @@ class HolderConcentrationAnalyzer:
         else:
             return "Well distributed"
     
-    def _analyze_whales(self, holder_data: List[Dict]) -> Dict[str, Any]:
+    def _analyze_whales(self, snapshot: HolderSnapshot) -> Dict[str, Any]:
         """
         Analyze whale holders (>5% of supply)
         """
-        if not holder_data:
-            return {}
-        
-        # Extract balances and calculate total
-        balances = []
-        addresses = []
-        for holder in holder_data:
-            balance = holder.get('balance', 0)
-            address = holder.get('address', '')
-            if isinstance(balance, (int, float)) and balance > 0:
-                balances.append(balance)
-                addresses.append(address)
-        
-        if not balances:
+        if not snapshot or not snapshot.holder_count:
             return {}
         
-        total_supply = sum(balances)
+        # Balances are sorted descending, so whales are the leading holders
+        whale_count, whale_total_percentage = snapshot.holders_above(self.whale_threshold)
+        total_supply = snapshot.total_balance
         
-        # Identify whales
         whales = []
-        whale_total = 0
-        
-        for i, balance in enumerate(balances):
-            percentage = (balance / total_supply) * 100
-            if percentage >= self.whale_threshold:
-                whales.append({
-                    'address': addresses[i] if i < len(addresses) else f"whale_{i+1}",
-                    'balance': balance,
-                    'percentage': percentage,
-                    'whale_category': self._categorize_whale(percentage)
-                })
-                whale_total += balance
-        
-        # Sort whales by percentage
-        whales.sort(key=lambda x: x['percentage'], reverse=True)
+        for i in range(min(whale_count, 10)):  # Top 10 whales
+            percentage = snapshot.balances[i] / total_supply * 100
+            whales.append({
+                'address': snapshot.addresses[i] or f"whale_{i+1}",
+                'balance': float(snapshot.balances[i]),
+                'percentage': float(percentage),
+                'whale_category': self._categorize_whale(percentage)
+            })
         
         analysis = {
-            'whale_count': len(whales),
-            'whale_total_percentage': (whale_total / total_supply) * 100 if total_supply > 0 else 0,
+            'whale_count': whale_count,
+            'whale_total_percentage': whale_total_percentage,
             'largest_whale_percentage': whales[0]['percentage'] if whales else 0,
-            'whales': whales[:10],  # Top 10 whales
-            'whale_risk_level': self._assess_whale_risk(len(whales), whale_total / total_supply if total_supply > 0 else 0)
+            'whales': whales,
+            'whale_risk_level': self._assess_whale_risk(whale_count, whale_total_percentage / 100)
         }
         
         return analysis
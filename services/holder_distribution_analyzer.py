@@ -9,13 +9,15 @@ to assess concentration risks and provide risk-adjusted scoring.
 import asyncio
 import time
 import logging
-import statistics
 import asyncio
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
 from api.birdeye_connector import BirdeyeAPI
 from core.cache_manager import CacheManager
+from services.holder_snapshot_service import (
+    HolderSnapshot, HolderSnapshotService, get_shared_holder_snapshot_service
+)
 
 
 class HolderDistributionAnalyzer:
@@ -26,17 +28,20 @@ class HolderDistributionAnalyzer:
     calculate concentration metrics, and provide risk assessments.
     """
     
-    def __init__(self, birdeye_api: BirdeyeAPI, logger: Optional[logging.Logger] = None):
+    def __init__(self, birdeye_api: BirdeyeAPI, logger: Optional[logging.Logger] = None,
+                 snapshot_service: Optional[HolderSnapshotService] = None):
         """
         Initialize the holder distribution analyzer.
         
         Args:
             birdeye_api: Birdeye API instance
             logger: Logger instance
+            snapshot_service: Holder snapshot source (defaults to the one shared per Birdeye API)
         """
         self.birdeye_api = birdeye_api
         self.logger = logger or logging.getLogger(__name__)
         self.cache_manager = CacheManager()
+        self.snapshot_service = snapshot_service or get_shared_holder_snapshot_service(birdeye_api)
         
         # Cache settings
         self.holder_cache_ttl = 1800  # 30 minutes cache for holder data
@@ -59,10 +64,6 @@ class HolderDistributionAnalyzer:
             "whale_risk_weight": 0.15      # Individual whale risk
         }
         
-        # Internal tracking
-        self._holder_data_cache = {}
-        self._distribution_metrics_cache = {}
-        
     async def analyze_holder_distribution(self, token_address: str, limit: int = 100) -> Dict[str, Any]:
         """
         Analyze holder distribution for a specific token.
@@ -85,35 +86,32 @@ class HolderDistributionAnalyzer:
         try:
             self.logger.info(f"📊 Analyzing holder distribution for token {token_address}")
             
-            # Get holder data from Birdeye API
-            result = await self.birdeye_api.get_token_holders(token_address, limit=limit)
+            # Get holder data from the shared snapshot service (one Birdeye call per token per TTL)
+            snapshot = await self.snapshot_service.get_snapshot(token_address, limit=limit)
             
-            # Fix: API returns direct structure with "items", not wrapped in "data"
-            if result and isinstance(result, dict) and "items" in result:
-                holders_data = result["items"]
-                
+            if snapshot:
                 # Perform comprehensive distribution analysis
-                analysis_result = await self._perform_distribution_analysis(holders_data, token_address)
+                analysis_result = await self._perform_distribution_analysis(snapshot, token_address)
                 
                 # Cache the results
                 self.cache_manager.set(cache_key, analysis_result, ttl=self.holder_cache_ttl)
                 
-                self.logger.info(f"✅ Analyzed {len(holders_data)} holders for {token_address}")
+                self.logger.info(f"✅ Analyzed {snapshot.holder_count} holders for {token_address}")
                 return analysis_result
             else:
-                self.logger.warning(f"⚠️ Holder data API call failed for {token_address}: {result}")
+                self.logger.warning(f"⚠️ No holder data available for {token_address}")
                 return self._get_empty_analysis(token_address)
                 
         except Exception as e:
             self.logger.error(f"❌ Error analyzing holder distribution for {token_address}: {e}")
             return self._get_empty_analysis(token_address)
     
-    async def _perform_distribution_analysis(self, holders_data: List[Dict[str, Any]], token_address: str) -> Dict[str, Any]:
+    async def _perform_distribution_analysis(self, snapshot: HolderSnapshot, token_address: str) -> Dict[str, Any]:
         """
         Perform comprehensive holder distribution analysis.
         
         Args:
-            holders_data: Raw holder data from API
+            snapshot: Holder snapshot with balances sorted descending
             token_address: Token address being analyzed
             
         Returns:
@@ -121,38 +119,18 @@ class HolderDistributionAnalyzer:
         """
         current_time = int(time.time())
         
-        # Extract holder balances and addresses
-        holder_balances = []
-        holder_addresses = []
-        total_supply = 0
-        
-        for holder in holders_data:
-            try:
-                # Fix: API returns "ui_amount" not "balance", "owner" not "address"
-                balance = holder.get("ui_amount", 0) or 0
-                address = holder.get("owner", "")
-                
-                if balance > 0 and address:
-                    holder_balances.append(balance)
-                    holder_addresses.append(address)
-                    total_supply += balance
-                    
-            except Exception as e:
-                self.logger.error(f"Error processing holder data: {e}")
-                continue
-        
-        if not holder_balances:
+        if not snapshot.holder_count:
             return self._get_empty_analysis(token_address)
         
         # Calculate distribution metrics
-        concentration_metrics = self._calculate_concentration_metrics(holder_balances, total_supply)
-        gini_coefficient = self._calculate_gini_coefficient(holder_balances)
-        whale_analysis = self._analyze_whale_presence(holder_balances, total_supply)
-        distribution_quality = self._assess_distribution_quality(holder_balances, total_supply)
+        concentration_metrics = self._calculate_concentration_metrics(snapshot)
+        gini_coefficient = self._calculate_gini_coefficient(snapshot)
+        whale_analysis = self._analyze_whale_presence(snapshot)
+        distribution_quality = self._assess_distribution_quality(snapshot)
         
         # Determine risk level
         risk_assessment = self._assess_concentration_risk(
-            concentration_metrics, gini_coefficient, whale_analysis, len(holder_balances)
+            concentration_metrics, gini_coefficient, whale_analysis, snapshot.holder_count
         )
         
         # Calculate score adjustment based on distribution
@@ -161,42 +139,41 @@ class HolderDistributionAnalyzer:
         return {
             "token_address": token_address,
             "analysis_timestamp": current_time,
-            "total_holders": len(holder_balances),
-            "total_supply_analyzed": total_supply,
+            "total_holders": snapshot.holder_count,
+            "total_supply_analyzed": snapshot.total_balance,
             "concentration_metrics": concentration_metrics,
             "gini_coefficient": gini_coefficient,
             "whale_analysis": whale_analysis,
             "distribution_quality": distribution_quality,
             "risk_assessment": risk_assessment,
             "score_adjustment": score_adjustment,
-            "holder_categories": self._categorize_holders(holder_balances, total_supply),
+            "holder_categories": self._categorize_holders(snapshot),
             "distribution_warnings": self._generate_distribution_warnings(risk_assessment, concentration_metrics),
-            "validation_passed": self._validate_distribution_analysis(holder_balances, total_supply)
+            "validation_passed": self._validate_distribution_analysis(snapshot)
         }
     
-    def _calculate_concentration_metrics(self, holder_balances: List[float], total_supply: float) -> Dict[str, Any]:
+    def _calculate_concentration_metrics(self, snapshot: HolderSnapshot) -> Dict[str, Any]:
         """
         Calculate concentration metrics for holder distribution.
         
         Args:
-            holder_balances: List of holder balances (sorted descending)
-            total_supply: Total token supply analyzed
+            snapshot: Holder snapshot with balances sorted descending
             
         Returns:
             Concentration metrics dictionary
         """
         try:
-            # Sort balances in descending order
-            sorted_balances = sorted(holder_balances, reverse=True)
+            stats = snapshot.concentration_stats()
+            holder_count = snapshot.holder_count
             
-            # Calculate top N holder concentrations
-            top_1_pct = (sorted_balances[0] / total_supply * 100) if len(sorted_balances) >= 1 else 0
-            top_5_pct = (sum(sorted_balances[:5]) / total_supply * 100) if len(sorted_balances) >= 5 else 0
-            top_10_pct = (sum(sorted_balances[:10]) / total_supply * 100) if len(sorted_balances) >= 10 else 0
-            top_20_pct = (sum(sorted_balances[:20]) / total_supply * 100) if len(sorted_balances) >= 20 else 0
+            # Top N holder concentrations (0 when there are fewer than N holders)
+            top_1_pct = stats['top_pct'][1] if holder_count >= 1 else 0
+            top_5_pct = stats['top_pct'][5] if holder_count >= 5 else 0
+            top_10_pct = stats['top_pct'][10] if holder_count >= 10 else 0
+            top_20_pct = stats['top_pct'][20] if holder_count >= 20 else 0
             
-            # Calculate Herfindahl-Hirschman Index (HHI)
-            hhi = sum((balance / total_supply) ** 2 for balance in sorted_balances) * 10000
+            # Herfindahl-Hirschman Index (HHI) on the 0-10000 scale
+            hhi = stats['hhi'] * 10000
             
             return {
                 "top_1_holder_pct": round(top_1_pct, 2),
@@ -218,56 +195,41 @@ class HolderDistributionAnalyzer:
                 "concentration_level": "unknown"
             }
     
-    def _calculate_gini_coefficient(self, holder_balances: List[float]) -> float:
+    def _calculate_gini_coefficient(self, snapshot: HolderSnapshot) -> float:
         """
         Calculate Gini coefficient for holder distribution inequality.
         
         Args:
-            holder_balances: List of holder balances
+            snapshot: Holder snapshot
             
         Returns:
             Gini coefficient (0 = perfect equality, 1 = perfect inequality)
         """
         try:
-            if not holder_balances or len(holder_balances) < 2:
+            if snapshot.holder_count < 2:
                 return 0.0
             
-            # Sort balances
-            sorted_balances = sorted(holder_balances)
-            n = len(sorted_balances)
-            
-            # Calculate Gini coefficient using the standard formula
-            cumulative_sum = sum((2 * i - n - 1) * balance for i, balance in enumerate(sorted_balances, 1))
-            gini = cumulative_sum / (n * sum(sorted_balances))
-            
-            return round(abs(gini), 4)
+            return round(abs(snapshot.concentration_stats()['gini']), 4)
             
         except Exception as e:
             self.logger.error(f"Error calculating Gini coefficient: {e}")
             return 0.0
     
-    def _analyze_whale_presence(self, holder_balances: List[float], total_supply: float) -> Dict[str, Any]:
+    def _analyze_whale_presence(self, snapshot: HolderSnapshot) -> Dict[str, Any]:
         """
         Analyze whale presence and dominance patterns.
         
         Args:
-            holder_balances: List of holder balances
-            total_supply: Total token supply
+            snapshot: Holder snapshot
             
         Returns:
             Whale analysis results
         """
         try:
-            sorted_balances = sorted(holder_balances, reverse=True)
-            
             # Define whale thresholds (holders with >1% of supply)
-            whale_threshold = total_supply * 0.01
-            whales = [balance for balance in sorted_balances if balance >= whale_threshold]
-            
-            # Calculate whale metrics
-            whale_count = len(whales)
-            whale_dominance_pct = (sum(whales) / total_supply * 100) if whales else 0
-            largest_whale_pct = (sorted_balances[0] / total_supply * 100) if sorted_balances else 0
+            whale_count, whale_dominance_pct = snapshot.holders_above(1.0)
+            largest_whale_pct = snapshot.top_share_pct(1)
+            whale_total = whale_dominance_pct / 100 * snapshot.total_balance
             
             # Assess whale risk level
             whale_risk_level = self._assess_whale_risk(whale_count, whale_dominance_pct, largest_whale_pct)
@@ -278,7 +240,7 @@ class HolderDistributionAnalyzer:
                 "largest_whale_pct": round(largest_whale_pct, 2),
                 "whale_risk_level": whale_risk_level,
                 "whale_threshold_pct": 1.0,  # 1% threshold used
-                "average_whale_holding": round(sum(whales) / len(whales), 2) if whales else 0
+                "average_whale_holding": round(whale_total / whale_count, 2) if whale_count else 0
             }
             
         except Exception as e:
@@ -292,34 +254,34 @@ class HolderDistributionAnalyzer:
                 "average_whale_holding": 0
             }
     
-    def _assess_distribution_quality(self, holder_balances: List[float], total_supply: float) -> Dict[str, Any]:
+    def _assess_distribution_quality(self, snapshot: HolderSnapshot) -> Dict[str, Any]:
         """
         Assess overall distribution quality and health.
         
         Args:
-            holder_balances: List of holder balances
-            total_supply: Total token supply
+            snapshot: Holder snapshot
             
         Returns:
             Distribution quality assessment
         """
         try:
-            holder_count = len(holder_balances)
+            holder_count = snapshot.holder_count
+            stats = snapshot.concentration_stats()
             
-            # Calculate distribution statistics
-            mean_holding = statistics.mean(holder_balances) if holder_balances else 0
-            median_holding = statistics.median(holder_balances) if holder_balances else 0
-            std_deviation = statistics.stdev(holder_balances) if len(holder_balances) > 1 else 0
+            # Distribution statistics
+            mean_holding = stats.get('mean', 0)
+            median_holding = stats.get('median', 0)
+            std_deviation = stats.get('std_deviation', 0)
             
-            # Calculate coefficient of variation (relative dispersion)
-            cv = (std_deviation / mean_holding) if mean_holding > 0 else 0
+            # Coefficient of variation (relative dispersion)
+            cv = stats.get('coefficient_of_variation', 0)
             
             # Assess holder count adequacy
             holder_adequacy = self._assess_holder_adequacy(holder_count)
             
             # Calculate distribution score (0-100)
             distribution_score = self._calculate_distribution_score(
-                holder_count, cv, holder_balances, total_supply
+                holder_count, cv, snapshot.top_share_pct(1)
             )
             
             return {
@@ -471,45 +433,30 @@ class HolderDistributionAnalyzer:
                 "risk_level": "unknown"
             }
     
-    def _categorize_holders(self, holder_balances: List[float], total_supply: float) -> Dict[str, Any]:
+    def _categorize_holders(self, snapshot: HolderSnapshot) -> Dict[str, Any]:
         """
         Categorize holders into different groups based on their holdings.
         
         Args:
-            holder_balances: List of holder balances
-            total_supply: Total token supply
+            snapshot: Holder snapshot
             
         Returns:
             Holder categorization results
         """
         try:
-            categories = {
-                "whales": [],      # >1% of supply
-                "large": [],       # 0.1% - 1% of supply
-                "medium": [],      # 0.01% - 0.1% of supply
-                "small": [],       # <0.01% of supply
-            }
-            
-            for balance in holder_balances:
-                percentage = (balance / total_supply) * 100
-                
-                if percentage > 1.0:
-                    categories["whales"].append(balance)
-                elif percentage > 0.1:
-                    categories["large"].append(balance)
-                elif percentage > 0.01:
-                    categories["medium"].append(balance)
-                else:
-                    categories["small"].append(balance)
+            # Holders strictly above each bound: whales >1%, large 0.1-1%, medium 0.01-0.1%, small <0.01%
+            whale_count, whale_share = snapshot.holders_above(1.0, inclusive=False)
+            above_large, above_large_share = snapshot.holders_above(0.1, inclusive=False)
+            above_medium, _ = snapshot.holders_above(0.01, inclusive=False)
             
             return {
-                "whale_holders": len(categories["whales"]),
-                "large_holders": len(categories["large"]),
-                "medium_holders": len(categories["medium"]),
-                "small_holders": len(categories["small"]),
-                "whale_dominance": round(sum(categories["whales"]) / total_supply * 100, 2),
-                "large_holder_share": round(sum(categories["large"]) / total_supply * 100, 2),
-                "retail_share": round((sum(categories["medium"]) + sum(categories["small"])) / total_supply * 100, 2)
+                "whale_holders": whale_count,
+                "large_holders": above_large - whale_count,
+                "medium_holders": above_medium - above_large,
+                "small_holders": snapshot.holder_count - above_medium,
+                "whale_dominance": round(whale_share, 2),
+                "large_holder_share": round(above_large_share - whale_share, 2),
+                "retail_share": round(100 - above_large_share, 2)
             }
             
         except Exception as e:
@@ -563,8 +510,7 @@ class HolderDistributionAnalyzer:
         else:
             return "insufficient"
     
-    def _calculate_distribution_score(self, holder_count: int, cv: float, 
-                                    holder_balances: List[float], total_supply: float) -> float:
+    def _calculate_distribution_score(self, holder_count: int, cv: float, top_1_pct: float) -> float:
         """Calculate overall distribution quality score."""
         try:
             score = 0.0
@@ -587,8 +533,6 @@ class HolderDistributionAnalyzer:
             score += min(30, evenness_score)
             
             # Top holder concentration component (30% weight)
-            sorted_balances = sorted(holder_balances, reverse=True)
-            top_1_pct = (sorted_balances[0] / total_supply * 100) if sorted_balances else 0
             concentration_score = max(0, 30 - top_1_pct)
             score += concentration_score
             
@@ -687,26 +631,10 @@ class HolderDistributionAnalyzer:
         
         return warnings
     
-    def _validate_distribution_analysis(self, holder_balances: List[float], total_supply: float) -> bool:
+    def _validate_distribution_analysis(self, snapshot: HolderSnapshot) -> bool:
         """Validate distribution analysis results."""
-        try:
-            if not holder_balances or total_supply <= 0:
-                return False
-            
-            # Check if balances sum reasonably close to total supply
-            balance_sum = sum(holder_balances)
-            if abs(balance_sum - total_supply) / total_supply > 0.1:  # 10% tolerance
-                return False
-            
-            # Check for reasonable holder count
-            if len(holder_balances) < 1:
-                return False
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Error validating distribution analysis: {e}")
-            return False
+        # Shares are computed against the snapshot's own total, so only emptiness can invalidate them
+        return snapshot.holder_count >= 1 and snapshot.total_balance > 0
     
     def _get_empty_analysis(self, token_address: str) -> Dict[str, Any]:
         """Get empty analysis result for error cases."""
@@ -0,0 +1,253 @@
+"""
+Shared holder snapshots for concentration analysis.
+
+The holder concentration and distribution analyzers used to fetch the same
+token's holder list independently, each with its own cache, and re-sort the
+balances in Python for every metric. ``HolderSnapshotService`` fetches a
+token's holders once per TTL (concurrent callers share one in-flight fetch)
+and hands out a ``HolderSnapshot``: balances stored once as a descending
+numpy array with their cumulative sums, from which Gini, HHI, top-N shares
+and threshold buckets are all read without another sort.
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TOP_N_LEVELS = (1, 4, 5, 10, 20, 50)
+
+
+class HolderSnapshot:
+    """One token's holder balances, sorted descending, with concentration statistics"""
+
+    def __init__(self, token_address: str, holders: List[Dict[str, Any]], source: str = "holders",
+                 total_holders: Optional[int] = None, fetched_at: Optional[float] = None):
+        """
+        Args:
+            token_address: Token the holders belong to
+            holders: Holder records (``ui_amount``/``balance`` and ``owner``/``address``);
+                records without an address or a positive balance are skipped
+            source: ``holders`` for real holder data, ``top_traders`` for the volume proxy
+            total_holders: Holder count reported by the API, when known
+            fetched_at: Fetch timestamp (defaults to now)
+        """
+        self.token_address = token_address
+        self.source = source
+        self.total_holders = total_holders
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+
+        addresses: List[str] = []
+        balances: List[float] = []
+        for holder in holders:
+            if not isinstance(holder, dict):
+                continue
+            balance = holder.get("ui_amount", holder.get("balance", 0)) or 0
+            address = holder.get("owner") or holder.get("address")
+            if address and isinstance(balance, (int, float)) and balance > 0:
+                balances.append(float(balance))
+                addresses.append(address)
+
+        values = np.asarray(balances, dtype=np.float64)
+        order = np.argsort(-values, kind="stable")
+        self.balances = values[order]
+        self.addresses = [addresses[i] for i in order]
+        self._cumulative = np.cumsum(self.balances)
+        self.total_balance = float(self._cumulative[-1]) if len(self._cumulative) else 0.0
+        self._stats: Optional[Dict[str, Any]] = None
+
+    @property
+    def holder_count(self) -> int:
+        return len(self.balances)
+
+    def top_share_pct(self, n: int) -> float:
+        """Percentage held by the top ``n`` holders (all holders when there are fewer)"""
+        if not self.holder_count or n <= 0:
+            return 0.0
+        return float(self._cumulative[min(n, self.holder_count) - 1] / self.total_balance * 100)
+
+    def holders_above(self, threshold_pct: float, inclusive: bool = True) -> Tuple[int, float]:
+        """
+        Holders whose share of the tracked supply reaches ``threshold_pct``.
+
+        Returns:
+            (holder count, percentage of supply they hold together)
+        """
+        if not self.holder_count:
+            return 0, 0.0
+        # Balances are descending, so the holders above a threshold are a prefix
+        cutoff = -self.total_balance * threshold_pct / 100
+        count = int(np.searchsorted(-self.balances, cutoff, side="right" if inclusive else "left"))
+        return count, self.top_share_pct(count)
+
+    def concentration_stats(self) -> Dict[str, Any]:
+        """
+        Concentration statistics computed in one vectorized pass (memoized).
+
+        ``hhi`` is the sum of squared shares (0-1) and ``gini`` is unrounded;
+        callers scale or round them to their own conventions.
+        """
+        if self._stats is not None:
+            return self._stats
+
+        n = self.holder_count
+        if not n:
+            self._stats = {"holder_count": 0, "total_balance": 0.0}
+            return self._stats
+
+        descending = self.balances
+        shares = descending / self.total_balance
+        ascending = descending[::-1]
+        mean = self.total_balance / n
+        ranks = np.arange(1, n + 1, dtype=np.float64)
+        ratios = ascending / mean
+        std_deviation = float(np.std(descending, ddof=1)) if n > 1 else 0.0
+
+        self._stats = {
+            "holder_count": n,
+            "total_balance": self.total_balance,
+            "gini": float(np.dot(2 * ranks - n - 1, ascending) / (n * self.total_balance)),
+            "hhi": float(np.dot(shares, shares)),
+            "theil_index": float(np.dot(ratios, np.log(ratios)) / n),
+            "top_pct": {level: self.top_share_pct(level) for level in TOP_N_LEVELS},
+            "mean": mean,
+            "median": float(np.median(descending)),
+            "std_deviation": std_deviation,
+            "coefficient_of_variation": std_deviation / mean if mean > 0 else 0.0,
+            "mean_pct": 100.0 / n,
+            "median_pct": float(np.median(shares) * 100)
+        }
+        return self._stats
+
+
+class HolderSnapshotService:
+    """Fetches and caches holder snapshots shared by all holder analyzers"""
+
+    def __init__(self, birdeye_api, ttl_seconds: float = 1800, max_snapshots: int = 2000,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            birdeye_api: Birdeye API instance
+            ttl_seconds: How long a snapshot is reused before refetching
+            max_snapshots: Snapshots kept before the least recently used one is evicted
+            logger: Logger instance
+        """
+        self.birdeye_api = birdeye_api
+        self.ttl_seconds = ttl_seconds
+        self.max_snapshots = max_snapshots
+        self.logger = logger or logging.getLogger(__name__)
+        self._snapshots: "OrderedDict[Tuple[str, str, int], HolderSnapshot]" = OrderedDict()
+        self._in_flight: Dict[Tuple[str, str, int], asyncio.Task] = {}
+        self.stats = {
+            "hits": 0,
+            "fetches": 0,
+            "shared_fetches": 0,
+            "fetch_failures": 0,
+            "evictions": 0
+        }
+
+    async def get_snapshot(self, token_address: str, limit: int = 100,
+                           trader_fallback: bool = False) -> Optional[HolderSnapshot]:
+        """
+        Get a token's holder snapshot, fetching it at most once per TTL.
+
+        Args:
+            token_address: Token to get holders for
+            limit: Number of top holders to fetch
+            trader_fallback: Use top traders (volume as holding proxy) when holder data is unavailable
+
+        Returns:
+            Snapshot, or None if no data is available
+        """
+        snapshot = await self._get_or_fetch((token_address, "holders", limit))
+        if snapshot is None and trader_fallback:
+            snapshot = await self._get_or_fetch((token_address, "top_traders", limit))
+        return snapshot
+
+    async def _get_or_fetch(self, key: Tuple[str, str, int]) -> Optional[HolderSnapshot]:
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None:
+            if time.time() - snapshot.fetched_at < self.ttl_seconds:
+                self.stats["hits"] += 1
+                self._snapshots.move_to_end(key)
+                return snapshot
+            del self._snapshots[key]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.stats["shared_fetches"] += 1
+        else:
+            task = asyncio.ensure_future(self._fetch(key))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shielded so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch(self, key: Tuple[str, str, int]) -> Optional[HolderSnapshot]:
+        token_address, source, limit = key
+        self.stats["fetches"] += 1
+        try:
+            if source == "holders":
+                result = await self.birdeye_api.get_token_holders(token_address, limit=limit)
+                items = result.get("items") if isinstance(result, dict) else None
+                total = result.get("total") if isinstance(result, dict) else None
+                holders = items or []
+            else:
+                traders = await self.birdeye_api.get_top_traders(token_address)
+                total = None
+                holders = [
+                    {"address": trader.get("address", ""), "balance": trader.get("volumeUsd", 0)}
+                    for trader in (traders or [])[:limit] if isinstance(trader, dict)
+                ]
+        except Exception as e:
+            self.logger.warning(f"Error fetching {source} for {token_address}: {e}")
+            self.stats["fetch_failures"] += 1
+            return None
+
+        snapshot = HolderSnapshot(token_address, holders, source=source, total_holders=total)
+        if not snapshot.holder_count:
+            self.stats["fetch_failures"] += 1
+            return None
+        self._snapshots[key] = snapshot
+        self._snapshots.move_to_end(key)
+        while len(self._snapshots) > self.max_snapshots:
+            self._snapshots.popitem(last=False)
+            self.stats["evictions"] += 1
+        return snapshot
+
+    def invalidate(self, token_address: str) -> int:
+        """Drop cached snapshots for a token; returns how many were dropped"""
+        keys = [key for key in self._snapshots if key[0] == token_address]
+        for key in keys:
+            del self._snapshots[key]
+        return len(keys)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get snapshot cache statistics"""
+        requests = self.stats["hits"] + self.stats["fetches"] + self.stats["shared_fetches"]
+        return {
+            **self.stats,
+            "cached_snapshots": len(self._snapshots),
+            "hit_rate": (self.stats["hits"] + self.stats["shared_fetches"]) / max(1, requests)
+        }
+
+
+_shared_services: Dict[int, HolderSnapshotService] = {}
+_shared_services_lock = threading.Lock()
+
+
+def get_shared_holder_snapshot_service(birdeye_api) -> HolderSnapshotService:
+    """Get the process-wide snapshot service for a Birdeye API instance"""
+    with _shared_services_lock:
+        service = _shared_services.get(id(birdeye_api))
+        # Guard against a recycled id() from a garbage-collected API instance
+        if service is None or service.birdeye_api is not birdeye_api:
+            service = HolderSnapshotService(birdeye_api)
+            _shared_services[id(birdeye_api)] = service
+    return service
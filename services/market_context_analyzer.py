@@ -10,6 +10,8 @@ from typing import Dict, List, Any, Optional, Tuple
 import statistics
 from datetime import datetime
 
+from services.analyzer_registry import memoized_analyzer
+
 class MarketContextAnalyzer:
     """
     Advanced market context and comparative analysis
@@ -87,6 +89,7 @@ class MarketContextAnalyzer:
             
         return analysis
     
+    @memoized_analyzer('market_context.classification', fields=('market_cap', 'liquidity', 'price'))
     def _classify_market_position(self, metadata: Dict) -> Dict[str, Any]:
         """
         Classify token's market position
@@ -159,6 +162,7 @@ class MarketContextAnalyzer:
         else:
             return "Early Stage Market"
     
+    @memoized_analyzer('market_context.liquidity', fields=('liquidity', 'market_cap', 'volume_24h'), data_arg=1)
     async def _analyze_liquidity_depth(self, token_address: str, metadata: Dict) -> Dict[str, Any]:
         """
         Analyze liquidity depth and quality
@@ -365,6 +369,7 @@ class MarketContextAnalyzer:
         
         return slippage_estimates
     
+    @memoized_analyzer('market_context.comparative', fields=('market_cap', 'liquidity', 'volume_24h'), data_arg=1)
     async def _calculate_comparative_metrics(self, token_address: str, metadata: Dict) -> Dict[str, Any]:
         """
         Calculate comparative metrics against market benchmarks
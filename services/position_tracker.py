@@ -2,12 +2,28 @@ import sqlite3
 import json
 import time
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple, Any, Iterator
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import asyncio
 from datetime import datetime, timedelta
 
+# Hot-path statements are kept as constants so sqlite3's per-connection
+# statement cache reuses the compiled statement on every call
+UPDATE_PRICE_SQL = """
+    UPDATE positions 
+    SET current_price = ?, updated_at = ?
+    WHERE id = ? AND status = 'active'
+"""
+
+INSERT_ALERT_SQL = """
+    INSERT INTO position_alerts 
+    (position_id, alert_type, alert_score, alert_message, sent_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
 @dataclass
 class Position:
     """Represents a tracked trading position"""
@@ -81,20 +97,64 @@ class UserPreferences:
 class PositionTracker:
     """Service for tracking and managing trading positions"""
     
-    def __init__(self, db_path: str = "data/positions.db", logger: Optional[logging.Logger] = None):
+    def __init__(self, db_path: str = "data/positions.db", logger: Optional[logging.Logger] = None,
+                 max_pending_writes: int = 200, flush_interval_seconds: float = 5.0):
+        """
+        Args:
+            db_path: SQLite database file
+            logger: Logger instance
+            max_pending_writes: Queued price updates/alerts that trigger a flush
+            flush_interval_seconds: Maximum age of queued writes before a flush
+        """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
         self.logger = logger or logging.getLogger(__name__)
         
+        # One long-lived connection (WAL) shared by all methods, guarded by a lock
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=64)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        
+        # Write-behind queues: latest price per position, alerts in arrival order
+        self.max_pending_writes = max_pending_writes
+        self.flush_interval_seconds = flush_interval_seconds
+        self._pending_prices: Dict[int, Tuple[float, int]] = {}
+        self._pending_alerts: List[Tuple[int, str, float, str, int]] = []
+        self._last_flush = time.time()
+        self.write_stats = {
+            "flushes": 0,
+            "prices_flushed": 0,
+            "alerts_flushed": 0
+        }
+        
         # Initialize database
         self._init_database()
         
         self.logger.info(f"🎯 PositionTracker initialized with database: {self.db_path}")
     
+    @contextmanager
+    def _get_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Use the shared connection inside one transaction.
+        
+        Queued writes are flushed first so callers always read their own writes.
+        Commits on success and rolls back on error.
+        """
+        with self._lock:
+            self._flush_locked()
+            try:
+                yield self._conn
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+    
     def _init_database(self):
         """Initialize SQLite database with required tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS positions (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -146,8 +206,6 @@ class PositionTracker:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_positions_user_status ON positions(user_id, status)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_positions_status ON positions(status)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_position_id ON position_alerts(position_id)")
-            
-            conn.commit()
     
     def add_position(self, user_id: str, token_address: str, token_symbol: str, 
                     token_name: str, entry_price: float, entry_score: float = 0.0,
@@ -167,7 +225,7 @@ class PositionTracker:
         
         entry_conditions_json = json.dumps(entry_conditions or {})
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.execute("""
                 INSERT OR REPLACE INTO positions 
                 (user_id, token_address, token_symbol, token_name, entry_timestamp, 
@@ -179,7 +237,6 @@ class PositionTracker:
                   entry_score, entry_conditions_json, current_time, current_time))
             
             position_id = cursor.lastrowid
-            conn.commit()
         
         self.logger.info(f"📊 Added position {position_id}: {token_symbol} for user {user_id} at ${entry_price:.6f}")
         return position_id
@@ -188,26 +245,114 @@ class PositionTracker:
         """Update current price for a position"""
         current_time = int(time.time())
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                UPDATE positions 
-                SET current_price = ?, updated_at = ?
-                WHERE id = ? AND status = 'active'
-            """, (current_price, current_time, position_id))
-            
+        with self._get_connection() as conn:
+            cursor = conn.execute(UPDATE_PRICE_SQL, (current_price, current_time, position_id))
             updated = cursor.rowcount > 0
-            conn.commit()
         
         if updated:
             self.logger.debug(f"💰 Updated position {position_id} price to ${current_price:.6f}")
         
         return updated
     
+    def update_position_prices(self, prices: Dict[int, float]) -> int:
+        """
+        Update the current price of many positions in one transaction.
+        
+        Args:
+            prices: Current price by position ID
+            
+        Returns:
+            Number of active positions updated
+        """
+        if not prices:
+            return 0
+        
+        current_time = int(time.time())
+        with self._get_connection() as conn:
+            cursor = conn.executemany(
+                UPDATE_PRICE_SQL,
+                [(price, current_time, position_id) for position_id, price in prices.items()]
+            )
+            updated = cursor.rowcount
+        
+        self.logger.debug(f"💰 Updated prices for {updated}/{len(prices)} positions")
+        return updated
+    
+    def queue_price_update(self, position_id: int, current_price: float) -> None:
+        """
+        Queue a price update for the next batched flush.
+        
+        Only the latest queued price per position is written.
+        """
+        with self._lock:
+            self._pending_prices[position_id] = (current_price, int(time.time()))
+            self._maybe_flush_locked()
+    
+    def queue_alert(self, position_id: int, alert_type: str, alert_score: float, message: str) -> None:
+        """Queue an alert for the next batched flush (use add_alert when the alert ID is needed)"""
+        with self._lock:
+            self._pending_alerts.append((position_id, alert_type, alert_score, message, int(time.time())))
+            self._maybe_flush_locked()
+    
+    def flush(self) -> int:
+        """
+        Write all queued price updates and alerts in one transaction.
+        
+        Returns:
+            Number of queued writes flushed
+        """
+        with self._lock:
+            return self._flush_locked()
+    
+    def _maybe_flush_locked(self) -> None:
+        pending = len(self._pending_prices) + len(self._pending_alerts)
+        if pending >= self.max_pending_writes or time.time() - self._last_flush >= self.flush_interval_seconds:
+            self._flush_locked()
+    
+    def _flush_locked(self) -> int:
+        self._last_flush = time.time()
+        if not self._pending_prices and not self._pending_alerts:
+            return 0
+        
+        prices, self._pending_prices = self._pending_prices, {}
+        alerts, self._pending_alerts = self._pending_alerts, []
+        try:
+            with self._conn:
+                if prices:
+                    self._conn.executemany(
+                        UPDATE_PRICE_SQL,
+                        [(price, updated_at, position_id) for position_id, (price, updated_at) in prices.items()]
+                    )
+                if alerts:
+                    self._conn.executemany(INSERT_ALERT_SQL, alerts)
+        except sqlite3.Error as e:
+            # Keep the writes queued for the next flush
+            prices.update(self._pending_prices)
+            self._pending_prices = prices
+            self._pending_alerts = alerts + self._pending_alerts
+            self.logger.error(f"❌ Failed to flush {len(prices) + len(alerts)} queued position writes: {e}")
+            return 0
+        
+        self.write_stats["flushes"] += 1
+        self.write_stats["prices_flushed"] += len(prices)
+        self.write_stats["alerts_flushed"] += len(alerts)
+        self.logger.debug(f"💾 Flushed {len(prices)} price updates and {len(alerts)} alerts")
+        return len(prices) + len(alerts)
+    
+    def close(self) -> None:
+        """Flush queued writes and close the database connection"""
+        with self._lock:
+            if self._conn is None:
+                return
+            self._flush_locked()
+            self._conn.close()
+            self._conn = None
+    
     def close_position(self, position_id: int, reason: str = "manual") -> bool:
         """Close a position"""
         current_time = int(time.time())
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.execute("""
                 UPDATE positions 
                 SET status = 'closed', updated_at = ?
@@ -215,7 +360,6 @@ class PositionTracker:
             """, (current_time, position_id))
             
             closed = cursor.rowcount > 0
-            conn.commit()
         
         if closed:
             # Add closing alert
@@ -226,8 +370,7 @@ class PositionTracker:
     
     def get_position(self, position_id: int) -> Optional[Position]:
         """Get a specific position by ID"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.execute("SELECT * FROM positions WHERE id = ?", (position_id,))
             row = cursor.fetchone()
             
@@ -238,8 +381,7 @@ class PositionTracker:
     
     def get_user_positions(self, user_id: str, status: str = "active") -> List[Position]:
         """Get all positions for a user"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.execute(
                 "SELECT * FROM positions WHERE user_id = ? AND status = ? ORDER BY created_at DESC",
                 (user_id, status)
@@ -249,8 +391,7 @@ class PositionTracker:
     
     def get_all_active_positions(self) -> List[Position]:
         """Get all active positions across all users"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.execute(
                 "SELECT * FROM positions WHERE status = 'active' ORDER BY created_at DESC"
             )
@@ -261,23 +402,17 @@ class PositionTracker:
         """Add an alert for a position"""
         current_time = int(time.time())
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                INSERT INTO position_alerts 
-                (position_id, alert_type, alert_score, alert_message, sent_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (position_id, alert_type, alert_score, message, current_time))
+        with self._get_connection() as conn:
+            cursor = conn.execute(INSERT_ALERT_SQL, (position_id, alert_type, alert_score, message, current_time))
             
             alert_id = cursor.lastrowid
-            conn.commit()
         
         self.logger.info(f"🚨 Added alert {alert_id} for position {position_id}: {alert_type}")
         return alert_id
     
     def get_position_alerts(self, position_id: int, unacknowledged_only: bool = False) -> List[PositionAlert]:
         """Get alerts for a position"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             
             query = "SELECT * FROM position_alerts WHERE position_id = ?"
             params = [position_id]
@@ -292,21 +427,19 @@ class PositionTracker:
     
     def acknowledge_alert(self, alert_id: int) -> bool:
         """Mark an alert as acknowledged"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.execute(
                 "UPDATE position_alerts SET acknowledged = 1 WHERE id = ?",
                 (alert_id,)
             )
             
             acknowledged = cursor.rowcount > 0
-            conn.commit()
         
         return acknowledged
     
     def get_user_preferences(self, user_id: str) -> Optional[UserPreferences]:
         """Get user preferences"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.execute("SELECT * FROM user_preferences WHERE user_id = ?", (user_id,))
             row = cursor.fetchone()
             
@@ -317,7 +450,7 @@ class PositionTracker:
     
     def set_user_preferences(self, prefs: UserPreferences) -> bool:
         """Set user preferences"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.execute("""
                 INSERT OR REPLACE INTO user_preferences 
                 (user_id, exit_sensitivity, max_hold_time_hours, default_profit_target_percent,
@@ -328,14 +461,13 @@ class PositionTracker:
                   prefs.alert_frequency_minutes, prefs.auto_close_on_exit_signal))
             
             updated = cursor.rowcount > 0
-            conn.commit()
         
         self.logger.info(f"⚙️ Updated preferences for user {prefs.user_id}")
         return updated
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get position tracking statistics"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             # Active positions
             cursor = conn.execute("SELECT COUNT(*) FROM positions WHERE status = 'active'")
             active_count = cursor.fetchone()[0]
@@ -358,14 +490,15 @@ class PositionTracker:
                 "total_positions": total_count,
                 "recent_alerts_24h": recent_alerts,
                 "total_users": user_count,
-                "database_path": str(self.db_path)
+                "database_path": str(self.db_path),
+                "write_batching": dict(self.write_stats)
             }
     
     def cleanup_old_positions(self, days_old: int = 30) -> int:
         """Clean up old closed positions"""
         cutoff_time = int(time.time()) - (days_old * 86400)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             # First delete related alerts
             conn.execute("""
                 DELETE FROM position_alerts 
@@ -382,7 +515,6 @@ class PositionTracker:
             """, (cutoff_time,))
             
             deleted_count = cursor.rowcount
-            conn.commit()
         
         self.logger.info(f"🧹 Cleaned up {deleted_count} old positions")
         return deleted_count 
\ No newline at end of file
@@ -8,10 +8,13 @@ Advanced pattern recognition with trading opportunity identification:
 - Implements phase detection (early pump, peak pump, dump start, dump continuation)
 """
 
+import logging
 import time
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Callable, Dict, Any, List, NamedTuple, Tuple, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass
 class PumpDumpSignal:
@@ -38,6 +41,477 @@ class TradingOpportunity:
     reasoning: str
 
 
+class _RuleBand(NamedTuple):
+    """One branch of an if/elif rule ladder"""
+    when: Callable[[Dict[str, np.ndarray]], np.ndarray]
+    points: int
+    detail_key: str
+    detail: str                 # Detail template, formatted only when the analysis dict is built
+    log_level: int
+    log: str                    # Log template, formatted only when the level is enabled
+    flag: Optional[str] = None
+
+
+class _RuleLadder:
+    """Ordered bands; the first band whose condition holds fires (if/elif semantics)"""
+
+    def __init__(self, *bands: _RuleBand, name: Optional[str] = None):
+        self.bands = bands
+        self.name = name  # Column the awarded points are published under for later rules
+        self.points = np.array([band.points for band in bands], dtype=np.int64)
+
+
+class _RuleSection(NamedTuple):
+    key: str                    # Analysis dict key
+    label: str                  # Debug progress label
+    ladders: Tuple[_RuleLadder, ...]
+
+
+_EXTREME_MOVE = 'EXTREME_PRICE_MOVEMENT'
+_VOLUME_MANIPULATION = 'VOLUME_MANIPULATION'
+
+PUMP_DUMP_RULES: Tuple[_RuleSection, ...] = (
+    _RuleSection('pump_indicators', 'pump patterns', (
+        # Extreme price acceleration over 24h (e.g. TDCCP's 750,000% gain)
+        _RuleLadder(
+            _RuleBand(lambda c: c['price_24h'] > 10000, 50, 'extreme_mega_pump', "EXTREME PUMP: {price_24h:+.1f}% in 24h",
+                      logging.WARNING, "EXTREME MEGA PUMP DETECTED: {price_24h:+.1f}%", _EXTREME_MOVE),
+            _RuleBand(lambda c: c['price_24h'] > 1000, 40, 'mega_pump', "MEGA PUMP: {price_24h:+.1f}% in 24h",
+                      logging.WARNING, "MEGA PUMP DETECTED: {price_24h:+.1f}%", _EXTREME_MOVE),
+            _RuleBand(lambda c: c['price_24h'] > 500, 35, 'massive_pump', "MASSIVE PUMP: {price_24h:+.1f}% in 24h",
+                      logging.WARNING, "MASSIVE PUMP DETECTED: {price_24h:+.1f}%", _EXTREME_MOVE),
+            _RuleBand(lambda c: c['price_24h'] > 200, 30, 'major_pump', "MAJOR PUMP: {price_24h:+.1f}% in 24h",
+                      logging.WARNING, "MAJOR PUMP DETECTED: {price_24h:+.1f}%"),
+            _RuleBand(lambda c: c['price_24h'] > 100, 25, 'pump_detected', "PUMP: {price_24h:+.1f}% in 24h",
+                      logging.WARNING, "PUMP DETECTED: {price_24h:+.1f}%"),
+        ),
+        # Shorter timeframe extreme movements
+        _RuleLadder(
+            _RuleBand(lambda c: c['price_1h'] > 500, 40, 'extreme_1h_pump', "CRITICAL: {price_1h:+.1f}% in 1 hour",
+                      logging.CRITICAL, "CRITICAL 1h pump detected: {price_1h:+.1f}%", _EXTREME_MOVE),
+            _RuleBand(lambda c: c['price_1h'] > 200, 30, 'extreme_1h_pump', "EXTREME: {price_1h:+.1f}% in 1 hour",
+                      logging.WARNING, "Extreme 1h pump detected: {price_1h:+.1f}%", _EXTREME_MOVE),
+            _RuleBand(lambda c: c['price_1h'] > 100, 25, 'extreme_1h_pump', "{price_1h:+.1f}% in 1 hour",
+                      logging.WARNING, "Extreme 1h pump detected: {price_1h:+.1f}%"),
+            _RuleBand(lambda c: c['price_1h'] > 50, 15, 'high_1h_pump', "{price_1h:+.1f}% in 1 hour",
+                      logging.DEBUG, "High 1h pump detected: {price_1h:+.1f}%"),
+            _RuleBand(lambda c: c['price_1h'] > 20, 10, 'moderate_1h_pump', "{price_1h:+.1f}% in 1 hour",
+                      logging.DEBUG, "Moderate 1h pump detected: {price_1h:+.1f}%"),
+        ),
+        # Acceleration (1h gain outpacing the longer windows)
+        _RuleLadder(
+            _RuleBand(lambda c: (c['price_1h'] > c['price_4h'] * 2) & (c['price_4h'] > c['price_24h'] * 0.1) & (c['price_1h'] > 50),
+                      25, 'acceleration_pattern',
+                      "Classic pump acceleration: 1h={price_1h:+.1f}% >> 4h={price_4h:+.1f}% >> 24h={price_24h:+.1f}%",
+                      logging.WARNING, "ACCELERATION PATTERN DETECTED: 1h={price_1h:+.1f}% >> 4h={price_4h:+.1f}% >> 24h={price_24h:+.1f}%"),
+            _RuleBand(lambda c: (c['price_1h'] > c['price_4h'] * 1.5) & (c['price_4h'] > 0), 15, 'price_acceleration',
+                      "1h gain ({price_1h:+.1f}%) >> 4h gain ({price_4h:+.1f}%)",
+                      logging.DEBUG, "Price acceleration detected: 1h={price_1h:+.1f}% vs 4h={price_4h:+.1f}%"),
+        ),
+        # Volume surge against the 24h hourly average
+        _RuleLadder(
+            _RuleBand(lambda c: c['volume_surge_ratio'] > 50, 35, 'extreme_volume_surge', "EXTREME: {volume_surge_ratio:.1f}x normal volume",
+                      logging.CRITICAL, "EXTREME volume surge: {volume_surge_ratio:.1f}x normal", _VOLUME_MANIPULATION),
+            _RuleBand(lambda c: c['volume_surge_ratio'] > 20, 30, 'critical_volume_surge', "CRITICAL: {volume_surge_ratio:.1f}x normal volume",
+                      logging.WARNING, "Critical volume surge: {volume_surge_ratio:.1f}x normal", _VOLUME_MANIPULATION),
+            _RuleBand(lambda c: c['volume_surge_ratio'] > 10, 20, 'extreme_volume_surge', "{volume_surge_ratio:.1f}x normal volume",
+                      logging.WARNING, "Extreme volume surge: {volume_surge_ratio:.1f}x normal"),
+            _RuleBand(lambda c: c['volume_surge_ratio'] > 5, 15, 'high_volume_surge', "{volume_surge_ratio:.1f}x normal volume",
+                      logging.DEBUG, "High volume surge: {volume_surge_ratio:.1f}x normal"),
+            _RuleBand(lambda c: c['volume_surge_ratio'] > 2, 10, 'moderate_volume_surge', "{volume_surge_ratio:.1f}x normal volume",
+                      logging.DEBUG, "Moderate volume surge: {volume_surge_ratio:.1f}x normal"),
+            name='volume_surge_score',
+        ),
+        # Volume far above market cap
+        _RuleLadder(
+            _RuleBand(lambda c: c['volume_to_mcap_ratio'] > 50, 40, 'extreme_volume_ratio',
+                      "EXTREME MANIPULATION: Volume {volume_to_mcap_ratio:.1f}x market cap",
+                      logging.CRITICAL, "EXTREME volume manipulation: {volume_to_mcap_ratio:.1f}x market cap", _VOLUME_MANIPULATION),
+            _RuleBand(lambda c: c['volume_to_mcap_ratio'] > 20, 30, 'critical_volume_ratio',
+                      "CRITICAL MANIPULATION: Volume {volume_to_mcap_ratio:.1f}x market cap",
+                      logging.WARNING, "Critical volume manipulation: {volume_to_mcap_ratio:.1f}x market cap", _VOLUME_MANIPULATION),
+            _RuleBand(lambda c: c['volume_to_mcap_ratio'] > 10, 25, 'high_volume_ratio',
+                      "HIGH MANIPULATION: Volume {volume_to_mcap_ratio:.1f}x market cap",
+                      logging.WARNING, "High volume manipulation: {volume_to_mcap_ratio:.1f}x market cap", _VOLUME_MANIPULATION),
+            _RuleBand(lambda c: c['volume_to_mcap_ratio'] > 5, 20, 'excessive_volume_ratio', "Volume {volume_to_mcap_ratio:.1f}x market cap",
+                      logging.WARNING, "Excessive volume ratio: {volume_to_mcap_ratio:.1f}x market cap"),
+            _RuleBand(lambda c: c['volume_to_mcap_ratio'] > 2, 10, 'high_volume_ratio', "Volume {volume_to_mcap_ratio:.1f}x market cap",
+                      logging.DEBUG, "High volume ratio: {volume_to_mcap_ratio:.1f}x market cap"),
+        ),
+    )),
+    _RuleSection('dump_indicators', 'dump patterns', (
+        # Price crash patterns
+        _RuleLadder(
+            _RuleBand(lambda c: c['price_1h'] < -70, 40, 'extreme_crash', "EXTREME CRASH: {price_1h:+.1f}% in 1 hour",
+                      logging.CRITICAL, "EXTREME crash detected: {price_1h:+.1f}%", _EXTREME_MOVE),
+            _RuleBand(lambda c: c['price_1h'] < -50, 30, 'severe_crash', "SEVERE CRASH: {price_1h:+.1f}% in 1 hour",
+                      logging.WARNING, "Severe crash detected: {price_1h:+.1f}%", _EXTREME_MOVE),
+            _RuleBand(lambda c: c['price_1h'] < -30, 25, 'extreme_1h_crash', "{price_1h:+.1f}% in 1 hour",
+                      logging.WARNING, "Extreme 1h crash detected: {price_1h:+.1f}%"),
+            _RuleBand(lambda c: c['price_1h'] < -15, 15, 'high_1h_crash', "{price_1h:+.1f}% in 1 hour",
+                      logging.DEBUG, "High 1h crash detected: {price_1h:+.1f}%"),
+        ),
+        # Dump after pump (classic pattern)
+        _RuleLadder(
+            _RuleBand(lambda c: (c['price_24h'] > 1000) & (c['price_1h'] < -30), 35, 'mega_pump_crash',
+                      "MEGA PUMP CRASH: 24h={price_24h:+.1f}%, 1h={price_1h:+.1f}%",
+                      logging.CRITICAL, "MEGA PUMP CRASH PATTERN: 24h={price_24h:+.1f}%, 1h={price_1h:+.1f}%", 'PUMP_DUMP_PATTERN'),
+            _RuleBand(lambda c: (c['price_24h'] > 500) & (c['price_1h'] < -20), 30, 'massive_pump_crash',
+                      "MASSIVE PUMP CRASH: 24h={price_24h:+.1f}%, 1h={price_1h:+.1f}%",
+                      logging.WARNING, "MASSIVE PUMP CRASH PATTERN: 24h={price_24h:+.1f}%, 1h={price_1h:+.1f}%", 'PUMP_DUMP_PATTERN'),
+            _RuleBand(lambda c: (c['price_24h'] > 100) & (c['price_1h'] < -15), 25, 'pump_dump_pattern',
+                      "PUMP DUMP: 24h={price_24h:+.1f}%, 1h={price_1h:+.1f}%",
+                      logging.WARNING, "PUMP DUMP PATTERN: 24h={price_24h:+.1f}%, 1h={price_1h:+.1f}%", 'PUMP_DUMP_PATTERN'),
+            _RuleBand(lambda c: (c['price_24h'] > 50) & (c['price_1h'] < -10), 20, 'dump_after_pump',
+                      "24h: {price_24h:+.1f}%, 1h: {price_1h:+.1f}%",
+                      logging.DEBUG, "Dump after pump pattern: 24h={price_24h:+.1f}%, 1h={price_1h:+.1f}%"),
+        ),
+        # Volume during the crash (reuses the pump section's volume surge points)
+        _RuleLadder(
+            _RuleBand(lambda c: (c['price_1h'] < -10) & (c['volume_1h'] > 0) & (c['volume_surge_score'] > 20), 20, 'panic_selling',
+                      "PANIC SELLING: {price_1h:+.1f}% with {volume_surge_score} volume score",
+                      logging.WARNING, "Panic selling detected: {price_1h:+.1f}% with volume"),
+            _RuleBand(lambda c: (c['price_1h'] < -10) & (c['volume_1h'] > 0) & (c['volume_surge_score'] > 10), 15, 'panic_selling',
+                      "High volume crash: {price_1h:+.1f}% with {volume_surge_score} volume score",
+                      logging.DEBUG, "High volume crash detected: {price_1h:+.1f}% with volume"),
+        ),
+    )),
+    _RuleSection('manipulation_signals', 'manipulation signals', (
+        # Volume per unique trader
+        _RuleLadder(
+            _RuleBand(lambda c: c['volume_per_trader'] > 1000000, 35, 'extreme_volume_per_trader', "EXTREME: ${volume_per_trader:,.0f} per trader",
+                      logging.CRITICAL, "EXTREME volume per trader: ${volume_per_trader:,.0f}", _VOLUME_MANIPULATION),
+            _RuleBand(lambda c: c['volume_per_trader'] > 500000, 30, 'critical_volume_per_trader', "CRITICAL: ${volume_per_trader:,.0f} per trader",
+                      logging.WARNING, "Critical volume per trader: ${volume_per_trader:,.0f}", _VOLUME_MANIPULATION),
+            _RuleBand(lambda c: c['volume_per_trader'] > 100000, 20, 'high_volume_per_trader', "${volume_per_trader:,.0f} per trader",
+                      logging.WARNING, "High volume per trader: ${volume_per_trader:,.0f}"),
+            _RuleBand(lambda c: c['volume_per_trader'] > 50000, 10, 'moderate_volume_per_trader', "${volume_per_trader:,.0f} per trader",
+                      logging.DEBUG, "Moderate volume per trader: ${volume_per_trader:,.0f}"),
+        ),
+        # Few traders behind large volume
+        _RuleLadder(
+            _RuleBand(lambda c: (c['volume_24h'] > 1000000) & (c['unique_traders'] < 5), 40, 'extreme_few_traders',
+                      "EXTREME: Only {unique_traders} traders for ${volume_24h:,.0f} volume",
+                      logging.CRITICAL, "EXTREME manipulation: {unique_traders} traders, ${volume_24h:,.0f}", _VOLUME_MANIPULATION),
+            _RuleBand(lambda c: (c['volume_24h'] > 500000) & (c['unique_traders'] < 5), 30, 'critical_few_traders',
+                      "CRITICAL: Only {unique_traders} traders for ${volume_24h:,.0f} volume",
+                      logging.WARNING, "Critical manipulation: {unique_traders} traders, ${volume_24h:,.0f}", _VOLUME_MANIPULATION),
+            _RuleBand(lambda c: (c['volume_24h'] > 100000) & (c['unique_traders'] < 10), 25, 'few_traders_high_volume',
+                      "Only {unique_traders} traders for ${volume_24h:,.0f} volume",
+                      logging.WARNING, "Few traders, high volume: {unique_traders} traders, ${volume_24h:,.0f}"),
+            _RuleBand(lambda c: (c['volume_24h'] > 50000) & (c['unique_traders'] < 5), 20, 'very_few_traders',
+                      "Only {unique_traders} traders for ${volume_24h:,.0f} volume",
+                      logging.DEBUG, "Very few traders: {unique_traders} traders, ${volume_24h:,.0f}"),
+        ),
+        # Extreme moves on tokens less than 24 hours old
+        _RuleLadder(
+            _RuleBand(lambda c: _is_new(c) & ((c['price_24h'] > 5000) | (c['price_24h'] < -90)), 30, 'new_token_extreme_moves',
+                      "EXTREME: {token_age_hours:.1f}h old with {price_24h:+.1f}% move",
+                      logging.CRITICAL, "EXTREME new token manipulation: {token_age_hours:.1f}h old, {price_24h:+.1f}%", 'NEW_TOKEN_MANIPULATION'),
+            _RuleBand(lambda c: _is_new(c) & ((c['price_24h'] > 1000) | (c['price_24h'] < -80)), 25, 'new_token_major_moves',
+                      "MAJOR: {token_age_hours:.1f}h old with {price_24h:+.1f}% move",
+                      logging.WARNING, "Major new token manipulation: {token_age_hours:.1f}h old, {price_24h:+.1f}%", 'NEW_TOKEN_MANIPULATION'),
+            _RuleBand(lambda c: _is_new(c) & ((c['price_24h'] > 500) | (c['price_24h'] < -80)), 15, 'new_token_extreme_moves',
+                      "{token_age_hours:.1f}h old with {price_24h:+.1f}% move",
+                      logging.WARNING, "New token extreme moves: {token_age_hours:.1f}h old, {price_24h:+.1f}%"),
+        ),
+    )),
+    _RuleSection('time_pattern_analysis', 'time patterns', (
+        # Unsustainable momentum (1h rate far above the 4h/24h hourly rates)
+        _RuleLadder(
+            _RuleBand(lambda c: _all_rising(c) & (c['momentum_1h'] > c['momentum_4h'] * 5) & (c['momentum_1h'] > c['momentum_24h'] * 10),
+                      25, 'unsustainable_momentum',
+                      "1h momentum ({momentum_1h:.1f}%) >> 4h rate ({momentum_4h:.1f}%) >> 24h rate ({momentum_24h:.1f}%)",
+                      logging.WARNING, "Unsustainable momentum detected"),
+            _RuleBand(lambda c: _all_rising(c) & (c['momentum_1h'] > c['momentum_4h'] * 3) & (c['momentum_1h'] > c['momentum_24h'] * 5),
+                      15, 'accelerating_momentum',
+                      "Accelerating: 1h={momentum_1h:.1f}%, 4h_rate={momentum_4h:.1f}%, 24h_rate={momentum_24h:.1f}%",
+                      logging.DEBUG, "Accelerating momentum detected"),
+        ),
+    )),
+)
+
+# Normalization for risk_score (raised with the enhanced scoring)
+PUMP_DUMP_MAX_SCORE = 200
+
+# (min risk_score, min total_score, risk level, recommendation); below all of them: MINIMAL / MONITOR
+RISK_LEVELS = (
+    (0.8, 100, 'CRITICAL', 'AVOID'),
+    (0.6, 75, 'HIGH', 'AVOID'),
+    (0.4, 50, 'MEDIUM', 'CAUTION'),
+    (0.2, 25, 'LOW', 'MONITOR'),
+)
+
+# Phase opportunities, in the order phases are checked against the 1h price change
+PHASE_OPPORTUNITIES = (
+    {'opportunity_type': 'EXTREME_PUMP', 'action': 'EXIT', 'estimated_profit_potential': -20.0, 'max_hold_time_minutes': 10,
+     'stop_loss_percentage': 10.0, 'take_profit_percentage': 0.0,
+     'reasoning': 'Extreme pump detected; exit recommended to avoid crash.'},
+    {'opportunity_type': 'MOMENTUM_PUMP', 'action': 'ENTER_HIGH_RISK', 'estimated_profit_potential': 30.0, 'max_hold_time_minutes': 30,
+     'stop_loss_percentage': 15.0, 'take_profit_percentage': 20.0,
+     'reasoning': 'Momentum pump detected; high-risk scalp possible.'},
+    {'opportunity_type': 'EARLY_PUMP', 'action': 'ENTER', 'estimated_profit_potential': 50.0, 'max_hold_time_minutes': 60,
+     'stop_loss_percentage': 20.0, 'take_profit_percentage': 40.0,
+     'reasoning': 'Early pump detected; entry opportunity.'},
+    {'opportunity_type': 'DUMP_START', 'action': 'EXIT', 'estimated_profit_potential': -30.0, 'max_hold_time_minutes': 5,
+     'stop_loss_percentage': 10.0, 'take_profit_percentage': 0.0,
+     'reasoning': 'Severe dump detected; exit recommended.'},
+    {'opportunity_type': 'DUMP_CONTINUATION', 'action': 'AVOID', 'estimated_profit_potential': -10.0, 'max_hold_time_minutes': 0,
+     'stop_loss_percentage': 0.0, 'take_profit_percentage': 0.0,
+     'reasoning': 'Ongoing dump detected; avoid entry.'},
+)
+
+
+def _is_new(c: Dict[str, np.ndarray]) -> np.ndarray:
+    return (c['token_age_hours'] > 0) & (c['token_age_hours'] < 24)
+
+
+def _all_rising(c: Dict[str, np.ndarray]) -> np.ndarray:
+    return (c['price_1h'] > 0) & (c['price_4h'] > 0) & (c['price_24h'] > 0)
+
+
+class PumpDumpResult:
+    """
+    Batch screening result for one token.
+
+    Scores, risk level and phase are plain attributes; ``analysis`` (the full
+    ``analyze_token`` dict with detail strings and signals) is built on first
+    access, and ``log_diagnostics`` formats only the lines the logger emits.
+    """
+
+    __slots__ = ('detector', 'token_symbol', 'token_data', 'pump_score', 'dump_score', 'manipulation_score',
+                 'time_pattern_score', 'total_score', 'risk_score', 'risk_level', 'recommendation', 'current_phase',
+                 'error', '_columns', '_row', '_unique_traders', '_band_indexes', '_phase_index', '_analysis')
+
+    def __init__(self, detector: 'EnhancedPumpDumpDetector', token_symbol: str, token_data: Dict[str, Any],
+                 columns: Optional[Dict[str, np.ndarray]], row: int, unique_traders: int,
+                 band_indexes: List[List[int]], section_scores: List[int], risk_score: float,
+                 risk_level_index: int, phase_index: int):
+        self.detector = detector
+        self.token_symbol = token_symbol
+        self.token_data = token_data
+        self._columns = columns
+        self._row = row
+        self._unique_traders = unique_traders
+        self._band_indexes = band_indexes
+        self._phase_index = phase_index
+        self._analysis: Optional[Dict[str, Any]] = None
+        self.error: Optional[Exception] = None
+
+        self.pump_score, self.dump_score, self.manipulation_score, self.time_pattern_score = section_scores
+        self.total_score = self.pump_score + self.dump_score + self.manipulation_score + self.time_pattern_score
+        self.risk_score = risk_score
+        if risk_level_index < len(RISK_LEVELS):
+            _, _, self.risk_level, self.recommendation = RISK_LEVELS[risk_level_index]
+        else:
+            self.risk_level, self.recommendation = 'MINIMAL', 'MONITOR'
+        self.current_phase = PHASE_OPPORTUNITIES[phase_index]['opportunity_type'] if phase_index >= 0 else 'NEUTRAL'
+
+    @classmethod
+    def failed(cls, detector: 'EnhancedPumpDumpDetector', token_symbol: str, token_data: Dict[str, Any],
+               error: Exception) -> 'PumpDumpResult':
+        """Result for a token whose metrics could not be read"""
+        result = cls(detector, token_symbol, token_data, None, -1, 0, [], [0, 0, 0, 0], 0.5, len(RISK_LEVELS), -1)
+        result.risk_level, result.recommendation = 'UNKNOWN', 'AVOID'
+        result.error = error
+        result._analysis = {
+            'overall_risk_level': 'UNKNOWN',
+            'risk_score': 0.5,  # Default to medium risk if analysis fails
+            'pump_indicators': {},
+            'dump_indicators': {},
+            'manipulation_signals': {},
+            'time_pattern_analysis': {},
+            'volume_price_analysis': {},
+            'trader_behavior_analysis': {},
+            'recommendation': 'AVOID',  # Be conservative if analysis fails
+            'warning_flags': ['ANALYSIS_ERROR'],
+            'detailed_breakdown': {},
+            'error': str(error)
+        }
+        return result
+
+    def _fired(self):
+        """(section, band) for every rule band that fired, in rule order"""
+        for section, ladder_indexes in zip(PUMP_DUMP_RULES, self._band_indexes):
+            for ladder, index in zip(section.ladders, ladder_indexes):
+                if index >= 0:
+                    yield section, ladder.bands[index]
+
+    @property
+    def warning_flags(self) -> List[str]:
+        if self.error is not None:
+            return ['ANALYSIS_ERROR']
+        return [band.flag for _, band in self._fired() if band.flag]
+
+    def _values(self) -> Dict[str, Any]:
+        """Scalar metrics the detail and log templates refer to"""
+        values = {name: column[self._row].item() for name, column in self._columns.items()}
+        values['unique_traders'] = self._unique_traders
+        values['token_symbol'] = self.token_symbol
+        return values
+
+    @property
+    def analysis(self) -> Dict[str, Any]:
+        """Full analysis dict, as ``analyze_token`` returns it"""
+        if self._analysis is None:
+            self._analysis = self._build_analysis()
+        return self._analysis
+
+    def _build_analysis(self) -> Dict[str, Any]:
+        values = self._values()
+        details = {section.key: {} for section in PUMP_DUMP_RULES}
+        for section, band in self._fired():
+            details[section.key][band.detail_key] = band.detail.format(**values)
+
+        section_scores = (self.pump_score, self.dump_score, self.manipulation_score, self.time_pattern_score)
+        analysis = {
+            'overall_risk_level': self.risk_level,
+            'risk_score': self.risk_score,
+            **{section.key: {'score': score, 'details': details[section.key]}
+               for section, score in zip(PUMP_DUMP_RULES, section_scores)},
+            'volume_price_analysis': {},
+            'trader_behavior_analysis': {},
+            'recommendation': self.recommendation,
+            'warning_flags': self.warning_flags,
+            'detailed_breakdown': {
+                'pump_score': self.pump_score,
+                'dump_score': self.dump_score,
+                'manipulation_score': self.manipulation_score,
+                'time_pattern_score': self.time_pattern_score,
+                'max_possible_score': PUMP_DUMP_MAX_SCORE
+            },
+            'total_score': self.total_score,
+        }
+
+        # --- PHASE DETECTION ---
+        phase_confidence = 0.0
+        trading_opportunities = []
+        profit_potential = 0.0
+        if self._phase_index >= 0:
+            price_1h = values['price_1h']
+            pump_thresholds = self.detector.PUMP_OPPORTUNITY_THRESHOLDS
+            phase_confidence = (
+                min(1.0, (price_1h - pump_thresholds['extreme_pump_1h']) / 200 + 0.8),
+                min(1.0, (price_1h - pump_thresholds['momentum_pump_1h']) / 150 + 0.7),
+                min(1.0, (price_1h - pump_thresholds['early_pump_1h']) / 100 + 0.6),
+                min(1.0, abs(price_1h) / 100),
+                min(1.0, abs(price_1h) / 60),
+            )[self._phase_index]
+            opportunity = PHASE_OPPORTUNITIES[self._phase_index]
+            trading_opportunities.append({
+                'opportunity_type': opportunity['opportunity_type'],
+                'action': opportunity['action'],
+                'confidence': phase_confidence,
+                'risk_level': self.risk_level,
+                **{key: opportunity[key] for key in ('estimated_profit_potential', 'max_hold_time_minutes',
+                                                     'stop_loss_percentage', 'take_profit_percentage', 'reasoning')}
+            })
+            profit_potential = opportunity['estimated_profit_potential']
+        analysis['current_phase'] = self.current_phase
+        analysis['phase_confidence'] = phase_confidence
+        analysis['trading_opportunities'] = trading_opportunities
+        analysis['profit_potential'] = profit_potential
+        analysis['overall_risk'] = self.risk_level
+
+        # --- SIGNALS OUTPUT ---
+        signals = []
+        for k, v in details['pump_indicators'].items():
+            if any(word in k.lower() or word in str(v).lower() for word in ['extreme', 'mega', 'critical']):
+                trading_action = 'AVOID'
+            else:
+                trading_action = 'BUY_OPPORTUNITY'
+            signals.append({
+                'type': 'PUMP',
+                'subtype': k,
+                'severity': 'HIGH' if 'extreme' in k or 'mega' in k or 'critical' in k else 'MEDIUM',
+                'description': v,
+                'stage': 'pump',
+                'trading_action': trading_action
+            })
+        for k, v in details['dump_indicators'].items():
+            if any(word in k.lower() or word in str(v).lower() for word in ['extreme', 'crash', 'panic', 'severe']):
+                trading_action = 'SELL_WARNING'
+            else:
+                trading_action = 'AVOID'
+            signals.append({
+                'type': 'DUMP',
+                'subtype': k,
+                'severity': 'HIGH' if 'extreme' in k or 'crash' in k or 'panic' in k or 'severe' in k else 'MEDIUM',
+                'description': v,
+                'stage': 'dump',
+                'trading_action': trading_action
+            })
+        for k, v in details['manipulation_signals'].items():
+            signals.append({
+                'type': 'MANIPULATION',
+                'subtype': k,
+                'severity': 'HIGH' if 'extreme' in k or 'critical' in k else 'MEDIUM',
+                'description': v,
+                'stage': 'manipulation',
+                'trading_action': 'AVOID'
+            })
+        # Add warning flags as generic signals if not already present
+        for flag in analysis['warning_flags']:
+            if not any(flag in s['description'] for s in signals):
+                signals.append({
+                    'type': 'WARNING_FLAG',
+                    'subtype': flag,
+                    'severity': 'HIGH' if 'EXTREME' in flag or 'CRITICAL' in flag else 'MEDIUM',
+                    'description': flag,
+                    'stage': 'flag',
+                    'trading_action': 'AVOID'
+                })
+        analysis['signals'] = signals
+        return analysis
+
+    def log_diagnostics(self, logger: logging.Logger) -> None:
+        """Emit the per-token analysis log, formatting only lines the logger will output"""
+        if self.error is not None:
+            logger.error(f"[PUMP_DUMP] Error analyzing token: {self.error}")
+            return
+
+        symbol = self.token_symbol
+        debug = logger.isEnabledFor(logging.DEBUG)
+        values = None
+        if debug:
+            values = self._values()
+            token_data = self.token_data
+            logger.debug(f"[PUMP_DUMP] Starting enhanced analysis for {symbol}")
+            logger.debug(f"[PUMP_DUMP] {symbol} - Input data analysis:")
+            logger.debug(f"  - Price change 1h: {token_data.get('price_change_1h_percent', 'N/A')}%")
+            logger.debug(f"  - Price change 4h: {token_data.get('price_change_4h_percent', 'N/A')}%")
+            logger.debug(f"  - Price change 24h: {token_data.get('price_change_24h_percent', 'N/A')}%")
+            logger.debug(f"  - Volume 24h: ${values['volume_24h']:,.0f}")
+            logger.debug(f"  - Market cap: ${values['market_cap']:,.0f}")
+            logger.debug(f"  - Unique traders: {values['unique_traders']}")
+            if token_data.get('creation_time'):
+                logger.debug(f"[PUMP_DUMP] {symbol} - Token age: {values['token_age_hours']:.1f} hours")
+
+        fired = list(self._fired())
+        for section in PUMP_DUMP_RULES:
+            if debug:
+                logger.debug(f"[PUMP_DUMP] {symbol} - Analyzing {section.label}...")
+            for fired_section, band in fired:
+                if fired_section is section and logger.isEnabledFor(band.log_level):
+                    values = values if values is not None else self._values()
+                    logger.log(band.log_level, f"[PUMP_DUMP] {symbol} - " + band.log.format(**values))
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"[PUMP_DUMP] {symbol} - FINAL RISK ANALYSIS:")
+            logger.info(f"  🔥 Pump Score: {self.pump_score}")
+            logger.info(f"  📉 Dump Score: {self.dump_score}")
+            logger.info(f"  🤖 Manipulation Score: {self.manipulation_score}")
+            logger.info(f"  ⏱️  Time Pattern Score: {self.time_pattern_score}")
+            logger.info(f"  📊 Total Score: {self.total_score}/{PUMP_DUMP_MAX_SCORE}")
+            logger.info(f"  ⚠️  Risk Score: {self.risk_score:.3f}")
+            logger.info(f"  🚨 Risk Level: {self.risk_level}")
+            logger.info(f"  🎯 Recommendation: {self.recommendation}")
+            logger.info(f"  🏷️  Warning Flags: {self.warning_flags}")
+
+        if self.risk_level in ['CRITICAL', 'HIGH']:
+            logger.warning(f"[PUMP_DUMP] {symbol} - ⚠️  HIGH RISK TOKEN DETECTED - AVOID")
+
+
 class EnhancedPumpDumpDetector:
     """
     Enhanced pump and dump detection with trading opportunity identification.
@@ -50,7 +524,7 @@ class EnhancedPumpDumpDetector:
     """
     
     def __init__(self, logger=None):
-        self.logger = logger
+        self.logger = logger or logging.getLogger(__name__)
         
         # Pump opportunity thresholds (positive movements)
         self.PUMP_OPPORTUNITY_THRESHOLDS = {
@@ -95,561 +569,120 @@ class EnhancedPumpDumpDetector:
         Returns:
             Dictionary with comprehensive pump/dump analysis
         """
-        try:
-            token_symbol = token_data.get('token_symbol', 'UNKNOWN')
-            self.logger.debug(f"[PUMP_DUMP] Starting enhanced analysis for {token_symbol}")
-            
-            # Debug: Log input data sample
-            self.logger.debug(f"[PUMP_DUMP] {token_symbol} - Input data analysis:")
-            self.logger.debug(f"  - Price change 1h: {token_data.get('price_change_1h_percent', 'N/A')}%")
-            self.logger.debug(f"  - Price change 4h: {token_data.get('price_change_4h_percent', 'N/A')}%")
-            self.logger.debug(f"  - Price change 24h: {token_data.get('price_change_24h_percent', 'N/A')}%")
-            self.logger.debug(f"  - Volume 24h: ${token_data.get('volume_24h', 0):,.0f}")
-            self.logger.debug(f"  - Market cap: ${token_data.get('market_cap', 0):,.0f}")
-            self.logger.debug(f"  - Unique traders: {token_data.get('unique_trader_count', 0)}")
-            
-            # Initialize analysis result
-            analysis = {
-                'overall_risk_level': 'LOW',
-                'risk_score': 0.0,
-                'pump_indicators': {},
-                'dump_indicators': {},
-                'manipulation_signals': {},
-                'time_pattern_analysis': {},
-                'volume_price_analysis': {},
-                'trader_behavior_analysis': {},
-                'recommendation': 'MONITOR',
-                'warning_flags': [],
-                'detailed_breakdown': {}
-            }
-            
-            # Extract key metrics for analysis
-            price_1h = float(token_data.get('price_change_1h_percent', 0))
-            price_4h = float(token_data.get('price_change_4h_percent', 0)) 
-            price_24h = float(token_data.get('price_change_24h_percent', 0))
-            volume_24h = float(token_data.get('volume_24h', 0))
-            volume_1h = float(token_data.get('volume_1h', 0))
-            volume_4h = float(token_data.get('volume_4h', 0))
-            market_cap = float(token_data.get('market_cap', 0))
-            unique_traders = int(token_data.get('unique_trader_count', 0))
-            trade_count = int(token_data.get('trade_count_24h', 0))
-            creation_time = token_data.get('creation_time')
-            
-            # Calculate token age if creation time is available
-            token_age_hours = 0
-            if creation_time:
-                import time
-                current_time = time.time()
-                token_age_hours = (current_time - creation_time) / 3600
-                self.logger.debug(f"[PUMP_DUMP] {token_symbol} - Token age: {token_age_hours:.1f} hours")
-            
-            # 1. PUMP PATTERN ANALYSIS
-            self.logger.debug(f"[PUMP_DUMP] {token_symbol} - Analyzing pump patterns...")
-            
-            pump_score = 0
-            pump_details = {}
-            
-            # 1a. ENHANCED Extreme price acceleration (multiple timeframes)
-            # Special detection for cases like TDCCP (750,000% gains)
-            if price_24h > 10000:  # >10,000% gain = EXTREME PUMP
-                pump_score += 50
-                pump_details['extreme_mega_pump'] = f"EXTREME PUMP: {price_24h:+.1f}% in 24h"
-                analysis['warning_flags'].append('EXTREME_PRICE_MOVEMENT')
-                self.logger.warning(f"[PUMP_DUMP] {token_symbol} - EXTREME MEGA PUMP DETECTED: {price_24h:+.1f}%")
-            elif price_24h > 1000:  # >1,000% gain = MEGA PUMP
-                pump_score += 40
-                pump_details['mega_pump'] = f"MEGA PUMP: {price_24h:+.1f}% in 24h"
-                analysis['warning_flags'].append('EXTREME_PRICE_MOVEMENT')
-                self.logger.warning(f"[PUMP_DUMP] {token_symbol} - MEGA PUMP DETECTED: {price_24h:+.1f}%")
-            elif price_24h > 500:  # >500% gain = MASSIVE PUMP
-                pump_score += 35
-                pump_details['massive_pump'] = f"MASSIVE PUMP: {price_24h:+.1f}% in 24h"
-                analysis['warning_flags'].append('EXTREME_PRICE_MOVEMENT')
-                self.logger.warning(f"[PUMP_DUMP] {token_symbol} - MASSIVE PUMP DETECTED: {price_24h:+.1f}%")
-            elif price_24h > 200:  # >200% gain = MAJOR PUMP
-                pump_score += 30
-                pump_details['major_pump'] = f"MAJOR PUMP: {price_24h:+.1f}% in 24h"
-                self.logger.warning(f"[PUMP_DUMP] {token_symbol} - MAJOR PUMP DETECTED: {price_24h:+.1f}%")
-            elif price_24h > 100:  # >100% gain = PUMP
-                pump_score += 25
-                pump_details['pump_detected'] = f"PUMP: {price_24h:+.1f}% in 24h"
-                self.logger.warning(f"[PUMP_DUMP] {token_symbol} - PUMP DETECTED: {price_24h:+.1f}%")
-            
-            # Shorter timeframe extreme movements
-            if price_1h > 500:  # >500% in 1 hour = CRITICAL
-                pump_score += 40
-                pump_details['extreme_1h_pump'] = f"CRITICAL: {price_1h:+.1f}% in 1 hour"
-                analysis['warning_flags'].append('EXTREME_PRICE_MOVEMENT')
-                self.logger.critical(f"[PUMP_DUMP] {token_symbol} - CRITICAL 1h pump detected: {price_1h:+.1f}%")
-            elif price_1h > 200:  # >200% in 1 hour = EXTREME
-                pump_score += 30
-                pump_details['extreme_1h_pump'] = f"EXTREME: {price_1h:+.1f}% in 1 hour"
-                analysis['warning_flags'].append('EXTREME_PRICE_MOVEMENT')
-                self.logger.warning(f"[PUMP_DUMP] {token_symbol} - Extreme 1h pump detected: {price_1h:+.1f}%")
-            elif price_1h > 100:  # >100% in 1 hour
-                pump_score += 25
-                pump_details['extreme_1h_pump'] = f"{price_1h:+.1f}% in 1 hour"
-                self.logger.warning(f"[PUMP_DUMP] {token_symbol} - Extreme 1h pump detected: {price_1h:+.1f}%")
-            elif price_1h > 50:  # >50% in 1 hour
-                pump_score += 15
-                pump_details['high_1h_pump'] = f"{price_1h:+.1f}% in 1 hour"
-                self.logger.debug(f"[PUMP_DUMP] {token_symbol} - High 1h pump detected: {price_1h:+.1f}%")
-            elif price_1h > 20:  # >20% in 1 hour
-                pump_score += 10
-                pump_details['moderate_1h_pump'] = f"{price_1h:+.1f}% in 1 hour"
-                self.logger.debug(f"[PUMP_DUMP] {token_symbol} - Moderate 1h pump detected: {price_1h:+.1f}%")
-            
-            # Enhanced acceleration detection (pump pattern)
-            if price_1h > price_4h * 2 and price_4h > price_24h * 0.1 and price_1h > 50:
-                acceleration_penalty = 25
-                pump_score += acceleration_penalty
-                pump_details['acceleration_pattern'] = f"Classic pump acceleration: 1h={price_1h:+.1f}% >> 4h={price_4h:+.1f}% >> 24h={price_24h:+.1f}%"
-                self.logger.warning(f"[PUMP_DUMP] {token_symbol} - ACCELERATION PATTERN DETECTED: 1h={price_1h:+.1f}% >> 4h={price_4h:+.1f}% >> 24h={price_24h:+.1f}%")
-            elif price_1h > price_4h * 1.5 and price_4h > 0:  # 1h gain is 1.5x the 4h gain
-                pump_score += 15
-                pump_details['price_acceleration'] = f"1h gain ({price_1h:+.1f}%) >> 4h gain ({price_4h:+.1f}%)"
-                self.logger.debug(f"[PUMP_DUMP] {token_symbol} - Price acceleration detected: 1h={price_1h:+.1f}% vs 4h={price_4h:+.1f}%")
-            
-            # 1b. Enhanced Volume surge analysis
-            volume_surge_score = 0
-            if volume_1h > 0 and volume_24h > 0:
-                hourly_avg_volume = volume_24h / 24
-                volume_surge_ratio = volume_1h / hourly_avg_volume if hourly_avg_volume > 0 else 0
-                
-                if volume_surge_ratio > 50:  # 50x normal volume = EXTREME
-                    volume_surge_score = 35
-                    pump_details['extreme_volume_surge'] = f"EXTREME: {volume_surge_ratio:.1f}x normal volume"
-                    analysis['warning_flags'].append('VOLUME_MANIPULATION')
-                    self.logger.critical(f"[PUMP_DUMP] {token_symbol} - EXTREME volume surge: {volume_surge_ratio:.1f}x normal")
-                elif volume_surge_ratio > 20:  # 20x normal volume = CRITICAL
-                    volume_surge_score = 30
-                    pump_details['critical_volume_surge'] = f"CRITICAL: {volume_surge_ratio:.1f}x normal volume"
-                    analysis['warning_flags'].append('VOLUME_MANIPULATION')
-                    self.logger.warning(f"[PUMP_DUMP] {token_symbol} - Critical volume surge: {volume_surge_ratio:.1f}x normal")
-                elif volume_surge_ratio > 10:  # 10x normal volume
-                    volume_surge_score = 20
-                    pump_details['extreme_volume_surge'] = f"{volume_surge_ratio:.1f}x normal volume"
-                    self.logger.warning(f"[PUMP_DUMP] {token_symbol} - Extreme volume surge: {volume_surge_ratio:.1f}x normal")
-                elif volume_surge_ratio > 5:  # 5x normal volume
-                    volume_surge_score = 15
-                    pump_details['high_volume_surge'] = f"{volume_surge_ratio:.1f}x normal volume"
-                    self.logger.debug(f"[PUMP_DUMP] {token_symbol} - High volume surge: {volume_surge_ratio:.1f}x normal")
-                elif volume_surge_ratio > 2:  # 2x normal volume
-                    volume_surge_score = 10
-                    pump_details['moderate_volume_surge'] = f"{volume_surge_ratio:.1f}x normal volume"
-                    self.logger.debug(f"[PUMP_DUMP] {token_symbol} - Moderate volume surge: {volume_surge_ratio:.1f}x normal")
-            
-            pump_score += volume_surge_score
-            
-            # 1c. ENHANCED Market cap vs volume relationship (suspicious if volume >> market cap)
-            if market_cap > 0 and volume_24h > 0:
-                volume_to_mcap_ratio = volume_24h / market_cap
-                if volume_to_mcap_ratio > 50:  # Volume > 50x market cap (EXTREME manipulation)
-                    pump_score += 40
-                    pump_details['extreme_volume_ratio'] = f"EXTREME MANIPULATION: Volume {volume_to_mcap_ratio:.1f}x market cap"
-                    analysis['warning_flags'].append('VOLUME_MANIPULATION')
-                    self.logger.critical(f"[PUMP_DUMP] {token_symbol} - EXTREME volume manipulation: {volume_to_mcap_ratio:.1f}x market cap")
-                elif volume_to_mcap_ratio > 20:  # Volume > 20x market cap (CRITICAL manipulation)
-                    pump_score += 30
-                    pump_details['critical_volume_ratio'] = f"CRITICAL MANIPULATION: Volume {volume_to_mcap_ratio:.1f}x market cap"
-                    analysis['warning_flags'].append('VOLUME_MANIPULATION')
-                    self.logger.warning(f"[PUMP_DUMP] {token_symbol} - Critical volume manipulation: {volume_to_mcap_ratio:.1f}x market cap")
-                elif volume_to_mcap_ratio > 10:  # Volume > 10x market cap (HIGH manipulation)
-                    pump_score += 25
-                    pump_details['high_volume_ratio'] = f"HIGH MANIPULATION: Volume {volume_to_mcap_ratio:.1f}x market cap"
-                    analysis['warning_flags'].append('VOLUME_MANIPULATION')
-                    self.logger.warning(f"[PUMP_DUMP] {token_symbol} - High volume manipulation: {volume_to_mcap_ratio:.1f}x market cap")
-                elif volume_to_mcap_ratio > 5:  # Volume > 5x market cap (suspicious)
-                    pump_score += 20
-                    pump_details['excessive_volume_ratio'] = f"Volume {volume_to_mcap_ratio:.1f}x market cap"
-                    self.logger.warning(f"[PUMP_DUMP] {token_symbol} - Excessive volume ratio: {volume_to_mcap_ratio:.1f}x market cap")
-                elif volume_to_mcap_ratio > 2:  # Volume > 2x market cap (suspicious)
-                    pump_score += 10
-                    pump_details['high_volume_ratio'] = f"Volume {volume_to_mcap_ratio:.1f}x market cap"
-                    self.logger.debug(f"[PUMP_DUMP] {token_symbol} - High volume ratio: {volume_to_mcap_ratio:.1f}x market cap")
-            
-            analysis['pump_indicators'] = {
-                'score': pump_score,
-                'details': pump_details
-            }
-            
-            # 2. DUMP PATTERN ANALYSIS
-            self.logger.debug(f"[PUMP_DUMP] {token_symbol} - Analyzing dump patterns...")
-            
-            dump_score = 0
-            dump_details = {}
-            
-            # 2a. Enhanced Price crash patterns
-            if price_1h < -70:  # >70% drop in 1 hour = EXTREME CRASH
-                dump_score += 40
-                dump_details['extreme_crash'] = f"EXTREME CRASH: {price_1h:+.1f}% in 1 hour"
-                analysis['warning_flags'].append('EXTREME_PRICE_MOVEMENT')
-                self.logger.critical(f"[PUMP_DUMP] {token_symbol} - EXTREME crash detected: {price_1h:+.1f}%")
-            elif price_1h < -50:  # >50% drop in 1 hour = SEVERE CRASH
-                dump_score += 30
-                dump_details['severe_crash'] = f"SEVERE CRASH: {price_1h:+.1f}% in 1 hour"
-                analysis['warning_flags'].append('EXTREME_PRICE_MOVEMENT')
-                self.logger.warning(f"[PUMP_DUMP] {token_symbol} - Severe crash detected: {price_1h:+.1f}%")
-            elif price_1h < -30:  # >30% drop in 1 hour
-                dump_score += 25
-                dump_details['extreme_1h_crash'] = f"{price_1h:+.1f}% in 1 hour"
-                self.logger.warning(f"[PUMP_DUMP] {token_symbol} - Extreme 1h crash detected: {price_1h:+.1f}%")
-            elif price_1h < -15:  # >15% drop in 1 hour
-                dump_score += 15
-                dump_details['high_1h_crash'] = f"{price_1h:+.1f}% in 1 hour"
-                self.logger.debug(f"[PUMP_DUMP] {token_symbol} - High 1h crash detected: {price_1h:+.1f}%")
-            
-            # Enhanced dump after pump detection (classic pattern)
-            if price_24h > 1000 and price_1h < -30:  # Mega pump followed by crash
-                dump_score += 35
-                dump_details['mega_pump_crash'] = f"MEGA PUMP CRASH: 24h={price_24h:+.1f}%, 1h={price_1h:+.1f}%"
-                analysis['warning_flags'].append('PUMP_DUMP_PATTERN')
-                self.logger.critical(f"[PUMP_DUMP] {token_symbol} - MEGA PUMP CRASH PATTERN: 24h={price_24h:+.1f}%, 1h={price_1h:+.1f}%")
-            elif price_24h > 500 and price_1h < -20:  # Massive pump followed by crash
-                dump_score += 30
-                dump_details['massive_pump_crash'] = f"MASSIVE PUMP CRASH: 24h={price_24h:+.1f}%, 1h={price_1h:+.1f}%"
-                analysis['warning_flags'].append('PUMP_DUMP_PATTERN')
-                self.logger.warning(f"[PUMP_DUMP] {token_symbol} - MASSIVE PUMP CRASH PATTERN: 24h={price_24h:+.1f}%, 1h={price_1h:+.1f}%")
-            elif price_24h > 100 and price_1h < -15:  # Strong pump followed by dump
-                dump_score += 25
-                dump_details['pump_dump_pattern'] = f"PUMP DUMP: 24h={price_24h:+.1f}%, 1h={price_1h:+.1f}%"
-                analysis['warning_flags'].append('PUMP_DUMP_PATTERN')
-                self.logger.warning(f"[PUMP_DUMP] {token_symbol} - PUMP DUMP PATTERN: 24h={price_24h:+.1f}%, 1h={price_1h:+.1f}%")
-            elif price_24h > 50 and price_1h < -10:  # Strong 24h gain but recent crash
-                dump_score += 20
-                dump_details['dump_after_pump'] = f"24h: {price_24h:+.1f}%, 1h: {price_1h:+.1f}%"
-                self.logger.debug(f"[PUMP_DUMP] {token_symbol} - Dump after pump pattern: 24h={price_24h:+.1f}%, 1h={price_1h:+.1f}%")
-            
-            # 2b. Volume analysis during dumps
-            if price_1h < -10 and volume_1h > 0:  # Price crash with volume
-                if volume_surge_score > 20:  # High volume during crash = panic selling
-                    dump_score += 20
-                    dump_details['panic_selling'] = f"PANIC SELLING: {price_1h:+.1f}% with {volume_surge_score} volume score"
-                    self.logger.warning(f"[PUMP_DUMP] {token_symbol} - Panic selling detected: {price_1h:+.1f}% with volume")
-                elif volume_surge_score > 10:  # Moderate volume during crash
-                    dump_score += 15
-                    dump_details['panic_selling'] = f"High volume crash: {price_1h:+.1f}% with {volume_surge_score} volume score"
-                    self.logger.debug(f"[PUMP_DUMP] {token_symbol} - High volume crash detected: {price_1h:+.1f}% with volume")
-            
-            analysis['dump_indicators'] = {
-                'score': dump_score,
-                'details': dump_details
-            }
-            
-            # 3. ENHANCED MANIPULATION SIGNAL ANALYSIS
-            self.logger.debug(f"[PUMP_DUMP] {token_symbol} - Analyzing manipulation signals...")
-            
-            manipulation_score = 0
-            manipulation_details = {}
-            
-            # 3a. Enhanced trader count analysis relative to volume
-            if unique_traders > 0 and volume_24h > 0:
-                volume_per_trader = volume_24h / unique_traders
-                
-                if volume_per_trader > 1000000:  # >$1M volume per trader = EXTREME
-                    manipulation_score += 35
-                    manipulation_details['extreme_volume_per_trader'] = f"EXTREME: ${volume_per_trader:,.0f} per trader"
-                    analysis['warning_flags'].append('VOLUME_MANIPULATION')
-                    self.logger.critical(f"[PUMP_DUMP] {token_symbol} - EXTREME volume per trader: ${volume_per_trader:,.0f}")
-                elif volume_per_trader > 500000:  # >$500k volume per trader = CRITICAL
-                    manipulation_score += 30
-                    manipulation_details['critical_volume_per_trader'] = f"CRITICAL: ${volume_per_trader:,.0f} per trader"
-                    analysis['warning_flags'].append('VOLUME_MANIPULATION')
-                    self.logger.warning(f"[PUMP_DUMP] {token_symbol} - Critical volume per trader: ${volume_per_trader:,.0f}")
-                elif volume_per_trader > 100000:  # >$100k volume per trader
-                    manipulation_score += 20
-                    manipulation_details['high_volume_per_trader'] = f"${volume_per_trader:,.0f} per trader"
-                    self.logger.warning(f"[PUMP_DUMP] {token_symbol} - High volume per trader: ${volume_per_trader:,.0f}")
-                elif volume_per_trader > 50000:  # >$50k volume per trader
-                    manipulation_score += 10
-                    manipulation_details['moderate_volume_per_trader'] = f"${volume_per_trader:,.0f} per trader"
-                    self.logger.debug(f"[PUMP_DUMP] {token_symbol} - Moderate volume per trader: ${volume_per_trader:,.0f}")
-            
-            # 3b. Enhanced few traders analysis
-            if volume_24h > 1000000 and unique_traders < 5:  # >$1M volume but <5 traders = EXTREME
-                manipulation_score += 40
-                manipulation_details['extreme_few_traders'] = f"EXTREME: Only {unique_traders} traders for ${volume_24h:,.0f} volume"
-                analysis['warning_flags'].append('VOLUME_MANIPULATION')
-                self.logger.critical(f"[PUMP_DUMP] {token_symbol} - EXTREME manipulation: {unique_traders} traders, ${volume_24h:,.0f}")
-            elif volume_24h > 500000 and unique_traders < 5:  # >$500k volume but <5 traders = CRITICAL
-                manipulation_score += 30
-                manipulation_details['critical_few_traders'] = f"CRITICAL: Only {unique_traders} traders for ${volume_24h:,.0f} volume"
-                analysis['warning_flags'].append('VOLUME_MANIPULATION')
-                self.logger.warning(f"[PUMP_DUMP] {token_symbol} - Critical manipulation: {unique_traders} traders, ${volume_24h:,.0f}")
-            elif volume_24h > 100000 and unique_traders < 10:  # >$100k volume but <10 traders
-                manipulation_score += 25
-                manipulation_details['few_traders_high_volume'] = f"Only {unique_traders} traders for ${volume_24h:,.0f} volume"
-                self.logger.warning(f"[PUMP_DUMP] {token_symbol} - Few traders, high volume: {unique_traders} traders, ${volume_24h:,.0f}")
-            elif volume_24h > 50000 and unique_traders < 5:  # >$50k volume but <5 traders
-                manipulation_score += 20
-                manipulation_details['very_few_traders'] = f"Only {unique_traders} traders for ${volume_24h:,.0f} volume"
-                self.logger.debug(f"[PUMP_DUMP] {token_symbol} - Very few traders: {unique_traders} traders, ${volume_24h:,.0f}")
-            
-            # 3c. Enhanced new token extreme moves analysis
-            if token_age_hours > 0 and token_age_hours < 24:  # Less than 24 hours old
-                if price_24h > 5000 or price_24h < -90:  # EXTREME moves on new token
-                    manipulation_score += 30
-                    manipulation_details['new_token_extreme_moves'] = f"EXTREME: {token_age_hours:.1f}h old with {price_24h:+.1f}% move"
-                    analysis['warning_flags'].append('NEW_TOKEN_MANIPULATION')
-                    self.logger.critical(f"[PUMP_DUMP] {token_symbol} - EXTREME new token manipulation: {token_age_hours:.1f}h old, {price_24h:+.1f}%")
-                elif price_24h > 1000 or price_24h < -80:  # MAJOR moves on new token
-                    manipulation_score += 25
-                    manipulation_details['new_token_major_moves'] = f"MAJOR: {token_age_hours:.1f}h old with {price_24h:+.1f}% move"
-                    analysis['warning_flags'].append('NEW_TOKEN_MANIPULATION')
-                    self.logger.warning(f"[PUMP_DUMP] {token_symbol} - Major new token manipulation: {token_age_hours:.1f}h old, {price_24h:+.1f}%")
-                elif price_24h > 500 or price_24h < -80:  # Extreme moves on new token
-                    manipulation_score += 15
-                    manipulation_details['new_token_extreme_moves'] = f"{token_age_hours:.1f}h old with {price_24h:+.1f}% move"
-                    self.logger.warning(f"[PUMP_DUMP] {token_symbol} - New token extreme moves: {token_age_hours:.1f}h old, {price_24h:+.1f}%")
-            
-            analysis['manipulation_signals'] = {
-                'score': manipulation_score,
-                'details': manipulation_details
-            }
-            
-            # 4. TIME PATTERN ANALYSIS
-            self.logger.debug(f"[PUMP_DUMP] {token_symbol} - Analyzing time patterns...")
-            
-            time_pattern_score = 0
-            time_pattern_details = {}
-            
-            # Check for unsustainable momentum patterns
-            if price_1h > 0 and price_4h > 0 and price_24h > 0:
-                # Calculate momentum sustainability
-                momentum_1h = price_1h
-                momentum_4h = price_4h / 4  # Hourly rate
-                momentum_24h = price_24h / 24  # Hourly rate
-                
-                # If 1h momentum is way higher than longer-term rates (unsustainable)
-                if momentum_1h > momentum_4h * 5 and momentum_1h > momentum_24h * 10:
-                    time_pattern_score += 25
-                    time_pattern_details['unsustainable_momentum'] = f"1h momentum ({momentum_1h:.1f}%) >> 4h rate ({momentum_4h:.1f}%) >> 24h rate ({momentum_24h:.1f}%)"
-                    self.logger.warning(f"[PUMP_DUMP] {token_symbol} - Unsustainable momentum detected")
-                elif momentum_1h > momentum_4h * 3 and momentum_1h > momentum_24h * 5:
-                    time_pattern_score += 15
-                    time_pattern_details['accelerating_momentum'] = f"Accelerating: 1h={momentum_1h:.1f}%, 4h_rate={momentum_4h:.1f}%, 24h_rate={momentum_24h:.1f}%"
-                    self.logger.debug(f"[PUMP_DUMP] {token_symbol} - Accelerating momentum detected")
-            
-            analysis['time_pattern_analysis'] = {
-                'score': time_pattern_score,
-                'details': time_pattern_details
-            }
-            
-            # 5. CALCULATE OVERALL RISK SCORE AND LEVEL
-            total_score = pump_score + dump_score + manipulation_score + time_pattern_score
-            
-            # Normalize to 0-1 scale (adjusted for higher possible scores)
-            max_possible_score = 200  # Increased due to enhanced scoring
-            risk_score = min(1.0, total_score / max_possible_score)
-            
-            # Determine risk level with enhanced thresholds
-            if risk_score >= 0.8 or total_score >= 100:
-                risk_level = 'CRITICAL'
-                recommendation = 'AVOID'
-            elif risk_score >= 0.6 or total_score >= 75:
-                risk_level = 'HIGH'
-                recommendation = 'AVOID'
-            elif risk_score >= 0.4 or total_score >= 50:
-                risk_level = 'MEDIUM'
-                recommendation = 'CAUTION'
-            elif risk_score >= 0.2 or total_score >= 25:
-                risk_level = 'LOW'
-                recommendation = 'MONITOR'
-            else:
-                risk_level = 'MINIMAL'
-                recommendation = 'MONITOR'
-            
-            # Update analysis with final results
-            analysis.update({
-                'overall_risk_level': risk_level,
-                'risk_score': risk_score,
-                'total_score': total_score,
-                'recommendation': recommendation,
-                'detailed_breakdown': {
-                    'pump_score': pump_score,
-                    'dump_score': dump_score,
-                    'manipulation_score': manipulation_score,
-                    'time_pattern_score': time_pattern_score,
-                    'max_possible_score': max_possible_score
-                }
-            })
-            
-            # Log final analysis
-            self.logger.info(f"[PUMP_DUMP] {token_symbol} - FINAL RISK ANALYSIS:")
-            self.logger.info(f"  🔥 Pump Score: {pump_score}")
-            self.logger.info(f"  📉 Dump Score: {dump_score}")
-            self.logger.info(f"  🤖 Manipulation Score: {manipulation_score}")
-            self.logger.info(f"  ⏱️  Time Pattern Score: {time_pattern_score}")
-            self.logger.info(f"  📊 Total Score: {total_score}/{max_possible_score}")
-            self.logger.info(f"  ⚠️  Risk Score: {risk_score:.3f}")
-            self.logger.info(f"  🚨 Risk Level: {risk_level}")
-            self.logger.info(f"  🎯 Recommendation: {recommendation}")
-            self.logger.info(f"  🏷️  Warning Flags: {analysis['warning_flags']}")
-            
-            if risk_level in ['CRITICAL', 'HIGH']:
-                self.logger.warning(f"[PUMP_DUMP] {token_symbol} - ⚠️  HIGH RISK TOKEN DETECTED - AVOID")
-            
-            # --- PHASE DETECTION LOGIC ---
-            # Default values
-            current_phase = 'NEUTRAL'
-            phase_confidence = 0.0
-            trading_opportunities = []
-            profit_potential = 0.0
-            # Use price and volume to determine phase
-            if price_1h >= self.PUMP_OPPORTUNITY_THRESHOLDS['extreme_pump_1h']:
-                current_phase = 'EXTREME_PUMP'
-                phase_confidence = min(1.0, (price_1h - self.PUMP_OPPORTUNITY_THRESHOLDS['extreme_pump_1h']) / 200 + 0.8)
-                trading_opportunities.append({
-                    'opportunity_type': 'EXTREME_PUMP',
-                    'action': 'EXIT',
-                    'confidence': phase_confidence,
-                    'risk_level': risk_level,
-                    'estimated_profit_potential': -20.0,
-                    'max_hold_time_minutes': 10,
-                    'stop_loss_percentage': 10.0,
-                    'take_profit_percentage': 0.0,
-                    'reasoning': 'Extreme pump detected; exit recommended to avoid crash.'
-                })
-                profit_potential = -20.0
-            elif price_1h >= self.PUMP_OPPORTUNITY_THRESHOLDS['momentum_pump_1h']:
-                current_phase = 'MOMENTUM_PUMP'
-                phase_confidence = min(1.0, (price_1h - self.PUMP_OPPORTUNITY_THRESHOLDS['momentum_pump_1h']) / 150 + 0.7)
-                trading_opportunities.append({
-                    'opportunity_type': 'MOMENTUM_PUMP',
-                    'action': 'ENTER_HIGH_RISK',
-                    'confidence': phase_confidence,
-                    'risk_level': risk_level,
-                    'estimated_profit_potential': 30.0,
-                    'max_hold_time_minutes': 30,
-                    'stop_loss_percentage': 15.0,
-                    'take_profit_percentage': 20.0,
-                    'reasoning': 'Momentum pump detected; high-risk scalp possible.'
-                })
-                profit_potential = 30.0
-            elif price_1h >= self.PUMP_OPPORTUNITY_THRESHOLDS['early_pump_1h']:
-                current_phase = 'EARLY_PUMP'
-                phase_confidence = min(1.0, (price_1h - self.PUMP_OPPORTUNITY_THRESHOLDS['early_pump_1h']) / 100 + 0.6)
-                trading_opportunities.append({
-                    'opportunity_type': 'EARLY_PUMP',
-                    'action': 'ENTER',
-                    'confidence': phase_confidence,
-                    'risk_level': risk_level,
-                    'estimated_profit_potential': 50.0,
-                    'max_hold_time_minutes': 60,
-                    'stop_loss_percentage': 20.0,
-                    'take_profit_percentage': 40.0,
-                    'reasoning': 'Early pump detected; entry opportunity.'
-                })
-                profit_potential = 50.0
-            elif price_1h <= self.DUMP_WARNING_THRESHOLDS['severe_dump_1h']:
-                current_phase = 'DUMP_START'
-                phase_confidence = min(1.0, abs(price_1h) / 100)
-                trading_opportunities.append({
-                    'opportunity_type': 'DUMP_START',
-                    'action': 'EXIT',
-                    'confidence': phase_confidence,
-                    'risk_level': risk_level,
-                    'estimated_profit_potential': -30.0,
-                    'max_hold_time_minutes': 5,
-                    'stop_loss_percentage': 10.0,
-                    'take_profit_percentage': 0.0,
-                    'reasoning': 'Severe dump detected; exit recommended.'
-                })
-                profit_potential = -30.0
-            elif price_1h <= self.DUMP_WARNING_THRESHOLDS['moderate_dump_1h']:
-                current_phase = 'DUMP_CONTINUATION'
-                phase_confidence = min(1.0, abs(price_1h) / 60)
-                trading_opportunities.append({
-                    'opportunity_type': 'DUMP_CONTINUATION',
-                    'action': 'AVOID',
-                    'confidence': phase_confidence,
-                    'risk_level': risk_level,
-                    'estimated_profit_potential': -10.0,
-                    'max_hold_time_minutes': 0,
-                    'stop_loss_percentage': 0.0,
-                    'take_profit_percentage': 0.0,
-                    'reasoning': 'Ongoing dump detected; avoid entry.'
-                })
-                profit_potential = -10.0
-            # Add to analysis output
-            analysis['current_phase'] = current_phase
-            analysis['phase_confidence'] = phase_confidence
-            analysis['trading_opportunities'] = trading_opportunities
-            analysis['profit_potential'] = profit_potential
-            analysis['overall_risk'] = risk_level
-            
-            # --- SIGNALS OUTPUT ---
-            signals = []
-            # Pump signals
-            for k, v in pump_details.items():
-                if any(word in k.lower() or word in str(v).lower() for word in ['extreme', 'mega', 'critical']):
-                    trading_action = 'AVOID'
-                else:
-                    trading_action = 'BUY_OPPORTUNITY'
-                signals.append({
-                    'type': 'PUMP',
-                    'subtype': k,
-                    'severity': 'HIGH' if 'extreme' in k or 'mega' in k or 'critical' in k else 'MEDIUM',
-                    'description': v,
-                    'stage': 'pump',
-                    'trading_action': trading_action
-                })
-            # Dump signals
-            for k, v in dump_details.items():
-                if any(word in k.lower() or word in str(v).lower() for word in ['extreme', 'crash', 'panic', 'severe']):
-                    trading_action = 'SELL_WARNING'
-                else:
-                    trading_action = 'AVOID'
-                signals.append({
-                    'type': 'DUMP',
-                    'subtype': k,
-                    'severity': 'HIGH' if 'extreme' in k or 'crash' in k or 'panic' in k or 'severe' in k else 'MEDIUM',
-                    'description': v,
-                    'stage': 'dump',
-                    'trading_action': trading_action
-                })
-            # Manipulation signals
-            for k, v in manipulation_details.items():
-                signals.append({
-                    'type': 'MANIPULATION',
-                    'subtype': k,
-                    'severity': 'HIGH' if 'extreme' in k or 'critical' in k else 'MEDIUM',
-                    'description': v,
-                    'stage': 'manipulation',
-                    'trading_action': 'AVOID'
-                })
-            # Add warning flags as generic signals if not already present
-            for flag in analysis['warning_flags']:
-                if not any(flag in s['description'] for s in signals):
-                    signals.append({
-                        'type': 'WARNING_FLAG',
-                        'subtype': flag,
-                        'severity': 'HIGH' if 'EXTREME' in flag or 'CRITICAL' in flag else 'MEDIUM',
-                        'description': flag,
-                        'stage': 'flag',
-                        'trading_action': 'AVOID'
-                    })
-            analysis['signals'] = signals
-            
-            return analysis
+        result = self.analyze_batch([token_data])[0]
+        result.log_diagnostics(self.logger)
+        return result.analysis
+    
+    def analyze_batch(self, tokens: List[Dict[str, Any]]) -> List['PumpDumpResult']:
+        """
+        Screen many tokens at once.
+        
+        Metrics are pulled into columns once and every pump, dump,
+        manipulation and time-pattern rule is evaluated over the whole batch.
+        Scores, risk level and phase are available immediately; detail strings,
+        signals and the full ``analyze_token`` dict are built only when a
+        result's ``analysis`` is read, and log lines only by ``log_diagnostics``.
+        
+        Args:
+            tokens: Token metric dicts (same shape as ``analyze_token`` input)
             
-        except Exception as e:
-            self.logger.error(f"[PUMP_DUMP] Error analyzing token: {e}")
-            return {
-                'overall_risk_level': 'UNKNOWN',
-                'risk_score': 0.5,  # Default to medium risk if analysis fails
-                'pump_indicators': {},
-                'dump_indicators': {},
-                'manipulation_signals': {},
-                'time_pattern_analysis': {},
-                'volume_price_analysis': {},
-                'trader_behavior_analysis': {},
-                'recommendation': 'AVOID',  # Be conservative if analysis fails
-                'warning_flags': ['ANALYSIS_ERROR'],
-                'detailed_breakdown': {},
-                'error': str(e)
-            }
-
+        Returns:
+            One ``PumpDumpResult`` per token, in order
+        """
+        count = len(tokens)
+        if count == 0:
+            return []
+        
+        now = time.time()
+        numeric = {name: np.zeros(count) for name in ('price_1h', 'price_4h', 'price_24h', 'volume_24h',
+                                                      'volume_1h', 'market_cap', 'unique_traders', 'token_age_hours')}
+        symbols: List[str] = []
+        trader_counts: List[int] = [0] * count
+        errors: List[Optional[Exception]] = [None] * count
+        
+        for i, token_data in enumerate(tokens):
+            symbols.append(token_data.get('token_symbol', 'UNKNOWN'))
+            try:
+                numeric['price_1h'][i] = float(token_data.get('price_change_1h_percent', 0))
+                numeric['price_4h'][i] = float(token_data.get('price_change_4h_percent', 0))
+                numeric['price_24h'][i] = float(token_data.get('price_change_24h_percent', 0))
+                numeric['volume_24h'][i] = float(token_data.get('volume_24h', 0))
+                numeric['volume_1h'][i] = float(token_data.get('volume_1h', 0))
+                float(token_data.get('volume_4h', 0))
+                numeric['market_cap'][i] = float(token_data.get('market_cap', 0))
+                trader_counts[i] = int(token_data.get('unique_trader_count', 0))
+                numeric['unique_traders'][i] = trader_counts[i]
+                int(token_data.get('trade_count_24h', 0))
+                creation_time = token_data.get('creation_time')
+                if creation_time:
+                    numeric['token_age_hours'][i] = (now - creation_time) / 3600
+            except Exception as e:
+                errors[i] = e
+        
+        columns = self._derive_columns(numeric)
+        band_indexes = []
+        section_scores = []
+        for section in PUMP_DUMP_RULES:
+            ladder_indexes = []
+            score = np.zeros(count, dtype=np.int64)
+            for ladder in section.ladders:
+                index = np.select([band.when(columns) for band in ladder.bands], range(len(ladder.bands)), default=-1)
+                points = np.where(index >= 0, ladder.points[index], 0)
+                if ladder.name:
+                    columns[ladder.name] = points
+                score += points
+                ladder_indexes.append(index)
+            band_indexes.append(ladder_indexes)
+            section_scores.append(score)
+        
+        total_score = sum(section_scores)
+        risk_score = np.minimum(1.0, total_score / PUMP_DUMP_MAX_SCORE)
+        risk_level_index = np.select(
+            [(risk_score >= cutoff) | (total_score >= points) for cutoff, points, _, _ in RISK_LEVELS],
+            range(len(RISK_LEVELS)), default=len(RISK_LEVELS))
+        
+        price_1h = columns['price_1h']
+        pump_thresholds, dump_thresholds = self.PUMP_OPPORTUNITY_THRESHOLDS, self.DUMP_WARNING_THRESHOLDS
+        phase_index = np.select([
+            price_1h >= pump_thresholds['extreme_pump_1h'],
+            price_1h >= pump_thresholds['momentum_pump_1h'],
+            price_1h >= pump_thresholds['early_pump_1h'],
+            price_1h <= dump_thresholds['severe_dump_1h'],
+            price_1h <= dump_thresholds['moderate_dump_1h'],
+        ], range(5), default=-1)
+        
+        results = []
+        for i in range(count):
+            if errors[i] is not None:
+                results.append(PumpDumpResult.failed(self, symbols[i], tokens[i], errors[i]))
+                continue
+            results.append(PumpDumpResult(
+                self, symbols[i], tokens[i], columns, i, trader_counts[i],
+                [[index[i] for index in ladder_indexes] for ladder_indexes in band_indexes],
+                [score[i].item() for score in section_scores],
+                risk_score[i].item(), risk_level_index[i].item(), phase_index[i].item()
+            ))
+        return results
+    
+    @staticmethod
+    def _derive_columns(numeric: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Ratios the rules compare, zero where their guard does not hold"""
+        columns = dict(numeric)
+        volume_1h, volume_24h = numeric['volume_1h'], numeric['volume_24h']
+        market_cap, unique_traders = numeric['market_cap'], numeric['unique_traders']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            hourly_avg_volume = volume_24h / 24
+            columns['volume_surge_ratio'] = np.where(
+                (volume_1h > 0) & (volume_24h > 0) & (hourly_avg_volume > 0), volume_1h / hourly_avg_volume, 0.0)
+            columns['volume_to_mcap_ratio'] = np.where(
+                (market_cap > 0) & (volume_24h > 0), volume_24h / market_cap, 0.0)
+            columns['volume_per_trader'] = np.where(
+                (unique_traders > 0) & (volume_24h > 0), volume_24h / unique_traders, 0.0)
+        columns['momentum_1h'] = numeric['price_1h']
+        columns['momentum_4h'] = numeric['price_4h'] / 4
+        columns['momentum_24h'] = numeric['price_24h'] / 24
+        return columns
+    
     def _calculate_pump_score(self, token_data: Dict[str, Any]) -> float:
         """Calculate pump pattern score with detailed logging."""
         try:
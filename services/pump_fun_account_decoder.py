@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+🔬 PUMP.FUN ACCOUNT DECODER - Layout-aware bonding curve decoding
+Reads pump.fun BondingCurve accounts straight from their on-chain binary layout
+"""
+
+import base64
+import hashlib
+import struct
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+# Anchor account discriminator: first 8 bytes of sha256("account:BondingCurve")
+BONDING_CURVE_DISCRIMINATOR = hashlib.sha256(b"account:BondingCurve").digest()[:8]
+
+# BondingCurve account layout (little endian, no padding):
+#   0  discriminator            [u8; 8]
+#   8  virtual_token_reserves   u64
+#   16 virtual_sol_reserves     u64
+#   24 real_token_reserves      u64
+#   32 real_sol_reserves        u64
+#   40 token_total_supply       u64
+#   48 complete                 bool
+#   49 creator                  Pubkey (newer program versions only)
+BONDING_CURVE_LAYOUT = struct.Struct("<8x5Q?")
+CREATOR_OFFSET = BONDING_CURVE_LAYOUT.size
+CREATOR_END = CREATOR_OFFSET + 32
+
+# Graduation happens when the curve has sold all of its initial real token reserves
+INITIAL_REAL_TOKEN_RESERVES = 793_100_000_000_000
+TOKEN_DECIMALS = 6
+LAMPORTS_PER_SOL = 1_000_000_000
+
+_B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def b58encode(data: Buffer) -> str:
+    """Base58-encode bytes (Solana address / memcmp filter encoding)"""
+    data = bytes(data)
+    number = int.from_bytes(data, "big")
+    encoded = []
+    while number:
+        number, remainder = divmod(number, 58)
+        encoded.append(_B58_ALPHABET[remainder])
+    leading_zeros = len(data) - len(data.lstrip(b"\0"))
+    return "1" * leading_zeros + "".join(reversed(encoded))
+
+
+@dataclass
+class BondingCurveState:
+    """Decoded pump.fun bonding curve account"""
+    virtual_token_reserves: int
+    virtual_sol_reserves: int
+    real_token_reserves: int
+    real_sol_reserves: int
+    token_total_supply: int
+    complete: bool
+    creator: Optional[str] = None
+    account: Optional[str] = None
+
+    @property
+    def graduation_progress(self) -> float:
+        """Percent of the curve's sellable tokens already bought (100 once complete)"""
+        if self.complete:
+            return 100.0
+        sold = INITIAL_REAL_TOKEN_RESERVES - self.real_token_reserves
+        return max(0.0, min(100.0, sold * 100.0 / INITIAL_REAL_TOKEN_RESERVES))
+
+    @property
+    def price_sol(self) -> float:
+        """Current curve price in SOL per whole token"""
+        if not self.virtual_token_reserves:
+            return 0.0
+        return (self.virtual_sol_reserves / LAMPORTS_PER_SOL) / (self.virtual_token_reserves / 10 ** TOKEN_DECIMALS)
+
+    @property
+    def market_cap_sol(self) -> float:
+        return self.price_sol * (self.token_total_supply / 10 ** TOKEN_DECIMALS)
+
+    @property
+    def sol_in_curve(self) -> float:
+        return self.real_sol_reserves / LAMPORTS_PER_SOL
+
+    def to_dict(self, sol_price_usd: Optional[float] = None) -> Dict:
+        """Flatten to the token-data dict shape used by the monitors"""
+        data = {
+            'bonding_curve_address': self.account,
+            'creator': self.creator,
+            'virtual_token_reserves': self.virtual_token_reserves,
+            'virtual_sol_reserves': self.virtual_sol_reserves,
+            'real_token_reserves': self.real_token_reserves,
+            'real_sol_reserves': self.real_sol_reserves,
+            'total_supply': self.token_total_supply / 10 ** TOKEN_DECIMALS,
+            'decimals': TOKEN_DECIMALS,
+            'complete': self.complete,
+            'graduation_progress_pct': self.graduation_progress,
+            'sol_in_bonding_curve': self.sol_in_curve,
+            'price_sol': self.price_sol,
+            'market_cap_sol': self.market_cap_sol,
+        }
+        if sol_price_usd:
+            data['price'] = self.price_sol * sol_price_usd
+            data['market_cap'] = self.market_cap_sol * sol_price_usd
+        return data
+
+
+def decode_bonding_curve(data: Buffer, account: Optional[str] = None) -> Optional[BondingCurveState]:
+    """
+    Decode one BondingCurve account.
+
+    Args:
+        data: Raw account data (bytes, bytearray or memoryview; not copied)
+        account: Optional account public key
+
+    Returns:
+        Decoded state, or None if the data is not a BondingCurve account
+    """
+    view = memoryview(data)
+    if len(view) < BONDING_CURVE_LAYOUT.size or view[:8] != BONDING_CURVE_DISCRIMINATOR:
+        return None
+    fields = BONDING_CURVE_LAYOUT.unpack_from(view)
+    creator = b58encode(view[CREATOR_OFFSET:CREATOR_END]) if len(view) >= CREATOR_END else None
+    return BondingCurveState(*fields, creator=creator, account=account)
+
+
+def decode_bonding_curves(accounts: Iterable[Tuple[Optional[str], str]]) -> List[BondingCurveState]:
+    """
+    Decode a burst of base64 account payloads.
+
+    Args:
+        accounts: (account pubkey, base64 data) pairs, e.g. one websocket burst
+
+    Returns:
+        Decoded bonding curves; payloads of other account types are skipped
+    """
+    decoded = []
+    for account, data_b64 in accounts:
+        if not data_b64:
+            continue
+        try:
+            raw = base64.b64decode(data_b64)
+        except (ValueError, TypeError):
+            continue
+        state = decode_bonding_curve(raw, account)
+        if state is not None:
+            decoded.append(state)
+    return decoded
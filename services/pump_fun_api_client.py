@@ -101,7 +101,7 @@ class PumpFunAPIClient:
             self.token_cache[token_address] = token_data
             self.rpc_tokens_discovered += 1
             
-            self.logger.info(f"🚨 RPC DETECTION: {token_data['symbol']} (${token_data['market_cap']:,})")
+            self.logger.info(f"🚨 RPC DETECTION: {token_data['symbol']} ({PumpFunRPCMonitor._format_market_cap(token_data)})")
             
         except Exception as e:
             self.logger.error(f"RPC token handling error: {e}")
@@ -475,7 +475,7 @@ async def test_enhanced_client():
         print(f"📊 Results: {len(tokens)} tokens discovered")
         
         for i, token in enumerate(tokens[:3], 1):
-            print(f"   {i}. {token['symbol']} (${token['market_cap']:,}) - {token['source']}")
+            print(f"   {i}. {token['symbol']} ({PumpFunRPCMonitor._format_market_cap(token)}) - {token['source']}")
         
         # Show stats
         stats = client.get_api_stats()
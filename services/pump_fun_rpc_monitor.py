@@ -17,6 +17,13 @@ import base64
 import struct
 import traceback
 
+from services.pump_fun_account_decoder import (
+    BONDING_CURVE_DISCRIMINATOR,
+    BondingCurveState,
+    b58encode,
+    decode_bonding_curve,
+)
+
 class PumpFunRPCMonitor:
     """
     🚀 Real-time pump.fun monitoring via Solana RPC
@@ -34,19 +41,32 @@ class PumpFunRPCMonitor:
     # pump.fun program constants
     PUMP_FUN_PROGRAM = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
     BONDING_CURVE_SEED = "bonding-curve"
+    # Token programs a curve's token vault can belong to (classic SPL Token, Token-2022)
+    TOKEN_PROGRAMS = (
+        "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",
+        "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb",
+    )
     
     def __init__(self, 
                  rpc_url: str = "wss://api.mainnet-beta.solana.com",
                  http_rpc_url: str = "https://api.mainnet-beta.solana.com",
                  logger: Optional[logging.Logger] = None,
                  debug_mode: bool = True,
-                 use_mock_data: bool = False):
+                 use_mock_data: bool = False,
+                 sol_price_usd: Optional[float] = None,
+                 max_burst_size: int = 100,
+                 burst_window_seconds: float = 0.005):
         """Initialize RPC monitor with enhanced debugging"""
         
         self.rpc_url = rpc_url
         self.http_rpc_url = http_rpc_url
         self.debug_mode = debug_mode
         self.use_mock_data = use_mock_data
+        # SOL/USD used to express curve prices and market caps in USD (SOL-only when unset)
+        self.sol_price_usd = sol_price_usd
+        # Messages already queued on the socket are drained and decoded together
+        self.max_burst_size = max_burst_size
+        self.burst_window_seconds = burst_window_seconds
         self.logger = logger or self._setup_enhanced_logger()
         
         # Connection management
@@ -64,6 +84,8 @@ class PumpFunRPCMonitor:
         
         # Data tracking with debug info
         self.detected_tokens: Dict[str, Dict] = {}
+        # Bonding curve account -> token mint (the curve account itself does not store the mint)
+        self.curve_mints: Dict[str, str] = {}
         self.recent_events: List[Dict] = []
         self.debug_events: List[Dict] = []
         
@@ -83,6 +105,8 @@ class PumpFunRPCMonitor:
             'account_updates': 0,
             'parsing_attempts': 0,
             'successful_parses': 0,
+            'bursts_processed': 0,
+            'non_curve_accounts': 0,
             'connection_drops': 0,
             'reconnection_attempts': 0
         }
@@ -195,7 +219,10 @@ class PumpFunRPCMonitor:
                     {
                         "commitment": "confirmed",
                         "encoding": "base64",
-                        "filters": []
+                        # Only BondingCurve accounts (Anchor discriminator at offset 0)
+                        "filters": [
+                            {"memcmp": {"offset": 0, "bytes": b58encode(BONDING_CURVE_DISCRIMINATOR)}}
+                        ]
                     }
                 ]
             }
@@ -216,7 +243,7 @@ class PumpFunRPCMonitor:
                 self.subscription_id = data['result']
                 self.logger.info(f"✅ Subscribed to pump.fun program (ID: {self.subscription_id})")
                 self.logger.debug(f"   🎯 Program address: {self.PUMP_FUN_PROGRAM}")
-                self.logger.debug(f"   📋 Subscription filters: None (all events)")
+                self.logger.debug(f"   📋 Subscription filters: BondingCurve discriminator")
                 self.logger.debug(f"   🔒 Commitment level: confirmed")
             else:
                 error_msg = data.get('error', 'Unknown subscription error')
@@ -235,36 +262,48 @@ class PumpFunRPCMonitor:
         
         try:
             async for message in self.websocket:
-                try:
-                    self.debug_stats['messages_received'] += 1
-                    self.last_heartbeat = time.time()
-                    
-                    if self.debug_mode:
-                        self.logger.debug(f"📥 Raw message received (#{self.debug_stats['messages_received']})")
-                        self.logger.debug(f"   📊 Message length: {len(message)} bytes")
-                        self.logger.debug(f"   ⏰ Timestamp: {datetime.now().isoformat()}")
-                    
-                    event_data = json.loads(message)
-                    
-                    if self.debug_mode:
-                        # Log message structure without full content
-                        msg_keys = list(event_data.keys()) if isinstance(event_data, dict) else []
-                        self.logger.debug(f"   🔍 Message structure: {msg_keys}")
+                # Drain whatever else already arrived so the burst is decoded together
+                messages = [message]
+                messages.extend(await self._drain_pending_messages())
+                notifications = []
+                
+                for message in messages:
+                    try:
+                        self.debug_stats['messages_received'] += 1
+                        self.last_heartbeat = time.time()
                         
-                        if 'method' in event_data:
-                            self.logger.debug(f"   🎯 Method: {event_data['method']}")
-                    
-                    await self._handle_event(event_data)
-                    
-                except json.JSONDecodeError as e:
-                    self.invalid_events += 1
-                    self.logger.warning(f"⚠️ Invalid JSON received: {e}")
-                    self.logger.debug(f"   📝 Raw message (first 200 chars): {message[:200]}...")
-                    
-                except Exception as e:
-                    self.parse_errors += 1
-                    self.logger.error(f"❌ Event processing error: {e}")
-                    self.logger.debug(f"   📝 Processing error trace: {traceback.format_exc()}")
+                        if self.debug_mode:
+                            self.logger.debug(f"📥 Raw message received (#{self.debug_stats['messages_received']})")
+                            self.logger.debug(f"   📊 Message length: {len(message)} bytes")
+                            self.logger.debug(f"   ⏰ Timestamp: {datetime.now().isoformat()}")
+                        
+                        event_data = json.loads(message)
+                        
+                        if self.debug_mode:
+                            # Log message structure without full content
+                            msg_keys = list(event_data.keys()) if isinstance(event_data, dict) else []
+                            self.logger.debug(f"   🔍 Message structure: {msg_keys}")
+                            
+                            if 'method' in event_data:
+                                self.logger.debug(f"   🎯 Method: {event_data['method']}")
+                        
+                        if isinstance(event_data, dict) and event_data.get('method') == 'programNotification':
+                            notifications.append(event_data)
+                        else:
+                            await self._handle_event(event_data)
+                        
+                    except json.JSONDecodeError as e:
+                        self.invalid_events += 1
+                        self.logger.warning(f"⚠️ Invalid JSON received: {e}")
+                        self.logger.debug(f"   📝 Raw message (first 200 chars): {message[:200]}...")
+                        
+                    except Exception as e:
+                        self.parse_errors += 1
+                        self.logger.error(f"❌ Event processing error: {e}")
+                        self.logger.debug(f"   📝 Processing error trace: {traceback.format_exc()}")
+                
+                if notifications:
+                    await self._process_notification_burst(notifications)
                     
         except websockets.exceptions.ConnectionClosed as e:
             self.debug_stats['connection_drops'] += 1
@@ -279,6 +318,16 @@ class PumpFunRPCMonitor:
             self.logger.error(f"❌ Event processing failed: {e}")
             self.logger.debug(f"   📝 Processing failure trace: {traceback.format_exc()}")
     
+    async def _drain_pending_messages(self) -> List[str]:
+        """Collect messages that arrive within the burst window (up to max_burst_size)"""
+        pending = []
+        while len(pending) < self.max_burst_size - 1:
+            try:
+                pending.append(await asyncio.wait_for(self.websocket.recv(), timeout=self.burst_window_seconds))
+            except asyncio.TimeoutError:
+                break
+        return pending
+    
     async def _handle_event(self, event_data: Dict):
         """Handle individual WebSocket event with detailed debug logging"""
         
@@ -302,152 +351,87 @@ class PumpFunRPCMonitor:
                 self.logger.debug(f"   ⏭️ Ignoring method: {method}")
     
     async def _process_program_notification(self, notification: Dict):
-        """Process pump.fun program notification with enhanced debug logging"""
-        try:
-            if self.debug_mode:
-                self.logger.debug("   🔍 Processing program notification...")
-            
-            params = notification.get('params', {})
-            if not params:
-                self.logger.debug("   ⚠️ No params in notification")
-                return
-                
-            result = params.get('result', {})
-            if not result:
-                self.logger.debug("   ⚠️ No result in params")
-                return
-            
-            if self.debug_mode:
-                self.logger.debug(f"   📋 Result keys: {list(result.keys())}")
-            
-            account_info = result.get('value', {})
-            if not account_info:
-                self.logger.debug("   ⚠️ No account info in result")
-                return
-                
-            account_data = account_info.get('account', {})
-            if not account_data:
-                self.logger.debug("   ⚠️ No account data in account info")
-                return
-            
-            self.debug_stats['account_updates'] += 1
-            
-            if self.debug_mode:
-                self.logger.debug(f"   📊 Account update #{self.debug_stats['account_updates']}")
-                self.logger.debug(f"   🔑 Account data keys: {list(account_data.keys())}")
-                
-                # Log account metadata
-                owner = account_data.get('owner')
-                lamports = account_data.get('lamports')
-                executable = account_data.get('executable')
-                
-                self.logger.debug(f"   👤 Owner: {owner}")
-                self.logger.debug(f"   💰 Lamports: {lamports}")
-                self.logger.debug(f"   🔧 Executable: {executable}")
-            
-            # Parse account data
-            self.debug_stats['parsing_attempts'] += 1
-            parsed_event = await self._parse_account_data(account_data)
-            
-            if parsed_event:
-                self.debug_stats['successful_parses'] += 1
-                if self.debug_mode:
-                    self.logger.debug(f"   ✅ Parsing successful (#{self.debug_stats['successful_parses']})")
-                await self._process_pump_fun_event(parsed_event)
-            else:
-                if self.debug_mode:
-                    self.logger.debug("   ⏭️ Parsing returned no event")
+        """Process a single pump.fun program notification"""
+        await self._process_notification_burst([notification])
+    
+    async def _process_notification_burst(self, notifications: List[Dict]):
+        """Decode a burst of program notifications in one pass, then dispatch the events"""
+        self.debug_stats['bursts_processed'] += 1
+        if self.debug_mode:
+            self.logger.debug(f"   📦 Decoding burst of {len(notifications)} program notifications")
+        
+        events = []
+        for notification in notifications:
+            try:
+                self.debug_stats['program_notifications'] += 1
+                result = notification.get('params', {}).get('result', {})
+                account_info = result.get('value', {}) if result else {}
+                account_data = account_info.get('account', {}) if account_info else {}
+                if not account_data:
+                    if self.debug_mode:
+                        self.logger.debug("   ⚠️ No account data in notification")
+                    continue
                 
-        except Exception as e:
-            self.parse_errors += 1
-            self.logger.error(f"❌ Program notification processing error: {e}")
-            self.logger.debug(f"   📝 Notification error trace: {traceback.format_exc()}")
+                self.debug_stats['account_updates'] += 1
+                self.debug_stats['parsing_attempts'] += 1
+                event = self._decode_account(account_data, account_info.get('pubkey'))
+                if event:
+                    self.debug_stats['successful_parses'] += 1
+                    events.append(event)
+            except Exception as e:
+                self.parse_errors += 1
+                self.logger.error(f"❌ Program notification processing error: {e}")
+                self.logger.debug(f"   📝 Notification error trace: {traceback.format_exc()}")
+        
+        for event in events:
+            await self._process_pump_fun_event(event)
+    
+    async def _parse_account_data(self, account_data: Dict, pubkey: Optional[str] = None) -> Optional[Dict]:
+        """Parse pump.fun account data into a bonding curve event"""
+        return self._decode_account(account_data, pubkey)
     
-    async def _parse_account_data(self, account_data: Dict) -> Optional[Dict]:
-        """Parse pump.fun account data with comprehensive debug logging"""
+    def _decode_account(self, account_data: Dict, pubkey: Optional[str] = None) -> Optional[Dict]:
+        """Decode a BondingCurve account from its binary layout (no follow-up RPC needed)"""
         try:
-            if self.debug_mode:
-                self.logger.debug("   🔬 Parsing account data...")
-            
-            # Get account data
             data_info = account_data.get('data', [])
-            if not data_info or len(data_info) == 0:
-                if self.debug_mode:
-                    self.logger.debug("   ⚠️ No data field in account")
-                return None
-            
-            data_b64 = data_info[0] if isinstance(data_info, list) else data_info
+            data_b64 = data_info[0] if isinstance(data_info, list) and data_info else data_info
             if not data_b64:
                 if self.debug_mode:
                     self.logger.debug("   ⚠️ Empty data field")
                 return None
             
-            if self.debug_mode:
-                self.logger.debug(f"   📊 Data length (base64): {len(data_b64)} chars")
-            
-            # Decode base64 data
-            try:
-                raw_data = base64.b64decode(data_b64)
+            raw_data = base64.b64decode(data_b64)
+            curve = decode_bonding_curve(raw_data, pubkey)
+            if curve is None:
+                self.debug_stats['non_curve_accounts'] += 1
                 if self.debug_mode:
-                    self.logger.debug(f"   📊 Raw data length: {len(raw_data)} bytes")
-                    self.logger.debug(f"   🔍 First 32 bytes (hex): {raw_data[:32].hex()}")
-            except Exception as e:
-                if self.debug_mode:
-                    self.logger.debug(f"   ❌ Base64 decode error: {e}")
+                    self.logger.debug(f"   ⏭️ Not a BondingCurve account ({len(raw_data)} bytes, discriminator {raw_data[:8].hex()})")
                 return None
             
-            # Enhanced parsing logic
-            if len(raw_data) >= 32:  # Minimum viable data length
-                
-                if self.debug_mode:
-                    self.logger.debug("   ✅ Data length sufficient for parsing")
-                    
-                    # Try to identify data patterns
-                    try:
-                        # Look for common pump.fun patterns
-                        first_bytes = raw_data[:8]
-                        last_bytes = raw_data[-8:]
-                        
-                        self.logger.debug(f"   🔍 First 8 bytes: {first_bytes.hex()}")
-                        self.logger.debug(f"   🔍 Last 8 bytes: {last_bytes.hex()}")
-                        
-                        # Check for potential discriminators or identifiers
-                        potential_discriminator = int.from_bytes(raw_data[:8], 'little')
-                        self.logger.debug(f"   🎯 Potential discriminator: {potential_discriminator}")
-                        
-                    except Exception as parse_debug_error:
-                        self.logger.debug(f"   ⚠️ Debug parsing error: {parse_debug_error}")
-                
-                # Create event with enhanced metadata
-                event = {
-                    'event_type': 'account_update',
-                    'timestamp': time.time(),
-                    'raw_data': raw_data,
-                    'data_length': len(raw_data),
-                    'account_owner': account_data.get('owner'),
-                    'account_lamports': account_data.get('lamports'),
-                    'parsing_attempt': self.debug_stats['parsing_attempts'],
-                    'debug_info': {
-                        'first_8_bytes': raw_data[:8].hex(),
-                        'last_8_bytes': raw_data[-8:].hex(),
-                        'data_b64_length': len(data_b64)
-                    }
+            if self.debug_mode:
+                self.logger.debug(f"   ✅ Bonding curve decoded: {curve.graduation_progress:.2f}% "
+                                  f"({curve.sol_in_curve:.3f} SOL, complete={curve.complete})")
+            
+            return {
+                'event_type': 'account_update',
+                'timestamp': time.time(),
+                'account_pubkey': pubkey,
+                'bonding_curve': curve,
+                'raw_data': raw_data,
+                'data_length': len(raw_data),
+                'account_owner': account_data.get('owner'),
+                'account_lamports': account_data.get('lamports'),
+                'parsing_attempt': self.debug_stats['parsing_attempts'],
+                'debug_info': {
+                    'first_8_bytes': raw_data[:8].hex(),
+                    'last_8_bytes': raw_data[-8:].hex(),
+                    'data_b64_length': len(data_b64)
                 }
-                
-                if self.debug_mode:
-                    self.logger.debug("   ✅ Event created successfully")
-                    self.logger.debug(f"   📋 Event type: {event['event_type']}")
-                
-                return event
-            else:
-                if self.debug_mode:
-                    self.logger.debug(f"   ⚠️ Data too short: {len(raw_data)} bytes (need ≥32)")
-                
+            }
         except Exception as e:
             self.logger.debug(f"❌ Account data parsing error: {e}")
             self.logger.debug(f"   📝 Parse error trace: {traceback.format_exc()}")
-            
-        return None
+            return None
     
     async def _process_pump_fun_event(self, event: Dict):
         """Process parsed pump.fun event with enhanced debug logging"""
@@ -511,8 +495,14 @@ class PumpFunRPCMonitor:
                 self.logger.debug(f"   👤 Account owner: {account_owner}")
                 self.logger.debug(f"   📊 Analyzing {len(raw_data)} bytes of data")
             
+            curve = event.get('bonding_curve')
+            known_token = self.detected_tokens.get(event.get('account_pubkey')) if curve else None
+            if known_token is not None:
+                await self._update_curve_progress(known_token, curve)
+                return
+            
             # Check if this could be a token creation
-            is_potential_token = self._analyze_for_token_patterns(raw_data)
+            is_potential_token = self._analyze_for_token_patterns(raw_data, curve)
             
             if is_potential_token:
                 if self.debug_mode:
@@ -523,7 +513,7 @@ class PumpFunRPCMonitor:
                     **event,
                     'event_type': 'token_creation',
                     'potential_token': True,
-                    'analysis_confidence': 'medium'
+                    'analysis_confidence': 'high'
                 }
                 
                 await self._handle_token_creation(token_event)
@@ -535,33 +525,30 @@ class PumpFunRPCMonitor:
             self.logger.error(f"❌ Account update handling error: {e}")
             self.logger.debug(f"   📝 Account update error trace: {traceback.format_exc()}")
     
-    def _analyze_for_token_patterns(self, raw_data: bytes) -> bool:
-        """Analyze raw data for token creation patterns"""
-        try:
-            if len(raw_data) < 32:
-                return False
-            
-            # Look for patterns that might indicate token creation
-            # This is a simplified heuristic - real implementation would need
-            # detailed knowledge of pump.fun's data structures
-            
-            if self.debug_mode:
-                self.logger.debug("   🔍 Looking for token creation patterns...")
-            
-            # Check for common patterns
-            has_potential_mint = len(raw_data) >= 64  # Minimum for mint data
-            has_non_zero_data = any(b != 0 for b in raw_data[:32])
-            
-            if self.debug_mode:
-                self.logger.debug(f"   📊 Sufficient length: {has_potential_mint}")
-                self.logger.debug(f"   📊 Non-zero data: {has_non_zero_data}")
-            
-            return has_potential_mint and has_non_zero_data
-            
-        except Exception as e:
-            if self.debug_mode:
-                self.logger.debug(f"   ❌ Pattern analysis error: {e}")
+    def _analyze_for_token_patterns(self, raw_data: bytes, curve: Optional[BondingCurveState] = None) -> bool:
+        """Check whether an account update is a live (not yet graduated) bonding curve"""
+        if curve is None:
+            curve = decode_bonding_curve(raw_data) if raw_data else None
+        if curve is None:
             return False
+        
+        if self.debug_mode:
+            self.logger.debug(f"   📊 Curve progress: {curve.graduation_progress:.2f}%, complete: {curve.complete}")
+        
+        return not curve.complete
+    
+    async def _update_curve_progress(self, token: Dict, curve: BondingCurveState):
+        """Refresh a tracked token from a newer bonding curve snapshot"""
+        was_complete = token.get('complete', False)
+        token.update(curve.to_dict(self.sol_price_usd))
+        
+        if self.debug_mode:
+            self.logger.debug(f"   📈 {token['token_address'][:8]}... progress {curve.graduation_progress:.2f}%")
+        
+        if curve.complete and not was_complete:
+            self.logger.info(f"🎓 Bonding curve completed: {token['symbol']} ({token['token_address']})")
+            if self.on_graduation:
+                await self.on_graduation(token)
     
     async def _handle_token_creation(self, event: Dict):
         """Handle new token creation with comprehensive debug logging"""
@@ -569,15 +556,22 @@ class PumpFunRPCMonitor:
             if self.debug_mode:
                 self.logger.debug("   🚨 Processing potential token creation...")
             
-            # Generate token address (simplified for demo)
-            current_time = int(event['timestamp'])
-            token_address = f"LIVE_{current_time}_{self.events_processed}"
+            # Tracked tokens are keyed by curve account (that is what later updates carry),
+            # while token_address is the mint the rest of the pipeline looks tokens up by
+            curve_account = event.get('account_pubkey')
+            token_address = await self._resolve_mint(curve_account) if curve_account else None
+            if not token_address:
+                if not self.use_mock_data:
+                    if self.debug_mode:
+                        self.logger.debug(f"   ⚠️ Could not resolve mint for curve {curve_account}")
+                    return
+                token_address = curve_account or f"LIVE_{int(event['timestamp'])}_{self.events_processed}"
+            token_key = curve_account or token_address
             
             if self.debug_mode:
-                self.logger.debug(f"   🎯 Generated token address: {token_address}")
+                self.logger.debug(f"   🎯 Token mint: {token_address} (curve {curve_account})")
             
-            # Get additional token data via HTTP RPC
-            self.logger.debug("   📡 Fetching additional token metadata...")
+            self.logger.debug("   📡 Building token data...")
             token_data = await self._fetch_token_data(token_address, event)
             
             if token_data:
@@ -587,8 +581,6 @@ class PumpFunRPCMonitor:
                     'symbol': token_data.get('symbol', f"LIVE{token_address[:6]}"),
                     'name': token_data.get('name', 'Live Pump.fun Token'),
                     'creation_timestamp': event['timestamp'],
-                    'market_cap': token_data.get('market_cap', 1000),
-                    'price': token_data.get('price', 0.001),
                     'bonding_curve_stage': 'STAGE_0_LIVE_RPC',
                     'estimated_age_minutes': 0,
                     'source': 'pump_fun_rpc_monitor',
@@ -597,6 +589,7 @@ class PumpFunRPCMonitor:
                     'volume_24h': 0,
                     'liquidity': 500,
                     'ultra_early_bonus_eligible': True,
+                    **{key: value for key, value in token_data.items() if key not in ('symbol', 'name')},
                     'debug_info': {
                         'processing_number': self.events_processed,
                         'raw_data_length': event.get('data_length', 0),
@@ -606,7 +599,7 @@ class PumpFunRPCMonitor:
                 }
                 
                 # Store token with debug info
-                self.detected_tokens[token_address] = full_event
+                self.detected_tokens[token_key] = full_event
                 self.valid_events += 1
                 
                 # Trigger callback
@@ -615,7 +608,7 @@ class PumpFunRPCMonitor:
                         self.logger.debug("   📞 Triggering new token callback...")
                     await self.on_new_token(full_event)
                 
-                self.logger.info(f"🚨 LIVE TOKEN DETECTED: {full_event['symbol']} (${full_event['market_cap']:,})")
+                self.logger.info(f"🚨 LIVE TOKEN DETECTED: {full_event['symbol']} ({self._format_market_cap(full_event)})")
                 self.logger.info(f"   🎯 Address: {token_address}")
                 self.logger.info(f"   📊 Processing #: {self.events_processed}")
                 self.logger.info(f"   🔍 Detection method: {full_event['detection_method']}")
@@ -628,6 +621,48 @@ class PumpFunRPCMonitor:
             self.logger.error(f"❌ Token creation handling error: {e}")
             self.logger.debug(f"   📝 Token creation error trace: {traceback.format_exc()}")
     
+    async def _resolve_mint(self, curve_account: str) -> Optional[str]:
+        """Find the mint of a bonding curve through the token account it holds"""
+        if curve_account in self.curve_mints:
+            return self.curve_mints[curve_account]
+        if self.session is None:
+            return None
+        
+        for program_id in self.TOKEN_PROGRAMS:
+            payload = {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "getTokenAccountsByOwner",
+                "params": [curve_account, {"programId": program_id}, {"encoding": "jsonParsed"}]
+            }
+            try:
+                async with self.session.post(self.http_rpc_url, json=payload) as response:
+                    if response.status != 200:
+                        continue
+                    result = await response.json()
+            except Exception as e:
+                self.logger.debug(f"❌ Mint lookup error for {curve_account}: {e}")
+                return None
+            
+            for account in (result.get('result') or {}).get('value') or []:
+                mint = (
+                    account.get('account', {}).get('data', {})
+                    .get('parsed', {}).get('info', {}).get('mint')
+                )
+                if mint:
+                    self.curve_mints[curve_account] = mint
+                    return mint
+        return None
+    
+    @staticmethod
+    def _format_market_cap(token: Dict) -> str:
+        """Market cap in USD when known, otherwise in SOL"""
+        if token.get('market_cap') is not None:
+            return f"${token['market_cap']:,.0f}"
+        if token.get('market_cap_sol') is not None:
+            return f"{token['market_cap_sol']:,.2f} SOL"
+        return "market cap unknown"
+    
     async def _fetch_token_data(self, token_address: str, event: Dict) -> Optional[Dict]:
         """Fetch additional token data via HTTP RPC with debug logging"""
         try:
@@ -663,15 +698,21 @@ class PumpFunRPCMonitor:
                     self.logger.debug(f"   💲 Price: ${token_data['price']:.6f}")
                 
                 return token_data
-            else:
-                # 🚫 MOCK DATA DISABLED - Real RPC implementation needed
-                # Real RPC calls would be implemented here to fetch actual token metadata
-                # For production use, this should call Solana RPC to get real token data
-                
+            
+            # The notification already carries the full curve state - no RPC round trip needed
+            curve = event.get('bonding_curve')
+            if curve is None:
                 if self.debug_mode:
-                    self.logger.debug("   🚫 Mock data disabled - real RPC implementation required")
-                
-                return None  # Return None to prevent mock data generation
+                    self.logger.debug("   ⚠️ No decoded bonding curve in event")
+                return None
+            
+            # USD price/market_cap are only set when a SOL price is known; SOL values stay in *_sol
+            token_data = curve.to_dict(self.sol_price_usd)
+            
+            if self.debug_mode:
+                self.logger.debug(f"   ✅ Token data decoded from curve ({token_data['graduation_progress_pct']:.2f}% to graduation)")
+            
+            return token_data
             
         except Exception as e:
             self.logger.debug(f"❌ Token data fetch error: {e}")
@@ -818,7 +859,7 @@ async def demo_enhanced_rpc_monitor():
     
     # Set up callbacks with debug info
     async def on_new_token(token_data):
-        print(f"🚨 NEW TOKEN CALLBACK: {token_data['symbol']} (${token_data['market_cap']:,})")
+        print(f"🚨 NEW TOKEN CALLBACK: {token_data['symbol']} ({PumpFunRPCMonitor._format_market_cap(token_data)})")
         print(f"   🎯 Address: {token_data['token_address']}")
         print(f"   🔍 Detection: {token_data['detection_method']}")
         print(f"   🐛 Debug: Processing #{token_data['debug_info']['processing_number']}")
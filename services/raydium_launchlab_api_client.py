@@ -12,6 +12,8 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import json
 
+from utils.http_client_manager import HTTPClientFactory, upstream_for_url
+
 class RaydiumLaunchLabAPIClient:
     """Real LaunchLab client using Jupiter and Raydium APIs"""
     
@@ -52,18 +54,18 @@ class RaydiumLaunchLabAPIClient:
             if time_since_last < self.min_request_interval:
                 await asyncio.sleep(self.min_request_interval - time_since_last)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    self.last_request_time = time.time()
-                    self.api_calls_made += 1
-                    
-                    if response.status == 200:
-                        data = await response.json()
-                        self.logger.debug(f"✅ API call successful: {url}")
-                        return data
-                    else:
-                        self.logger.warning(f"⚠️ API call failed: {response.status} - {url}")
-                        return None
+            session = HTTPClientFactory.get_shared_session(upstream_for_url(url))
+            async with session.get(url, params=params) as response:
+                self.last_request_time = time.time()
+                self.api_calls_made += 1
+                
+                if response.status == 200:
+                    data = await response.json()
+                    self.logger.debug(f"✅ API call successful: {url}")
+                    return data
+                else:
+                    self.logger.warning(f"⚠️ API call failed: {response.status} - {url}")
+                    return None
                         
         except Exception as e:
             self.logger.error(f"❌ API request error: {e}")
@@ -81,7 +81,9 @@ class SmartMoneyDetector:
         self._smart_traders_cache = {}
         self._token_trader_cache = {}
         
-    async def analyze_smart_money(self, token_address: str, priority_level: str = "normal") -> Dict[str, Any]:
+    async def analyze_smart_money(self, token_address: str, priority_level: str = "normal",
+                                  whale_shark_data: Optional[Dict[str, Any]] = None,
+                                  skill_memo: Optional[Dict[tuple, Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Analyze smart money activity for a token using skill-based criteria.
         
@@ -91,6 +93,8 @@ class SmartMoneyDetector:
         Args:
             token_address: Token address to analyze
             priority_level: "normal" or "high" (passed to whale/shark tracker)
+            whale_shark_data: Already fetched whale/shark analysis (skips the tracker call)
+            skill_memo: Optional per-trader skill memo shared across a batch
             
         Returns:
             Smart money analysis results with skill-based metrics
@@ -107,14 +111,15 @@ class SmartMoneyDetector:
             self.logger.info(f"🧠 Analyzing smart money activity for token {token_address}")
             
             # Get whale/shark data (reuses their API calls - no additional cost!)
-            whale_shark_data = await self.whale_shark_tracker.analyze_whale_shark_movements(
-                token_address, priority_level
-            )
+            if whale_shark_data is None:
+                whale_shark_data = await self.whale_shark_tracker.analyze_whale_shark_movements(
+                    token_address, priority_level
+                )
             
             # Perform skill-based analysis on the trader data
-            smart_money_analysis = await self._analyze_trader_skills(whale_shark_data, token_address)
+            smart_money_analysis = await self._analyze_trader_skills(whale_shark_data, token_address, skill_memo)
                 
-                # Cache the results
+            # Cache the results
             self.cache_manager.set(cache_key, smart_money_analysis, ttl=self.smart_money_cache_ttl)
                 
             self.logger.info(f"✅ Completed smart money analysis for {token_address}")
@@ -124,13 +129,15 @@ class SmartMoneyDetector:
             self.logger.error(f"❌ Error analyzing smart money for {token_address}: {e}")
             return self._get_empty_smart_money_analysis()
     
-    async def _analyze_trader_skills(self, whale_shark_data: Dict[str, Any], token_address: str) -> Dict[str, Any]:
+    async def _analyze_trader_skills(self, whale_shark_data: Dict[str, Any], token_address: str,
+                                     skill_memo: Optional[Dict[tuple, Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Analyze trader skills from whale/shark movement data.
         
         Args:
             whale_shark_data: Data from whale/shark tracker
             token_address: Token address being analyzed
+            skill_memo: Optional per-trader skill memo shared across a batch
             
         Returns:
             Smart money analysis with skill-based metrics
@@ -157,8 +164,11 @@ class SmartMoneyDetector:
                 "skill_distribution": {"high": 0, "medium": 0, "low": 0}
             }
             
-            for trader in all_traders:
-                skill_analysis = self._analyze_individual_trader_skill(trader)
+            if skill_memo is None:
+                skill_memo = {}
+            skill_analyses = [self._analyze_trader_skill_memoized(trader, skill_memo) for trader in all_traders]
+            
+            for trader, skill_analysis in zip(all_traders, skill_analyses):
                 
                 if skill_analysis["skill_score"] >= self.smart_money_criteria["skill_score_threshold"]:
                     skilled_traders.append({
@@ -177,7 +187,7 @@ class SmartMoneyDetector:
             
             # Calculate average skill score
             if all_traders:
-                total_skill = sum(self._analyze_individual_trader_skill(t)["skill_score"] for t in all_traders)
+                total_skill = sum(skill_analysis["skill_score"] for skill_analysis in skill_analyses)
                 skill_metrics["average_skill_score"] = total_skill / len(all_traders)
             
             # Generate smart money insights
@@ -197,6 +207,27 @@ class SmartMoneyDetector:
             self.logger.error(f"❌ Error analyzing trader skills: {e}")
             return self._get_empty_smart_money_analysis()
     
+    def _analyze_trader_skill_memoized(self, trader: Dict[str, Any],
+                                       skill_memo: Dict[tuple, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Skill analysis for a trader, computed once per wallet and activity.
+        
+        Skill scores depend only on the trader's volume, trade count and buy/sell
+        split, so a wallet seen with the same activity again reuses its analysis.
+        """
+        memo_key = (
+            trader.get("address"),
+            trader.get("volume", 0),
+            trader.get("trade_count", 0),
+            trader.get("volume_buy", 0),
+            trader.get("volume_sell", 0)
+        )
+        skill_analysis = skill_memo.get(memo_key)
+        if skill_analysis is None:
+            skill_analysis = self._analyze_individual_trader_skill(trader)
+            skill_memo[memo_key] = skill_analysis
+        return skill_analysis
+    
     def _analyze_individual_trader_skill(self, trader: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze individual trader skill based on behavioral patterns.
@@ -519,6 +550,10 @@ class SmartMoneyDetector:
         """
         Batch analyze smart money for multiple tokens efficiently.
         
+        Whale/shark data for all uncached tokens is fetched concurrently in one
+        tracker batch, and each trader's skill is analyzed once even when the
+        wallet appears in several tokens.
+        
         Args:
             token_addresses: List of token addresses to analyze
             priority_level: Priority level for whale/shark analysis
@@ -526,12 +561,40 @@ class SmartMoneyDetector:
         Returns:
             Dictionary mapping token addresses to smart money analysis results
         """
+        unique_addresses = list(dict.fromkeys(address for address in token_addresses if address))
         results = {}
+        pending = []
+        
+        for token_address in unique_addresses:
+            cached_data = self.cache_manager.get(f"smart_money_{token_address}_{priority_level}")
+            if cached_data:
+                results[token_address] = cached_data
+            else:
+                pending.append(token_address)
+        
+        if not pending:
+            return results
+        
+        self.logger.info(f"🧠 Batch analyzing smart money for {len(pending)} tokens ({len(results)} cached)")
+        
+        try:
+            whale_shark_batch = await self.whale_shark_tracker.batch_analyze_whale_shark_movements(
+                pending, priority_level=priority_level
+            )
+        except Exception as e:
+            self.logger.error(f"❌ Error fetching whale/shark data for smart money batch: {e}")
+            whale_shark_batch = {}
         
-        for token_address in token_addresses:
+        skill_memo: Dict[tuple, Dict[str, Any]] = {}
+        for token_address in pending:
+            whale_shark_data = whale_shark_batch.get(token_address)
+            if whale_shark_data is None:
+                results[token_address] = self._get_empty_smart_money_analysis()
+                continue
             try:
-                self.logger.info(f"🧠 Batch analyzing smart money for {token_address}")
-                results[token_address] = await self.analyze_smart_money(token_address, priority_level)
+                results[token_address] = await self.analyze_smart_money(
+                    token_address, priority_level, whale_shark_data=whale_shark_data, skill_memo=skill_memo
+                )
             except Exception as e:
                 self.logger.error(f"❌ Error in batch smart money analysis for {token_address}: {e}")
                 results[token_address] = self._get_empty_smart_money_analysis()
@@ -14,6 +14,10 @@ from typing import Dict, List, Any, Optional, Set
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from utils.hedged_requests import AllEndpointsFailed, HedgedRequester
+from utils.http_client_manager import HTTPClientFactory
+from utils.json_stream import JsonArrayStream, stream_response_array
+
 class SolBondingCurveDetector:
     """
     🎯 INTEGRATED SOL BONDING CURVE DETECTOR
@@ -60,6 +64,13 @@ class SolBondingCurveDetector:
         self.cache_dir.mkdir(exist_ok=True)
         self.cache_file = self.cache_dir / "raydium_pools_integrated.json"
         
+        # Hedged endpoint fallback with health persisted next to the pool cache
+        self.endpoint_racer = HedgedRequester(
+            state_file=self.cache_dir / "raydium_endpoint_health.json",
+            default_hedge_delay=3.0,
+            max_hedge_delay=self.FAST_TIMEOUT / 2
+        )
+        
         # Memory Caching
         self.cached_pools_data = None
         self.cache_timestamp = 0
@@ -153,18 +164,12 @@ class SolBondingCurveDetector:
         
         self.logger.info("🚀 Attempting integrated optimized fetch")
         
-        # Use optimized connection settings
-        connector = aiohttp.TCPConnector(
-            limit=10,  # Lower connection limit for stability
-            limit_per_host=5,  # Fewer connections per host
-            ttl_dns_cache=300,
-            keepalive_timeout=30,
-            enable_cleanup_closed=True
-        )
+        # Pooled Raydium connections stay warm across endpoint attempts and fetches
+        session = HTTPClientFactory.get_shared_session('raydium')
         
         timeout = aiohttp.ClientTimeout(total=self.FAST_TIMEOUT)
         
-        # Try endpoints in order of preference - Enhanced coverage
+        # Endpoints in order of preference - Enhanced coverage
         endpoints_to_try = [
             ('primary', self.endpoints['raydium_pairs_primary']),
             ('amm_pools', self.endpoints['raydium_amm_pools']),
@@ -174,62 +179,65 @@ class SolBondingCurveDetector:
             ('liquidity_pools', self.endpoints['raydium_liquidity_pools'])
         ]
         
-        for endpoint_name, endpoint_url in endpoints_to_try:
+        async def attempt(endpoint_name: str, endpoint_url: str) -> Optional[List[Dict[str, Any]]]:
+            self.logger.info(f"🔗 Trying {endpoint_name}: {endpoint_url}")
             try:
-                self.logger.info(f"🔗 Trying {endpoint_name}: {endpoint_url}")
-                async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-                    async with session.get(endpoint_url) as response:
-                        if response.status == 200:
-                            # Stream processing for large responses
-                            data = await self._process_response_with_streaming(response)
-                            
-                            if data and len(data) > 0:
-                                self.stats['api_calls_made'] += 1
-                                self.last_successful_fetch = time.time()
-                                self.logger.info(f"✅ {endpoint_name} succeeded with {len(data)} pools")
-                                return data
-                            else:
-                                self.logger.warning(f"⚠️ {endpoint_name} returned empty data")
-                        else:
-                            self.logger.warning(f"⚠️ {endpoint_name} returned HTTP {response.status}")
-            
+                async with session.get(endpoint_url, timeout=timeout) as response:
+                    if response.status != 200:
+                        self.logger.warning(f"⚠️ {endpoint_name} returned HTTP {response.status}")
+                        return None
+                    # Stream processing for large responses
+                    data = await self._process_response_with_streaming(response)
+                    if not data:
+                        self.logger.warning(f"⚠️ {endpoint_name} returned empty data")
+                    return data
             except asyncio.TimeoutError:
                 self.stats['timeouts'] += 1
                 self.logger.warning(f"⏰ {endpoint_name} timeout after {self.FAST_TIMEOUT}s")
-                continue
+                raise
             except Exception as e:
                 self.logger.warning(f"❌ {endpoint_name} error: {e}")
-                continue
+                raise
         
-        # If we get here, all endpoints failed
-        raise Exception("All endpoints failed to return valid data")
+        # Fallbacks are hedged: the next endpoint fires once the current one is slower
+        # than its learned latency percentile, and the first valid response wins
+        try:
+            endpoint_name, data = await self.endpoint_racer.race(endpoints_to_try, attempt)
+        except AllEndpointsFailed:
+            raise Exception("All endpoints failed to return valid data")
+        
+        self.stats['api_calls_made'] += 1
+        self.last_successful_fetch = time.time()
+        self.logger.info(f"✅ {endpoint_name} succeeded with {len(data)} pools")
+        return data
     
     async def _process_response_with_streaming(self, response) -> List[Dict[str, Any]]:
         """Process response with streaming to handle large datasets efficiently"""
         
-        data = await response.json()
-        
-        if not isinstance(data, list):
+        # Parse pairs straight off the socket and stop reading once we have enough SOL pairs
+        parser = JsonArrayStream()
+        try:
+            sol_items = await stream_response_array(
+                response,
+                predicate=lambda item: isinstance(item, dict) and self._is_sol_pair_optimized(item),
+                limit=self.MAX_POOLS_TO_ANALYZE,
+                stream=parser
+            )
+        except json.JSONDecodeError as e:
+            self.logger.warning(f"⚠️ Could not stream pairs payload: {e.msg}")
             return []
         
-        # Filter for SOL pairs with early termination for performance
         sol_pools = []
-        processed = 0
+        for item in sol_items:
+            converted = self._convert_to_standard_format_optimized(item)
+            if converted:
+                sol_pools.append(converted)
         
-        for item in data:
-            processed += 1
-            
-            if self._is_sol_pair_optimized(item):
-                converted = self._convert_to_standard_format_optimized(item)
-                if converted:
-                    sol_pools.append(converted)
-                
-                # Early termination when we have enough
-                if len(sol_pools) >= self.MAX_POOLS_TO_ANALYZE:
-                    self.logger.info(f"🌊 Found {len(sol_pools)} SOL pairs (processed {processed}/{len(data)})")
-                    break
+        if not parser.done:
+            self.logger.info(f"🌊 Found {len(sol_pools)} SOL pairs after {parser.elements_parsed} items "
+                             f"({parser.bytes_consumed / 1024:.0f} KB read, rest of payload skipped)")
         
-        self.logger.info(f"✅ Processed {processed} items, found {len(sol_pools)} SOL pairs")
+        self.logger.info(f"✅ Processed {parser.elements_parsed} items, found {len(sol_pools)} SOL pairs")
         return sol_pools
     
     def _is_sol_pair_optimized(self, item: Dict) -> bool:
@@ -478,5 +486,6 @@ class SolBondingCurveDetector:
             'high_load_mode': self.high_load_mode,
             'cache_file_exists': self.cache_file.exists(),
             'cache_age_minutes': (time.time() - self.cache_file.stat().st_mtime) / 60 if self.cache_file.exists() else None,
-            'memory_cache_valid': self._is_cache_valid()
+            'memory_cache_valid': self._is_cache_valid(),
+            'endpoint_hedging': self.endpoint_racer.get_stats()
         }
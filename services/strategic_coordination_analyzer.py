@@ -16,6 +16,8 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from services.analyzer_registry import memoized_analyzer
+
 class CoordinationType(Enum):
     SMART_ACCUMULATION = "smart_accumulation"      # Grade A: Follow these
     INSTITUTIONAL_BUILD = "institutional_build"    # Grade A: Follow these  
@@ -78,6 +80,10 @@ class StrategicCoordinationAnalyzer:
             'institutional_volume_threshold': 1000000,  # $1M+ volume = institutional scale
         }
 
+    # Timing factor depends on token age, so results expire well inside its smallest (2h) band
+    @memoized_analyzer('strategic_coordination',
+                       fields=('token_symbol', 'volume_24h', 'market_cap', 'unique_trader_count', 'creation_time', 'trader_list'),
+                       ttl_seconds=300)
     def analyze_coordination_patterns(self, token_data: Dict[str, Any]) -> CoordinationSignal:
         """
         Main analysis function that determines coordination type and opportunity grade.
@@ -7,6 +7,7 @@ import json
 
 from services.position_tracker import Position, PositionTracker, UserPreferences
 from services.telegram_alerter import TelegramAlerter
+from services.token_symbol_index import get_shared_token_symbol_index
 from api.birdeye_connector import BirdeyeAPI
 from scripts.cross_platform_token_analyzer import CrossPlatformAnalyzer
 
@@ -25,6 +26,9 @@ class TelegramBotHandler:
         # Initialize cross-platform analyzer for token validation
         self.cross_platform_analyzer = CrossPlatformAnalyzer(config, logger)
         
+        # Local symbol/name/address index filled by discovery metadata fetches
+        self.symbol_index = get_shared_token_symbol_index()
+        
         # Command handlers mapping
         self.command_handlers = {
             '/track': self._handle_track_command,
@@ -89,7 +93,7 @@ class TelegramBotHandler:
             # Resolve token address (handle both addresses and symbols)
             token_address, token_symbol, token_name = await self._resolve_token(token_input)
             if not token_address:
-                return f"❌ Could not find token: {token_input}\nPlease check the address or symbol."
+                return self._format_token_suggestions(token_input)
             
             # Check if position already exists
             existing_positions = self.position_tracker.get_user_positions(user_id, "active")
@@ -195,15 +199,16 @@ class TelegramBotHandler:
             
             total_pnl = 0.0
             total_positions_with_size = 0
+            refreshed_prices = {}
             
             for i, position in enumerate(active_positions, 1):
                 # Get current price
                 current_data = await self.birdeye_api.get_token_overview(position.token_address)
                 current_price = current_data.get('price', 0) if current_data else position.current_price
                 
-                # Update position price
+                # Update position price (saved for all positions at once below)
                 if current_price > 0:
-                    self.position_tracker.update_position_price(position.id, current_price)
+                    refreshed_prices[position.id] = current_price
                     position.current_price = current_price
                 
                 # Calculate metrics
@@ -235,6 +240,8 @@ class TelegramBotHandler:
                 response_parts.append("\n".join(position_parts))
                 response_parts.append("")
             
+            self.position_tracker.update_position_prices(refreshed_prices)
+            
             # Add portfolio summary if we have position sizes
             if total_positions_with_size > 0:
                 response_parts.extend([
@@ -664,6 +671,12 @@ class TelegramBotHandler:
     
     async def _resolve_token(self, token_input: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """Resolve token input to address, symbol, and name"""
+        # Addresses seen by discovery resolve locally without spending API calls. Symbols
+        # always go to the live search: copycats share them and indexed liquidity can be stale
+        entry = self.symbol_index.get(token_input.strip())
+        if entry:
+            return entry.address, entry.symbol, entry.name or entry.symbol
+        
         try:
             # If input looks like an address (long alphanumeric string)
             if len(token_input) > 32 and token_input.replace('_', '').replace('-', '').isalnum():
@@ -680,15 +693,31 @@ class TelegramBotHandler:
             search_results = await self.cross_platform_analyzer.search_token_by_symbol(token_input)
             
             if search_results:
+                self.symbol_index.record_tokens(search_results)
                 # Return the first matching result
                 token = search_results[0]
                 return token.get('address'), token.get('symbol'), token.get('name')
             
-            return None, None, None
-            
         except Exception as e:
             self.logger.warning(f"⚠️ Error resolving token {token_input}: {e}")
-            return None, None, None
+        
+        # Live search found nothing (or is rate limited): local matches are only suggested
+        return None, None, None
+    
+    def _format_token_suggestions(self, token_input: str) -> str:
+        """Not-found reply listing local index matches for the user to confirm by address"""
+        matches = self.symbol_index.search(token_input, limit=5)
+        if not matches:
+            return f"❌ Could not find token: {token_input}\nPlease check the address or symbol."
+        
+        response_parts = [f"❓ Could not confirm token: {token_input}", "", "Did you mean:"]
+        for entry in matches:
+            label = entry.symbol or 'UNKNOWN'
+            if entry.name and entry.name != entry.symbol:
+                label = f"{entry.name} ({label})"
+            response_parts.append(f"• {label}: `{entry.address}`")
+        response_parts.extend(["", "💡 Re-run /track with the token address to confirm."])
+        return "\n".join(response_parts)
     
     def create_track_position_button(self, token_address: str, token_symbol: str, 
                                    current_price: float) -> str:
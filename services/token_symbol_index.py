@@ -0,0 +1,240 @@
+"""
+Local token symbol/name/address index.
+
+Interactive bot commands used to resolve every ``/track`` argument with a live
+Birdeye overview or cross-platform symbol search. ``TokenSymbolIndex`` is
+filled from the token metadata discovery already fetches (overviews, batch
+metadata, token lists) and resolves addresses, symbols and names locally:
+exact lookups are dict hits, prefix matches bisect a sorted key list, and
+fuzzy matches compare only keys of similar length sharing the first character.
+"""
+
+import time
+import bisect
+import difflib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TokenEntry:
+    """Indexed token metadata"""
+    address: str
+    symbol: Optional[str]
+    name: Optional[str]
+    liquidity: float = 0.0
+    seen_at: float = 0.0
+
+
+class TokenSymbolIndex:
+    """Address, symbol and name lookup with prefix and fuzzy matching (thread-safe)"""
+
+    def __init__(self, max_tokens: int = 50000, fuzzy_cutoff: float = 0.75):
+        """
+        Args:
+            max_tokens: Tokens kept at most (least recently seen are evicted first)
+            fuzzy_cutoff: Minimum similarity ratio for fuzzy matches
+        """
+        self.max_tokens = max_tokens
+        self.fuzzy_cutoff = fuzzy_cutoff
+        # Least recently seen first
+        self._entries: "OrderedDict[str, TokenEntry]" = OrderedDict()
+        # Lowercased symbol or name -> addresses, plus the same keys sorted for prefix search
+        self._addresses_by_key: Dict[str, Set[str]] = {}
+        self._sorted_keys: List[str] = []
+        self._lock = threading.Lock()
+        self.stats = {
+            'recorded': 0,
+            'evicted': 0,
+            'exact_hits': 0,
+            'prefix_hits': 0,
+            'fuzzy_hits': 0,
+            'misses': 0
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, address: str) -> bool:
+        return address in self._entries
+
+    @staticmethod
+    def _keys(entry: TokenEntry) -> Set[str]:
+        return {value.strip().lower() for value in (entry.symbol, entry.name) if value and value.strip()}
+
+    def _add_key(self, key: str, address: str) -> None:
+        addresses = self._addresses_by_key.get(key)
+        if addresses is None:
+            self._addresses_by_key[key] = {address}
+            bisect.insort(self._sorted_keys, key)
+        else:
+            addresses.add(address)
+
+    def _remove_key(self, key: str, address: str) -> None:
+        addresses = self._addresses_by_key.get(key)
+        if addresses is None:
+            return
+        addresses.discard(address)
+        if not addresses:
+            del self._addresses_by_key[key]
+            position = bisect.bisect_left(self._sorted_keys, key)
+            if position < len(self._sorted_keys) and self._sorted_keys[position] == key:
+                del self._sorted_keys[position]
+
+    def record(self, address: str, symbol: Optional[str] = None, name: Optional[str] = None,
+               liquidity: Optional[float] = None, seen_at: Optional[float] = None) -> None:
+        """Add or refresh a token; missing fields keep their previously indexed values"""
+        if not address:
+            return
+        seen_at = seen_at if seen_at is not None else time.time()
+        with self._lock:
+            entry = self._entries.get(address)
+            if entry is None:
+                entry = TokenEntry(address, symbol, name, float(liquidity or 0), seen_at)
+                self._entries[address] = entry
+                old_keys: Set[str] = set()
+            else:
+                self._entries.move_to_end(address)
+                old_keys = self._keys(entry)
+                entry.symbol = symbol or entry.symbol
+                entry.name = name or entry.name
+                if liquidity is not None:
+                    entry.liquidity = float(liquidity or 0)
+                entry.seen_at = seen_at
+
+            new_keys = self._keys(entry)
+            for key in old_keys - new_keys:
+                self._remove_key(key, address)
+            for key in new_keys - old_keys:
+                self._add_key(key, address)
+            self.stats['recorded'] += 1
+
+            while len(self._entries) > self.max_tokens:
+                evicted_address, evicted = self._entries.popitem(last=False)
+                for key in self._keys(evicted):
+                    self._remove_key(key, evicted_address)
+                self.stats['evicted'] += 1
+
+    def record_tokens(self, tokens: Iterable[Dict[str, Any]]) -> int:
+        """
+        Index token metadata dicts as returned by Birdeye overviews and token lists.
+
+        Returns:
+            Number of tokens indexed
+        """
+        recorded = 0
+        for token in tokens:
+            if not isinstance(token, dict):
+                continue
+            address = token.get('address') or token.get('token_address')
+            symbol, name = token.get('symbol'), token.get('name')
+            if not address or not (symbol or name):
+                continue
+            liquidity = token.get('liquidity')
+            try:
+                liquidity = float(liquidity) if liquidity is not None else None
+            except (TypeError, ValueError):
+                liquidity = None
+            self.record(address, symbol if isinstance(symbol, str) else None,
+                        name if isinstance(name, str) else None, liquidity)
+            recorded += 1
+        return recorded
+
+    def get(self, address: str) -> Optional[TokenEntry]:
+        """Indexed metadata for an address"""
+        return self._entries.get(address)
+
+    def _ranked(self, addresses: Iterable[str]) -> List[TokenEntry]:
+        """Entries for addresses, most liquid (then most recently seen) first"""
+        entries = [self._entries[address] for address in addresses if address in self._entries]
+        return sorted(entries, key=lambda entry: (entry.liquidity, entry.seen_at), reverse=True)
+
+    def _prefix_keys(self, prefix: str, limit: int) -> List[str]:
+        start = bisect.bisect_left(self._sorted_keys, prefix)
+        keys = []
+        for key in self._sorted_keys[start:]:
+            if not key.startswith(prefix) or len(keys) >= limit:
+                break
+            keys.append(key)
+        return keys
+
+    def _fuzzy_keys(self, query: str, limit: int) -> List[str]:
+        # Typos rarely change the first character; comparing only that block keeps this cheap
+        first = query[0]
+        start = bisect.bisect_left(self._sorted_keys, first)
+        end = bisect.bisect_left(self._sorted_keys, chr(ord(first) + 1))
+        candidates = [key for key in self._sorted_keys[start:end] if abs(len(key) - len(query)) <= 2]
+        return difflib.get_close_matches(query, candidates, n=limit, cutoff=self.fuzzy_cutoff)
+
+    def search(self, query: str, limit: int = 5, fuzzy: bool = True) -> List[TokenEntry]:
+        """
+        Match a query against addresses, symbols and names.
+
+        Exact address/symbol/name matches come first, then prefix matches,
+        then (when ``fuzzy``) close spellings. Within each tier the most
+        liquid token wins.
+        """
+        query = (query or '').strip()
+        if not query:
+            return []
+        with self._lock:
+            if query in self._entries:
+                self.stats['exact_hits'] += 1
+                return [self._entries[query]]
+
+            key = query.lower()
+            matches = self._ranked(self._addresses_by_key.get(key, ()))
+            tier = 'exact_hits'
+            if len(matches) < limit:
+                prefix_addresses = set()
+                for prefix_key in self._prefix_keys(key, limit * 4):
+                    if prefix_key != key:
+                        prefix_addresses.update(self._addresses_by_key[prefix_key])
+                prefix_matches = self._ranked(prefix_addresses)
+                if prefix_matches and not matches:
+                    tier = 'prefix_hits'
+                matches.extend(entry for entry in prefix_matches if entry not in matches)
+            if not matches and fuzzy:
+                fuzzy_addresses = [address for fuzzy_key in self._fuzzy_keys(key, limit)
+                                   for address in self._addresses_by_key[fuzzy_key]]
+                matches = self._ranked(dict.fromkeys(fuzzy_addresses))
+                tier = 'fuzzy_hits'
+            self.stats[tier if matches else 'misses'] += 1
+            return matches[:limit]
+
+    def resolve(self, query: str) -> Optional[TokenEntry]:
+        """Exact address, symbol or name match (case-insensitive), most liquid first"""
+        query = (query or '').strip()
+        with self._lock:
+            entry = self._entries.get(query)
+            if entry is None:
+                ranked = self._ranked(self._addresses_by_key.get(query.lower(), ()))
+                entry = ranked[0] if ranked else None
+            self.stats['exact_hits' if entry else 'misses'] += 1
+            return entry
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics"""
+        return {
+            **self.stats,
+            'indexed_tokens': len(self._entries),
+            'indexed_keys': len(self._sorted_keys)
+        }
+
+
+_shared_index: Optional[TokenSymbolIndex] = None
+_shared_index_lock = threading.Lock()
+
+
+def get_shared_token_symbol_index() -> TokenSymbolIndex:
+    """Get the process-wide token symbol index"""
+    global _shared_index
+    with _shared_index_lock:
+        if _shared_index is None:
+            _shared_index = TokenSymbolIndex()
+    return _shared_index
@@ -27,6 +27,7 @@ from services.trader_performance_analyzer import (
     TraderTier,
     TraderProfile
 )
+from services.trader_profile_store import ProfileChange, TraderProfileStore
 from utils.structured_logger import get_structured_logger
 
 class TraderAlertType(Enum):
@@ -98,8 +99,8 @@ class TraderAlertSystem:
         
         # Active alerts and tracking
         self.active_alerts: List[TraderAlert] = []
-        self.trader_history: Dict[str, Dict] = {}  # Track trader performance history
-        self.last_alert_times: Dict[str, int] = {}  # Cooldown tracking
+        # Trader performance history, indexed by wallet and timeframe
+        self.profile_store = TraderProfileStore(self.tracker_state_path)
         
         # Optional Telegram integration
         self.telegram_alerter = None
@@ -109,6 +110,16 @@ class TraderAlertSystem:
         
         self.structured_logger = get_structured_logger('TraderWhaleAlerting')
     
+    @property
+    def trader_history(self) -> Dict[str, Dict]:
+        """Stored trader profiles keyed by ``{address}_{timeframe}``"""
+        return self.profile_store.profiles
+    
+    @property
+    def last_alert_times(self) -> Dict[str, int]:
+        """Cooldown tracking"""
+        return self.profile_store.last_alert_times
+    
     def setup_telegram_alerts(self, telegram_alerter, min_level: str = 'high'):
         """Setup Telegram integration for trader alerts"""
         self.telegram_alerter = telegram_alerter
@@ -133,6 +144,7 @@ class TraderAlertSystem:
             timeframes = [PerformanceTimeframe.HOUR_24, PerformanceTimeframe.DAYS_7]
         
         all_alerts = []
+        changed_addresses: Set[str] = set()
         
         for timeframe in timeframes:
             self.logger.info(f"🔍 Monitoring trader performance for {timeframe.value}")
@@ -141,51 +153,55 @@ class TraderAlertSystem:
                 # Discover current top traders
                 current_traders = await self.trader_analyzer.discover_top_traders(timeframe, 50)
                 
+                # Update trader history; only new or changed profiles need checking
+                changes = self._update_trader_history(current_traders, timeframe)
+                changed_addresses.update(change.trader.address for change in changes)
+                
                 # Generate alerts for discoveries and changes
-                alerts = await self._process_trader_discoveries(current_traders, timeframe)
+                alerts = await self._process_trader_discoveries(changes, timeframe)
                 all_alerts.extend(alerts)
                 
-                # Update trader history
-                self._update_trader_history(current_traders, timeframe)
-                
             except Exception as e:
                 self.logger.error(f"Error monitoring {timeframe.value} traders: {e}")
         
         # Check for cross-timeframe consistency
-        consistency_alerts = await self._check_cross_timeframe_consistency()
+        consistency_alerts = await self._check_cross_timeframe_consistency(changed_addresses)
         all_alerts.extend(consistency_alerts)
         
+        self._save_tracker_state()
+        
         # Process and handle all alerts
         for alert in all_alerts:
             await self._handle_alert(alert, scan_id=scan_id)
         
         return all_alerts
     
-    async def _process_trader_discoveries(self, current_traders: List[TraderProfile], 
+    async def _process_trader_discoveries(self, changes: List[ProfileChange], 
                                         timeframe: PerformanceTimeframe) -> List[TraderAlert]:
         """Process new trader discoveries and changes"""
         alerts = []
         
-        for trader in current_traders:
+        for change in changes:
+            trader, previous = change.trader, change.previous
             try:
                 # Check for new elite discoveries
                 if trader.tier == TraderTier.ELITE:
-                    alert = await self._check_new_elite_discovery(trader, timeframe)
+                    alert = await self._check_new_elite_discovery(trader, timeframe, previous)
                     if alert:
                         alerts.append(alert)
                 
                 # Check for tier changes
-                tier_alert = await self._check_tier_changes(trader, timeframe)
+                tier_alert = await self._check_tier_changes(trader, timeframe, previous)
                 if tier_alert:
                     alerts.append(tier_alert)
                 
                 # Check for performance spikes
-                spike_alert = await self._check_performance_spikes(trader, timeframe)
+                spike_alert = await self._check_performance_spikes(trader, timeframe, previous)
                 if spike_alert:
                     alerts.append(spike_alert)
                 
                 # Check for risk changes
-                risk_alert = await self._check_risk_changes(trader, timeframe)
+                risk_alert = await self._check_risk_changes(trader, timeframe, previous)
                 if risk_alert:
                     alerts.append(risk_alert)
                 
@@ -194,13 +210,11 @@ class TraderAlertSystem:
         
         return alerts
     
-    async def _check_new_elite_discovery(self, trader: TraderProfile, 
-                                       timeframe: PerformanceTimeframe) -> Optional[TraderAlert]:
+    async def _check_new_elite_discovery(self, trader: TraderProfile, timeframe: PerformanceTimeframe,
+                                       previous: Optional[Dict[str, Any]]) -> Optional[TraderAlert]:
         """Check for new elite trader discoveries"""
-        trader_key = f"{trader.address}_{timeframe.value}"
-        
         # Check if this is a new elite discovery
-        if trader_key not in self.trader_history:
+        if previous is None:
             if (trader.tier == TraderTier.ELITE and 
                 trader.discovery_score >= self.alert_config['min_elite_discovery_score']):
                 
@@ -230,13 +244,11 @@ class TraderAlertSystem:
         
         return None
     
-    async def _check_tier_changes(self, trader: TraderProfile, 
-                                timeframe: PerformanceTimeframe) -> Optional[TraderAlert]:
+    async def _check_tier_changes(self, trader: TraderProfile, timeframe: PerformanceTimeframe,
+                                previous: Optional[Dict[str, Any]]) -> Optional[TraderAlert]:
         """Check for trader tier upgrades/downgrades"""
-        trader_key = f"{trader.address}_{timeframe.value}"
-        
-        if trader_key in self.trader_history:
-            previous_tier = self.trader_history[trader_key].get('tier')
+        if previous is not None:
+            previous_tier = previous.get('tier')
             
             if previous_tier and previous_tier != trader.tier.value:
                 # Determine if upgrade or downgrade
@@ -297,13 +309,11 @@ class TraderAlertSystem:
         
         return None
     
-    async def _check_performance_spikes(self, trader: TraderProfile, 
-                                      timeframe: PerformanceTimeframe) -> Optional[TraderAlert]:
+    async def _check_performance_spikes(self, trader: TraderProfile, timeframe: PerformanceTimeframe,
+                                      previous: Optional[Dict[str, Any]]) -> Optional[TraderAlert]:
         """Check for significant performance improvements"""
-        trader_key = f"{trader.address}_{timeframe.value}"
-        
-        if trader_key in self.trader_history:
-            previous_score = self.trader_history[trader_key].get('discovery_score', 0)
+        if previous is not None:
+            previous_score = previous.get('discovery_score', 0)
             
             if previous_score > 0:
                 score_improvement = ((trader.discovery_score - previous_score) / previous_score) * 100
@@ -334,13 +344,11 @@ class TraderAlertSystem:
         
         return None
     
-    async def _check_risk_changes(self, trader: TraderProfile, 
-                                timeframe: PerformanceTimeframe) -> Optional[TraderAlert]:
+    async def _check_risk_changes(self, trader: TraderProfile, timeframe: PerformanceTimeframe,
+                                previous: Optional[Dict[str, Any]]) -> Optional[TraderAlert]:
         """Check for significant risk profile changes"""
-        trader_key = f"{trader.address}_{timeframe.value}"
-        
-        if trader_key in self.trader_history:
-            previous_risk = self.trader_history[trader_key].get('risk_score', 50)
+        if previous is not None:
+            previous_risk = previous.get('risk_score', 50)
             risk_change = abs(trader.risk_score - previous_risk)
             
             if risk_change >= self.alert_config['risk_change_threshold']:
@@ -373,25 +381,18 @@ class TraderAlertSystem:
         
         return None
     
-    async def _check_cross_timeframe_consistency(self) -> List[TraderAlert]:
-        """Check for traders who are consistent across multiple timeframes"""
+    async def _check_cross_timeframe_consistency(self, addresses: Set[str]) -> List[TraderAlert]:
+        """Check traders whose profiles changed this scan for consistency across 24h and 7d"""
         alerts = []
         
-        # Find traders who appear in both 24h and 7d top lists
-        traders_24h = {addr: data for addr, data in self.trader_history.items() if addr.endswith("_24h")}
-        traders_7d = {addr: data for addr, data in self.trader_history.items() if addr.endswith("_7d")}
-        
-        # Extract base addresses
-        addresses_24h = {addr.split("_")[0] for addr in traders_24h.keys()}
-        addresses_7d = {addr.split("_")[0] for addr in traders_7d.keys()}
-        
-        # Find consistent performers
-        consistent_addresses = addresses_24h.intersection(addresses_7d)
+        # Find consistent performers (changed traders that appear in both 24h and 7d top lists)
+        consistent_addresses = [address for address in addresses
+                                if {'24h', '7d'} <= self.profile_store.timeframes_for(address)]
         
         for address in consistent_addresses:
             try:
-                trader_24h = traders_24h.get(f"{address}_24h", {})
-                trader_7d = traders_7d.get(f"{address}_7d", {})
+                trader_24h = self.profile_store.get(address, '24h') or {}
+                trader_7d = self.profile_store.get(address, '7d') or {}
                 
                 # Check if both performances are strong
                 score_24h = trader_24h.get('discovery_score', 0)
@@ -450,21 +451,9 @@ class TraderAlertSystem:
         
         return hours_since_last >= self.alert_config['alert_cooldown_hours']
     
-    def _update_trader_history(self, traders: List[TraderProfile], timeframe: PerformanceTimeframe):
-        """Update trader performance history for comparison"""
-        for trader in traders:
-            trader_key = f"{trader.address}_{timeframe.value}"
-            
-            self.trader_history[trader_key] = {
-                'discovery_score': trader.discovery_score,
-                'risk_score': trader.risk_score,
-                'tier': trader.tier.value,
-                'last_updated': int(time.time()),
-                'timeframe': timeframe.value
-            }
-        
-        # Save updated history
-        self._save_tracker_state()
+    def _update_trader_history(self, traders: List[TraderProfile], timeframe: PerformanceTimeframe) -> List[ProfileChange]:
+        """Update trader performance history; returns the new or changed profiles"""
+        return self.profile_store.update(traders, timeframe)
     
     async def _handle_alert(self, alert: TraderAlert, scan_id: Optional[str] = None):
         self.structured_logger.info({
@@ -582,26 +571,14 @@ class TraderAlertSystem:
     def _load_tracker_state(self):
         """Load tracker state from disk"""
         try:
-            if self.tracker_state_path.exists():
-                with open(self.tracker_state_path, 'r') as f:
-                    state = json.load(f)
-                    self.trader_history = state.get('trader_history', {})
-                    self.last_alert_times = state.get('last_alert_times', {})
+            self.profile_store.load()
         except Exception as e:
             self.logger.warning(f"Error loading tracker state: {e}")
     
     def _save_tracker_state(self):
         """Save tracker state to disk"""
         try:
-            state = {
-                'trader_history': self.trader_history,
-                'last_alert_times': self.last_alert_times,
-                'last_updated': int(time.time())
-            }
-            
-            with open(self.tracker_state_path, 'w') as f:
-                json.dump(state, f, indent=2)
-                
+            self.profile_store.save()
         except Exception as e:
             self.logger.error(f"Error saving tracker state: {e}")
     
@@ -632,5 +609,5 @@ class TraderAlertSystem:
             'tracked_traders': len(self.trader_history),
             'alert_types_24h': alert_counts_by_type,
             'alert_levels_24h': alert_counts_by_level,
-            'last_monitoring_run': max(self.trader_history.values(), key=lambda x: x.get('last_updated', 0)).get('last_updated', 0) if self.trader_history else 0
+            'last_monitoring_run': self.profile_store.last_scan_time()
         } 
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""
+Keyed request fan-in for trader discovery.
+
+A discovery run builds trader profiles for several timeframes from the same
+wallets and the same top tokens. Each profile builder used to request its own
+wallet portfolio and token transactions one at a time, so a wallet seen in the
+24h and 7d scans was fetched twice and token transactions were fetched
+sequentially with sleeps in between. ``RequestFanIn`` collects the keys a run
+needs, drops duplicates, serves keys fetched within the TTL from memory, shares
+requests already in flight, and fetches the rest concurrently under a
+semaphore. Birdeye has no multi-wallet endpoint, so the "batch" is a bounded
+concurrent fan-out; the API client's own rate limiter still applies per call.
+"""
+
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+
+class RequestFanIn:
+    """Deduplicated, concurrency-limited fetches of keyed results with short-lived sharing"""
+
+    def __init__(self, fetch: Callable[[Hashable], Awaitable[Any]], name: str = "requests",
+                 max_concurrency: int = 5, ttl_seconds: float = 300, max_entries: int = 5000,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            fetch: Coroutine function fetching one key (None means no data)
+            name: Label used in logs and statistics
+            max_concurrency: Fetches in flight at once
+            ttl_seconds: How long fetched results are shared between callers
+            max_entries: Results kept at most (oldest are evicted first)
+        """
+        self.fetch = fetch
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.logger = logger or logging.getLogger(__name__)
+        # Created per event loop: the analyzer outlives the loops of one-off asyncio.run() scans
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Oldest first; failed (None) results are not kept so the next run retries them
+        self._results: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.stats = {
+            "requested": 0,
+            "duplicates": 0,
+            "hits": 0,
+            "shared_fetches": 0,
+            "fetches": 0,
+            "fetch_failures": 0
+        }
+
+    def _cached(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._results.get(key)
+        if entry is None:
+            return False, None
+        stored_at, result = entry
+        if time.time() - stored_at >= self.ttl_seconds:
+            del self._results[key]
+            return False, None
+        return True, result
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _fetch(self, key: Hashable) -> Any:
+        async with self._get_semaphore():
+            self.stats["fetches"] += 1
+            try:
+                result = await self.fetch(key)
+            except Exception as e:
+                self.logger.warning(f"Error fetching {self.name} for {str(key)[:8]}...: {e}")
+                result = None
+        if result is None:
+            self.stats["fetch_failures"] += 1
+            return None
+        self._results[key] = (time.time(), result)
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+        return result
+
+    def _start(self, key: Hashable) -> asyncio.Future:
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.stats["shared_fetches"] += 1
+            return task
+        task = asyncio.ensure_future(self._fetch(key))
+        self._in_flight[key] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return task
+
+    async def get(self, key: Hashable) -> Any:
+        """Result for one key, fetched at most once per TTL"""
+        results = await self.gather([key])
+        return results.get(key)
+
+    async def gather(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """
+        Results for many keys, fetching each missing key once.
+
+        Returns:
+            Dict mapping every distinct requested key to its result (None when unavailable)
+        """
+        results: Dict[Hashable, Any] = {}
+        pending: Dict[Hashable, asyncio.Future] = {}
+        for key in keys:
+            self.stats["requested"] += 1
+            if key in results or key in pending:
+                self.stats["duplicates"] += 1
+                continue
+            hit, result = self._cached(key)
+            if hit:
+                self.stats["hits"] += 1
+                results[key] = result
+            else:
+                pending[key] = self._start(key)
+
+        if pending:
+            # Shielded so one cancelled caller does not cancel the fetches shared with others
+            fetched = await asyncio.gather(*(asyncio.shield(task) for task in pending.values()))
+            results.update(zip(pending.keys(), fetched))
+        return results
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one shared result (all when None)"""
+        if key is None:
+            self._results.clear()
+        else:
+            self._results.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get fan-in statistics"""
+        served = self.stats["requested"] - self.stats["fetches"]
+        return {
+            **self.stats,
+            "cached_results": len(self._results),
+            "saved_requests": max(0, served),
+            "savings_rate": max(0, served) / self.stats["requested"] if self.stats["requested"] else 0.0
+        }
@@ -23,6 +23,7 @@ from enum import Enum
 from pathlib import Path
 from datetime import datetime, timedelta
 from utils.structured_logger import get_structured_logger
+from services.trader_data_fan_in import RequestFanIn
 
 class PerformanceTimeframe(Enum):
     HOUR_24 = "24h"
@@ -150,6 +151,17 @@ class TraderPerformanceAnalyzer:
         self._cache_expiry = {}
         self.cache_duration = 3600  # 1 hour cache
         
+        # Wallet portfolios and token transactions are fetched once per run and
+        # shared by every timeframe's profile builders
+        self.portfolio_fan_in = RequestFanIn(
+            lambda address: self._get_trader_portfolio(address), name="wallet_portfolio",
+            max_concurrency=5, ttl_seconds=300, logger=self.logger
+        )
+        self.token_transactions_fan_in = RequestFanIn(
+            lambda address: self._get_token_transactions(address), name="token_transactions",
+            max_concurrency=5, ttl_seconds=300, logger=self.logger
+        )
+        
         # API call tracking for rate limiting monitoring
         self.api_call_tracker = {
             'total_calls': 0,
@@ -225,7 +237,9 @@ class TraderPerformanceAnalyzer:
             'calls_last_minute': calls_last_minute,
             'session_duration_minutes': session_duration / 60,
             'average_calls_per_minute': self.api_call_tracker['total_calls'] / (session_duration / 60) if session_duration > 0 else 0,
-            'cache_hit_rate': len(self._trader_cache) / max(1, self.api_call_tracker['total_calls']) * 100
+            'cache_hit_rate': len(self._trader_cache) / max(1, self.api_call_tracker['total_calls']) * 100,
+            'portfolio_fan_in': self.portfolio_fan_in.get_stats(),
+            'token_transactions_fan_in': self.token_transactions_fan_in.get_stats()
         }
 
     async def discover_top_traders(self, timeframe: PerformanceTimeframe, max_traders: int = 50, scan_id: Optional[str] = None) -> List[TraderProfile]:
@@ -290,34 +304,47 @@ class TraderPerformanceAnalyzer:
         self.logger.info(f"🚀 BATCHED trader analysis: {len(trader_addresses)} traders")
         
         analyzed_traders = []
+        pending_addresses = []
         
-        # Check if we have access to batch manager
-        if hasattr(self, 'birdeye_api') and hasattr(self.birdeye_api, 'batch_manager'):
+        # Reuse profiles built earlier for this timeframe; each remaining wallet is fetched once
+        for trader_address in dict.fromkeys(trader_addresses):
+            cache_key = f"{trader_address}_{primary_timeframe.value}"
+            if self._is_cached(cache_key):
+                profile = self._trader_cache[cache_key]
+                if profile.discovery_score >= 60:
+                    analyzed_traders.append(profile)
+            else:
+                pending_addresses.append(trader_address)
+        
+        try:
+            portfolios = await self.portfolio_fan_in.gather(pending_addresses)
+        except Exception as e:
+            self.logger.error(f"Error in trader batch analysis, falling back to individual: {e}")
+            return analyzed_traders + await self._analyze_traders_individual(pending_addresses, primary_timeframe)
+        
+        # Process batched results efficiently
+        for trader_address in pending_addresses:
+            portfolio = portfolios.get(trader_address)
+            if not portfolio:
+                continue
+            trader_data = {
+                'portfolio': portfolio,
+                'total_value': portfolio.get('totalValueUsd', 0),
+                'token_count': len(portfolio.get('items', [])),
+                'fetch_timestamp': time.time()
+            }
             try:
-                # Use intelligent batching
-                batch_data = await self.birdeye_api.batch_manager.batch_trader_analysis(trader_addresses)
-                
-                # Process batched results efficiently
-                for trader_address, trader_data in batch_data.items():
-                    try:
-                        profile = await self._create_trader_profile_from_batch(
-                            trader_address, trader_data, primary_timeframe
-                        )
-                        if profile and profile.discovery_score >= 60:  # Quality threshold
-                            analyzed_traders.append(profile)
-                    except Exception as e:
-                        self.logger.warning(f"Error creating profile for {trader_address[:8]}...: {e}")
-                        continue
-                
-                self.logger.info(f"✅ BATCHED analysis completed: {len(analyzed_traders)} valid profiles")
-                
+                profile = await self._create_trader_profile_from_batch(
+                    trader_address, trader_data, primary_timeframe
+                )
+                if profile and profile.discovery_score >= 60:  # Quality threshold
+                    analyzed_traders.append(profile)
             except Exception as e:
-                self.logger.error(f"Error in trader batch analysis, falling back to individual: {e}")
-                # Fallback to individual analysis
-                analyzed_traders = await self._analyze_traders_individual(trader_addresses, primary_timeframe)
-        else:
-            # Fallback to individual analysis
-            analyzed_traders = await self._analyze_traders_individual(trader_addresses, primary_timeframe)
+                self.logger.warning(f"Error creating profile for {trader_address[:8]}...: {e}")
+                continue
+        
+        self.logger.info(f"✅ BATCHED analysis completed: {len(analyzed_traders)} valid profiles "
+                         f"({len(pending_addresses)} wallets fetched or shared)")
         
         return analyzed_traders
 
@@ -326,16 +353,14 @@ class TraderPerformanceAnalyzer:
         """Fallback method: Analyze traders individually (less efficient)"""
         analyzed_traders = []
         
-        # Analyze performance for each trader individually (old method)
-        for i, trader_address in enumerate(trader_addresses):
+        # Prefetch portfolios concurrently; the per-trader analysis below reads them from the fan-in
+        await self.portfolio_fan_in.gather(trader_addresses)
+        
+        for trader_address in trader_addresses:
             try:
                 profile = await self._analyze_trader_performance(trader_address, primary_timeframe)
                 if profile and profile.discovery_score >= 60:  # Minimum quality threshold
                     analyzed_traders.append(profile)
-                
-                # Rate limiting
-                if i % 10 == 0:
-                    await asyncio.sleep(1)
                     
             except Exception as e:
                 self.logger.warning(f"Error analyzing trader {trader_address[:8]}...: {e}")
@@ -607,43 +632,43 @@ class TraderPerformanceAnalyzer:
             
             trending_tokens = trending_response.get('data', {}).get('tokens', [])
             
-            # Get top traders for each trending token using transaction data
-            for token in trending_tokens[:10]:  # Focus on top 10 to avoid API limits
-                token_address = token.get('address')
-                if not token_address:
-                    continue
-                
-                try:
-                    # Use token transactions to find active traders
-                    transactions = await self._make_tracked_api_call(
-                        f"token_transactions_{token_address}",
-                        self.birdeye_api.get_token_transactions,
-                        token_address=token_address,
-                        limit=20  # Get recent transactions
-                    )
-                    
-                    if transactions:
-                        # Extract trader addresses from transaction data
-                        for tx in transactions:
-                            # Get wallet addresses from transaction
-                            if 'owner' in tx:
-                                trader_addresses.add(tx['owner'])
-                            elif 'user' in tx:
-                                trader_addresses.add(tx['user'])
-                            elif 'trader' in tx:
-                                trader_addresses.add(tx['trader'])
-                    
-                    await asyncio.sleep(0.5)  # Rate limiting
-                    
-                except Exception as e:
-                    self.logger.warning(f"Error getting traders for token {token_address}: {e}")
-                    continue
+            # Get top traders for each trending token using transaction data, fetching
+            # all tokens' transactions together (and once across timeframes)
+            token_addresses = [token.get('address') for token in trending_tokens[:10]  # Focus on top 10 to avoid API limits
+                               if token.get('address')]
+            transactions_by_token = await self.token_transactions_fan_in.gather(token_addresses)
+            
+            for token_address in token_addresses:
+                # Extract trader addresses from transaction data
+                for tx in transactions_by_token.get(token_address) or []:
+                    # Get wallet addresses from transaction
+                    if 'owner' in tx:
+                        trader_addresses.add(tx['owner'])
+                    elif 'user' in tx:
+                        trader_addresses.add(tx['user'])
+                    elif 'trader' in tx:
+                        trader_addresses.add(tx['trader'])
         
         except Exception as e:
             self.logger.warning(f"Error getting traders from top tokens: {e}")
         
         return trader_addresses
 
+    async def _get_token_transactions(self, token_address: str) -> Optional[List[Dict[str, Any]]]:
+        """Get a token's recent transactions (used to find active traders)"""
+        try:
+            # Use token transactions to find active traders
+            transactions = await self._make_tracked_api_call(
+                f"token_transactions_{token_address}",
+                self.birdeye_api.get_token_transactions,
+                token_address=token_address,
+                limit=20  # Get recent transactions
+            )
+        except Exception as e:
+            self.logger.warning(f"Error getting traders for token {token_address}: {e}")
+            return None
+        return transactions or None
+
     async def _get_active_high_volume_traders(self, timeframe: PerformanceTimeframe) -> Set[str]:
         """Get active high-volume traders (placeholder for additional discovery methods)"""
         # This could be enhanced with additional Birdeye endpoints
@@ -661,7 +686,7 @@ class TraderPerformanceAnalyzer:
         
         try:
             # Get wallet portfolio and transaction history
-            portfolio_data = await self._get_trader_portfolio(trader_address)
+            portfolio_data = await self.portfolio_fan_in.get(trader_address)
             if not portfolio_data:
                 return None
             
@@ -990,7 +1015,7 @@ class TraderPerformanceAnalyzer:
             # Analyze for both timeframes
             perf_24h = await self._calculate_performance(trader_address, PerformanceTimeframe.HOUR_24)
             perf_7d = await self._calculate_performance(trader_address, PerformanceTimeframe.DAYS_7)
-            portfolio = await self._get_trader_portfolio(trader_address)
+            portfolio = await self.portfolio_fan_in.get(trader_address)
             
             # Create summary
             summary = {
@@ -0,0 +1,136 @@
+"""
+Persistent trader profile store with change events.
+
+The trader alert system used to keep every tracked trader's last tier and
+scores in one dict, re-check all of them after each scan and rewrite the whole
+state file. ``TraderProfileStore`` keeps those profiles indexed by wallet and
+timeframe, persists only changed profiles through an append-only journal
+(``AppendOnlyHistoryStore``, same snapshot format as the old state file), and
+returns a ``ProfileChange`` for each trader that is new or whose tier, discovery
+score or risk score moved, so alert checks run only over what changed.
+"""
+
+import time
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from core_local.history_store import AppendOnlyHistoryStore
+from services.trader_performance_analyzer import PerformanceTimeframe, TraderProfile
+
+logger = logging.getLogger(__name__)
+
+# Profile fields whose change produces a change event
+TRACKED_FIELDS = ('tier', 'discovery_score', 'risk_score')
+
+
+@dataclass
+class ProfileChange:
+    """A trader profile that is new or changed in one timeframe during a scan"""
+    trader: TraderProfile
+    timeframe: str
+    previous: Optional[Dict[str, Any]]  # Stored profile before this scan (None for a new trader)
+    current: Dict[str, Any]
+
+    @property
+    def is_new(self) -> bool:
+        return self.previous is None
+
+
+class TraderProfileStore:
+    """Trader profiles keyed by ``{address}_{timeframe}``, indexed by wallet and timeframe"""
+
+    def __init__(self, state_path: Path, compact_after: int = 1000):
+        """
+        Args:
+            state_path: JSON snapshot path (journal is kept alongside it)
+            compact_after: Journal records to accumulate before compacting
+        """
+        self.history_store = AppendOnlyHistoryStore(Path(state_path), 'trader_history', compact_after=compact_after)
+        self.state: Dict[str, Any] = {'trader_history': {}, 'last_alert_times': {}}
+        self._timeframes_by_address: Dict[str, Set[str]] = {}
+        self._addresses_by_timeframe: Dict[str, Set[str]] = {}
+
+    @property
+    def profiles(self) -> Dict[str, Dict[str, Any]]:
+        return self.state['trader_history']
+
+    @property
+    def last_alert_times(self) -> Dict[str, int]:
+        return self.state['last_alert_times']
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    @staticmethod
+    def _key(address: str, timeframe: str) -> str:
+        return f"{address}_{timeframe}"
+
+    def _index(self, key: str, profile: Dict[str, Any]) -> None:
+        address, _, timeframe = key.rpartition('_')
+        timeframe = profile.get('timeframe', timeframe)
+        self._timeframes_by_address.setdefault(address, set()).add(timeframe)
+        self._addresses_by_timeframe.setdefault(timeframe, set()).add(address)
+
+    def load(self) -> None:
+        """Load the snapshot and journal (raises on a corrupted snapshot)"""
+        state = self.history_store.load()
+        if not isinstance(state.get('last_alert_times'), dict):
+            state['last_alert_times'] = {}
+        self.state = state
+        self._timeframes_by_address.clear()
+        self._addresses_by_timeframe.clear()
+        for key, profile in self.profiles.items():
+            self._index(key, profile)
+
+    def save(self) -> None:
+        """Persist profiles changed since the last save (raises on I/O errors)"""
+        self.state['last_updated'] = int(time.time())
+        self.history_store.save(self.state)
+
+    def get(self, address: str, timeframe: str) -> Optional[Dict[str, Any]]:
+        return self.profiles.get(self._key(address, timeframe))
+
+    def timeframes_for(self, address: str) -> Set[str]:
+        """Timeframes the wallet has a stored profile in"""
+        return self._timeframes_by_address.get(address, set())
+
+    def addresses_in(self, timeframe: str) -> Set[str]:
+        """Wallets with a stored profile in a timeframe"""
+        return self._addresses_by_timeframe.get(timeframe, set())
+
+    def update(self, traders: List[TraderProfile], timeframe: PerformanceTimeframe,
+               now: Optional[int] = None) -> List[ProfileChange]:
+        """
+        Record a scan's traders and return the new or changed ones.
+
+        Unchanged traders are neither rewritten nor returned.
+        """
+        now = int(now if now is not None else time.time())
+        changes = []
+        for trader in traders:
+            key = self._key(trader.address, timeframe.value)
+            current = {
+                'discovery_score': trader.discovery_score,
+                'risk_score': trader.risk_score,
+                'tier': trader.tier.value,
+                'last_updated': now,
+                'timeframe': timeframe.value
+            }
+            previous = self.profiles.get(key)
+            if previous is not None and all(previous.get(field) == current[field] for field in TRACKED_FIELDS):
+                continue
+            self.profiles[key] = current
+            self.history_store.mark_dirty(key)
+            self._index(key, current)
+            changes.append(ProfileChange(trader, timeframe.value, previous, current))
+        self.state.setdefault('last_scan_times', {})[timeframe.value] = now
+        return changes
+
+    def last_scan_time(self) -> int:
+        """Time of the most recent recorded scan"""
+        scan_times = self.state.get('last_scan_times') or {}
+        if scan_times:
+            return max(scan_times.values())
+        return max((profile.get('last_updated', 0) for profile in self.profiles.values()), default=0)
@@ -15,6 +15,7 @@ from datetime import datetime, timedelta
 from api.birdeye_connector import BirdeyeAPI
 from core.cache_manager import CacheManager
 from utils.structured_logger import get_structured_logger
+from services.analyzer_registry import memoized_analyzer
 
 
 class TrendingTokenMonitor:
@@ -39,7 +40,6 @@ class TrendingTokenMonitor:
         
         # Cache settings
         self.trending_cache_ttl = 300  # 5 minutes cache for trending data
-        self.momentum_cache_ttl = 600  # 10 minutes cache for momentum analysis
         
         # Trending analysis settings
         self.trending_thresholds = {
@@ -177,6 +177,9 @@ class TrendingTokenMonitor:
             self.logger.error(f"Error in trending quality check: {e}")
             return False
     
+    # Memoized on exactly the fields the momentum helpers read, so a changed token is never served stale metrics
+    @memoized_analyzer('trending_momentum', fields=('address', 'priceChange24h', 'volume24h', 'volumeChange24h',
+                                                    'liquidity', 'liquidityChange24h', 'trade24h', 'tradeChange24h'))
     async def _calculate_momentum_metrics(self, token: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calculate momentum metrics for trending token.
@@ -192,13 +195,6 @@ class TrendingTokenMonitor:
             if not token_address:
                 return {}
             
-            # Get historical data for momentum calculation
-            cache_key = f"momentum_{token_address}"
-            cached_momentum = self.cache_manager.get(cache_key)
-            
-            if cached_momentum:
-                return cached_momentum
-            
             # Calculate momentum metrics
             momentum_metrics = {
                 "price_momentum_24h": self._calculate_price_momentum(token),
@@ -211,9 +207,6 @@ class TrendingTokenMonitor:
             # Calculate overall momentum score
             momentum_metrics["overall_momentum_score"] = self._calculate_overall_momentum_score(momentum_metrics)
             
-            # Cache momentum data
-            self.cache_manager.set(cache_key, momentum_metrics, ttl=self.momentum_cache_ttl)
-            
             return momentum_metrics
             
         except Exception as e:
@@ -23,6 +23,8 @@ from enum import Enum
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+from services.analyzer_registry import memoized_analyzer
+
 class VLRCategory(Enum):
     """VLR optimization categories"""
     GEM_DISCOVERY = "🔍 Gem Discovery"      # VLR 0.5-2.0
@@ -289,6 +291,7 @@ class VLRIntelligence:
         
         return warnings
     
+    @memoized_analyzer('vlr_intelligence', fields=('address', 'symbol', 'volume_24h', 'liquidity', 'market_cap'))
     def analyze_token_vlr(self, token_data: Dict[str, Any]) -> VLRAnalysis:
         """Perform comprehensive VLR analysis on a token"""
         # Extract data
@@ -0,0 +1,247 @@
+"""
+Persistent wallet-token graph for whale discovery.
+
+Each edge links a wallet to a token it was seen trading (as one of the
+token's top traders) together with the volume and trade count observed.
+Whale discovery updates the graph one token at a time and gets back the
+wallets whose edges actually changed, so only those need re-qualifying.
+A refresh replaces the token's edges, and edges not refreshed within the
+discovery window expire, so a wallet's edges describe recent trading only.
+
+The graph is persisted with ``AppendOnlyHistoryStore``: a session appends
+the changed wallets to a journal instead of rewriting the whole file.
+"""
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from core_local.history_store import AppendOnlyHistoryStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GRAPH_FILE = Path("data/whale_discovery/wallet_token_graph.json")
+
+
+class WalletTokenGraph:
+    """Wallet -> token edges with incremental, journaled persistence"""
+
+    def __init__(self, graph_file: Optional[Path] = None, compact_after: int = 5000,
+                 max_change_log: int = 50000):
+        """
+        Initialize the graph.
+
+        Args:
+            graph_file: Snapshot file (a ``.journal.jsonl`` file is kept beside it)
+            compact_after: Journal records to accumulate before compacting
+            max_change_log: Wallets to keep in the change log before dropping the oldest
+        """
+        self.graph_file = Path(graph_file or DEFAULT_GRAPH_FILE)
+        self.graph_file.parent.mkdir(parents=True, exist_ok=True)
+        self.store = AppendOnlyHistoryStore(self.graph_file, "wallets", compact_after=compact_after)
+        self.history: Dict[str, Any] = {"wallets": {}, "token_refreshed_at": {}}
+        # In-memory change log so several consumers can each ask what changed since they last looked:
+        # wallet -> revision of its latest change, oldest first, bounded by max_change_log
+        self.revision = 0
+        self.max_change_log = max_change_log
+        self._change_log: "OrderedDict[str, int]" = OrderedDict()
+        # Changes up to this revision may have been dropped from the log
+        self._change_log_floor = 0
+        # Token -> wallets with an edge to it, so a refresh can drop wallets that left the top list
+        self._token_wallets: Dict[str, Set[str]] = {}
+
+    @property
+    def wallets(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        return self.history["wallets"]
+
+    def load(self) -> int:
+        """
+        Load the graph from disk.
+
+        Returns:
+            Number of wallets loaded (0 when starting fresh or the snapshot is unreadable)
+        """
+        try:
+            history = self.store.load()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load wallet graph {self.graph_file}, starting empty: {e}")
+            return 0
+        history.setdefault("token_refreshed_at", {})
+        self.history = history
+        self._token_wallets = {}
+        for wallet, edges in self.wallets.items():
+            for token in edges:
+                self._token_wallets.setdefault(token, set()).add(wallet)
+        # Everything loaded counts as changed for consumers that have not seen it yet
+        self.revision += 1
+        self._log_changes(self.wallets)
+        return len(self.wallets)
+
+    def update_token_traders(self, token_address: str, traders: List[Dict[str, Any]],
+                             now: Optional[float] = None) -> Set[str]:
+        """
+        Replace a token's edges with its current top traders.
+
+        Only call this with a successful fetch: wallets missing from
+        ``traders`` lose their edge to the token.
+
+        Args:
+            token_address: Token the traders were fetched for
+            traders: Normalized traders (``address``, ``volume``, ``trades``)
+            now: Update timestamp (defaults to the current time)
+
+        Returns:
+            Wallets whose edge to this token was added, changed or removed
+        """
+        now = now if now is not None else time.time()
+        self.revision += 1
+        changed: Set[str] = set()
+        current: Set[str] = set()
+        for trader in traders:
+            wallet = trader.get("address")
+            if not wallet:
+                continue
+            current.add(wallet)
+            volume = float(trader.get("volume", 0) or 0)
+            trades = int(trader.get("trades", 0) or 0)
+
+            edges = self.wallets.setdefault(wallet, {})
+            edge = edges.get(token_address)
+            if edge is None or edge["volume"] != volume or edge["trades"] != trades:
+                changed.add(wallet)
+            # Unchanged edges are still re-stamped so they do not expire while the wallet stays on top
+            edges[token_address] = {"volume": volume, "trades": trades, "updated": now}
+            self.store.mark_dirty(wallet)
+
+        for wallet in self._token_wallets.get(token_address, set()) - current:
+            self._remove_edge(wallet, token_address)
+            changed.add(wallet)
+        self._token_wallets[token_address] = current
+
+        self._log_changes(changed)
+        self.history["token_refreshed_at"][token_address] = now
+        return changed
+
+    def expire(self, max_age_seconds: float, now: Optional[float] = None) -> Set[str]:
+        """
+        Drop edges and token refresh stamps older than ``max_age_seconds``.
+
+        Returns:
+            Wallets that lost an edge
+        """
+        now = now if now is not None else time.time()
+        cutoff = now - max_age_seconds
+        self.revision += 1
+        changed: Set[str] = set()
+        for wallet, edges in list(self.wallets.items()):
+            for token, edge in list(edges.items()):
+                if edge["updated"] < cutoff:
+                    self._remove_edge(wallet, token)
+                    wallets = self._token_wallets.get(token)
+                    if wallets is not None:
+                        wallets.discard(wallet)
+                    changed.add(wallet)
+
+        refreshed_at = self.history["token_refreshed_at"]
+        for token in [token for token, stamp in refreshed_at.items() if stamp < cutoff]:
+            del refreshed_at[token]
+            if not self._token_wallets.get(token):
+                self._token_wallets.pop(token, None)
+
+        self._log_changes(changed)
+        return changed
+
+    def _log_changes(self, wallets: Iterable[str]) -> None:
+        """Record wallets as changed at the current revision, dropping the oldest entries past the cap"""
+        for wallet in wallets:
+            self._change_log[wallet] = self.revision
+            self._change_log.move_to_end(wallet)
+        while len(self._change_log) > self.max_change_log:
+            _, dropped_revision = self._change_log.popitem(last=False)
+            self._change_log_floor = max(self._change_log_floor, dropped_revision)
+
+    def _remove_edge(self, wallet: str, token_address: str) -> None:
+        """Remove one edge, forgetting the wallet once it has none left"""
+        edges = self.wallets.get(wallet)
+        if edges is None:
+            return
+        edges.pop(token_address, None)
+        if edges:
+            self.store.mark_dirty(wallet)
+        else:
+            del self.wallets[wallet]
+            self.store.mark_deleted(wallet)
+
+    def changed_since(self, revision: int) -> Set[str]:
+        """
+        Wallets whose edges changed after ``revision`` (0 returns every wallet seen).
+
+        A revision older than the trimmed part of the change log gets every
+        wallet still in the graph, since its changes can no longer be told apart.
+        """
+        if revision < self._change_log_floor:
+            return set(self.wallets) | set(self._change_log)
+        changed: Set[str] = set()
+        for wallet, changed_at in reversed(self._change_log.items()):
+            if changed_at <= revision:
+                break
+            changed.add(wallet)
+        return changed
+
+    def token_is_fresh(self, token_address: str, max_age_seconds: float) -> bool:
+        """Whether the token's traders were merged within ``max_age_seconds``"""
+        refreshed_at = self.history["token_refreshed_at"].get(token_address)
+        return refreshed_at is not None and time.time() - refreshed_at < max_age_seconds
+
+    def trading_data(self, wallet: str, max_age_seconds: Optional[float] = None) -> List[Dict[str, Any]]:
+        """A wallet's edges as per-token trading records (only those updated within ``max_age_seconds``)"""
+        cutoff = time.time() - max_age_seconds if max_age_seconds is not None else None
+        return [
+            {"token": token, "volume": edge["volume"], "trades": edge["trades"], "updated": edge["updated"]}
+            for token, edge in self.wallets.get(wallet, {}).items()
+            if cutoff is None or edge["updated"] >= cutoff
+        ]
+
+    def save(self) -> None:
+        """Persist changes since the last save"""
+        self.store.save(self.history)
+
+    async def save_async(self) -> None:
+        """Persist changes without blocking the event loop"""
+        await self.store.save_async(self.history)
+
+    def __len__(self) -> int:
+        return len(self.wallets)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get graph statistics"""
+        return {
+            "wallets": len(self.wallets),
+            "edges": sum(len(edges) for edges in self.wallets.values()),
+            "tokens_tracked": len(self.history["token_refreshed_at"]),
+            "store": self.store.get_stats()
+        }
+
+
+_shared_graphs: Dict[Path, WalletTokenGraph] = {}
+_shared_graphs_lock = threading.Lock()
+
+
+def get_shared_wallet_graph(graph_file: Optional[Path] = None) -> WalletTokenGraph:
+    """
+    Get the process-wide graph for a file, loading it on first use.
+
+    Services that discover whales share one graph per file, so they never
+    append to (or compact) the same journal from divergent copies.
+    """
+    path = Path(graph_file or DEFAULT_GRAPH_FILE).resolve()
+    with _shared_graphs_lock:
+        graph = _shared_graphs.get(path)
+        if graph is None:
+            graph = WalletTokenGraph(path)
+            graph.load()
+            _shared_graphs[path] = graph
+    return graph
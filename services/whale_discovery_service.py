@@ -6,13 +6,15 @@ Dynamically discovers and qualifies whale addresses based on trading patterns
 import asyncio
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 from collections import defaultdict, Counter
 
 from utils.logger_setup import LoggerSetup
+from services.wallet_token_graph import WalletTokenGraph, get_shared_wallet_graph
 
 
 class WhaleQualificationLevel(Enum):
@@ -108,7 +110,13 @@ class WhaleDiscoveryService:
     based on trading patterns across multiple tokens
     """
     
-    def __init__(self, birdeye_api, logger=None, config=None):
+    QUALIFIED_LEVELS = (
+        WhaleQualificationLevel.QUALIFIED,
+        WhaleQualificationLevel.VERIFIED,
+        WhaleQualificationLevel.ELITE
+    )
+
+    def __init__(self, birdeye_api, logger=None, config=None, wallet_graph: Optional[WalletTokenGraph] = None):
         self.birdeye_api = birdeye_api
         self.logger = logger or LoggerSetup("WhaleDiscoveryService").logger
         self.config = config or self._get_default_config()
@@ -118,13 +126,27 @@ class WhaleDiscoveryService:
         self.qualified_whales: Dict[str, WhaleMetrics] = {}
         self.discovery_sessions: List[DiscoverySession] = []
         
+        # Qualified whales in the analyzer's whale-database format, maintained
+        # incrementally and exposed read-only via get_whale_database_for_analyzer()
+        self._analyzer_whales: Dict[str, Dict[str, Any]] = {}
+        
         # Cache for performance
         self.trader_cache: Dict[str, List] = {}
         self.cache_ttl = 3600  # 1 hour
         self.last_cache_cleanup = time.time()
         
+        # Persistent wallet -> token graph; only wallets whose edges change are re-qualified
+        self.wallet_graph = (wallet_graph if wallet_graph is not None
+                             else get_shared_wallet_graph(self.config["discovery_scope"].get("graph_file")))
+        # Edges older than this no longer count towards a wallet's volume or token diversity
+        self.edge_max_age = self.config["discovery_scope"].get("edge_max_age_hours", 24) * 3600
+        # Graph revision this service last qualified; 0 means wallets loaded from
+        # disk (or merged by another service) get qualified on the first session
+        self._graph_revision = 0
+        
         self.logger.info("🔍 WhaleDiscoveryService initialized")
         self.logger.info(f"   📊 Discovery thresholds: {self.config['qualification_thresholds']}")
+        self.logger.info(f"   🕸️ Wallet graph: {len(self.wallet_graph)} wallets")
     
     def _get_default_config(self) -> Dict:
         """Get default configuration for whale discovery"""
@@ -147,6 +169,9 @@ class WhaleDiscoveryService:
                 "max_tokens_per_session": 20,   # Analyze top 20 tokens
                 "max_traders_per_token": 50,    # Top 50 traders per token
                 "discovery_frequency_hours": 6, # Run discovery every 6 hours
+                "max_concurrent_fetches": 5,    # Parallel top-trader requests
+                "graph_file": "data/whale_discovery/wallet_token_graph.json",
+                "edge_max_age_hours": 24,       # Wallet-token edges count for 24h after their last refresh
             },
             "tier_assignment": {
                 "tier_1_min_volume": 5000000,   # $5M+ for tier 1
@@ -175,52 +200,29 @@ class WhaleDiscoveryService:
             
             self.logger.info(f"📊 Analyzing {len(trending_tokens)} trending tokens for whale discovery")
             
-            # Analyze traders across all tokens
-            all_traders = {}
-            for token_address in trending_tokens:
-                try:
-                    traders = await self._get_top_traders_for_token(token_address)
-                    session.api_calls_used += 1
-                    
-                    for trader in traders:
-                        trader_address = trader.get('address', '')
-                        if trader_address:
-                            if trader_address not in all_traders:
-                                all_traders[trader_address] = []
-                            all_traders[trader_address].append({
-                                'token': token_address,
-                                'volume': trader.get('volume', 0),
-                                'trades': trader.get('trades', 0),
-                                'timestamp': datetime.now()
-                            })
-                    
-                except Exception as e:
-                    self.logger.warning(f"Error analyzing token {token_address}: {e}")
-                    continue
+            # Replace each refreshed token's edges, then age out edges nobody refreshed
+            traders_by_token = await self._fetch_top_traders(trending_tokens, session)
+            for token_address, traders in traders_by_token.items():
+                self.wallet_graph.update_token_traders(token_address, traders)
+            self.wallet_graph.expire(self.edge_max_age)
             
-            # Process trader data to identify whale candidates
-            candidates_found = 0
-            for trader_address, trading_data in all_traders.items():
-                candidate = await self._analyze_trader_for_whale_qualification(
-                    trader_address, trading_data
-                )
-                
-                if candidate and candidate.qualification_level != WhaleQualificationLevel.UNQUALIFIED:
-                    self.candidates[trader_address] = candidate
-                    candidates_found += 1
-            
-            session.candidates_found = candidates_found
+            # Re-qualify only wallets whose edges changed since our last session
+            changed_wallets = self.wallet_graph.changed_since(self._graph_revision)
+            self._graph_revision = self.wallet_graph.revision
+            session.candidates_found, session.whales_qualified = await self._requalify_wallets(changed_wallets)
             
-            # Qualify candidates as whales
-            whales_qualified = await self._qualify_whale_candidates()
-            session.whales_qualified = whales_qualified
+            try:
+                await self.wallet_graph.save_async()
+            except OSError as e:
+                self.logger.warning(f"Could not persist wallet graph: {e}")
             
             session.end_time = datetime.now()
             session.processing_time_ms = int((session.end_time - session.start_time).total_seconds() * 1000)
             session.success = True
             
             self.logger.info(f"✅ Discovery session completed: {session_id}")
-            self.logger.info(f"   📊 Tokens analyzed: {session.tokens_analyzed}")
+            self.logger.info(f"   📊 Tokens analyzed: {session.tokens_analyzed} ({session.api_calls_used} fetched)")
+            self.logger.info(f"   🔄 Wallets re-qualified: {len(changed_wallets)} of {len(self.wallet_graph)}")
             self.logger.info(f"   🎯 Candidates found: {session.candidates_found}")
             self.logger.info(f"   🐋 Whales qualified: {session.whales_qualified}")
             self.logger.info(f"   ⏱️ Processing time: {session.processing_time_ms}ms")
@@ -272,6 +274,41 @@ class WhaleDiscoveryService:
             self.logger.error(f"Error getting trending tokens: {e}")
             return []
     
+    async def _fetch_top_traders(self, token_addresses: List[str], session: DiscoverySession) -> Dict[str, List[Dict]]:
+        """
+        Fetch top traders for tokens whose graph edges are stale, concurrently.
+        
+        Tokens merged into the graph within the cache TTL (including by an
+        earlier process) are skipped, and tokens whose fetch failed or came
+        back empty are left out so their edges and refresh time stay as they were.
+        """
+        stale = [
+            token_address for token_address in dict.fromkeys(token_addresses)
+            if not self.wallet_graph.token_is_fresh(token_address, self.cache_ttl)
+        ]
+        if not stale:
+            return {}
+        
+        semaphore = asyncio.Semaphore(self.config["discovery_scope"].get("max_concurrent_fetches", 5))
+        
+        async def fetch(token_address: str) -> List[Dict]:
+            async with semaphore:
+                return await self._get_top_traders_for_token(token_address)
+        
+        results = await asyncio.gather(*(fetch(token_address) for token_address in stale), return_exceptions=True)
+        session.api_calls_used += len(stale)
+        
+        traders_by_token = {}
+        for token_address, result in zip(stale, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Error analyzing token {token_address}: {result}")
+                continue
+            # The API answers failures with an empty list too, so empty means "no data", not "no traders"
+            if not result:
+                continue
+            traders_by_token[token_address] = result
+        return traders_by_token
+    
     async def _get_top_traders_for_token(self, token_address: str) -> List[Dict]:
         """Get top traders for a specific token"""
         try:
@@ -290,12 +327,21 @@ class WhaleDiscoveryService:
                 limit=max_traders
             )
             
-            traders = []
-            if traders_data and 'items' in traders_data:
-                traders = traders_data['items']
+            if isinstance(traders_data, dict):
+                traders_data = traders_data.get('items', [])
+            traders = [
+                {
+                    'address': trader.get('address') or trader.get('owner', ''),
+                    'volume': trader.get('volume', 0),
+                    'trades': trader.get('trades', trader.get('trade', 0))
+                }
+                for trader in traders_data or []
+                if isinstance(trader, dict)
+            ]
             
-            # Cache the result
-            self.trader_cache[cache_key] = (traders, time.time())
+            # Cache the result (empty answers are usually failures, so retry them next time)
+            if traders:
+                self.trader_cache[cache_key] = (traders, time.time())
             
             return traders
             
@@ -472,17 +518,49 @@ class WhaleDiscoveryService:
         
         return min(1.0, score)
     
-    async def _qualify_whale_candidates(self) -> int:
-        """Convert qualified candidates to whale metrics"""
+    async def _requalify_wallets(self, wallets: Iterable[str]) -> Tuple[int, int]:
+        """
+        Re-run qualification for wallets from their graph edges.
+        
+        Returns:
+            (candidates found, whales qualified) among the given wallets
+        """
+        candidates_found = 0
+        qualified: List[str] = []
+        for trader_address in wallets:
+            candidate = await self._analyze_trader_for_whale_qualification(
+                trader_address, self.wallet_graph.trading_data(trader_address, self.edge_max_age)
+            )
+            
+            if candidate and candidate.qualification_level != WhaleQualificationLevel.UNQUALIFIED:
+                self.candidates[trader_address] = candidate
+                candidates_found += 1
+                qualified.append(trader_address)
+            else:
+                self._drop_whale(trader_address)
+        
+        whales_qualified = await self._qualify_whale_candidates(qualified)
+        return candidates_found, whales_qualified
+    
+    def _drop_whale(self, address: str) -> None:
+        """Forget a wallet that no longer qualifies"""
+        self.candidates.pop(address, None)
+        self.qualified_whales.pop(address, None)
+        self._analyzer_whales.pop(address, None)
+    
+    async def _qualify_whale_candidates(self, addresses: Optional[Iterable[str]] = None) -> int:
+        """Convert qualified candidates to whale metrics (all candidates, or just ``addresses``)"""
         qualified_count = 0
         
-        for address, candidate in self.candidates.items():
-            if candidate.qualification_level in [
-                WhaleQualificationLevel.QUALIFIED,
-                WhaleQualificationLevel.VERIFIED,
-                WhaleQualificationLevel.ELITE
-            ]:
+        if addresses is None:
+            addresses = list(self.candidates)
+        for address in addresses:
+            candidate = self.candidates.get(address)
+            if candidate is None:
+                continue
+            if candidate.qualification_level in self.QUALIFIED_LEVELS:
                 # Convert to whale metrics
+                previous = self.qualified_whales.get(address)
                 whale_metrics = WhaleMetrics(
                     address=address,
                     qualification_level=candidate.qualification_level,
@@ -493,20 +571,40 @@ class WhaleDiscoveryService:
                     avg_trade_size=candidate.avg_trade_size,
                     consistency_score=candidate.behavior_indicators.get("volume_consistency", 0),
                     confidence_score=candidate.confidence_score,
-                    tier=self._assign_tier(candidate.total_volume)
+                    tier=self._assign_tier(candidate.total_volume),
+                    discovery_date=previous.discovery_date if previous else datetime.now()
                 )
                 
                 self.qualified_whales[address] = whale_metrics
+                self._analyzer_whales[address] = self._to_analyzer_entry(whale_metrics)
                 qualified_count += 1
                 
-                self.logger.info(f"🐋 Qualified new whale: {address[:8]}...")
-                self.logger.info(f"   💰 Volume: ${candidate.total_volume:,.2f}")
-                self.logger.info(f"   🎯 Confidence: {candidate.confidence_score:.2f}")
-                self.logger.info(f"   🏷️ Type: {candidate.behavior_type.value}")
-                self.logger.info(f"   ⭐ Tier: {whale_metrics.tier}")
+                if previous is None:
+                    self.logger.info(f"🐋 Qualified new whale: {address[:8]}...")
+                    self.logger.info(f"   💰 Volume: ${candidate.total_volume:,.2f}")
+                    self.logger.info(f"   🎯 Confidence: {candidate.confidence_score:.2f}")
+                    self.logger.info(f"   🏷️ Type: {candidate.behavior_type.value}")
+                    self.logger.info(f"   ⭐ Tier: {whale_metrics.tier}")
+            else:
+                self.qualified_whales.pop(address, None)
+                self._analyzer_whales.pop(address, None)
         
         return qualified_count
     
+    @staticmethod
+    def _to_analyzer_entry(whale: WhaleMetrics) -> Dict[str, Any]:
+        """Whale metrics in the movement analyzers' whale-database entry format"""
+        return {
+            'tier': whale.tier,
+            'name': f"Discovered {whale.behavior_type.value.title()} {whale.address[:8]}",
+            'avg_position': whale.avg_trade_size * 10,  # Estimate position size
+            'success_rate': whale.confidence_score,
+            'known_for': whale.behavior_type.value,
+            'discovery_date': whale.discovery_date.isoformat(),
+            'qualification_level': whale.qualification_level.value,
+            'total_volume_24h': whale.total_volume_24h
+        }
+    
     def _assign_tier(self, volume: float) -> int:
         """Assign tier based on volume"""
         tier_config = self.config["tier_assignment"]
@@ -522,6 +620,15 @@ class WhaleDiscoveryService:
         """Get all qualified whales"""
         return self.qualified_whales.copy()
     
+    def get_whale_database_for_analyzer(self) -> Mapping[str, Dict[str, Any]]:
+        """
+        Get qualified whales in the analyzers' whale-database format.
+        
+        Returns a live read-only view, not a copy: it reflects later discovery
+        sessions without the caller having to reload it.
+        """
+        return MappingProxyType(self._analyzer_whales)
+    
     def get_discovery_stats(self) -> Dict:
         """Get discovery service statistics"""
         total_sessions = len(self.discovery_sessions)
@@ -534,7 +641,8 @@ class WhaleDiscoveryService:
             "total_candidates": len(self.candidates),
             "qualified_whales": len(self.qualified_whales),
             "qualification_rate": len(self.qualified_whales) / len(self.candidates) if self.candidates else 0,
-            "last_discovery": self.discovery_sessions[-1].start_time if self.discovery_sessions else None
+            "last_discovery": self.discovery_sessions[-1].start_time if self.discovery_sessions else None,
+            "wallet_graph": self.wallet_graph.get_stats()
         }
     
     async def cleanup_cache(self):
@@ -9,7 +9,8 @@ Tracks movement patterns, positioning, and market impact to understand what big
 import asyncio
 import logging
 import time
-from typing import Dict, List, Any, Optional
+from collections import ChainMap
+from typing import Dict, List, Any, Mapping, Optional
 from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass
@@ -82,7 +83,7 @@ class WhaleSharkMovementTracker:
             self.logger.debug(f"Enhanced discovery service not available: {e}")
         
         # Known whale database (from WhaleActivityAnalyzer)
-        self.whale_database = {
+        self.known_whales = {
             # Tier 1: Mega Whales (>$50M typical positions)
             "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM": {
                 "tier": 1, "name": "Alameda Research", "avg_position": 100_000_000,
@@ -116,6 +117,13 @@ class WhaleSharkMovementTracker:
             }
         }
         
+        # Lookups go through a ChainMap: local additions first, then live read-only
+        # views of discovered whales, then the known whales above. Discovered
+        # whales are never copied, so new discoveries are visible immediately.
+        self._local_whales: Dict[str, Dict[str, Any]] = {}
+        self._discovered_whale_views: Dict[int, Mapping[str, Dict[str, Any]]] = {}
+        self.whale_database = ChainMap(self._local_whales, self.known_whales)
+        
         # Load discovered whales if discovery service available
         self._load_discovered_whales()
         
@@ -145,17 +153,20 @@ class WhaleSharkMovementTracker:
             "primary_timeframe": "24h",      # Main analysis timeframe
             "secondary_timeframe": "6h",     # For high-priority tokens only
             "max_api_calls_per_token": 2,   # Hard limit: 1-2 calls max
-            "high_priority_volume_threshold": 1000000  # $1M+ = high priority
+            "high_priority_volume_threshold": 1000000,  # $1M+ = high priority
+            "batch_concurrency": 5           # Tokens analyzed concurrently in batch mode
         }
     
     async def analyze_whale_shark_movements(self, token_address: str, 
-                                          priority_level: str = "normal") -> Dict[str, Any]:
+                                          priority_level: str = "normal",
+                                          trader_memo: Optional[Dict[tuple, Optional[Dict[str, Any]]]] = None) -> Dict[str, Any]:
         """
         Analyze whale and shark movements for a token with minimal API calls.
         
         Args:
             token_address: Token address to analyze
             priority_level: "normal" (1 API call) or "high" (2 API calls)
+            trader_memo: Optional classification memo shared across a batch
             
         Returns:
             Comprehensive whale/shark movement analysis
@@ -173,9 +184,9 @@ class WhaleSharkMovementTracker:
             
             # Efficient API strategy: 1-2 calls maximum
             if priority_level == "high":
-                movement_analysis = await self._analyze_high_priority_movements(token_address)
+                movement_analysis = await self._analyze_high_priority_movements(token_address, trader_memo)
             else:
-                movement_analysis = await self._analyze_standard_movements(token_address)
+                movement_analysis = await self._analyze_standard_movements(token_address, trader_memo)
             
             # Cache the results
             self.cache_manager.set(cache_key, movement_analysis, ttl=self.movement_cache_ttl)
@@ -187,12 +198,14 @@ class WhaleSharkMovementTracker:
             self.logger.error(f"❌ Error analyzing whale/shark movements for {token_address}: {e}")
             return self._get_empty_analysis()
     
-    async def _analyze_standard_movements(self, token_address: str) -> Dict[str, Any]:
+    async def _analyze_standard_movements(self, token_address: str,
+                                          trader_memo: Optional[Dict[tuple, Optional[Dict[str, Any]]]] = None) -> Dict[str, Any]:
         """
         Standard analysis using 1 API call (24h volume sorting).
         
         Args:
             token_address: Token address to analyze
+            trader_memo: Optional classification memo shared across a batch
             
         Returns:
             Movement analysis based on 24h data
@@ -214,15 +227,17 @@ class WhaleSharkMovementTracker:
         
         # Classify and analyze movements
         return await self._perform_whale_shark_analysis(
-            traders_data, token_address, ["24h"], api_calls_used=1
+            traders_data, token_address, ["24h"], api_calls_used=1, trader_memo=trader_memo
         )
     
-    async def _analyze_high_priority_movements(self, token_address: str) -> Dict[str, Any]:
+    async def _analyze_high_priority_movements(self, token_address: str,
+                                               trader_memo: Optional[Dict[tuple, Optional[Dict[str, Any]]]] = None) -> Dict[str, Any]:
         """
         High-priority analysis using 2 API calls (24h + 6h volume sorting).
         
         Args:
             token_address: Token address to analyze
+            trader_memo: Optional classification memo shared across a batch
             
         Returns:
             Enhanced movement analysis with recent trend data
@@ -230,21 +245,22 @@ class WhaleSharkMovementTracker:
         self.logger.debug(f"🎯 High-priority movement analysis for {token_address} (2 API calls)")
         
         # API Call 1: 24h volume sorting (main analysis)
-        traders_24h = await self.birdeye_api.get_top_traders_optimized(
-            token_address=token_address,
-            time_frame="24h",
-            sort_by="volume",
-            sort_type="desc",
-            limit=10
-        )
-        
-        # API Call 2: 6h volume sorting (recent trends)
-        traders_6h = await self.birdeye_api.get_top_traders_optimized(
-            token_address=token_address,
-            time_frame="6h",
-            sort_by="volume",
-            sort_type="desc",
-            limit=10
+        # API Call 2: 6h volume sorting (recent trends) - both issued concurrently
+        traders_24h, traders_6h = await asyncio.gather(
+            self.birdeye_api.get_top_traders_optimized(
+                token_address=token_address,
+                time_frame="24h",
+                sort_by="volume",
+                sort_type="desc",
+                limit=10
+            ),
+            self.birdeye_api.get_top_traders_optimized(
+                token_address=token_address,
+                time_frame="6h",
+                sort_by="volume",
+                sort_type="desc",
+                limit=10
+            )
         )
         
         if not traders_24h and not traders_6h:
@@ -253,14 +269,15 @@ class WhaleSharkMovementTracker:
         
         # Combine and analyze movements
         combined_analysis = await self._perform_enhanced_whale_shark_analysis(
-            traders_24h or [], traders_6h or [], token_address, api_calls_used=2
+            traders_24h or [], traders_6h or [], token_address, api_calls_used=2, trader_memo=trader_memo
         )
         
         return combined_analysis
     
     async def _perform_whale_shark_analysis(self, traders_data: List[Dict[str, Any]], 
                                           token_address: str, timeframes: List[str],
-                                          api_calls_used: int) -> Dict[str, Any]:
+                                          api_calls_used: int,
+                                          trader_memo: Optional[Dict[tuple, Optional[Dict[str, Any]]]] = None) -> Dict[str, Any]:
         """
         Perform whale/shark classification and movement analysis.
         
@@ -269,6 +286,7 @@ class WhaleSharkMovementTracker:
             token_address: Token address being analyzed
             timeframes: List of timeframes analyzed
             api_calls_used: Number of API calls used
+            trader_memo: Optional classification memo shared across a batch
             
         Returns:
             Comprehensive whale/shark movement analysis
@@ -287,56 +305,21 @@ class WhaleSharkMovementTracker:
         
         for trader in traders_data:
             try:
-                # Extract trader metrics
-                volume = trader.get("volume", 0) or 0
-                trade_count = trader.get("trade", 0) or 0
-                volume_buy = trader.get("volumeBuy", 0) or 0
-                volume_sell = trader.get("volumeSell", 0) or 0
-                trader_address = trader.get("owner") or trader.get("address", "unknown")
+                record = self._classify_trader_record(trader, trader_memo)
+                if record is None:
+                    continue
                 
-                # Calculate derived metrics
-                avg_trade_size = volume / max(trade_count, 1)
-                buy_ratio = volume_buy / max(volume, 1)
-                sell_ratio = volume_sell / max(volume, 1)
-                
-                # Classify trader
-                trader_classification = self._classify_trader(volume, trade_count, avg_trade_size)
-                
-                if trader_classification == "whale":
-                    whales.append({
-                        "address": trader_address,
-                        "volume": volume,
-                        "trade_count": trade_count,
-                        "avg_trade_size": avg_trade_size,
-                        "volume_buy": volume_buy,
-                        "volume_sell": volume_sell,
-                        "buy_ratio": buy_ratio,
-                        "sell_ratio": sell_ratio,
-                        "directional_bias": self._get_directional_bias(buy_ratio),
-                        "market_impact": self._estimate_market_impact(volume, avg_trade_size),
-                        "classification": "whale"
-                    })
-                    total_whale_volume += volume
-                    whale_buy_volume += volume_buy
-                    whale_sell_volume += volume_sell
+                if record["classification"] == "whale":
+                    whales.append(record)
+                    total_whale_volume += record["volume"]
+                    whale_buy_volume += record["volume_buy"]
+                    whale_sell_volume += record["volume_sell"]
                     
-                elif trader_classification == "shark":
-                    sharks.append({
-                        "address": trader_address,
-                        "volume": volume,
-                        "trade_count": trade_count,
-                        "avg_trade_size": avg_trade_size,
-                        "volume_buy": volume_buy,
-                        "volume_sell": volume_sell,
-                        "buy_ratio": buy_ratio,
-                        "sell_ratio": sell_ratio,
-                        "directional_bias": self._get_directional_bias(buy_ratio),
-                        "market_impact": self._estimate_market_impact(volume, avg_trade_size),
-                        "classification": "shark"
-                    })
-                    total_shark_volume += volume
-                    shark_buy_volume += volume_buy
-                    shark_sell_volume += volume_sell
+                elif record["classification"] == "shark":
+                    sharks.append(record)
+                    total_shark_volume += record["volume"]
+                    shark_buy_volume += record["volume_buy"]
+                    shark_sell_volume += record["volume_sell"]
                     
             except Exception as e:
                 self.logger.error(f"Error analyzing trader: {e}")
@@ -390,7 +373,8 @@ class WhaleSharkMovementTracker:
     async def _perform_enhanced_whale_shark_analysis(self, traders_24h: List[Dict], 
                                                    traders_6h: List[Dict],
                                                    token_address: str, 
-                                                   api_calls_used: int) -> Dict[str, Any]:
+                                                   api_calls_used: int,
+                                                   trader_memo: Optional[Dict[tuple, Optional[Dict[str, Any]]]] = None) -> Dict[str, Any]:
         """
         Enhanced analysis combining 24h and 6h data for trend detection.
         
@@ -399,18 +383,23 @@ class WhaleSharkMovementTracker:
             traders_6h: 6h trader data  
             token_address: Token address
             api_calls_used: Number of API calls used
+            trader_memo: Optional classification memo shared across a batch
             
         Returns:
             Enhanced whale/shark analysis with trend data
         """
+        # Traders whose 6h activity equals their 24h activity are classified once
+        if trader_memo is None:
+            trader_memo = {}
+        
         # Perform standard analysis on 24h data
         main_analysis = await self._perform_whale_shark_analysis(
-            traders_24h, token_address, ["24h"], api_calls_used=1
+            traders_24h, token_address, ["24h"], api_calls_used=1, trader_memo=trader_memo
         )
         
         # Analyze 6h trends
         recent_analysis = await self._perform_whale_shark_analysis(
-            traders_6h, token_address, ["6h"], api_calls_used=1
+            traders_6h, token_address, ["6h"], api_calls_used=1, trader_memo=trader_memo
         )
         
         # Compare trends
@@ -435,6 +424,60 @@ class WhaleSharkMovementTracker:
         
         return enhanced_analysis
     
+    def _classify_trader_record(self, trader: Dict[str, Any],
+                                trader_memo: Optional[Dict[tuple, Optional[Dict[str, Any]]]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Build the whale/shark record for one raw top-trader entry.
+        
+        Args:
+            trader: Raw trader data from API
+            trader_memo: Optional memo keyed by wallet and its trading metrics, so
+                a wallet seen with the same activity again is classified once
+            
+        Returns:
+            Whale/shark record, or None for fish
+        """
+        # Extract trader metrics
+        volume = trader.get("volume", 0) or 0
+        trade_count = trader.get("trade", 0) or 0
+        volume_buy = trader.get("volumeBuy", 0) or 0
+        volume_sell = trader.get("volumeSell", 0) or 0
+        trader_address = trader.get("owner") or trader.get("address", "unknown")
+        
+        memo_key = (trader_address, volume, trade_count, volume_buy, volume_sell)
+        if trader_memo is not None and memo_key in trader_memo:
+            record = trader_memo[memo_key]
+            return dict(record) if record is not None else None
+        
+        # Calculate derived metrics
+        avg_trade_size = volume / max(trade_count, 1)
+        buy_ratio = volume_buy / max(volume, 1)
+        sell_ratio = volume_sell / max(volume, 1)
+        
+        # Classify trader
+        trader_classification = self._classify_trader(volume, trade_count, avg_trade_size)
+        
+        record = None
+        if trader_classification in ("whale", "shark"):
+            record = {
+                "address": trader_address,
+                "volume": volume,
+                "trade_count": trade_count,
+                "avg_trade_size": avg_trade_size,
+                "volume_buy": volume_buy,
+                "volume_sell": volume_sell,
+                "buy_ratio": buy_ratio,
+                "sell_ratio": sell_ratio,
+                "directional_bias": self._get_directional_bias(buy_ratio),
+                "market_impact": self._estimate_market_impact(volume, avg_trade_size),
+                "classification": trader_classification
+            }
+        
+        if trader_memo is not None:
+            trader_memo[memo_key] = record
+            return dict(record) if record is not None else None
+        return record
+    
     def _classify_trader(self, volume: float, trade_count: int, avg_trade_size: float) -> str:
         """
         Classify trader as whale, shark, or fish based on volume and behavior.
@@ -797,41 +840,80 @@ class WhaleSharkMovementTracker:
         }
     
     async def batch_analyze_whale_shark_movements(self, token_addresses: List[str], 
-                                                 auto_prioritize: bool = True) -> Dict[str, Dict[str, Any]]:
+                                                 auto_prioritize: bool = True,
+                                                 priority_level: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
         """
         Efficiently analyze whale/shark movements for multiple tokens.
         
+        Tokens are analyzed concurrently (bounded by api_strategy["batch_concurrency"];
+        every request still goes through the API's shared rate limiter), and a
+        wallet seen with the same activity in several tokens or timeframes is
+        classified once.
+        
         Args:
             token_addresses: List of token addresses to analyze
             auto_prioritize: Automatically determine priority based on volume
+            priority_level: Fixed priority for every token (overrides auto_prioritize)
             
         Returns:
             Dictionary mapping token addresses to their analyses
         """
-        self.logger.info(f"🐋 Batch analyzing whale/shark movements for {len(token_addresses)} tokens")
+        unique_addresses = list(dict.fromkeys(address for address in token_addresses if address))
+        self.logger.info(f"🐋 Batch analyzing whale/shark movements for {len(unique_addresses)} tokens")
         
-        results = {}
+        if priority_level:
+            priorities = {address: priority_level for address in unique_addresses}
+        elif auto_prioritize:
+            priorities = await self._determine_batch_priorities(unique_addresses)
+        else:
+            priorities = {address: "normal" for address in unique_addresses}
+        
+        trader_memo: Dict[tuple, Optional[Dict[str, Any]]] = {}
+        semaphore = asyncio.Semaphore(self.api_strategy["batch_concurrency"])
+        
+        async def analyze(token_address: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    analysis = await self.analyze_whale_shark_movements(
+                        token_address, priorities[token_address], trader_memo=trader_memo
+                    )
+                    self.logger.debug(f"✅ Completed whale/shark analysis for {token_address} (priority: {priorities[token_address]})")
+                    return analysis
+                except Exception as e:
+                    self.logger.error(f"❌ Failed whale/shark analysis for {token_address}: {e}")
+                    return self._get_empty_analysis()
+        
+        analyses = await asyncio.gather(*(analyze(address) for address in unique_addresses))
+        results = dict(zip(unique_addresses, analyses))
+        
+        self.logger.info(f"🎯 Batch whale/shark analysis completed: {len(results)} tokens processed "
+                         f"({len(trader_memo)} distinct trader records classified)")
+        return results
+    
+    async def _determine_batch_priorities(self, token_addresses: List[str]) -> Dict[str, str]:
+        """
+        Determine analysis priority for many tokens from concurrent overview lookups.
         
-        for token_address in token_addresses:
-            try:
-                # Auto-prioritize based on token characteristics if enabled
-                if auto_prioritize:
-                    priority = await self._determine_analysis_priority(token_address)
-                else:
-                    priority = "normal"
-                
-                # Analyze with determined priority
-                analysis = await self.analyze_whale_shark_movements(token_address, priority)
-                results[token_address] = analysis
-                
-                self.logger.debug(f"✅ Completed whale/shark analysis for {token_address} (priority: {priority})")
-                
-            except Exception as e:
-                self.logger.error(f"❌ Failed whale/shark analysis for {token_address}: {e}")
-                results[token_address] = self._get_empty_analysis()
+        The multi-token endpoint behind batch_get_token_overviews only returns metadata
+        (name, symbol, logo) without 24h volume, so full overviews are fetched per token.
+        """
+        semaphore = asyncio.Semaphore(self.api_strategy["batch_concurrency"])
         
-        self.logger.info(f"🎯 Batch whale/shark analysis completed: {len(results)} tokens processed")
-        return results
+        async def prioritize(token_address: str) -> str:
+            async with semaphore:
+                return await self._determine_analysis_priority(token_address)
+        
+        priorities = await asyncio.gather(*(prioritize(address) for address in token_addresses))
+        return dict(zip(token_addresses, priorities))
+    
+    def _priority_from_overview(self, overview: Optional[Dict[str, Any]]) -> str:
+        """High priority for high-volume tokens"""
+        if overview and isinstance(overview, dict):
+            volume = overview.get("volume", {})
+            volume_24h = (volume.get("h24", 0) if isinstance(volume, dict) else 0) or 0
+            if volume_24h >= self.api_strategy["high_priority_volume_threshold"]:
+                return "high"
+        return "normal"
     
     async def _determine_analysis_priority(self, token_address: str) -> str:
         """
@@ -846,15 +928,7 @@ class WhaleSharkMovementTracker:
         try:
             # Get basic token overview to determine priority
             overview = await self.birdeye_api.get_token_overview(token_address)
-            
-            if overview and isinstance(overview, dict):
-                volume_24h = overview.get("volume", {}).get("h24", 0) or 0
-                
-                # High priority for high-volume tokens
-                if volume_24h >= self.api_strategy["high_priority_volume_threshold"]:
-                    return "high"
-            
-            return "normal"
+            return self._priority_from_overview(overview)
             
         except Exception as e:
             self.logger.debug(f"Could not determine priority for {token_address}: {e}")
@@ -863,22 +937,22 @@ class WhaleSharkMovementTracker:
     # === WHALE DATABASE MANAGEMENT ===
 
     def _load_discovered_whales(self):
-        """Load dynamically discovered whales into the database"""
-        if self.whale_discovery_service:
+        """Attach read-only views of dynamically discovered whales to the database"""
+        original_count = len(self.whale_database)
+        for service in (self.whale_discovery_service, self.enhanced_discovery_service):
+            if service is None or not hasattr(service, 'get_whale_database_for_analyzer'):
+                continue
             try:
-                discovered_whales = self.whale_discovery_service.get_whale_database_for_analyzer()
-                
-                # Merge discovered whales with existing database
-                original_count = len(self.whale_database)
-                self.whale_database.update(discovered_whales)
-                new_count = len(self.whale_database) - original_count
-                
-                if new_count > 0:
-                    self.logger.info(f"🐋 Loaded {new_count} dynamically discovered whales")
-                    self.logger.info(f"   Total whale database size: {len(self.whale_database)} wallets")
-                    
+                self._discovered_whale_views[id(service)] = service.get_whale_database_for_analyzer()
             except Exception as e:
                 self.logger.warning(f"Failed to load discovered whales: {e}")
+        
+        self.whale_database.maps = [self._local_whales, *self._discovered_whale_views.values(), self.known_whales]
+        new_count = len(self.whale_database) - original_count
+        
+        if new_count > 0:
+            self.logger.info(f"🐋 Loaded {new_count} dynamically discovered whales")
+            self.logger.info(f"   Total whale database size: {len(self.whale_database)} wallets")
 
     async def refresh_whale_database(self):
         """Refresh the whale database with latest discoveries"""
@@ -907,6 +981,7 @@ class WhaleSharkMovementTracker:
         
         try:
             self.logger.info(f"🔍 Starting enhanced whale discovery session")
+            known_before = set(self.whale_database)
             
             # Run discovery session
             session = await self.enhanced_discovery_service.discover_whales_from_trending_tokens(
@@ -916,21 +991,8 @@ class WhaleSharkMovementTracker:
             # Get qualified whales
             qualified_whales = self.enhanced_discovery_service.get_qualified_whales()
             
-            # Integrate discovered whales into our database
-            integrated_count = 0
-            for address, whale_metrics in qualified_whales.items():
-                if address not in self.whale_database:
-                    self.whale_database[address] = {
-                        'tier': whale_metrics.tier,
-                        'name': f"Discovered {whale_metrics.behavior_type.value.title()} {address[:8]}",
-                        'avg_position': whale_metrics.avg_trade_size * 10,  # Estimate position size
-                        'success_rate': whale_metrics.confidence_score,
-                        'known_for': whale_metrics.behavior_type.value,
-                        'discovery_date': whale_metrics.discovery_date.isoformat(),
-                        'qualification_level': whale_metrics.qualification_level.value,
-                        'total_volume_24h': whale_metrics.total_volume_24h
-                    }
-                    integrated_count += 1
+            # Discovered whales are a live view in our database; count the new ones
+            integrated_count = sum(1 for address in qualified_whales if address not in known_before)
             
             # Prepare results
             results = {
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Dashboard Update Bus for the Virtuoso Web Dashboard
+Coalesces stats/token/alert changes over a short tick and broadcasts deltas
+"""
+
+import threading
+from collections import deque
+from typing import Dict, Any, Optional, Callable
+
+
+class DashboardUpdateBus:
+    """Coalesces dashboard changes and flushes them as deltas once per tick.
+
+    Producers (``add_token``, ``update_stats``, ``_add_alert``...) only mark
+    state as dirty or queue new items. A single background loop flushes the
+    pending changes every ``tick_interval`` seconds, so a detection burst of
+    hundreds of tokens costs a handful of emits instead of hundreds.
+    """
+
+    def __init__(self,
+                 emit: Callable[[str, Any], None],
+                 snapshot_stats: Callable[[], Dict[str, Any]],
+                 snapshot_tokens_summary: Optional[Callable[[], Dict[str, Any]]] = None,
+                 tick_interval: float = 0.25,
+                 max_pending_tokens: int = 50,
+                 max_pending_alerts: int = 50,
+                 has_clients: Optional[Callable[[], bool]] = None,
+                 sleep: Optional[Callable[[float], None]] = None):
+        self._emit = emit
+        self._snapshot_stats = snapshot_stats
+        self._snapshot_tokens_summary = snapshot_tokens_summary
+        self._has_clients = has_clients or (lambda: True)
+        self._sleep = sleep
+        self.tick_interval = tick_interval
+
+        self._lock = threading.Lock()
+        self._stats_dirty = False
+        self._pending_tokens = {
+            'recent': deque(maxlen=max_pending_tokens),
+            'high_conviction': deque(maxlen=max_pending_tokens),
+            'raydium_v3': deque(maxlen=max_pending_tokens)
+        }
+        self._pending_alerts = deque(maxlen=max_pending_alerts)
+        self._last_broadcast_stats: Dict[str, Any] = {}
+
+        self._running = False
+        self._stop_event = threading.Event()
+
+        self.bus_stats = {
+            'changes_received': 0,
+            'flushes': 0,
+            'emits': 0
+        }
+
+    # ------------------------------------------------------------------
+    # Producer API
+    # ------------------------------------------------------------------
+
+    def mark_stats_dirty(self):
+        """Schedule a stats delta for the next tick"""
+        with self._lock:
+            self._stats_dirty = True
+            self.bus_stats['changes_received'] += 1
+
+    def push_token(self, channel: str, token: Dict[str, Any]):
+        """Queue a new token for the given channel ('recent', 'high_conviction', 'raydium_v3')"""
+        with self._lock:
+            self._pending_tokens[channel].append(token)
+            self.bus_stats['changes_received'] += 1
+
+    def push_alert(self, alert: Dict[str, Any]):
+        """Queue an alert for the next tick"""
+        with self._lock:
+            self._pending_alerts.append(alert)
+            self.bus_stats['changes_received'] += 1
+
+    def reset_baseline(self):
+        """Forget the last broadcast stats so the next flush sends every key"""
+        with self._lock:
+            self._last_broadcast_stats = {}
+            self._stats_dirty = True
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    def flush(self) -> int:
+        """Broadcast all pending deltas. Returns the number of emits made."""
+        with self._lock:
+            stats_dirty = self._stats_dirty
+            self._stats_dirty = False
+            new_tokens = {channel: list(items) for channel, items in self._pending_tokens.items() if items}
+            for items in self._pending_tokens.values():
+                items.clear()
+            alerts = list(self._pending_alerts)
+            self._pending_alerts.clear()
+
+        self.bus_stats['flushes'] += 1
+
+        if not self._has_clients():
+            # Nobody is listening - drop the deltas and resync on the next flush
+            if stats_dirty or new_tokens or alerts:
+                with self._lock:
+                    self._last_broadcast_stats = {}
+            return 0
+
+        emits = 0
+
+        if stats_dirty:
+            snapshot = self._snapshot_stats()
+            delta = {key: value for key, value in snapshot.items()
+                     if key not in self._last_broadcast_stats or self._last_broadcast_stats[key] != value}
+            if delta:
+                self._emit('stats_delta', delta)
+                emits += 1
+            # Nested dicts are mutated in place by callers, so store copies
+            self._last_broadcast_stats = {
+                key: (dict(value) if isinstance(value, dict) else value)
+                for key, value in snapshot.items()
+            }
+
+        if new_tokens:
+            payload: Dict[str, Any] = dict(new_tokens)
+            if self._snapshot_tokens_summary is not None:
+                payload['stats_summary'] = self._snapshot_tokens_summary()
+            self._emit('tokens_delta', payload)
+            emits += 1
+
+        if alerts:
+            self._emit('alerts_batch', alerts)
+            emits += 1
+
+        self.bus_stats['emits'] += emits
+        return emits
+
+    # ------------------------------------------------------------------
+    # Background loop
+    # ------------------------------------------------------------------
+
+    def run(self):
+        """Flush loop; intended to run as a background task"""
+        self._running = True
+        sleep = self._sleep or self._stop_event.wait
+        while self._running:
+            sleep(self.tick_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"⚠️ Dashboard update bus flush failed: {e}")
+
+    def stop(self):
+        """Stop the flush loop and push whatever is still pending"""
+        self._running = False
+        self._stop_event.set()
+        self.flush()
+
+    def get_bus_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics"""
+        with self._lock:
+            pending_tokens = sum(len(items) for items in self._pending_tokens.values())
+            pending_alerts = len(self._pending_alerts)
+        return {
+            **self.bus_stats,
+            'pending_tokens': pending_tokens,
+            'pending_alerts': pending_alerts,
+            'tick_interval': self.tick_interval
+        }
@@ -19,10 +19,12 @@ import queue
 from collections import deque
 import statistics
 
+from .dashboard_update_bus import DashboardUpdateBus
+
 class VirtuosoWebDashboard:
     """Enhanced real-time web dashboard with seamless integration"""
     
-    def __init__(self, port: int = 9090, debug_mode: bool = False):
+    def __init__(self, port: int = 9090, debug_mode: bool = False, update_interval: float = 0.25):
         self.port = port
         self.debug_mode = debug_mode
         self.app = Flask(__name__)
@@ -72,12 +74,20 @@ class VirtuosoWebDashboard:
             }
         }
         
-        # Enhanced token tracking
-        self.recent_tokens = deque(maxlen=50)  # Convert to deque for efficiency
-        self.high_conviction_tokens = []
+        # Optimization: Limit data retention
+        self.MAX_RECENT_TOKENS = 50
+        self.MAX_HIGH_CONVICTION_TOKENS = 100
+        self.MAX_ERROR_LOG = 100
+        self.MAX_CYCLE_HISTORY = 20
+        self.MAX_CHART_POINTS = 50
+        
+        # Enhanced token tracking (bounded ring buffers)
+        self.recent_tokens = deque(maxlen=self.MAX_RECENT_TOKENS)
+        self.high_conviction_tokens = deque(maxlen=self.MAX_HIGH_CONVICTION_TOKENS)
+        self.high_conviction_total = 0
         self.raydium_v3_candidates = deque(maxlen=50)
-        self.error_log = []
-        self.cycle_history = deque(maxlen=20)
+        self.error_log = deque(maxlen=self.MAX_ERROR_LOG)
+        self.cycle_history = deque(maxlen=self.MAX_CYCLE_HISTORY)
         
         # Performance metrics
         self.performance_metrics = {
@@ -93,14 +103,22 @@ class VirtuosoWebDashboard:
         self._last_broadcast_stats = {}
         self._last_broadcast_tokens = {'recent': [], 'high_conviction': []}
         
-        # Optimization: Limit data retention
-        self.MAX_RECENT_TOKENS = 50
-        self.MAX_CYCLE_HISTORY = 20
-        self.MAX_CHART_POINTS = 50
-        
         # Data update queue
         self.update_queue = queue.Queue()
         
+        # Optimization: Coalesce changes and broadcast deltas once per tick
+        self.update_bus = DashboardUpdateBus(
+            emit=self.socketio.emit,
+            snapshot_stats=self._build_stats_payload,
+            snapshot_tokens_summary=self._build_tokens_summary,
+            tick_interval=update_interval,
+            max_pending_tokens=self.MAX_RECENT_TOKENS,
+            max_pending_alerts=self.alert_queue.maxlen,
+            has_clients=self._has_connected_clients,
+            sleep=self.socketio.sleep
+        )
+        self._update_bus_started = False
+        
         # Setup routes
         self._setup_routes()
         self._setup_socketio_handlers()
@@ -117,7 +135,7 @@ class VirtuosoWebDashboard:
             return jsonify({
                 'stats': self.stats,
                 'recent_tokens': list(self.recent_tokens)[-10:],
-                'high_conviction': self.high_conviction_tokens[-10:],
+                'high_conviction': list(self.high_conviction_tokens)[-10:],
                 'cycle_history': list(self.cycle_history)[-20:]
             })
         
@@ -128,7 +146,7 @@ class VirtuosoWebDashboard:
         @self.app.route('/api/tokens')
         def get_tokens():
             return jsonify({
-                'high_conviction': self.high_conviction_tokens,
+                'high_conviction': list(self.high_conviction_tokens),
                 'recent': list(self.recent_tokens),
                 'raydium_v3': list(self.raydium_v3_candidates),
                 'total_analyzed': len(self.recent_tokens)
@@ -141,13 +159,22 @@ class VirtuosoWebDashboard:
         @self.app.route('/api/alerts')
         def get_alerts():
             return jsonify(list(self.alert_queue))
+        
+        @self.app.route('/api/bus')
+        def get_bus_stats():
+            return jsonify(self.update_bus.get_bus_stats())
     
     def _setup_socketio_handlers(self):
         """Setup Socket.IO event handlers"""
         @self.socketio.on('connect')
         def handle_connect():
             print(f"Client connected: {request.sid}")
+            self._ensure_update_bus()
             emit('initial_state', self._get_comprehensive_stats())
+            # New clients need full snapshots before they can apply deltas
+            emit('stats_update', self._build_stats_payload())
+            emit('tokens_update', self._build_tokens_payload())
+            self.update_bus.reset_baseline()
         
         @self.socketio.on('disconnect')
         def handle_disconnect():
@@ -177,7 +204,7 @@ class VirtuosoWebDashboard:
                 'cycles_per_hour': (self.stats['cycles_completed'] / max(1, (time.time() - (self.stats.get('start_time') or time.time())) / 3600))
             },
             'token_counts': {
-                'high_conviction': len(self.high_conviction_tokens),
+                'high_conviction': self.high_conviction_total,
                 'recent': len(self.recent_tokens),
                 'raydium_v3': len(self.raydium_v3_candidates)
             }
@@ -219,7 +246,7 @@ class VirtuosoWebDashboard:
         self.stats['total_cycles'] = total_cycles
         
         self._add_alert('info', f'Detection session started - {total_cycles} cycles planned')
-        self.emit_update()
+        self.update_bus.mark_stats_dirty()
         
     def update_stats(self, **kwargs):
         """Update dashboard statistics"""
@@ -233,7 +260,7 @@ class VirtuosoWebDashboard:
                 self.stats[key] = value
                 
         self.stats['last_update'] = time.time()
-        self.emit_update()
+        self.update_bus.mark_stats_dirty()
         
     def add_token(self, token_data: Dict[str, Any], is_high_conviction: bool = False):
         """Enhanced add_token with full metadata support"""
@@ -259,11 +286,14 @@ class VirtuosoWebDashboard:
         
         # Add to recent tokens
         self.recent_tokens.append(enriched_token)
+        self.update_bus.push_token('recent', enriched_token)
         
         # Track high conviction
         if is_high_conviction or enriched_token['score'] >= 85:
             self.high_conviction_tokens.append(enriched_token)
-            self.stats['high_conviction_found'] = len(self.high_conviction_tokens)
+            self.high_conviction_total += 1
+            self.stats['high_conviction_found'] = self.high_conviction_total
+            self.update_bus.push_token('high_conviction', enriched_token)
             self._add_alert('high_conviction', 
                           f"High conviction token found: {enriched_token['symbol']} (Score: {enriched_token['score']})", 
                           enriched_token)
@@ -272,6 +302,7 @@ class VirtuosoWebDashboard:
         if enriched_token.get('discovery_source') == 'raydium_v3_enhanced' or enriched_token.get('is_early_gem_candidate'):
             self.raydium_v3_candidates.append(enriched_token)
             self.stats['raydium_v3_gems'] = len(self.raydium_v3_candidates)
+            self.update_bus.push_token('raydium_v3', enriched_token)
             if enriched_token.get('is_early_gem_candidate'):
                 self._add_alert('raydium_gem', 
                               f"Raydium V3 early gem: {enriched_token['symbol']} (TVL ratio: {enriched_token.get('volume_tvl_ratio', 0):.2f})", 
@@ -280,9 +311,8 @@ class VirtuosoWebDashboard:
         # Update total count
         self.stats['total_tokens_analyzed'] = len(self.recent_tokens)
         
-        # Optimization: Only emit if there are connected clients
-        if hasattr(self.socketio, 'server') and self.socketio.server.manager.rooms:
-            self.emit_tokens_update()
+        # Optimization: Deltas are flushed by the update bus on its next tick
+        self.update_bus.mark_stats_dirty()
     
     def _add_alert(self, alert_type: str, message: str, data: Any = None):
         """Add an alert to the queue"""
@@ -293,7 +323,7 @@ class VirtuosoWebDashboard:
             'data': data
         }
         self.alert_queue.append(alert)
-        self.socketio.emit('new_alert', alert)
+        self.update_bus.push_alert(alert)
     
     def update_stage_performance(self, stage: str, processed: int, filtered: int, time_taken: float):
         """Update stage performance metrics"""
@@ -303,7 +333,7 @@ class VirtuosoWebDashboard:
                 'filtered': filtered,
                 'time': time_taken
             }
-        self.emit_update()
+        self.update_bus.mark_stats_dirty()
         
     def complete_cycle(self, cycle_num: int, tokens_analyzed: int, high_conviction_found: int):
         """Enhanced cycle completion with performance tracking"""
@@ -329,16 +359,26 @@ class VirtuosoWebDashboard:
         self.stats['current_cycle'] = cycle_num
         
         self.socketio.emit('cycle_complete', cycle_data)
-        self.emit_update()
+        self.update_bus.mark_stats_dirty()
         
     def start_cycle(self):
         """Mark the start of a new cycle"""
         self._cycle_start_time = time.time()
         
-    def emit_update(self):
-        """Emit stats update with diff optimization"""
-        # Include comprehensive stats
-        comprehensive_stats = {
+    def _has_connected_clients(self) -> bool:
+        """Check whether any Socket.IO client is connected"""
+        return bool(hasattr(self.socketio, 'server') and self.socketio.server
+                    and self.socketio.server.manager.rooms)
+    
+    def _ensure_update_bus(self):
+        """Start the update bus flush loop once the Socket.IO server is up"""
+        if not self._update_bus_started:
+            self._update_bus_started = True
+            self.socketio.start_background_task(self.update_bus.run)
+    
+    def _build_stats_payload(self) -> Dict[str, Any]:
+        """Build the stats snapshot broadcast to clients"""
+        return {
             **self.stats,
             'performance_metrics': {
                 'average_cycle_time': self.stats.get('average_cycle_time', 0),
@@ -346,24 +386,37 @@ class VirtuosoWebDashboard:
                 'discovery_rate': self._calculate_discovery_rate()
             }
         }
+    
+    def _build_tokens_summary(self) -> Dict[str, Any]:
+        """Build the token counters sent alongside token updates"""
+        return {
+            'total_analyzed': self.stats['total_tokens_analyzed'],
+            'high_conviction_count': self.high_conviction_total,
+            'raydium_count': len(self.raydium_v3_candidates)
+        }
+    
+    def _build_tokens_payload(self) -> Dict[str, Any]:
+        """Build the full token snapshot broadcast to clients"""
+        return {
+            'recent': list(self.recent_tokens)[-20:],  # Last 20 for recent
+            'high_conviction': list(self.high_conviction_tokens)[-10:],  # Last 10 high conviction
+            'raydium_v3': list(self.raydium_v3_candidates)[-10:],  # Last 10 Raydium gems
+            'stats_summary': self._build_tokens_summary()
+        }
+    
+    def emit_update(self):
+        """Emit a full stats snapshot with diff optimization"""
+        comprehensive_stats = self._build_stats_payload()
         
         # Optimization: Only broadcast if data actually changed
         if comprehensive_stats != self._last_broadcast_stats:
             self.socketio.emit('stats_update', comprehensive_stats)
             self._last_broadcast_stats = comprehensive_stats.copy()
+            self.update_bus.reset_baseline()
         
     def emit_tokens_update(self):
-        """Enhanced tokens update with rich data"""
-        current_data = {
-            'recent': list(self.recent_tokens)[-20:],  # Last 20 for recent
-            'high_conviction': self.high_conviction_tokens[-10:],  # Last 10 high conviction
-            'raydium_v3': list(self.raydium_v3_candidates)[-10:],  # Last 10 Raydium gems
-            'stats_summary': {
-                'total_analyzed': self.stats['total_tokens_analyzed'],
-                'high_conviction_count': len(self.high_conviction_tokens),
-                'raydium_count': len(self.raydium_v3_candidates)
-            }
-        }
+        """Emit a full tokens snapshot with rich data"""
+        current_data = self._build_tokens_payload()
         
         # Optimization: Only broadcast if token data changed
         if current_data != self._last_broadcast_tokens:
@@ -1187,8 +1240,23 @@ class VirtuosoWebDashboard:
             lastStats = {...stats};
         }
         
+        // Client-side state that deltas are merged into
+        let dashboardStats = {};
+        let dashboardTokens = {recent: [], high_conviction: [], raydium_v3: []};
+        const TOKEN_LIMITS = {recent: 20, high_conviction: 10, raydium_v3: 10};
+        
         // Socket event handlers
         socket.on('stats_update', function(data) {
+            dashboardStats = {...data};
+            renderStats(dashboardStats);
+        });
+        
+        socket.on('stats_delta', function(delta) {
+            dashboardStats = {...dashboardStats, ...delta};
+            renderStats(dashboardStats);
+        });
+        
+        function renderStats(data) {
             // Update basic stats
             document.getElementById('cycles-completed').textContent = data.cycles_completed;
             document.getElementById('tokens-analyzed').textContent = data.total_tokens_analyzed;
@@ -1232,9 +1300,29 @@ class VirtuosoWebDashboard:
                 updateTimer(data.start_time);
                 document.getElementById('timer').dataset.started = 'true';
             }
-        });
+        }
         
         socket.on('tokens_update', function(data) {
+            dashboardTokens = {
+                recent: data.recent || [],
+                high_conviction: data.high_conviction || [],
+                raydium_v3: data.raydium_v3 || []
+            };
+            renderTokens(dashboardTokens);
+        });
+        
+        socket.on('tokens_delta', function(delta) {
+            Object.keys(TOKEN_LIMITS).forEach(channel => {
+                if (delta[channel] && delta[channel].length > 0) {
+                    dashboardTokens[channel] = dashboardTokens[channel]
+                        .concat(delta[channel])
+                        .slice(-TOKEN_LIMITS[channel]);
+                }
+            });
+            renderTokens(dashboardTokens);
+        });
+        
+        function renderTokens(data) {
             // Update high conviction tokens
             const highConvictionList = document.getElementById('high-conviction-list');
             if (data.high_conviction && data.high_conviction.length > 0) {
@@ -1262,7 +1350,7 @@ class VirtuosoWebDashboard:
             } else {
                 recentList.innerHTML = '<div class="loading">Starting analysis...</div>';
             }
-        });
+        }
         
         // Create enhanced token element
         function createEnhancedTokenElement(token, isHighConviction) {
@@ -1340,6 +1428,10 @@ class VirtuosoWebDashboard:
             showAlert(alert);
         });
         
+        socket.on('alerts_batch', function(alerts) {
+            alerts.forEach(showAlert);
+        });
+        
         function showAlert(alert) {
             const container = document.getElementById('alerts-container');
             const alertEl = document.createElement('div');
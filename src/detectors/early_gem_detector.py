@@ -37,6 +37,8 @@ from api.raydium_connector import RaydiumConnector
 # Import batch API manager for efficient batching
 try:
     from api.batch_api_manager import BatchAPIManager
+    from api.cache_prefetcher import CachePrefetcher
+    from core_local.popularity_sketch import PopularitySketch
 except ImportError:
     BatchAPIManager = None
 
@@ -52,6 +54,30 @@ def load_early_gem_scorer():
     
     return module.EarlyGemFocusedScoring
 
+# Load the compiled batch form of EarlyGemFocusedScoring the same way
+def load_early_gem_scoring_plan():
+    """Load the EarlyGemScoringPlan class"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    plan_path = os.path.join(os.path.dirname(script_dir), 'scoring', 'early_gem_scoring_plan.py')
+    
+    spec = importlib.util.spec_from_file_location("early_gem_scoring_plan", plan_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    
+    return module.EarlyGemScoringPlan
+
+# Load the table-driven Stage 1 TriageScorer the same way
+def load_triage_scorer():
+    """Load the TriageScorer class"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    scorer_path = os.path.join(os.path.dirname(script_dir), 'scoring', 'triage_scorer.py')
+    
+    spec = importlib.util.spec_from_file_location("triage_scorer", scorer_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    
+    return module.TriageScorer
+
 
 class EarlyGemDetector:
     """
@@ -148,6 +174,15 @@ class EarlyGemDetector:
             self.logger.error(f"❌ Failed to initialize Early Gem Scorer: {e}")
             self.early_gem_scorer = None
         
+        # Stage 4 scores its candidates as one batch through the compiled scoring plan
+        self.scoring_plan = None
+        if self.early_gem_scorer:
+            try:
+                EarlyGemScoringPlan = load_early_gem_scoring_plan()
+                self.scoring_plan = EarlyGemScoringPlan(self.early_gem_scorer, self.logger)
+            except Exception as e:
+                self.logger.warning(f"⚠️ Scoring plan unavailable, Stage 4 scores candidates one by one: {e}")
+        
         # Telegram alerter
         self.telegram_alerter = None
         
@@ -266,6 +301,10 @@ class EarlyGemDetector:
             # Use early gem hunting threshold instead of general alert_score_threshold
             self.high_conviction_threshold = early_gem_config.get('high_conviction_threshold', 35.0)
             
+            # Stage 1 triage rules are data: compile them once per detector
+            TriageScorer = load_triage_scorer()
+            self.triage_scorer = TriageScorer(scoring_config.get('stage1_triage'), logger=self.logger)
+            
             if self.debug_mode:
                 general_threshold = analysis_config.get('alert_score_threshold', 85.0)
                 self.logger.debug(f"🎯 THRESHOLD_DEBUG: General alert threshold: {general_threshold}")
@@ -2006,87 +2045,7 @@ class EarlyGemDetector:
             if not enriched_candidate:
                 enriched_candidate = candidate  # Fallback to original if enrichment fails
             
-            # Regular analysis for other candidates
-            # Build analysis data structure
-            overview_data = {
-                'symbol': enriched_candidate.get('symbol', ''),
-                'name': enriched_candidate.get('name', ''),
-                'address': enriched_candidate.get('address', ''),
-                'market_cap': enriched_candidate.get('market_cap', 0),
-                'price': enriched_candidate.get('price', 0),
-                'total_supply': enriched_candidate.get('total_supply', 0),
-                'unique_wallet_24h': enriched_candidate.get('unique_wallet_24h', 0),
-                'whale_activity_score': self._calculate_whale_score(enriched_candidate),
-                'liquidity': enriched_candidate.get('liquidity', 0),
-                'volume_24h': enriched_candidate.get('volume_24h', 0)
-            }
-            
-            whale_analysis = {
-                'whale_holders_5sol_plus': enriched_candidate.get('whale_holders_5sol_plus', 0),
-                'whale_concentration_score': enriched_candidate.get('whale_concentration_score', 0),
-                'estimated_dev_holdings': enriched_candidate.get('dev_current_holdings_pct', 0)
-            }
-            
-            # Fix data structure mismatch - extract string values for momentum scoring
-            volume_trend_dict = self._analyze_volume_trend(enriched_candidate)
-            price_momentum_dict = self._analyze_price_momentum(enriched_candidate)
-            
-            volume_price_analysis = {
-                'volume_trend': volume_trend_dict.get('volume_trend', 'unknown'),  # Extract string value
-                'price_momentum': price_momentum_dict.get('momentum_strength', 'neutral'),  # Extract string value (correct field)
-                'velocity_score': 0.0,  # Will be updated after scoring calculation
-                'volume_24h': enriched_candidate.get('volume_24h', 0),
-                'volume_1h': enriched_candidate.get('volume_1h', 0),
-                # Keep original dicts for debugging
-                'volume_trend_details': volume_trend_dict,
-                'price_momentum_details': price_momentum_dict
-            }
-            
-            community_boost_analysis = {
-                'community_score': self._calculate_community_score(enriched_candidate),
-                'holders_growth': enriched_candidate.get('holders_growth_24h', 0),
-                'retention_rate': enriched_candidate.get('retention_rate_24h', 0),
-                'social_sentiment': 'positive'
-            }
-            
-            security_analysis = {
-                'security_score': self._calculate_security_score(enriched_candidate),
-                'dev_behavior_score': 85.0,
-                'contract_security': 'verified',
-                'liquidity_locked': True
-            }
-            
-            # Fix trading activity data structure for momentum scoring
-            activity_score_raw = self._calculate_activity_score(enriched_candidate)  # Returns 0-1
-            
-            trading_activity = {
-                'recent_activity_score': activity_score_raw * 100,  # Scale to 0-100 range for momentum scoring
-                'buy_sell_ratio': 1.0,  # Default neutral ratio (no buy/sell data available)
-                'trades_24h': enriched_candidate.get('trades_24h', 0),
-                'unique_traders': enriched_candidate.get('unique_traders_24h', 0),
-                'avg_trade_size': enriched_candidate.get('avg_trade_size_usd', 0)
-            }
-            
-            dex_analysis = {
-                'dex_presence': ['raydium'] if 'raydium' in enriched_candidate.get('platforms', []) else [],
-                'liquidity_quality': self._calculate_liquidity_quality(enriched_candidate)
-            }
-            
-            first_100_analysis = {
-                'first_100_score': self._calculate_first_100_score({'retention_pct': 60, 'diamond_hands_score': 5}),
-                'retention_pct': 60,
-                'diamond_hands_score': 5
-            }
-            
-            graduation_analysis = {
-                'graduation_risk': self._calculate_graduation_risk(enriched_candidate),
-                'graduation_progress': enriched_candidate.get('graduation_progress_pct', 0),
-                'graduation_confidence': enriched_candidate.get('graduation_confidence', 0.7),
-                'graduation_barriers': enriched_candidate.get('graduation_barriers', []),
-                'graduation_catalysts': enriched_candidate.get('graduation_catalysts', []),
-                'momentum_sustainability': enriched_candidate.get('momentum_sustainability', 0.5),
-                'graduation_momentum_score': enriched_candidate.get('graduation_momentum_score', 0)
-            }
+            scoring_inputs = self._build_scoring_inputs(enriched_candidate)
             
             # 🚀 COST-OPTIMIZED SCORING SELECTION
             # Use basic scoring for early phases (no expensive OHLCV)
@@ -2099,21 +2058,16 @@ class EarlyGemDetector:
             if is_deep_analysis_phase:
                 # Deep analysis phase: Use full OHLCV-enhanced scoring
                 final_score, scoring_breakdown = self.early_gem_scorer.calculate_final_score(
-                    enriched_candidate, overview_data, whale_analysis, volume_price_analysis,
-                    community_boost_analysis, security_analysis, trading_activity,
-                    dex_analysis, first_100_analysis, graduation_analysis
+                    enriched_candidate, **scoring_inputs
                 )
                 self.logger.debug(f"🚀 Used ENHANCED scoring (with OHLCV) for {enriched_candidate.get('symbol', 'Unknown')}")
-                
-                # Track enhanced scoring usage
-                self.cost_tracking['enhanced_scoring_used'] += 1
-                self.cost_tracking['ohlcv_calls_made'] += 2  # Estimate 2 OHLCV calls per token (15m, 30m)
-                self.cost_tracking['api_cost_level_by_stage']['stage4_expensive'] += 1
+                self._track_enhanced_scoring()
                 
             else:
                 # Early phases: Use cost-optimized basic scoring (no OHLCV)
                 final_score, scoring_breakdown = self.early_gem_scorer.calculate_basic_velocity_score(
-                    enriched_candidate, overview_data, volume_price_analysis, trading_activity
+                    enriched_candidate, scoring_inputs['overview_data'],
+                    scoring_inputs['volume_price_analysis'], scoring_inputs['trading_activity']
                 )
                 self.logger.debug(f"💰 Used BASIC scoring (cost-optimized) for {enriched_candidate.get('symbol', 'Unknown')}")
                 
@@ -2122,45 +2076,163 @@ class EarlyGemDetector:
                 self.cost_tracking['ohlcv_calls_saved'] += 2  # Would have made 2 OHLCV calls per token
                 self.cost_tracking['api_cost_level_by_stage']['stage2_medium'] += 1
             
-            # Add cost optimization metadata
-            scoring_breakdown['cost_optimization'] = {
-                'analysis_phase': 'deep_analysis' if is_deep_analysis_phase else 'early_filtering',
-                'ohlcv_data_used': is_deep_analysis_phase,
-                'scoring_method': 'enhanced' if is_deep_analysis_phase else 'basic_cost_optimized',
-                'api_cost_level': 'high' if is_deep_analysis_phase else 'low'
-            }
-            
-            # Extract velocity metrics from scoring breakdown (no separate calculation needed)
-            momentum_analysis = scoring_breakdown.get('momentum_analysis', {})
-            velocity_confidence = momentum_analysis.get('score_components', {}).get('velocity_confidence', {})
-            
-            return {
-                'candidate': enriched_candidate,  # Return enriched candidate with trading data
-                'final_score': final_score,
-                'scoring_breakdown': scoring_breakdown,
-                'conviction_level': self._get_conviction_level(final_score),
-                'analysis_timestamp': datetime.now().isoformat(),
-                'discovery_source': enriched_candidate.get('source', 'unknown'),
-                'enhanced_metrics': {
-                    'velocity_score': momentum_analysis.get('score', 0) / 38.0,  # Normalize to 0-1 scale
-                    'velocity_confidence': velocity_confidence,
-                    'momentum_breakdown': {
-                        'volume_acceleration': momentum_analysis.get('score_components', {}).get('volume_acceleration', 0),
-                        'momentum_cascade': momentum_analysis.get('score_components', {}).get('momentum_cascade', 0),
-                        'activity_surge': momentum_analysis.get('score_components', {}).get('activity_surge', 0)
-                    },
-                    'first_100_score': self._calculate_first_100_score(first_100_analysis),
-                    'liquidity_quality': self._calculate_liquidity_quality(enriched_candidate),
-                    'graduation_risk': self._calculate_graduation_risk(enriched_candidate)
-                },
-                'confidence_adjusted_score': self._apply_confidence_adjustments(final_score, velocity_confidence),
-                'data_quality_assessment': self._assess_overall_data_quality(enriched_candidate)
-            }
+            analysis_result = self._build_analysis_result(enriched_candidate, final_score)
+            self._attach_scoring_breakdown(analysis_result, scoring_breakdown, is_deep_analysis_phase,
+                                           scoring_inputs['first_100_analysis'])
+            return analysis_result
             
         except Exception as e:
             self.logger.error(f"Enhanced analysis failed for {candidate.get('address', '')}: {e}")
             return None
     
+    def _build_scoring_inputs(self, enriched_candidate: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Analysis inputs for ``calculate_final_score``, keyed by its parameter names"""
+        # Regular analysis for other candidates
+        # Build analysis data structure
+        overview_data = {
+            'symbol': enriched_candidate.get('symbol', ''),
+            'name': enriched_candidate.get('name', ''),
+            'address': enriched_candidate.get('address', ''),
+            'market_cap': enriched_candidate.get('market_cap', 0),
+            'price': enriched_candidate.get('price', 0),
+            'total_supply': enriched_candidate.get('total_supply', 0),
+            'unique_wallet_24h': enriched_candidate.get('unique_wallet_24h', 0),
+            'whale_activity_score': self._calculate_whale_score(enriched_candidate),
+            'liquidity': enriched_candidate.get('liquidity', 0),
+            'volume_24h': enriched_candidate.get('volume_24h', 0)
+        }
+        
+        whale_analysis = {
+            'whale_holders_5sol_plus': enriched_candidate.get('whale_holders_5sol_plus', 0),
+            'whale_concentration_score': enriched_candidate.get('whale_concentration_score', 0),
+            'estimated_dev_holdings': enriched_candidate.get('dev_current_holdings_pct', 0)
+        }
+        
+        # Fix data structure mismatch - extract string values for momentum scoring
+        volume_trend_dict = self._analyze_volume_trend(enriched_candidate)
+        price_momentum_dict = self._analyze_price_momentum(enriched_candidate)
+        
+        volume_price_analysis = {
+            'volume_trend': volume_trend_dict.get('volume_trend', 'unknown'),  # Extract string value
+            'price_momentum': price_momentum_dict.get('momentum_strength', 'neutral'),  # Extract string value (correct field)
+            'velocity_score': 0.0,  # Will be updated after scoring calculation
+            'volume_24h': enriched_candidate.get('volume_24h', 0),
+            'volume_1h': enriched_candidate.get('volume_1h', 0),
+            # Keep original dicts for debugging
+            'volume_trend_details': volume_trend_dict,
+            'price_momentum_details': price_momentum_dict
+        }
+        
+        community_boost_analysis = {
+            'community_score': self._calculate_community_score(enriched_candidate),
+            'holders_growth': enriched_candidate.get('holders_growth_24h', 0),
+            'retention_rate': enriched_candidate.get('retention_rate_24h', 0),
+            'social_sentiment': 'positive'
+        }
+        
+        security_analysis = {
+            'security_score': self._calculate_security_score(enriched_candidate),
+            'dev_behavior_score': 85.0,
+            'contract_security': 'verified',
+            'liquidity_locked': True
+        }
+        
+        # Fix trading activity data structure for momentum scoring
+        activity_score_raw = self._calculate_activity_score(enriched_candidate)  # Returns 0-1
+        
+        trading_activity = {
+            'recent_activity_score': activity_score_raw * 100,  # Scale to 0-100 range for momentum scoring
+            'buy_sell_ratio': 1.0,  # Default neutral ratio (no buy/sell data available)
+            'trades_24h': enriched_candidate.get('trades_24h', 0),
+            'unique_traders': enriched_candidate.get('unique_traders_24h', 0),
+            'avg_trade_size': enriched_candidate.get('avg_trade_size_usd', 0)
+        }
+        
+        dex_analysis = {
+            'dex_presence': ['raydium'] if 'raydium' in enriched_candidate.get('platforms', []) else [],
+            'liquidity_quality': self._calculate_liquidity_quality(enriched_candidate)
+        }
+        
+        first_100_analysis = {
+            'first_100_score': self._calculate_first_100_score({'retention_pct': 60, 'diamond_hands_score': 5}),
+            'retention_pct': 60,
+            'diamond_hands_score': 5
+        }
+        
+        graduation_analysis = {
+            'graduation_risk': self._calculate_graduation_risk(enriched_candidate),
+            'graduation_progress': enriched_candidate.get('graduation_progress_pct', 0),
+            'graduation_confidence': enriched_candidate.get('graduation_confidence', 0.7),
+            'graduation_barriers': enriched_candidate.get('graduation_barriers', []),
+            'graduation_catalysts': enriched_candidate.get('graduation_catalysts', []),
+            'momentum_sustainability': enriched_candidate.get('momentum_sustainability', 0.5),
+            'graduation_momentum_score': enriched_candidate.get('graduation_momentum_score', 0)
+        }
+        
+        return {
+            'overview_data': overview_data,
+            'whale_analysis': whale_analysis,
+            'volume_price_analysis': volume_price_analysis,
+            'community_boost_analysis': community_boost_analysis,
+            'security_analysis': security_analysis,
+            'trading_activity': trading_activity,
+            'dex_analysis': dex_analysis,
+            'first_100_analysis': first_100_analysis,
+            'graduation_analysis': graduation_analysis
+        }
+    
+    def _track_enhanced_scoring(self) -> None:
+        """Count one token scored with the OHLCV-enhanced scoring"""
+        self.cost_tracking['enhanced_scoring_used'] += 1
+        self.cost_tracking['ohlcv_calls_made'] += 2  # Estimate 2 OHLCV calls per token (15m, 30m)
+        self.cost_tracking['api_cost_level_by_stage']['stage4_expensive'] += 1
+    
+    def _build_analysis_result(self, enriched_candidate: Dict[str, Any], final_score: float) -> Dict[str, Any]:
+        """Analysis result without the scoring breakdown (see ``_attach_scoring_breakdown``)"""
+        return {
+            'candidate': enriched_candidate,  # Return enriched candidate with trading data
+            'final_score': final_score,
+            'conviction_level': self._get_conviction_level(final_score),
+            'analysis_timestamp': datetime.now().isoformat(),
+            'discovery_source': enriched_candidate.get('source', 'unknown'),
+            'data_quality_assessment': self._assess_overall_data_quality(enriched_candidate)
+        }
+    
+    def _attach_scoring_breakdown(self, analysis_result: Dict[str, Any], scoring_breakdown: Dict[str, Any],
+                                  is_deep_analysis_phase: bool, first_100_analysis: Dict[str, Any]) -> None:
+        """Add the scoring breakdown and the metrics derived from it to an analysis result"""
+        enriched_candidate = analysis_result['candidate']
+        final_score = analysis_result['final_score']
+        
+        # Add cost optimization metadata
+        scoring_breakdown['cost_optimization'] = {
+            'analysis_phase': 'deep_analysis' if is_deep_analysis_phase else 'early_filtering',
+            'ohlcv_data_used': is_deep_analysis_phase,
+            'scoring_method': 'enhanced' if is_deep_analysis_phase else 'basic_cost_optimized',
+            'api_cost_level': 'high' if is_deep_analysis_phase else 'low'
+        }
+        
+        # Extract velocity metrics from scoring breakdown (no separate calculation needed)
+        momentum_analysis = scoring_breakdown.get('momentum_analysis', {})
+        velocity_confidence = momentum_analysis.get('score_components', {}).get('velocity_confidence', {})
+        
+        analysis_result.update({
+            'scoring_breakdown': scoring_breakdown,
+            'enhanced_metrics': {
+                'velocity_score': momentum_analysis.get('score', 0) / 38.0,  # Normalize to 0-1 scale
+                'velocity_confidence': velocity_confidence,
+                'momentum_breakdown': {
+                    'volume_acceleration': momentum_analysis.get('score_components', {}).get('volume_acceleration', 0),
+                    'momentum_cascade': momentum_analysis.get('score_components', {}).get('momentum_cascade', 0),
+                    'activity_surge': momentum_analysis.get('score_components', {}).get('activity_surge', 0)
+                },
+                'first_100_score': self._calculate_first_100_score(first_100_analysis),
+                'liquidity_quality': self._calculate_liquidity_quality(enriched_candidate),
+                'graduation_risk': self._calculate_graduation_risk(enriched_candidate)
+            },
+            'confidence_adjusted_score': self._apply_confidence_adjustments(final_score, velocity_confidence)
+        })
+    
     async def _analyze_single_candidate_with_enriched_data(self, enriched_candidate: Dict[str, Any], original_candidate: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Enhanced candidate analysis using pre-enriched data from batch processing"""
         try:
@@ -4519,6 +4591,11 @@ class EarlyGemDetector:
                 self.logger.info("🔍 Step 1: Multi-platform token discovery")
                 all_candidates = await self.discover_early_tokens()
             
+            # Feed the popularity sketch and make sure the prefetcher is warming hot tokens
+            if getattr(self, 'cache_prefetcher', None):
+                self.token_popularity.record_many(c.get('address') for c in all_candidates)
+                self.cache_prefetcher.start()
+            
             # Step 2: Enrich graduated tokens with DexScreener and Birdeye data  
             with self.enhanced_logger.stage_context(DetectionStage.ANALYSIS, 
                                                    operation="token_enrichment",
@@ -4672,10 +4749,8 @@ class EarlyGemDetector:
                             enhanced_token['analysis_tier'] = 'basic'  # Mark as basic analysis only
                     
                     # Dynamic threshold for trending tokens
-                    effective_threshold = self.high_conviction_threshold
+                    effective_threshold = self._alert_threshold(enhanced_token)
                     token_source = enhanced_token.get('source', 'unknown')
-                    if token_source == 'birdeye_trending':
-                        effective_threshold = max(25.0, self.high_conviction_threshold - 10)  # Lower threshold for trending
                     
                     if self.debug_mode:
                         token_symbol = enhanced_token.get('symbol', 'NO_SYMBOL')
@@ -5129,6 +5204,8 @@ class EarlyGemDetector:
     async def cleanup(self):
         """Cleanup resources"""
         try:
+            if getattr(self, 'cache_prefetcher', None):
+                await self.cache_prefetcher.stop()
             if hasattr(self, 'cache_manager'):
                 await self.cache_manager.cleanup()
         except Exception as e:
@@ -5316,8 +5393,23 @@ class EarlyGemDetector:
             if BatchAPIManager and self.birdeye_api:
                 self.batch_api_manager = BatchAPIManager(self.birdeye_api, self.logger)
                 self.logger.info("🚀 Batch API Manager initialized - efficient batching enabled")
+                
+                # Keep overview/price cache warm for tokens that keep reappearing across cycles
+                # (opt-in: the background refresh spends API calls between cycles)
+                prefetch_config = self.config.get('CACHING', {}).get('predictive_prefetch', {})
+                self.token_popularity = PopularitySketch()
+                if prefetch_config.get('enabled', False):
+                    self.cache_prefetcher = CachePrefetcher(
+                        self.batch_api_manager, self.token_popularity, logger=self.logger,
+                        hot_tokens=prefetch_config.get('max_prefetch_tokens', 30),
+                        min_popularity=prefetch_config.get('popularity_threshold', 2),
+                        interval=prefetch_config.get('prefetch_interval', 20.0)
+                    )
+                else:
+                    self.cache_prefetcher = None
             else:
                 self.batch_api_manager = None
+                self.cache_prefetcher = None
                 self.logger.warning("⚠️ Batch API Manager not available")
             
         except Exception as e:
@@ -6833,131 +6925,14 @@ class EarlyGemDetector:
         """
         if not candidates:
             return []
-            
-        high_priority_candidates = []
-        
-        for candidate in candidates:
-            try:
-                priority_score = 0
-                source = candidate.get('source', 'unknown')
-                
-                # === SOURCE-SPECIFIC SMART SCORING ===
-                
-                if source == 'moralis_graduated':
-                    # Rich data available - use it effectively
-                    hours_since_grad = candidate.get('hours_since_graduation', 999)
-                    market_cap = candidate.get('market_cap', 0)
-                    liquidity = candidate.get('liquidity', 0)
-                    
-                    # Time-sensitive fresh graduate bonus (CRITICAL)
-                    if hours_since_grad <= 1:
-                        priority_score += 40  # Ultra-fresh graduates
-                    elif hours_since_grad <= 6:
-                        priority_score += 25  # Fresh graduates
-                    elif hours_since_grad <= 12:
-                        priority_score += 15  # Recent graduates
-                    
-                    # Market validation (using available data)
-                    if 50000 <= market_cap <= 2000000:
-                        priority_score += 20  # Sweet spot
-                    elif 10000 <= market_cap <= 50000:
-                        priority_score += 15  # Early stage
-                    elif market_cap > 2000000:
-                        priority_score += 5   # Larger but still valid
-                    
-                    # Liquidity validation
-                    if liquidity > 50000:
-                        priority_score += 15  # Good liquidity
-                    elif liquidity > 10000:
-                        priority_score += 10  # Decent liquidity
-                    elif liquidity > 1000:
-                        priority_score += 5   # Minimal liquidity
-                
-                elif source == 'moralis_bonding':
-                    # Use bonding curve proximity (TIME-CRITICAL)
-                    bonding_progress = candidate.get('bonding_curve_progress', 0)
-                    market_cap = candidate.get('market_cap', 0)
-                    
-                    # Graduation proximity scoring (HIGHEST PRIORITY)
-                    if bonding_progress >= 95:
-                        priority_score += 50  # Imminent graduation
-                    elif bonding_progress >= 90:
-                        priority_score += 35  # Very close
-                    elif bonding_progress >= 85:
-                        priority_score += 25  # Close
-                    elif bonding_progress >= 75:
-                        priority_score += 15  # Promising
-                    elif bonding_progress >= 50:
-                        priority_score += 10  # Mid-stage
-                    
-                    # Market cap validation for bonding tokens
-                    if 5000 <= market_cap <= 500000:
-                        priority_score += 15  # Good range for bonding
-                    elif market_cap < 5000 and market_cap > 0:
-                        priority_score += 10  # Very early
-                
-                elif source == 'birdeye_trending':
-                    # Already trending = validated by market
-                    priority_score += 30  # Base trending bonus
-                    
-                elif source == 'sol_bonding_detector':
-                    # SOL ecosystem strength
-                    priority_score += 20  # Base SOL bonus
-                
-                # === UNIVERSAL QUALITY INDICATORS ===
-                
-                # Address validation
-                if candidate.get('address') and len(candidate.get('address', '')) == 44:
-                    priority_score += 5  # Valid Solana address
-                
-                # Symbol quality
-                symbol = candidate.get('symbol', '')
-                if symbol and symbol != 'Unknown' and len(symbol) <= 10:
-                    priority_score += 3  # Reasonable symbol
-                
-                # Age bonus (prefer newer tokens for early gems)
-                age_minutes = candidate.get('estimated_age_minutes', 999)
-                if age_minutes <= 60:
-                    priority_score += 8   # Ultra-fresh
-                elif age_minutes <= 360:
-                    priority_score += 5   # Very fresh
-                elif age_minutes <= 1440:
-                    priority_score += 2   # Fresh (24h)
-                
-                # === FILTERING LOGIC ===
-                candidate['discovery_priority_score'] = priority_score
-                candidate['triage_stage'] = 'smart_discovery_triage'
-                
-                # Dynamic thresholds based on source expectations
-                if source == 'moralis_graduated':
-                    threshold = 25  # Rich data available
-                elif source == 'moralis_bonding':
-                    threshold = 30  # Time-critical opportunities
-                elif source == 'birdeye_trending':
-                    threshold = 30  # Already validated
-                else:
-                    threshold = 20  # Conservative for others
-                
-                if priority_score >= threshold:
-                    high_priority_candidates.append(candidate)
-                    self.logger.debug(f"   ✅ {candidate.get('symbol', 'Unknown')} priority: {priority_score} (threshold: {threshold})")
-                else:
-                    self.logger.debug(f"   ❌ {candidate.get('symbol', 'Unknown')} priority: {priority_score} < {threshold}")
-                    
-            except Exception as e:
-                self.logger.debug(f"Error in smart discovery triage for {candidate.get('symbol', 'Unknown')}: {e}")
-                # Keep candidate if scoring fails (better safe than sorry)
-                candidate['discovery_priority_score'] = 20
-                candidate['triage_stage'] = 'smart_triage_error'
-                high_priority_candidates.append(candidate)
         
-        # Sort by priority score and limit to top candidates
-        sorted_candidates = sorted(high_priority_candidates, 
-                                  key=lambda x: x.get('discovery_priority_score', 0), 
-                                  reverse=True)
+        triage_scorer = getattr(self, 'triage_scorer', None)
+        if triage_scorer is None:
+            TriageScorer = load_triage_scorer()
+            triage_scorer = self.triage_scorer = TriageScorer(logger=self.logger)
         
-        # Target 35 top candidates for Stage 2
-        limited_candidates = sorted_candidates[:35]
+        # Whole batch scored at once from the compiled rule tables; top candidates for Stage 2
+        limited_candidates = triage_scorer.triage(candidates)
         
         self.logger.info(f"   🎯 Smart discovery triage: {len(candidates)} → {len(limited_candidates)} candidates")
         if limited_candidates:
@@ -7147,6 +7122,82 @@ class EarlyGemDetector:
             self.logger.warning(f"Error in OHLCV analysis for {candidate.get('symbol', 'Unknown')}: {e}")
             return None
     
+    async def _analyze_candidates_with_scoring_plan(self, candidates: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Stage 4 analysis scoring all candidates in one ``EarlyGemScoringPlan`` batch.
+        
+        Candidates are enriched one by one as in ``_analyze_single_candidate_with_ohlcv``.
+        The full scoring breakdown is only built for candidates that reach their
+        alert threshold; the rest are only listed by score.
+        
+        Returns:
+            One analysis result per candidate, in order (None when its analysis failed)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(candidates)
+        prepared = []
+        for i, candidate in enumerate(candidates):
+            try:
+                # Mark as deep analysis phase for OHLCV scoring
+                candidate['deep_analysis_phase'] = True
+                candidate['stage4_ohlcv_analysis'] = True
+                
+                enriched_candidate = await self._enrich_single_token(candidate)
+                if not enriched_candidate:
+                    enriched_candidate = candidate  # Fallback to original if enrichment fails
+                prepared.append((i, enriched_candidate, self._build_scoring_inputs(enriched_candidate)))
+            except Exception as e:
+                self.logger.warning(f"Error in OHLCV analysis for {candidate.get('symbol', 'Unknown')}: {e}")
+            
+            # Rate limiting for expensive OHLCV enrichment
+            if i < len(candidates) - 1:
+                await asyncio.sleep(0.3)  # Conservative rate limiting
+        
+        if not prepared:
+            return results
+        
+        try:
+            plan_scores = self.scoring_plan.score_batch(
+                [enriched_candidate for _, enriched_candidate, _ in prepared],
+                [scoring_inputs['security_analysis'] for _, _, scoring_inputs in prepared],
+                [scoring_inputs['dex_analysis'] for _, _, scoring_inputs in prepared]
+            )
+        except Exception as e:
+            # One bad candidate fails the whole batch, so score them one at a time to isolate it
+            self.logger.warning(f"Batch scoring failed, scoring {len(prepared)} candidates individually: {e}")
+            plan_scores = []
+            for _, enriched_candidate, scoring_inputs in prepared:
+                try:
+                    plan_scores.extend(self.scoring_plan.score_batch(
+                        [enriched_candidate], [scoring_inputs['security_analysis']], [scoring_inputs['dex_analysis']]
+                    ))
+                except Exception as candidate_error:
+                    self.logger.error(f"Enhanced scoring failed for {enriched_candidate.get('symbol', 'Unknown')} "
+                                      f"({enriched_candidate.get('address', '')}): {candidate_error}")
+                    plan_scores.append(None)
+        
+        for (i, enriched_candidate, scoring_inputs), plan_score in zip(prepared, plan_scores):
+            if plan_score is None:
+                continue
+            try:
+                self.cost_tracking['total_tokens_processed'] += 1
+                self._track_enhanced_scoring()
+                
+                analysis_result = self._build_analysis_result(enriched_candidate, plan_score.final_score)
+                if plan_score.final_score >= self._alert_threshold(enriched_candidate):
+                    self._attach_scoring_breakdown(analysis_result, plan_score.breakdown, True,
+                                                   scoring_inputs['first_100_analysis'])
+                results[i] = analysis_result
+            except Exception as e:
+                self.logger.error(f"Enhanced analysis failed for {enriched_candidate.get('address', '')}: {e}")
+        
+        return results
+    
+    def _alert_threshold(self, token: Dict[str, Any]) -> float:
+        """High conviction threshold for a token (lower for Birdeye trending tokens)"""
+        if token.get('source', 'unknown') == 'birdeye_trending':
+            return max(25.0, self.high_conviction_threshold - 10)  # Lower threshold for trending
+        return self.high_conviction_threshold
+    
     async def _stage3_market_validation(self, top_candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         🎯 STAGE 3: Market Validation (NO OHLCV)
@@ -7238,12 +7289,18 @@ class EarlyGemDetector:
         
         final_candidates = []
         
+        # Score the whole batch through the compiled plan when it is available
+        batch_results = await self._analyze_candidates_with_scoring_plan(stage3_candidates) if self.scoring_plan else None
+        
         for i, candidate in enumerate(stage3_candidates):
             try:
                 self.logger.debug(f"🔥 Stage 4 OHLCV analysis [{i+1}/{len(stage3_candidates)}]: {candidate.get('symbol', 'Unknown')}")
                 
                 # Full analysis with OHLCV data
-                analysis_result = await self._analyze_single_candidate_with_ohlcv(candidate)
+                if batch_results is not None:
+                    analysis_result = batch_results[i]
+                else:
+                    analysis_result = await self._analyze_single_candidate_with_ohlcv(candidate)
                 
                 if analysis_result:
                     # Mark as final analyzed
@@ -7274,8 +7331,8 @@ class EarlyGemDetector:
                     
                     final_candidates.append(analysis_result)
                 
-                # Rate limiting for expensive OHLCV analysis
-                if i < len(stage3_candidates) - 1:
+                # Rate limiting for expensive OHLCV analysis (the batch path already paced its enrichment)
+                if batch_results is None and i < len(stage3_candidates) - 1:
                     await asyncio.sleep(0.3)  # Conservative rate limiting
                     
             except Exception as e:
@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+"""
+⚡ Compiled Early Gem Scoring Plan
+EarlyGemFocusedScoring's enhanced score evaluated over whole candidate batches
+
+The plan is compiled once from the scorer's caps and the scoring tables below
+(the same thresholds the hand-written ``calculate_final_score`` helpers use)
+and scores a batch from columnar numpy arrays, without building the nested
+breakdown dict. Every step performs the same float operations in the same
+order as the reference path, so scores match it exactly. The breakdown is
+produced lazily through the scorer only for results that are displayed or
+alerted on.
+
+Candidates carrying values the columnar path cannot mirror exactly (missing
+numbers replaced by None, strings, NaN/inf, ...) are scored through the
+reference path instead, which also keeps its error behaviour.
+"""
+
+import logging
+import math
+from numbers import Real
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+TIMEFRAMES = ('5m', '15m', '30m', '1h', '6h', '24h')
+
+# Ladders: ordered bands, the first matching band awards its points (if/elif
+# semantics); bounds use gt/gte/lt/lte so the original edges are preserved.
+# Tiers: (multiple, points) pairs awarded when ``lhs > rhs * multiple``.
+EARLY_GEM_SCORING_TABLES: Dict[str, Any] = {
+    'early_platforms': {
+        'base_points': {'pump_fun': 15, 'launchlab': 12, 'moralis_graduated': 8, 'birdeye_trending': 6, 'default': 3},
+        'pump_fun_velocity': [
+            {'gt': 5000, 'points': 12}, {'gt': 2000, 'points': 10}, {'gt': 500, 'points': 6}, {'gt': 100, 'points': 3},
+        ],
+        'launchlab_velocity': [
+            {'gt': 10, 'points': 12}, {'gt': 5, 'points': 10}, {'gt': 2, 'points': 6}, {'gt': 0.5, 'points': 3},
+        ],
+        'pump_fun_stage_markers': [('STAGE_0_ULTRA_EARLY', 10), ('STAGE_0_EARLY_MOMENTUM', 8), ('STAGE_1_CONFIRMED', 5)],
+        'pump_fun_stage_default': 3,
+        'launchlab_stage': [
+            {'gte': 0, 'lt': 3, 'points': 10}, {'gte': 3, 'lt': 10, 'points': 8}, {'gte': 10, 'lt': 25, 'points': 6},
+            {'gte': 25, 'lt': 50, 'points': 4}, {'gte': 50, 'lt': 70, 'points': 2},
+        ],
+        'launchlab_stage_default': -2,
+        'age': [
+            {'lte': 5, 'points': 6}, {'lte': 15, 'points': 5}, {'lte': 30, 'points': 4},
+            {'lte': 60, 'points': 3}, {'lte': 180, 'points': 1},
+        ],
+        'graduation': [
+            {'gt': 85, 'points': -3}, {'gt': 70, 'points': -1},
+            {'gte': 50, 'lte': 80, 'points': 4}, {'gte': 20, 'lt': 50, 'points': 2},
+        ],
+        'graduation_default': 1,
+        'caps': {'base': 20, 'velocity': 12, 'stage': 10, 'age': 6, 'graduation': 4},
+    },
+    'momentum_signals': {
+        'volume_acceleration': {
+            'short_term': [(2, 0.15), (1.5, 0.10), (1, 0.05)],      # 5m hourly rate vs 1h
+            'sustained': [(3, 0.12), (2, 0.08), (1.5, 0.04)],       # 1h vs 6h hourly average
+            'recent': [(2, 0.08), (1.3, 0.04)],                     # 6h vs 24h hourly average
+            'absolute_1h': [{'gt': 50000, 'points': 0.05}, {'gt': 20000, 'points': 0.02}],
+            'cap': 0.4, 'scale': 37.5, 'max_points': 15,
+        },
+        'momentum_cascade': {
+            'short_term_all_positive': [{'gt': 10, 'points': 0.15}, {'gt': 5, 'points': 0.10}],
+            'short_term_all_positive_default': 0.05,
+            'short_term_majority': 0.03,
+            'sustained': [((15, 10), 0.12), ((8, 5), 0.08), ((3, 2), 0.04)],  # (1h, 6h) minimums
+            'one_hour_only': [{'gt': 20, 'points': 0.08}, {'gt': 10, 'points': 0.05}, {'gt': 5, 'points': 0.02}],
+            'daily_gain': [{'gt': 50, 'points': 0.05}, {'gt': 25, 'points': 0.03}],
+            'daily_loss': (-20, -0.05),
+            'acceleration': 0.05,
+            'floor': -0.1, 'cap': 0.35, 'scale': 37.14, 'max_points': 13,
+        },
+        'activity_surge': {
+            'trades_5m': [{'gt': 20, 'points': 0.10}, {'gt': 10, 'points': 0.06}, {'gt': 5, 'points': 0.03}],
+            'trades_1h': [{'gt': 200, 'points': 0.08}, {'gt': 100, 'points': 0.05}, {'gt': 50, 'points': 0.02}],
+            'diversity': [((100, 500), 0.05), ((50, 200), 0.02)],  # (unique traders, 24h trades) minimums
+            'cap': 0.25, 'scale': 40.0, 'max_points': 10,
+        },
+        'confidence_multipliers': {'EARLY_DETECTION': 1.05, 'HIGH': 1.02, 'VERY_LOW': 0.95},
+    },
+    'safety_validation': {
+        'security_scale': 12, 'risk_factor_penalty': 2, 'default_security': 8,
+        'dex_presence_max': 7, 'default_dex': 5,
+        'liquidity_quality': [{'gte': 80, 'points': 3}, {'gte': 60, 'points': 2}, {'gte': 40, 'points': 1}],
+    },
+    'cross_platform_bonus': {'points_per_platform': 3},
+}
+
+_BOUND_OPERATORS = {
+    'gt': np.greater,
+    'gte': np.greater_equal,
+    'lt': np.less,
+    'lte': np.less_equal,
+}
+
+# Ints beyond this lose precision as float64, so the columnar path cannot mirror them
+_EXACT_INT_LIMIT = 2 ** 53
+
+# Value types converted straight to float64 columns (anything else goes through ``_exact_float``)
+_PLAIN_NUMBERS = frozenset((int, float, bool))
+
+
+class _Ladder:
+    """A threshold ladder compiled to numpy condition/choice arrays"""
+
+    def __init__(self, bands: List[Dict[str, Any]], default: float = 0):
+        self.bounds = [[(op, band[name]) for name, op in _BOUND_OPERATORS.items() if name in band] for band in bands]
+        self.points = [band['points'] for band in bands]
+        self.default = default
+
+    def evaluate(self, values: np.ndarray) -> np.ndarray:
+        conditions = []
+        for bound_checks in self.bounds:
+            condition = np.ones(values.shape, dtype=bool)
+            for op, bound in bound_checks:
+                condition &= op(values, bound)
+            conditions.append(condition)
+        return np.select(conditions, self.points, default=self.default)
+
+
+def _tiers(lhs: np.ndarray, rhs: np.ndarray, tiers: Sequence[Tuple[float, float]]) -> np.ndarray:
+    """Points of the first tier with ``lhs > rhs * multiple`` (0 when none)"""
+    return np.select([lhs > rhs * multiple for multiple, _ in tiers], [points for _, points in tiers], default=0.0)
+
+
+def _exact_float(value: Any) -> Optional[float]:
+    """The value as float64 when the conversion is exact and finite, else None"""
+    if not isinstance(value, Real):
+        return None
+    if isinstance(value, int) and abs(value) >= _EXACT_INT_LIMIT:
+        return None
+    converted = float(value)
+    return converted if math.isfinite(converted) else None
+
+
+class PlanScore:
+    """One candidate's enhanced score with its breakdown produced on demand"""
+
+    __slots__ = ('candidate', 'final_score', 'early_platform_score', 'momentum_score', 'safety_score',
+                 'validation_bonus', 'confidence_level', '_plan', '_security_analysis', '_dex_analysis', '_breakdown')
+
+    def __init__(self, plan: 'EarlyGemScoringPlan', candidate: Dict[str, Any], security_analysis: Optional[Dict[str, Any]],
+                 dex_analysis: Optional[Dict[str, Any]], final_score: float, components: Optional[Tuple[float, float, float, float]],
+                 confidence_level: Optional[str], breakdown: Optional[Dict[str, Any]] = None):
+        self._plan = plan
+        self.candidate = candidate
+        self._security_analysis = security_analysis
+        self._dex_analysis = dex_analysis
+        self.final_score = final_score
+        self._breakdown = breakdown
+        if components is None:
+            components = (
+                breakdown['early_platform_analysis']['score'],
+                breakdown['momentum_analysis']['score'],
+                breakdown['safety_validation']['score'],
+                breakdown['cross_platform_bonus']['score'],
+            )
+            confidence_level = breakdown['momentum_analysis'].get('confidence_level')
+        self.early_platform_score, self.momentum_score, self.safety_score, self.validation_bonus = components
+        self.confidence_level = confidence_level
+
+    @property
+    def breakdown(self) -> Dict[str, Any]:
+        """Full ``calculate_final_score`` breakdown, built on first access"""
+        if self._breakdown is None:
+            final_score, self._breakdown = self._plan.reference_score(
+                self.candidate, self._security_analysis, self._dex_analysis
+            )
+            if final_score != self.final_score:
+                self._plan.logger.warning(
+                    f"⚠️ Scoring plan diverged for {self.candidate.get('symbol', 'Unknown')}: "
+                    f"{self.final_score} vs {final_score}"
+                )
+        return self._breakdown
+
+    def as_tuple(self) -> Tuple[float, Dict[str, Any]]:
+        """``(final_score, scoring_breakdown)`` like ``calculate_final_score``"""
+        return self.final_score, self.breakdown
+
+
+class EarlyGemScoringPlan:
+    """
+    Compiled batch form of ``EarlyGemFocusedScoring.calculate_final_score``.
+
+    ``score_batch`` depends only on the candidates and their security/DEX
+    analyses (the other ``calculate_final_score`` inputs do not affect the
+    score) and returns one ``PlanScore`` per candidate.
+    """
+
+    def __init__(self, scorer: Any, logger: Optional[logging.Logger] = None):
+        self.scorer = scorer
+        self.logger = logger or logging.getLogger('EarlyGemScoringPlan')
+        tables = EARLY_GEM_SCORING_TABLES
+        max_points = scorer.MAX_POINTS
+        self.normalization = float(sum(max_points.values()))
+
+        platforms = tables['early_platforms']
+        self._base_points = platforms['base_points']
+        self._pump_velocity = _Ladder(platforms['pump_fun_velocity'])
+        self._launchlab_velocity = _Ladder(platforms['launchlab_velocity'])
+        self._stage_markers = platforms['pump_fun_stage_markers']
+        self._stage_default = platforms['pump_fun_stage_default']
+        self._launchlab_stage = _Ladder(platforms['launchlab_stage'], platforms['launchlab_stage_default'])
+        self._age = _Ladder(platforms['age'])
+        self._graduation = _Ladder(platforms['graduation'], platforms['graduation_default'])
+        self._platform_caps = platforms['caps']
+        self._platform_max = float(max_points['early_platforms'])
+
+        momentum = tables['momentum_signals']
+        self._volume = momentum['volume_acceleration']
+        self._volume_absolute = _Ladder(self._volume['absolute_1h'])
+        self._cascade = momentum['momentum_cascade']
+        self._cascade_short = _Ladder(self._cascade['short_term_all_positive'], self._cascade['short_term_all_positive_default'])
+        self._cascade_one_hour = _Ladder(self._cascade['one_hour_only'])
+        self._cascade_daily = _Ladder(self._cascade['daily_gain'])
+        self._activity = momentum['activity_surge']
+        self._trades_5m = _Ladder(self._activity['trades_5m'])
+        self._trades_1h = _Ladder(self._activity['trades_1h'])
+        self._confidence_multipliers = momentum['confidence_multipliers']
+        self._momentum_max = float(max_points['momentum_signals'])
+
+        self._safety = tables['safety_validation']
+        self._liquidity_quality = _Ladder(self._safety['liquidity_quality'])
+        self._safety_max = max_points['safety_validation']
+
+        self._points_per_platform = tables['cross_platform_bonus']['points_per_platform']
+        self._validation_max = max_points['cross_platform_bonus']
+
+    def reference_score(self, candidate: Dict[str, Any], security_analysis: Optional[Dict[str, Any]],
+                        dex_analysis: Optional[Dict[str, Any]]) -> Tuple[float, Dict[str, Any]]:
+        """Score one candidate through the scorer's hand-written path"""
+        return self.scorer.calculate_final_score(candidate, {}, {}, {}, {}, security_analysis, {}, dex_analysis)
+
+    # ==============================================
+    # COLUMN EXTRACTION
+    # ==============================================
+
+    @staticmethod
+    def _column(values: List[Any], used: np.ndarray, fallback: np.ndarray) -> np.ndarray:
+        """Numeric column; rows that use a value the columnar path cannot mirror are flagged for fallback"""
+        if all(type(value) in _PLAIN_NUMBERS for value in values):
+            column = np.array(values, dtype=np.float64)
+        else:
+            column = np.array([_exact_float(value) for value in values], dtype=np.float64)  # None -> NaN
+        invalid = ~np.isfinite(column) | (np.abs(column) >= _EXACT_INT_LIMIT)
+        if invalid.any():
+            fallback |= invalid & used
+            column[invalid] = 0.0
+        return column
+
+    def _extract(self, candidates: List[Dict[str, Any]], security_analyses: Sequence[Optional[Dict[str, Any]]],
+                 dex_analyses: Sequence[Optional[Dict[str, Any]]]) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """Pull numeric columns and category codes out of the batch; returns (columns, fallback mask)"""
+        count = len(candidates)
+        kind = np.zeros(count, dtype=np.int8)        # 0 other, 1 pump.fun, 2 launchlab
+        source_points = np.zeros(count)
+        stage_points = np.zeros(count)
+        confidence_age: List[Any] = [0] * count
+        platform_count = [0] * count
+        fallback = np.zeros(count, dtype=bool)
+
+        base_points = self._base_points
+        estimate_age = self.scorer._estimate_token_age
+        for i, candidate in enumerate(candidates):
+            try:
+                source = candidate.get('source')
+                if source == 'pump_fun_stage0' or candidate.get('pump_fun_launch'):
+                    kind[i] = 1
+                    source_points[i] = base_points['pump_fun']
+                    stage = candidate.get('bonding_curve_stage', '')
+                    stage_points[i] = next((points for marker, points in self._stage_markers if marker in stage),
+                                           self._stage_default)
+                elif candidate.get('platform') == 'raydium_launchlab' or candidate.get('launchlab_stage'):
+                    kind[i] = 2
+                    source_points[i] = base_points['launchlab']
+                else:
+                    source_points[i] = base_points[source] if source in ('moralis_graduated', 'birdeye_trending') \
+                        else base_points['default']
+                confidence_age[i] = estimate_age(candidate)
+                platform_count[i] = len(candidate.get('platforms', []))
+            except Exception:
+                fallback[i] = True
+
+        everyone = np.ones(count, dtype=bool)
+        pump, launchlab = kind == 1, kind == 2
+        column = self._column
+        columns = {
+            'kind': kind,
+            'source_points': source_points,
+            'stage_points': stage_points,
+            'velocity': column([c.get('velocity', 0) for c in candidates], pump, fallback),
+            'velocity_per_hour': column([c.get('velocity_per_hour', 0) for c in candidates], launchlab, fallback),
+            'sol_raised_estimated': column([c.get('sol_raised_estimated', 0) for c in candidates], launchlab, fallback),
+            'estimated_age_minutes': column([c.get('estimated_age_minutes', 9999) for c in candidates], everyone, fallback),
+            'graduation_progress_pct': column([c.get('graduation_progress_pct', 0) for c in candidates], everyone, fallback),
+            'confidence_age': column(confidence_age, everyone, fallback),
+            'platform_count': np.array(platform_count, dtype=np.float64),
+            'unique_traders': column([c.get('unique_traders_24h', c.get('unique_traders', 0)) for c in candidates],
+                                     everyone, fallback),
+        }
+        for timeframe in TIMEFRAMES:
+            for prefix in ('volume', 'price_change', 'trades'):
+                key = f'{prefix}_{timeframe}'
+                columns[key] = column([c.get(key, 0) for c in candidates], everyone, fallback)
+
+        has_security = np.array([bool(analysis) for analysis in security_analyses], dtype=bool)
+        has_dex = np.array([bool(analysis) for analysis in dex_analyses], dtype=bool)
+        risk_factor_count = [0] * count
+        for i, analysis in enumerate(security_analyses):
+            if analysis:
+                try:
+                    risk_factor_count[i] = len(analysis.get('risk_factors', []))
+                except Exception:
+                    fallback[i] = True
+        columns.update(
+            has_security=has_security,
+            has_dex=has_dex,
+            security_score=column([a.get('security_score', 100) if a else 0 for a in security_analyses], has_security, fallback),
+            risk_factor_count=np.array(risk_factor_count, dtype=np.float64),
+            dex_presence=column([a.get('dex_presence_score', 0) if a else 0 for a in dex_analyses], has_dex, fallback),
+            liquidity_quality=column([a.get('liquidity_quality_score', 0) if a else 0 for a in dex_analyses], has_dex, fallback),
+        )
+        return columns, fallback
+
+    # ==============================================
+    # COMPONENT SCORES
+    # ==============================================
+
+    def _early_platform_scores(self, c: Dict[str, np.ndarray]) -> np.ndarray:
+        caps = self._platform_caps
+        pump, launchlab = c['kind'] == 1, c['kind'] == 2
+        base = np.minimum(caps['base'], c['source_points'])
+        velocity = np.select([pump, launchlab],
+                             [self._pump_velocity.evaluate(c['velocity']),
+                              self._launchlab_velocity.evaluate(c['velocity_per_hour'])], default=0)
+        velocity = np.minimum(caps['velocity'], velocity)
+        stage = np.select([pump, launchlab],
+                          [c['stage_points'], self._launchlab_stage.evaluate(c['sol_raised_estimated'])], default=0)
+        stage = np.minimum(caps['stage'], stage)
+        age = np.minimum(caps['age'], self._age.evaluate(c['estimated_age_minutes']))
+        graduation = np.minimum(caps['graduation'], self._graduation.evaluate(c['graduation_progress_pct']))
+        total = base + velocity + stage + age + graduation
+        return np.minimum(self._platform_max, np.maximum(0.0, total))
+
+    def _confidence_levels(self, c: Dict[str, np.ndarray]) -> np.ndarray:
+        """Velocity confidence level, as ``_assess_velocity_data_confidence`` assigns it"""
+        available = {
+            tf: (c[f'volume_{tf}'] > 0) | (c[f'price_change_{tf}'] != 0) | (c[f'trades_{tf}'] > 0)
+            for tf in TIMEFRAMES
+        }
+        available_count = sum(available[tf].astype(np.int64) for tf in TIMEFRAMES)
+        coverage = (available_count / len(TIMEFRAMES)) * 100
+        age = c['confidence_age']
+
+        has_short_term = available['5m'] | available['15m'] | available['30m']
+        only_long_term = (available_count >= 1) & ~(has_short_term | available['1h']) & (available['6h'] | available['24h'])
+        ultra_early = np.select(
+            [has_short_term & (available_count >= 2), only_long_term, available_count >= 1],
+            ['EARLY_DETECTION', 'LOW', 'MEDIUM'], default='LOW')
+        early = np.select([coverage >= 80, coverage >= 50], ['HIGH', 'MEDIUM'], default='LOW')
+        established = np.select([coverage >= 80, coverage >= 60, coverage >= 30], ['HIGH', 'MEDIUM', 'LOW'], default='VERY_LOW')
+        mature = np.select([coverage >= 90, coverage >= 70, coverage >= 40], ['HIGH', 'MEDIUM', 'LOW'], default='VERY_LOW')
+        return np.select([age <= 30, age <= 120, age <= 720], [ultra_early, early, established], default=mature)
+
+    def _volume_acceleration(self, c: Dict[str, np.ndarray]) -> np.ndarray:
+        table = self._volume
+        vol_5m, vol_1h, vol_6h, vol_24h = c['volume_5m'], c['volume_1h'], c['volume_6h'], c['volume_24h']
+        hourly_rate_6h = vol_6h / 6
+        bonus = np.zeros(len(vol_1h))
+        bonus = bonus + np.where((vol_5m > 0) & (vol_1h > 0), _tiers(vol_5m * 12, vol_1h, table['short_term']), 0.0)
+        bonus = bonus + np.where((vol_1h > 0) & (vol_6h > 0), _tiers(vol_1h, hourly_rate_6h, table['sustained']), 0.0)
+        bonus = bonus + np.where((vol_6h > 0) & (vol_24h > 0), _tiers(hourly_rate_6h, vol_24h / 24, table['recent']), 0.0)
+        bonus = bonus + self._volume_absolute.evaluate(vol_1h)
+        return np.minimum(table['cap'], bonus)
+
+    def _momentum_cascade(self, c: Dict[str, np.ndarray]) -> np.ndarray:
+        table = self._cascade
+        p5, p15, p30 = c['price_change_5m'], c['price_change_15m'], c['price_change_30m']
+        p1h, p6h, p24h = c['price_change_1h'], c['price_change_6h'], c['price_change_24h']
+
+        positive_short_term = (p5 > 0).astype(np.int64) + (p15 > 0) + (p30 > 0)
+        average_short_term = (0 + p5 + p15 + p30) / 3
+        short_term = np.select(
+            [positive_short_term >= 3, positive_short_term >= 2],
+            [self._cascade_short.evaluate(average_short_term), table['short_term_majority']], default=0.0)
+
+        sustained = np.select([(p1h > h1) & (p6h > h6) for (h1, h6), _ in table['sustained']],
+                              [points for _, points in table['sustained']], default=0.0)
+        medium_term = np.select([(p1h > 0) & (p6h > 0), p1h > 0], [sustained, self._cascade_one_hour.evaluate(p1h)], default=0.0)
+
+        loss_bound, loss_points = table['daily_loss']
+        daily = np.select([p24h > 0, p24h < loss_bound], [self._cascade_daily.evaluate(p24h), loss_points], default=0.0)
+        accelerating = np.where((p5 > p1h) & (p1h > p6h) & (p6h > 0), table['acceleration'], 0.0)
+
+        bonus = np.zeros(len(p5)) + short_term + medium_term + daily + accelerating
+        return np.minimum(table['cap'], np.maximum(table['floor'], bonus))
+
+    def _activity_surge(self, c: Dict[str, np.ndarray]) -> np.ndarray:
+        table = self._activity
+        unique_traders, trades_24h = c['unique_traders'], c['trades_24h']
+        diversity = np.select([(unique_traders > traders) & (trades_24h > trades) for (traders, trades), _ in table['diversity']],
+                              [points for _, points in table['diversity']], default=0.0)
+        bonus = np.zeros(len(trades_24h)) + self._trades_5m.evaluate(c['trades_5m']) + self._trades_1h.evaluate(c['trades_1h']) + diversity
+        return np.minimum(table['cap'], bonus)
+
+    def _momentum_scores(self, c: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        volume = np.minimum(self._volume['max_points'], self._volume_acceleration(c) * self._volume['scale'])
+        cascade = np.minimum(self._cascade['max_points'], self._momentum_cascade(c) * self._cascade['scale'])
+        activity = np.minimum(self._activity['max_points'], self._activity_surge(c) * self._activity['scale'])
+        score = np.minimum(self._momentum_max, np.maximum(0.0, volume + cascade + activity))
+
+        levels = self._confidence_levels(c)
+        for level, multiplier in self._confidence_multipliers.items():
+            adjusted = score * multiplier
+            if multiplier > 1:
+                adjusted = np.minimum(self._momentum_max, adjusted)
+            score = np.where(levels == level, adjusted, score)
+        return score, levels
+
+    def _safety_scores(self, c: Dict[str, np.ndarray]) -> np.ndarray:
+        table = self._safety
+        security = np.maximum(0, (c['security_score'] / 100) * table['security_scale']
+                              - c['risk_factor_count'] * table['risk_factor_penalty'])
+        security = np.where(c['has_security'], security, table['default_security'])
+        dex = np.minimum(table['dex_presence_max'], c['dex_presence'] / 10 * table['dex_presence_max'])
+        dex = np.where(c['has_dex'], dex, table['default_dex'])
+        liquidity = np.where(c['has_dex'], self._liquidity_quality.evaluate(c['liquidity_quality']), 0)
+        return np.minimum(self._safety_max, 0 + security + dex + liquidity)
+
+    # ==============================================
+    # BATCH SCORING
+    # ==============================================
+
+    def score_batch(self, candidates: List[Dict[str, Any]],
+                    security_analyses: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+                    dex_analyses: Optional[Sequence[Optional[Dict[str, Any]]]] = None) -> List[PlanScore]:
+        """
+        Score a candidate batch.
+
+        Args:
+            candidates: Candidate token dicts
+            security_analyses: Per-candidate security analysis (aligned with candidates, None entries allowed)
+            dex_analyses: Per-candidate DEX analysis (aligned with candidates, None entries allowed)
+
+        Returns:
+            One ``PlanScore`` per candidate, in order; breakdowns are built on access
+        """
+        count = len(candidates)
+        if count == 0:
+            return []
+        security_analyses = security_analyses if security_analyses is not None else [None] * count
+        dex_analyses = dex_analyses if dex_analyses is not None else [None] * count
+
+        columns, fallback = self._extract(candidates, security_analyses, dex_analyses)
+        early_platform = self._early_platform_scores(columns)
+        momentum, levels = self._momentum_scores(columns)
+        safety = self._safety_scores(columns)
+        validation = np.minimum(columns['platform_count'] * self._points_per_platform, self._validation_max)
+
+        raw_total = early_platform + momentum + safety + validation
+        final_scores = np.minimum(100.0, (raw_total / self.normalization) * 100.0)
+
+        results = []
+        for i, candidate in enumerate(candidates):
+            if fallback[i]:
+                final_score, breakdown = self.reference_score(candidate, security_analyses[i], dex_analyses[i])
+                results.append(PlanScore(self, candidate, security_analyses[i], dex_analyses[i],
+                                         final_score, None, None, breakdown))
+                continue
+            components = (early_platform[i].item(), momentum[i].item(), safety[i].item(), validation[i].item())
+            results.append(PlanScore(self, candidate, security_analyses[i], dex_analyses[i],
+                                     final_scores[i].item(), components, str(levels[i])))
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"⚡ Scoring plan scored {count} candidates ({int(fallback.sum())} via reference path)")
+        return results
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+⚡ Table-Driven Stage 1 Triage Scorer
+Stage 1 priority rules expressed as data and evaluated over whole candidate batches
+"""
+
+import copy
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+# Numeric columns extracted from every candidate, with the default used when absent
+TRIAGE_FEATURES = {
+    'market_cap': 0,
+    'liquidity': 0,
+    'bonding_curve_progress': 0,
+    'hours_since_graduation': 999,
+    'estimated_age_minutes': 999,
+}
+
+# Each ladder is an ordered list of bands; the first band whose bounds match
+# awards its points (same semantics as an if/elif chain). Bounds use
+# gt/gte/lt/lte so the original inclusive/exclusive edges are preserved.
+DEFAULT_TRIAGE_RULES: Dict[str, Any] = {
+    'max_candidates': 35,
+    'default_threshold': 20,
+    'sources': {
+        'moralis_graduated': {
+            'base_points': 0,
+            'threshold': 25,
+            'ladders': {
+                'hours_since_graduation': [
+                    {'lte': 1, 'points': 40},       # Ultra-fresh graduates
+                    {'lte': 6, 'points': 25},       # Fresh graduates
+                    {'lte': 12, 'points': 15},      # Recent graduates
+                ],
+                'market_cap': [
+                    {'gte': 50000, 'lte': 2000000, 'points': 20},  # Sweet spot
+                    {'gte': 10000, 'lte': 50000, 'points': 15},    # Early stage
+                    {'gt': 2000000, 'points': 5},                  # Larger but still valid
+                ],
+                'liquidity': [
+                    {'gt': 50000, 'points': 15},    # Good liquidity
+                    {'gt': 10000, 'points': 10},    # Decent liquidity
+                    {'gt': 1000, 'points': 5},      # Minimal liquidity
+                ],
+            },
+        },
+        'moralis_bonding': {
+            'base_points': 0,
+            'threshold': 30,
+            'ladders': {
+                'bonding_curve_progress': [
+                    {'gte': 95, 'points': 50},      # Imminent graduation
+                    {'gte': 90, 'points': 35},      # Very close
+                    {'gte': 85, 'points': 25},      # Close
+                    {'gte': 75, 'points': 15},      # Promising
+                    {'gte': 50, 'points': 10},      # Mid-stage
+                ],
+                'market_cap': [
+                    {'gte': 5000, 'lte': 500000, 'points': 15},  # Good range for bonding
+                    {'gt': 0, 'lt': 5000, 'points': 10},         # Very early
+                ],
+            },
+        },
+        'birdeye_trending': {
+            'base_points': 30,  # Already trending = validated by market
+            'threshold': 30,
+            'ladders': {},
+        },
+        'sol_bonding_detector': {
+            'base_points': 20,  # SOL ecosystem strength
+            'ladders': {},
+        },
+    },
+    'universal': {
+        'valid_address_points': 5,
+        'valid_symbol_points': 3,
+        'ladders': {
+            'estimated_age_minutes': [
+                {'lte': 60, 'points': 8},       # Ultra-fresh
+                {'lte': 360, 'points': 5},      # Very fresh
+                {'lte': 1440, 'points': 2},     # Fresh (24h)
+            ],
+        },
+    },
+}
+
+# Score kept for candidates whose data cannot be scored (better safe than sorry)
+TRIAGE_ERROR_SCORE = 20
+
+_BOUND_OPERATORS = {
+    'gt': np.greater,
+    'gte': np.greater_equal,
+    'lt': np.less,
+    'lte': np.less_equal,
+}
+
+
+def _merge_rules(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively merge rule overrides; ladders are replaced wholesale"""
+    merged = copy.deepcopy(base)
+    for key, value in override.items():
+        if key != 'ladders' and isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_rules(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+class _CompiledLadder:
+    """A threshold ladder compiled to numpy condition/choice arrays"""
+
+    def __init__(self, feature: str, bands: List[Dict[str, Any]]):
+        if feature not in TRIAGE_FEATURES:
+            raise ValueError(f"Unknown triage feature '{feature}'")
+        self.feature = feature
+        self.bounds: List[List[Tuple[Any, float]]] = []
+        self.points: List[float] = []
+        for band in bands:
+            bound_checks = []
+            for op_name, op in _BOUND_OPERATORS.items():
+                if op_name in band:
+                    bound_checks.append((op, float(band[op_name])))
+            self.bounds.append(bound_checks)
+            self.points.append(float(band['points']))
+
+    def evaluate(self, values: np.ndarray) -> np.ndarray:
+        """Return the points awarded to each value (first matching band wins)"""
+        conditions = []
+        for bound_checks in self.bounds:
+            condition = np.ones(values.shape, dtype=bool)
+            for op, bound in bound_checks:
+                condition &= op(values, bound)
+            conditions.append(condition)
+        if not conditions:
+            return np.zeros(values.shape)
+        return np.select(conditions, self.points, default=0.0)
+
+
+class TriageScorer:
+    """
+    Compiled Stage 1 triage scorer.
+
+    Rules are loaded from data (defaults above, optionally overridden from
+    config under ``ANALYSIS.scoring.stage1_triage``) and compiled once into
+    per-source ladders. ``score_batch`` extracts columnar numeric arrays from
+    the candidate batch and scores every candidate at once.
+    """
+
+    def __init__(self, rules_override: Optional[Dict[str, Any]] = None, logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger('TriageScorer')
+        self.rules = _merge_rules(DEFAULT_TRIAGE_RULES, rules_override or {})
+        self.max_candidates = int(self.rules.get('max_candidates', 35))
+        self.default_threshold = float(self.rules.get('default_threshold', 20))
+
+        self._sources: Dict[str, Dict[str, Any]] = {}
+        for source, source_rules in self.rules.get('sources', {}).items():
+            ladders = [_CompiledLadder(feature, bands)
+                       for feature, bands in (source_rules.get('ladders') or {}).items()]
+            self._sources[source] = {
+                'base_points': float(source_rules.get('base_points', 0)),
+                'threshold': float(source_rules.get('threshold', self.default_threshold)),
+                'ladders': ladders,
+            }
+
+        universal = self.rules.get('universal', {})
+        self._valid_address_points = float(universal.get('valid_address_points', 0))
+        self._valid_symbol_points = float(universal.get('valid_symbol_points', 0))
+        self._universal_ladders = [_CompiledLadder(feature, bands)
+                                   for feature, bands in (universal.get('ladders') or {}).items()]
+
+    @staticmethod
+    def _to_float(value: Any) -> float:
+        """Convert a candidate value to float, NaN when it is not numeric"""
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return np.nan
+
+    def _extract_columns(self, candidates: List[Dict[str, Any]]) -> Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """Pull the numeric feature columns and flag columns out of the batch"""
+        to_float = self._to_float
+        columns = {
+            feature: np.fromiter((to_float(c.get(feature, default)) for c in candidates),
+                                 dtype=float, count=len(candidates))
+            for feature, default in TRIAGE_FEATURES.items()
+        }
+
+        valid_address = np.zeros(len(candidates), dtype=bool)
+        valid_symbol = np.zeros(len(candidates), dtype=bool)
+        row_errors = np.zeros(len(candidates), dtype=bool)
+        sources = []
+        for i, candidate in enumerate(candidates):
+            sources.append(candidate.get('source', 'unknown'))
+            try:
+                address = candidate.get('address')
+                valid_address[i] = bool(address) and len(candidate.get('address', '')) == 44
+                symbol = candidate.get('symbol', '')
+                valid_symbol[i] = bool(symbol) and symbol != 'Unknown' and len(symbol) <= 10
+            except TypeError:
+                row_errors[i] = True
+        return columns, valid_address, valid_symbol, row_errors, sources
+
+    def score_batch(self, candidates: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Score a candidate batch.
+
+        Returns:
+            (scores, thresholds, error_mask) arrays aligned with ``candidates``
+        """
+        count = len(candidates)
+        scores = np.zeros(count)
+        thresholds = np.full(count, self.default_threshold)
+        if count == 0:
+            return scores, thresholds, np.zeros(0, dtype=bool)
+
+        columns, valid_address, valid_symbol, errors, sources = self._extract_columns(candidates)
+        source_array = np.array(sources, dtype=object)
+
+        # Source-specific ladders, evaluated once per source group
+        for source, compiled in self._sources.items():
+            mask = source_array == source
+            if not mask.any():
+                continue
+            scores[mask] += compiled['base_points']
+            thresholds[mask] = compiled['threshold']
+            for ladder in compiled['ladders']:
+                values = columns[ladder.feature][mask]
+                errors[mask] |= np.isnan(values)
+                scores[mask] += ladder.evaluate(values)
+
+        # Universal quality indicators
+        scores += np.where(valid_address, self._valid_address_points, 0.0)
+        scores += np.where(valid_symbol, self._valid_symbol_points, 0.0)
+        for ladder in self._universal_ladders:
+            values = columns[ladder.feature]
+            errors |= np.isnan(values)
+            scores += ladder.evaluate(values)
+
+        scores[errors] = TRIAGE_ERROR_SCORE
+        return scores, thresholds, errors
+
+    def triage(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Score, filter and rank a candidate batch.
+
+        Annotates each candidate with ``discovery_priority_score`` and
+        ``triage_stage`` and returns the top ``max_candidates`` that pass their
+        source threshold (unscorable candidates are always kept).
+        """
+        scores, thresholds, errors = self.score_batch(candidates)
+        passed = errors | (scores >= thresholds)
+
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        kept = []
+        for i, candidate in enumerate(candidates):
+            score = scores[i].item()
+            # Keep integer scores integral, as the hand-written ladders produced
+            candidate['discovery_priority_score'] = int(score) if score.is_integer() else score
+            candidate['triage_stage'] = 'smart_triage_error' if errors[i] else 'smart_discovery_triage'
+            if passed[i]:
+                kept.append(candidate)
+            if debug_enabled:
+                mark = '✅' if passed[i] else '❌'
+                self.logger.debug(f"   {mark} {candidate.get('symbol', 'Unknown')} priority: "
+                                  f"{candidate['discovery_priority_score']} (threshold: {thresholds[i]:g})")
+
+        kept.sort(key=lambda c: c.get('discovery_priority_score', 0), reverse=True)
+        return kept[:self.max_candidates]
@@ -0,0 +1,70 @@
+import asyncio
+
+from services.analyzer_registry import AnalyzerRegistry, AnalyzerSpec, get_analyzer_registry, memoized_analyzer
+from services.strategic_coordination_analyzer import StrategicCoordinationAnalyzer
+from services.vlr_intelligence import VLRIntelligence
+
+
+class CountingAnalyzer:
+    def __init__(self):
+        self.calls = 0
+
+    @memoized_analyzer("test.counting", fields=("volume_24h", "traders"), data_arg=1, max_entries=2)
+    async def analyze(self, token_address, token_data):
+        self.calls += 1
+        return {"address": token_address, "volume": token_data.get("volume_24h")}
+
+
+def test_unchanged_tokens_skip_reanalysis():
+    vlr = VLRIntelligence()
+    token = {"address": "A1", "symbol": "AAA", "volume_24h": 250_000, "liquidity": 100_000, "market_cap": 900_000}
+
+    first = vlr.analyze_token_vlr(token)
+    # Fields the analyzer does not read do not change the fingerprint
+    assert vlr.analyze_token_vlr({**token, "holders": 1234}) is first
+    changed = vlr.analyze_token_vlr({**token, "volume_24h": 900_000})
+    assert changed is not first and changed.vlr == 9.0
+
+    coordination = StrategicCoordinationAnalyzer()
+    data = {"token_symbol": "AAA", "volume_24h": 1_500_000, "market_cap": 2_000_000,
+            "unique_trader_count": 40, "creation_time": None, "trader_list": [{"owner": "w1"}, "w2"]}
+    signal = coordination.analyze_coordination_patterns(data)
+    assert coordination.analyze_coordination_patterns({**data, "trader_list": [{"owner": "w1"}, "w2"]}) is signal
+
+    stats = get_analyzer_registry().get_stats()
+    assert stats["vlr_intelligence"]["hits"] >= 1
+    assert stats["strategic_coordination"]["fields"][-1] == "trader_list"
+
+
+def test_async_memo_is_per_instance_keyed_by_other_args_and_bounded():
+    async def scenario():
+        analyzer, other = CountingAnalyzer(), CountingAnalyzer()
+        data = {"volume_24h": 10, "traders": ["w1", {"owner": "w2"}]}
+        first = await analyzer.analyze("A", data)
+        assert await analyzer.analyze("A", dict(data)) is first
+        await analyzer.analyze("B", data)
+        await other.analyze("A", data)
+        assert (analyzer.calls, other.calls) == (2, 1)
+
+        # Keyword data and a third key (evicting "A") run uncached / recompute
+        await analyzer.analyze("A", token_data=data)
+        await analyzer.analyze("C", data)
+        await analyzer.analyze("A", data)
+        assert analyzer.calls == 5
+
+    asyncio.run(scenario())
+    assert get_analyzer_registry().get_stats()["test.counting"]["evictions"] >= 1
+
+
+def test_ttl_expires_results(monkeypatch):
+    registry = AnalyzerRegistry()
+    spec = registry.register(AnalyzerSpec("ttl", ("x",), ttl_seconds=60))
+    owner = CountingAnalyzer()
+    now = [1000.0]
+    monkeypatch.setattr("services.analyzer_registry.time.time", lambda: now[0])
+
+    registry.store(spec, owner, spec.fingerprint({"x": 1}), "result")
+    assert registry.lookup(spec, owner, spec.fingerprint({"x": 1})) == "result"
+    now[0] += 61
+    assert registry.lookup(spec, owner, spec.fingerprint({"x": 1})) != "result"
+    assert registry.get_stats()["ttl"]["hits"] == 1
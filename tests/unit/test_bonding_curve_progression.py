@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from services.bonding_curve_progression import ProgressionBuffer, ProgressionTracker
+
+START = 1_760_000_000.0
+
+
+def test_fit_recovers_exact_linear_and_quadratic_curves():
+    linear = ProgressionBuffer(capacity=20)
+    quadratic = ProgressionBuffer(capacity=20)
+    for minute in range(0, 60, 5):
+        hours = minute / 60
+        linear.append(START + minute * 60, 10_000 + 6_000 * hours)
+        quadratic.append(START + minute * 60, 10_000 + 2_000 * hours + 1_500 * hours ** 2)
+
+    linear_fit = linear.fit()
+    assert linear_fit.velocity_per_hour == pytest.approx(6_000)
+    assert linear_fit.acceleration == pytest.approx(0, abs=1e-6)
+    assert linear_fit.time_span_hours == pytest.approx(55 / 60)
+    # 6k/hour from 15.5k reaches 69k in ~8.9 hours
+    assert linear_fit.hours_to_reach(69_000 - linear.latest()[1]) == pytest.approx((69_000 - 15_500) / 6_000)
+
+    quadratic_fit = quadratic.fit()
+    assert quadratic_fit.acceleration == pytest.approx(3_000)
+    assert quadratic_fit.current_velocity_per_hour == pytest.approx(2_000 + 3_000 * 55 / 60)
+    latest_hours = 55 / 60
+    remaining = 69_000 - quadratic.latest()[1]
+    eta = quadratic_fit.hours_to_reach(remaining)
+    reached = 2_000 * (latest_hours + eta) + 1_500 * (latest_hours + eta) ** 2
+    assert reached - (2_000 * latest_hours + 1_500 * latest_hours ** 2) == pytest.approx(remaining)
+
+
+def test_wrapped_buffer_matches_direct_polyfit():
+    rng = np.random.default_rng(7)
+    buffer = ProgressionBuffer(capacity=16)
+    timestamps = START + np.cumsum(rng.uniform(30, 300, size=53))
+    market_caps = 5_000 + np.cumsum(rng.uniform(-200, 900, size=53))
+    for timestamp, market_cap in zip(timestamps, market_caps):
+        buffer.append(timestamp, market_cap)
+
+    assert len(buffer) == 16
+    assert list(buffer) == list(zip(timestamps[-16:].tolist(), market_caps[-16:].tolist()))
+    assert buffer.oldest() == (timestamps[-16], market_caps[-16])
+
+    hours = (timestamps[-16:] - timestamps[-16]) / 3600
+    fit = buffer.fit()
+    assert fit.velocity_per_hour == pytest.approx(np.polyfit(hours, market_caps[-16:], 1)[0])
+    assert fit.acceleration == pytest.approx(2 * np.polyfit(hours, market_caps[-16:], 2)[0])
+
+    # A window inside the buffer fits only its suffix; an empty window falls back to the last two points
+    since = timestamps[-6]
+    windowed = buffer.fit(since=since)
+    assert windowed.data_points == 6
+    assert windowed.velocity_per_hour == pytest.approx(
+        np.polyfit((timestamps[-6:] - since) / 3600, market_caps[-6:], 1)[0]
+    )
+    assert buffer.fit(since=timestamps[-1] + 1).data_points == 2
+
+
+def test_tracker_evicts_inactive_graduated_and_excess_tokens():
+    tracker = ProgressionTracker(
+        capacity=10, max_tokens=3, inactive_after_seconds=3600,
+        graduated_grace_seconds=600, graduation_threshold=69_000
+    )
+
+    tracker.track("stale", START, 1_000, now=START)
+    tracker.track("graduating", START + 2800, 70_000, now=START + 2800)
+    tracker.track("active", START + 3000, 2_000, now=START + 3000)
+    assert len(tracker) == 3
+
+    # 'graduating' reaches its grace period; 'stale' has not been updated for an hour
+    tracker.track("active", START + 3700, 2_500, now=START + 3700)
+    assert "stale" not in tracker and "graduating" not in tracker
+    assert tracker.get_stats()["evicted_inactive"] == 1
+    assert tracker.get_stats()["evicted_graduated"] == 1
+
+    for name in ("a", "b", "c"):
+        tracker.track(name, START + 3800, 1_000, now=START + 3800)
+    assert len(tracker) == 3
+    assert "active" not in tracker
+    assert tracker.get_stats()["evicted_capacity"] == 1
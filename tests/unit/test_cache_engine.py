@@ -0,0 +1,66 @@
+import time
+
+from core_local.cache_engine import CacheEngine, make_cache_key, endpoint_cache_key
+
+
+def test_entries_expire_individually():
+    engine = CacheEngine()
+    engine.set("short", 1, ttl=0.05)
+    engine.set("long", 2, ttl=60)
+    time.sleep(0.06)
+
+    assert engine.get("short") is None
+    assert engine.get("long") == 2
+    assert engine.purge_expired() == 0  # "short" was already dropped on read
+    assert 59 < engine.ttl_remaining("long") <= 60
+
+
+def test_overwrite_keeps_latest_expiry():
+    engine = CacheEngine()
+    engine.set("key", "old", ttl=0.01)
+    engine.set("key", "new", ttl=60)
+    time.sleep(0.02)
+
+    # The stale heap record for the first write must not purge the new value
+    assert engine.purge_expired() == 0
+    assert engine.get("key") == "new"
+
+
+def test_lru_bound_prefers_dropping_expired_entries():
+    engine = CacheEngine(max_entries=2)
+    engine.set("a", 1, ttl=0.01)
+    engine.set("b", 2, ttl=60)
+    time.sleep(0.02)
+    engine.set("c", 3, ttl=60)
+    assert engine.get("b") == 2 and engine.get("c") == 3
+    assert engine.get_stats()["evictions"] == 0
+
+    engine.get("b")  # "c" becomes least recently used
+    engine.set("d", 4, ttl=60)
+    assert engine.get("c") is None
+    assert engine.get_stats()["evictions"] == 1
+
+
+def test_canonical_keys_match_connector_scheme():
+    address = "So11111111111111111111111111111111111111112"
+    assert make_cache_key("birdeye", "overview", address) == f"birdeye_overview_{address}"
+    # Raw responses never share a key with the connector's unwrapped payloads
+    assert endpoint_cache_key("birdeye", "/defi/token_overview", {"address": address}) == f"birdeye_raw_overview_{address}"
+    assert endpoint_cache_key("birdeye", "/defi/price", {"address": address}) == f"birdeye_raw_price_{address}"
+
+    first = endpoint_cache_key("birdeye", "/defi/v3/ohlcv", {"address": address, "type": "1m"})
+    second = endpoint_cache_key("birdeye", "/defi/v3/ohlcv", {"type": "1m", "address": address})
+    assert first == second and first.startswith("birdeye_raw_ohlcv_")
+
+
+def test_clear_only_removes_the_managers_own_entries():
+    from core_local.cache_manager import CacheManager
+
+    engine = CacheEngine()
+    first, second = CacheManager(engine=engine), CacheManager(engine=engine)
+    first.set("birdeye_overview_a", 1)
+    second.set("birdeye_price_a", 2)
+
+    assert first.clear() == 1
+    assert second.get("birdeye_price_a") == 2
+    assert first.get("birdeye_overview_a") is None
@@ -0,0 +1,85 @@
+import asyncio
+from types import SimpleNamespace
+
+from api.cache_prefetcher import CachePrefetcher
+from core_local.cache_engine import CacheEngine
+from core_local.cache_manager import CacheManager
+from core_local.popularity_sketch import PopularitySketch
+
+
+class FakeBirdeyeAPI:
+    def __init__(self, fail=False):
+        self.cache_manager = CacheManager(engine=CacheEngine())
+        self.fail = fail
+        self.price_calls = []
+
+    async def get_multi_price(self, addresses):
+        self.price_calls.append(list(addresses))
+        if self.fail:
+            raise RuntimeError("429 Too Many Requests")
+        return {address: {"value": 2.0} for address in addresses}
+
+    async def get_token_overview(self, address, refresh=False):
+        assert refresh
+        if self.fail:
+            return None  # the connector answers failures with None
+        return {"symbol": "HOT", "liquidity": 50_000.0, "volume": {"h24": 120_000.0}}
+
+    async def get_token_metadata_multiple(self, addresses):
+        raise AssertionError("metadata has no liquidity/volume and must not replace overviews")
+
+
+def make_prefetcher(api):
+    sketch = PopularitySketch()
+    for _ in range(3):
+        sketch.record("hot")
+    return CachePrefetcher(SimpleNamespace(birdeye_api=api), sketch, refresh_ahead={"price": 60, "overview": 0})
+
+
+def test_failed_refresh_keeps_the_current_entry():
+    api = FakeBirdeyeAPI(fail=True)
+    api.cache_manager.set("birdeye_price_hot", {"value": 1.0}, ttl=20)
+    api.cache_manager.set("birdeye_overview_hot", {"symbol": "HOT", "liquidity": 1.0}, ttl=20)
+
+    refreshed = asyncio.run(make_prefetcher(api).refresh_once())
+
+    assert refreshed == {"price": 0, "overview": 0}
+    assert api.cache_manager.get("birdeye_price_hot") == {"value": 1.0}
+    assert api.cache_manager.get("birdeye_overview_hot") == {"symbol": "HOT", "liquidity": 1.0}
+
+
+def test_successful_refresh_overwrites_the_entry():
+    api = FakeBirdeyeAPI()
+    api.cache_manager.set("birdeye_price_hot", {"value": 1.0}, ttl=20)
+
+    refreshed = asyncio.run(make_prefetcher(api).refresh_once())
+
+    assert refreshed == {"price": 1, "overview": 1}
+    assert api.cache_manager.get("birdeye_price_hot") == {"value": 2.0}
+    assert api.cache_manager.get("birdeye_overview_hot")["volume"]["h24"] == 120_000.0
+
+
+def test_overview_refresh_bypasses_and_keeps_the_cached_entry_on_failure():
+    import logging
+
+    from api.birdeye_connector import BirdeyeAPI
+
+    api = BirdeyeAPI.__new__(BirdeyeAPI)
+    api.logger = logging.getLogger("test")
+    api.cache_manager = CacheManager(engine=CacheEngine())
+    api.default_ttl = 300
+    api.error_ttl = 60
+    api._should_skip_token = lambda address: False
+    api._track_cache_hit = api._track_cache_miss = lambda key: None
+    api.cache_manager.set("birdeye_overview_hot", {"symbol": "HOT", "liquidity": 1.0}, ttl=300)
+    responses = [{"success": True, "data": {"symbol": "HOT", "liquidity": 9.0, "volume": {"h24": 5.0}}}, None]
+
+    async def request(*args, **kwargs):
+        return responses.pop(0)
+
+    api._make_request_with_retry = request
+
+    assert asyncio.run(api.get_token_overview("hot"))["liquidity"] == 1.0
+    assert asyncio.run(api.get_token_overview("hot", refresh=True))["liquidity"] == 9.0
+    assert asyncio.run(api.get_token_overview("hot", refresh=True)) is None
+    assert api.cache_manager.get("birdeye_overview_hot")["liquidity"] == 9.0
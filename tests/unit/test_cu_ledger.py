@@ -0,0 +1,95 @@
+import asyncio
+import time
+
+from core_local.cu_ledger import CULedger
+
+
+class FakeClock:
+    def __init__(self, *when):
+        self.now = time.mktime((*when, 0, 0, -1))
+
+    def __call__(self):
+        return self.now
+
+
+def test_checkpointed_usage_survives_restart_and_rolls_over_by_day(tmp_path):
+    clock = FakeClock(2026, 10, 18, 10, 30, 0)
+    ledger = CULedger(tmp_path / "ledger.json", clock=clock)
+    ledger.load()
+
+    ledger.add("birdeye", 30, "/defi/token_overview")
+    ledger.add("birdeye", 10, "/defi/price")
+    clock.now += 3600
+    ledger.add("birdeye", 5, "/defi/price")
+    ledger.add("moralis", 50, "bonding")
+    assert ledger.checkpoint() == 3
+
+    # Journal-only state (no compaction since the first snapshot) reloads in a fresh process
+    restarted = CULedger(tmp_path / "ledger.json", clock=clock)
+    assert restarted.load() == 95
+    assert restarted.used_today("birdeye") == 45
+    assert restarted.requests_today("birdeye") == 3
+    assert restarted.hourly_usage("birdeye") == {"2026-10-18 10": 40, "2026-10-18 11": 5}
+    assert restarted.operations_today("moralis") == {"bonding": 1}
+
+    clock.now += 86400
+    assert restarted.used_today("birdeye") == 0
+    assert restarted.add("birdeye", 7) == 7
+    assert restarted.today == "2026-10-19"
+
+
+def test_threshold_alerts_are_edge_triggered(tmp_path):
+    clock = FakeClock(2026, 10, 18, 9, 0, 0)
+    ledger = CULedger(tmp_path / "ledger.json", clock=clock)
+    ledger.set_budget("birdeye", 100)
+    received = []
+
+    async def listener(provider, level, status):
+        received.append((provider, level, status["used"]))
+
+    ledger.add_alert_listener(listener)
+
+    async def run():
+        ledger.add("birdeye", 85)
+        first = await ledger.check_alerts()
+        ledger.add("birdeye", 1)
+        repeat = await ledger.check_alerts()
+        ledger.add("birdeye", 20)
+        jump = await ledger.check_alerts()
+        clock.now += 86400
+        ledger.add("birdeye", 90)
+        next_day = await ledger.check_alerts()
+        await ledger.stop()
+        return first, repeat, jump, next_day
+
+    first, repeat, jump, next_day = asyncio.run(run())
+
+    assert [alert["level"] for alert in first] == ["warning"]
+    assert repeat == []
+    # 86 -> 106 crosses critical and emergency at once; only the highest is reported
+    assert [alert["level"] for alert in jump] == ["emergency"]
+    assert [alert["level"] for alert in next_day] == ["warning"]
+    assert received == [("birdeye", "warning", 85), ("birdeye", "emergency", 106), ("birdeye", "warning", 90)]
+
+
+def test_single_watcher_checkpoints_in_the_background(tmp_path):
+    ledger = CULedger(tmp_path / "ledger.json", checkpoint_interval=0.01)
+    ledger.load()
+
+    async def run():
+        for _ in range(100):
+            ledger.add("birdeye", 1)
+        watcher = ledger._watcher
+        await asyncio.sleep(0.05)
+        assert ledger._watcher is watcher
+        return ledger.get_stats()
+
+    stats = asyncio.run(run())
+
+    assert stats["checkpoints"] >= 1
+    assert stats["pending_buckets"] == 0
+    assert stats["watcher_running"]
+    # asyncio.run cancelled the watcher, which left a final checkpoint
+    assert ledger._watcher is None
+    reloaded = CULedger(tmp_path / "ledger.json")
+    assert reloaded.load() == 100
@@ -0,0 +1,84 @@
+from src.dashboard.dashboard_update_bus import DashboardUpdateBus
+
+
+class RecordingEmitter:
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event, payload):
+        self.events.append((event, payload))
+
+
+def make_bus(stats, has_clients=True, **kwargs):
+    emitter = RecordingEmitter()
+    bus = DashboardUpdateBus(
+        emit=emitter,
+        snapshot_stats=lambda: dict(stats),
+        snapshot_tokens_summary=lambda: {'total_analyzed': stats.get('total', 0)},
+        has_clients=lambda: has_clients,
+        **kwargs
+    )
+    return bus, emitter
+
+
+def test_burst_of_tokens_coalesces_into_single_emit():
+    stats = {'total': 0}
+    bus, emitter = make_bus(stats)
+
+    for i in range(300):
+        stats['total'] = i + 1
+        bus.push_token('recent', {'address': f'token_{i}'})
+        bus.mark_stats_dirty()
+
+    assert bus.flush() == 2
+    events = dict(emitter.events)
+    assert len(emitter.events) == 2
+    # Pending tokens are kept in a bounded buffer
+    assert len(events['tokens_delta']['recent']) == 50
+    assert events['tokens_delta']['recent'][-1]['address'] == 'token_299'
+    assert events['tokens_delta']['stats_summary'] == {'total_analyzed': 300}
+
+
+def test_stats_delta_only_contains_changed_keys():
+    stats = {'cycles_completed': 1, 'status': 'running'}
+    bus, emitter = make_bus(stats)
+
+    bus.mark_stats_dirty()
+    bus.flush()
+    assert emitter.events[-1] == ('stats_delta', {'cycles_completed': 1, 'status': 'running'})
+
+    stats['cycles_completed'] = 2
+    bus.mark_stats_dirty()
+    bus.flush()
+    assert emitter.events[-1] == ('stats_delta', {'cycles_completed': 2})
+
+    # Nothing changed - no emit
+    bus.mark_stats_dirty()
+    assert bus.flush() == 0
+
+
+def test_alerts_are_batched_and_bounded():
+    bus, emitter = make_bus({}, max_pending_alerts=5)
+
+    for i in range(12):
+        bus.push_alert({'type': 'info', 'message': str(i)})
+
+    bus.flush()
+    event, alerts = emitter.events[-1]
+    assert event == 'alerts_batch'
+    assert [a['message'] for a in alerts] == ['7', '8', '9', '10', '11']
+
+
+def test_no_clients_drops_deltas_and_resyncs_later():
+    stats = {'status': 'running'}
+    bus, emitter = make_bus(stats, has_clients=False)
+
+    bus.mark_stats_dirty()
+    bus.push_token('recent', {'address': 'a'})
+    assert bus.flush() == 0
+    assert emitter.events == []
+
+    bus._has_clients = lambda: True
+    bus.mark_stats_dirty()
+    bus.flush()
+    assert emitter.events == [('stats_delta', {'status': 'running'})]
@@ -0,0 +1,103 @@
+import asyncio
+import logging
+
+from services.adaptive_rate_limiter import DataAvailabilityChecker
+
+
+class ProbeCountingChecker(DataAvailabilityChecker):
+    def __init__(self, **kwargs):
+        super().__init__(birdeye_api=None, cache_manager=None, **kwargs)
+        self.probe_calls = 0
+
+    async def _check_recent_trades(self, token_address):
+        self.probe_calls += 1
+        return None
+
+    async def _get_quick_metadata(self, token_address):
+        return {"age_hours": 2}
+
+    async def _get_basic_price_data(self, token_address):
+        return None
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_profile_is_reused_across_timeframes():
+    checker = ProbeCountingChecker()
+    first = run(checker.check_data_availability("tokenA", time_frame="1m"))
+    assert first["skip_ohlcv"] is False
+    assert first["reason"] == "new_token"
+
+    checker.record_ohlcv_result("tokenA", "1m", [{"unix_time": 100}, {"unix_time": 160}])
+    for time_frame in ("5m", "15m", "1h"):
+        assert run(checker.check_data_availability("tokenA", time_frame=time_frame))["skip_ohlcv"] is False
+
+    profile = checker.get_profile("tokenA")
+    assert checker.probe_calls == 1
+    assert (profile.first_trade_time, profile.last_trade_time) == (100, 160)
+
+
+def test_empty_resolution_is_skipped_and_stale_profile_reprobed():
+    checker = ProbeCountingChecker(negative_ttl=0)
+    checker.record_ohlcv_result("tokenB", "1m", [{"unixTime": 50}])
+    checker.record_ohlcv_result("tokenB", "1s", [])
+
+    assert run(checker.check_data_availability("tokenB", time_frame="1s"))["skip_ohlcv"] is True
+    assert run(checker.check_data_availability("tokenB", time_frame="1m"))["skip_ohlcv"] is False
+    assert checker.probe_calls == 0
+
+    # Unknown token with an expired negative profile is probed again
+    run(checker.check_data_availability("tokenC"))
+    run(checker.check_data_availability("tokenC"))
+    assert checker.probe_calls == 2
+
+
+def test_profiles_are_bounded():
+    checker = ProbeCountingChecker(max_profiles=2)
+    for address in ("a", "b", "c"):
+        checker.record_ohlcv_result(address, "1m", [])
+    assert list(checker.profiles) == ["b", "c"]
+    assert checker.get_stats()["evictions"] == 1
+
+
+class FakeCache:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, ttl=None):
+        self.values[key] = value
+
+
+def make_ohlcv_api(response):
+    from api.birdeye_connector import BirdeyeAPI
+
+    api = BirdeyeAPI.__new__(BirdeyeAPI)
+    api.logger = logging.getLogger("test")
+    api.cache_manager = FakeCache()
+    api.default_ttl = 60
+    api._availability_checker = ProbeCountingChecker()
+    api._should_skip_token = lambda address: False
+
+    async def request(*args, **kwargs):
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    api._make_request_with_retry = request
+    api._make_request = request
+    return api
+
+
+def test_failed_ohlcv_fetch_is_not_recorded_as_empty():
+    api = make_ohlcv_api(asyncio.TimeoutError())
+    assert run(api.get_ohlcv_data("tokenD", time_frame="1m")) == []
+    assert run(api._availability_checker.check_data_availability("tokenD", time_frame="1m"))["skip_ohlcv"] is False
+
+    api = make_ohlcv_api({"success": True, "data": {"items": []}})
+    assert run(api.get_ohlcv_data("tokenE", time_frame="1m")) == []
+    assert run(api._availability_checker.check_data_availability("tokenE", time_frame="1m"))["skip_ohlcv"] is True
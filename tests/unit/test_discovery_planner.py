@@ -0,0 +1,206 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from core_local.discovery_planner import DiscoveryPlanner
+
+
+class FakeStrategy:
+    def __init__(self, name, **api_parameters):
+        self.name = name
+        self.api_parameters = api_parameters
+
+    def get_discovery_parameters(self):
+        return self.api_parameters.copy()
+
+
+class FakeBirdeyeAPI:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.calls = []
+
+    async def get_token_list(self, sort_by, sort_type, limit, offset, **filters):
+        self.calls.append({"sort_by": sort_by, "limit": limit, "offset": offset, **filters})
+        matching = [
+            t for t in self.tokens
+            if (filters.get("min_liquidity") is None or t["liquidity"] >= filters["min_liquidity"])
+            and (filters.get("min_holder") is None or t["holder"] >= filters["min_holder"])
+        ]
+        matching.sort(key=lambda t: t[sort_by], reverse=(sort_type == "desc"))
+        return {"success": True, "data": {"tokens": matching[offset:offset + limit]}}
+
+
+def make_tokens(count):
+    return [
+        {
+            "address": f"token{i}",
+            "liquidity": 1000 * i,
+            "holder": 10 * i,
+            "volume_24h_usd": 1_000_000,
+        }
+        for i in range(count)
+    ]
+
+
+def test_strategies_with_same_sort_share_one_query():
+    planner = DiscoveryPlanner()
+    strategies = [
+        FakeStrategy("A", sort_by="liquidity", sort_type="desc", min_liquidity=50000, min_holder=250, limit=30),
+        FakeStrategy("B", sort_by="liquidity", sort_type="desc", min_liquidity=50000, min_holder=100, limit=30),
+        FakeStrategy("C", sort_by="volume_24h_usd", sort_type="desc", min_liquidity=50000, limit=20),
+    ]
+    queries = planner.plan(strategies)
+
+    assert len(queries) == 2
+    liquidity_query = next(q for q in queries if q.sort_by == "liquidity")
+    assert [m.strategy_name for m in liquidity_query.members] == ["A", "B"]
+    # Fused query uses the loosest threshold of the group
+    assert liquidity_query.filters["min_holder"] == 100
+
+
+def test_local_selection_matches_individual_queries():
+    api = FakeBirdeyeAPI(make_tokens(120))
+    planner = DiscoveryPlanner()
+    strategies = [
+        FakeStrategy("strict", sort_by="liquidity", sort_type="desc", min_liquidity=0, min_volume_24h_usd=0, min_holder=900, limit=10),
+        FakeStrategy("loose", sort_by="liquidity", sort_type="desc", min_liquidity=0, min_volume_24h_usd=0, min_holder=100, limit=10),
+    ]
+
+    selected = asyncio.run(planner.fetch(api, planner.plan(strategies)))
+
+    assert len(api.calls) == 1
+    for strategy in strategies:
+        spec = planner.build_spec(strategy)
+        expected = asyncio.run(
+            FakeBirdeyeAPI(make_tokens(120)).get_token_list(
+                sort_by=spec.sort_by, sort_type=spec.sort_type, limit=spec.limit, offset=0, **spec.filters
+            )
+        )["data"]["tokens"]
+        assert [t["address"] for t in selected[strategy.name]] == [t["address"] for t in expected]
+
+
+def test_short_strategy_triggers_next_page():
+    api = FakeBirdeyeAPI(make_tokens(250))
+    planner = DiscoveryPlanner(max_pages=3)
+    strategies = [
+        FakeStrategy("odd", sort_by="liquidity", sort_type="asc", min_liquidity=0, min_volume_24h_usd=0, min_holder=1500, limit=20),
+        FakeStrategy("any", sort_by="liquidity", sort_type="asc", min_liquidity=0, min_volume_24h_usd=0, min_holder=0, limit=20),
+    ]
+
+    selected = asyncio.run(planner.fetch(api, planner.plan(strategies)))
+
+    assert [call["offset"] for call in api.calls] == [0, 100]
+    assert len(selected["odd"]) == 20
+    assert selected["odd"][0]["address"] == "token150"
+
+
+class FakeExecutingStrategy(FakeStrategy):
+    def __init__(self, name, uses_shared_enrichment=True, **api_parameters):
+        super().__init__(name, **api_parameters)
+        self.uses_shared_enrichment = uses_shared_enrichment
+        self.enriched_batches = []
+        self.received = None
+
+    async def _batch_enrich_all_data(self, tokens, birdeye_api):
+        self.enriched_batches.append([t["address"] for t in tokens])
+        return [dict(t, enriched=True) for t in tokens]
+
+    async def execute_with_tokens(self, tokens, birdeye_api, scan_id=None, already_enriched=False):
+        self.received = (tokens, already_enriched)
+        return tokens
+
+
+def test_shared_enrichment_skips_strategies_that_ignore_it():
+    from core_local.strategy_scheduler import StrategyScheduler
+
+    api = FakeBirdeyeAPI(make_tokens(50))
+    enriching = FakeExecutingStrategy("enriching", sort_by="liquidity", sort_type="desc", min_liquidity=0,
+                                      min_volume_24h_usd=0, min_holder=400, limit=5)
+    whale = FakeExecutingStrategy("whale", uses_shared_enrichment=False, sort_by="volume_24h_usd", sort_type="desc",
+                                  min_liquidity=0, min_volume_24h_usd=0, limit=5)
+    scheduler = SimpleNamespace(
+        strategies=[whale, enriching], discovery_planner=DiscoveryPlanner(), birdeye_api=api,
+        structured_logger=MagicMock(), logger=MagicMock()
+    )
+
+    results = asyncio.run(StrategyScheduler._run_planned_discovery(scheduler, "scan"))
+
+    assert whale.enriched_batches == []
+    assert enriching.enriched_batches == [["token49", "token48", "token47", "token46", "token45"]]
+    tokens, already_enriched = whale.received
+    assert already_enriched is False and len(tokens) == 5 and not any("enriched" in t for t in tokens)
+    assert enriching.received[1] is True and all(t["enriched"] for t in results["enriching"])
+
+
+class FailingBirdeyeAPI(FakeBirdeyeAPI):
+    def __init__(self, tokens, failing_sort):
+        super().__init__(tokens)
+        self.failing_sort = failing_sort
+
+    async def get_token_list(self, sort_by, **kwargs):
+        if sort_by == self.failing_sort:
+            raise RuntimeError("token list unavailable")
+        return await super().get_token_list(sort_by, **kwargs)
+
+
+class FallbackStrategy(FakeExecutingStrategy):
+    def __init__(self, name, fail_enrichment=False, **kwargs):
+        super().__init__(name, **kwargs)
+        self.fail_enrichment = fail_enrichment
+        self.executed_alone = 0
+
+    async def _batch_enrich_all_data(self, tokens, birdeye_api):
+        if self.fail_enrichment:
+            raise RuntimeError("enrichment failed")
+        return await super()._batch_enrich_all_data(tokens, birdeye_api)
+
+    async def execute(self, birdeye_api, scan_id=None):
+        self.executed_alone += 1
+        return [{"address": f"{self.name}_own", "strategy_data": {}}]
+
+
+def make_scheduler(tmp_path, monkeypatch, api, strategies):
+    from core_local.strategy_scheduler import StrategyScheduler
+
+    monkeypatch.chdir(tmp_path)
+    scheduler = StrategyScheduler(api, logger=MagicMock(), enabled=True)
+    scheduler.strategies = strategies
+    scheduler.should_run_strategies = lambda: True
+    return scheduler
+
+
+def test_scheduler_isolates_failed_shared_query_and_enrichment(tmp_path, monkeypatch):
+    api = FailingBirdeyeAPI(make_tokens(50), failing_sort="volume_24h_usd")
+    enriching = FallbackStrategy("enriching", fail_enrichment=True, sort_by="liquidity", sort_type="desc",
+                                 min_liquidity=0, min_volume_24h_usd=0, min_holder=400, limit=5)
+    whale = FallbackStrategy("whale", uses_shared_enrichment=False, sort_by="liquidity", sort_type="asc",
+                             min_liquidity=0, min_volume_24h_usd=0, limit=5)
+    broken = FallbackStrategy("broken", sort_by="volume_24h_usd", sort_type="desc",
+                              min_liquidity=0, min_volume_24h_usd=0, limit=5)
+    scheduler = make_scheduler(tmp_path, monkeypatch, api, [enriching, whale, broken])
+
+    results = asyncio.run(scheduler.run_due_strategies("scan"))
+
+    addresses = {token["address"] for token in results}
+    # The broken query and the failed enrichment fall back to the strategies' own discovery
+    assert broken.executed_alone == 1 and broken.received is None
+    assert enriching.executed_alone == 1 and enriching.received is None
+    # The non-enriching strategy still runs off the shared fetch
+    assert whale.executed_alone == 0 and whale.received[1] is False
+    assert {"broken_own", "enriching_own", "token1"} <= addresses
+    assert "executions" in scheduler.execution_history
+
+
+def test_scheduler_falls_back_to_individual_discovery_when_planning_fails(tmp_path, monkeypatch):
+    strategies = [FallbackStrategy("a", sort_by="liquidity"), FallbackStrategy("b", sort_by="liquidity")]
+    scheduler = make_scheduler(tmp_path, monkeypatch, FakeBirdeyeAPI(make_tokens(5)), strategies)
+
+    def broken_plan(strategies):
+        raise ValueError("bad discovery parameters")
+
+    scheduler.discovery_planner.plan = broken_plan
+
+    results = asyncio.run(scheduler.run_due_strategies("scan"))
+
+    assert sorted(token["address"] for token in results) == ["a_own", "b_own"]
+    assert [s.executed_alone for s in strategies] == [1, 1]
@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import random
+
+import pytest
+
+from src.scoring.early_gem_focused_scoring import EarlyGemFocusedScoring
+from src.scoring.early_gem_scoring_plan import EarlyGemScoringPlan
+
+TIMEFRAMES = ("5m", "15m", "30m", "1h", "6h", "24h")
+
+
+def random_candidate(rng):
+    candidate = {
+        "symbol": f"GEM{rng.randrange(1000)}",
+        "source": rng.choice(["pump_fun_stage0", "moralis_graduated", "birdeye_trending", "dexscreener", None]),
+        "platforms": rng.sample(["birdeye", "dexscreener", "jupiter", "pump_fun", "raydium"], rng.randrange(6)),
+        "graduation_progress_pct": rng.choice([0, 19.9, 20, 49.9, 50, 70, 70.1, 80, 85, 85.1, rng.uniform(0, 100)]),
+    }
+    if rng.random() < 0.3:
+        candidate["pump_fun_launch"] = True
+        candidate["bonding_curve_stage"] = rng.choice(
+            ["STAGE_0_ULTRA_EARLY", "STAGE_0_EARLY_MOMENTUM", "STAGE_1_CONFIRMED", "", "OTHER"])
+    if rng.random() < 0.3:
+        candidate["platform"] = "raydium_launchlab"
+        candidate["velocity_per_hour"] = rng.choice([0, 0.5, 2, 5, 10, rng.uniform(0, 20)])
+        candidate["sol_raised_estimated"] = rng.choice([-1, 0, 3, 10, 25, 50, 70, rng.uniform(0, 90)])
+    candidate["velocity"] = rng.choice([0, 100, 500, 2000, 5000, rng.uniform(0, 8000)])
+    if rng.random() < 0.8:
+        candidate["estimated_age_minutes"] = rng.choice([0, 5, 15, 30, 60, 120, 180, 720, rng.uniform(0, 2000)])
+    elif rng.random() < 0.5:
+        candidate["age_hours"] = rng.uniform(0, 30)
+    for timeframe in TIMEFRAMES:
+        if rng.random() < 0.7:
+            candidate[f"volume_{timeframe}"] = rng.choice([0, rng.uniform(0, 80000), rng.uniform(0, 2000)])
+            candidate[f"price_change_{timeframe}"] = rng.choice([0, rng.uniform(-40, 80), rng.uniform(-5, 20)])
+            candidate[f"trades_{timeframe}"] = rng.choice([0, rng.randrange(400), rng.randrange(30)])
+    candidate["unique_traders_24h"] = rng.randrange(200)
+    return candidate
+
+
+def random_security(rng):
+    if rng.random() < 0.3:
+        return None
+    return {"security_score": rng.uniform(0, 100), "risk_factors": ["risk"] * rng.randrange(4)}
+
+
+def random_dex(rng):
+    if rng.random() < 0.3:
+        return None
+    return {"dex_presence_score": rng.uniform(0, 15), "liquidity_quality_score": rng.choice([39, 40, 60, 80, rng.uniform(0, 100)])}
+
+
+def test_batch_scores_match_reference_exactly():
+    rng = random.Random(11)
+    scorer = EarlyGemFocusedScoring()
+    plan = EarlyGemScoringPlan(scorer)
+    candidates = [random_candidate(rng) for _ in range(600)]
+    security = [random_security(rng) for _ in candidates]
+    dex = [random_dex(rng) for _ in candidates]
+
+    results = plan.score_batch(candidates, security, dex)
+
+    for result, candidate, security_analysis, dex_analysis in zip(results, candidates, security, dex):
+        expected, breakdown = scorer.calculate_final_score(
+            candidate, {}, {}, {}, {}, security_analysis, {}, dex_analysis)
+        assert result.final_score == expected
+        assert result.early_platform_score == breakdown["early_platform_analysis"]["score"]
+        assert result.momentum_score == breakdown["momentum_analysis"]["score"]
+        assert result.safety_score == breakdown["safety_validation"]["score"]
+        assert result.confidence_level == breakdown["momentum_analysis"]["confidence_level"]
+
+
+def test_breakdown_is_built_lazily_and_odd_values_use_reference_path():
+    scorer = EarlyGemFocusedScoring()
+    calls = []
+    original = scorer.calculate_final_score
+
+    def counting(*args, **kwargs):
+        calls.append(args[0]["symbol"])
+        return original(*args, **kwargs)
+
+    scorer.calculate_final_score = counting
+    plan = EarlyGemScoringPlan(scorer)
+    clean = {"symbol": "CLEAN", "source": "pump_fun_stage0", "velocity": 3000, "volume_1h": 25000}
+    odd = {"symbol": "ODD", "source": "birdeye_trending", "volume_1h": "25000"}
+
+    results = plan.score_batch([clean, odd])
+
+    assert calls == ["ODD"]
+    assert results[1].final_score == original(odd, {}, {}, {}, {}, None, {}, None)[0]
+    breakdown = results[0].breakdown
+    assert calls == ["ODD", "CLEAN"]
+    assert results[0].breakdown is breakdown
+    assert results[0].as_tuple()[0] == pytest.approx(breakdown["final_score_summary"]["scoring_totals"]["final_score"])
+
+    with pytest.raises(TypeError):
+        plan.score_batch([{"symbol": "BROKEN", "source": "pump_fun_stage0", "velocity": None}])
+
+
+def test_detector_stage4_scores_through_the_plan_and_breaks_down_alerted_tokens_only():
+    from src.detectors.early_gem_detector import EarlyGemDetector
+
+    detector = EarlyGemDetector.__new__(EarlyGemDetector)
+    detector.logger = logging.getLogger("test")
+    detector.debug_mode = False
+    detector.early_gem_scorer = EarlyGemFocusedScoring()
+    detector.cost_tracking = {
+        "total_tokens_processed": 0, "enhanced_scoring_used": 0, "ohlcv_calls_made": 0,
+        "api_cost_level_by_stage": {"stage4_expensive": 0},
+    }
+
+    async def enrich(candidate):
+        return dict(candidate)
+
+    detector._enrich_single_token = enrich
+    hot = {"symbol": "HOT", "address": "hot", "source": "pump_fun_stage0", "velocity": 6000,
+           "bonding_curve_stage": "STAGE_0_ULTRA_EARLY", "estimated_age_minutes": 4,
+           "volume_5m": 9000, "volume_1h": 60000, "price_change_5m": 30, "price_change_1h": 20,
+           "trades_5m": 30, "trades_1h": 250, "platforms": ["pump_fun", "birdeye"]}
+    cold = {"symbol": "COLD", "address": "cold", "source": "dexscreener", "estimated_age_minutes": 5000}
+
+    detector.scoring_plan = None
+    reference = [asyncio.run(detector._analyze_single_candidate_with_ohlcv(dict(c))) for c in (hot, cold)]
+    detector.high_conviction_threshold = (reference[0]["final_score"] + reference[1]["final_score"]) / 2
+
+    detector.scoring_plan = EarlyGemScoringPlan(detector.early_gem_scorer)
+    results = asyncio.run(detector._analyze_candidates_with_scoring_plan([dict(hot), dict(cold)]))
+
+    assert [r["final_score"] for r in results] == [r["final_score"] for r in reference]
+    assert results[0]["enhanced_metrics"] == reference[0]["enhanced_metrics"]
+    assert results[0]["scoring_breakdown"]["cost_optimization"]["analysis_phase"] == "deep_analysis"
+    assert "scoring_breakdown" not in results[1]
+    assert detector.cost_tracking["enhanced_scoring_used"] == 4
+
+
+def test_detector_stage4_isolates_a_candidate_the_plan_cannot_score(caplog):
+    from src.detectors.early_gem_detector import EarlyGemDetector
+
+    detector = EarlyGemDetector.__new__(EarlyGemDetector)
+    detector.logger = logging.getLogger("test")
+    detector.debug_mode = False
+    detector.early_gem_scorer = EarlyGemFocusedScoring()
+    detector.high_conviction_threshold = 101
+    detector.cost_tracking = {
+        "total_tokens_processed": 0, "enhanced_scoring_used": 0, "ohlcv_calls_made": 0,
+        "api_cost_level_by_stage": {"stage4_expensive": 0},
+    }
+
+    async def enrich(candidate):
+        return dict(candidate)
+
+    detector._enrich_single_token = enrich
+    detector.scoring_plan = EarlyGemScoringPlan(detector.early_gem_scorer)
+    good = {"symbol": "GOOD", "address": "good", "source": "dexscreener", "estimated_age_minutes": 30}
+    broken = {"symbol": "BROKEN", "address": "broken", "source": "pump_fun_stage0", "velocity": None}
+
+    with caplog.at_level(logging.ERROR, logger="test"):
+        results = asyncio.run(detector._analyze_candidates_with_scoring_plan([dict(good), dict(broken)]))
+
+    assert results[0] is not None and results[0]["candidate"]["symbol"] == "GOOD"
+    assert results[1] is None
+    assert "BROKEN" in caplog.text
@@ -0,0 +1,141 @@
+import asyncio
+import json
+import logging
+import time
+
+import pytest
+
+from services.exit_cohort_evaluator import ExitCohortEvaluator
+from services.position_tracker import Position
+
+
+class _Cache:
+    def register_tracked_token(self, token_address, is_position=False):
+        pass
+
+
+class _Tracker:
+    def __init__(self):
+        self.queued = {}
+        self.preference_lookups = 0
+
+    def queue_price_update(self, position_id, price):
+        self.queued[position_id] = price
+
+    def get_user_preferences(self, user_id):
+        self.preference_lookups += 1
+        return None
+
+
+class _Detector:
+    """Minimal stand-in exposing the hooks the evaluator uses"""
+
+    factor_weights = {
+        "volume_degradation": 0.25,
+        "price_momentum": 0.25,
+        "whale_activity": 0.20,
+        "community_sentiment": 0.15,
+        "technical_indicators": 0.15,
+    }
+
+    def __init__(self, market):
+        self.market = market
+        self.fetches = []
+        self.enhanced_cache = _Cache()
+        self.position_tracker = _Tracker()
+        self.logger = logging.getLogger("test")
+
+    async def _get_current_token_data_cached(self, token_address):
+        self.fetches.append(token_address)
+        return self.market[token_address]["data"]
+
+    async def _token_momentum_score(self, token_address):
+        return self.market[token_address]["momentum"]
+
+    async def _token_whale_activity_score(self, token_address):
+        return self.market[token_address]["whale"]
+
+    async def _token_technical_levels(self, token_address):
+        return self.market[token_address]["levels"]
+
+    @staticmethod
+    def _rsi_score(rsi):
+        return 8.0 if rsi > 80 else 5.0 if rsi > 70 else 0.0
+
+    def _generate_exit_signal(self, position, exit_score, factors):
+        return ("signal", position.id, exit_score, factors)
+
+    def _create_no_data_signal(self, position):
+        return ("no_data", position.id)
+
+    def _create_error_signal(self, position, error):
+        return ("error", position.id)
+
+
+def _position(position_id, token, entry_price, hours_held=1.0, user="u1", **entry_conditions):
+    return Position(
+        id=position_id,
+        user_id=user,
+        token_address=token,
+        token_symbol=token.upper(),
+        entry_timestamp=int(time.time() - hours_held * 3600),
+        entry_price=entry_price,
+        current_price=entry_price,
+        entry_conditions=json.dumps(entry_conditions),
+    )
+
+
+MARKET = {
+    "hot": {
+        "data": {"price": 2.0, "volume": {"h24": 400.0}, "holders": 90},
+        "momentum": 25.0,
+        "whale": 20.0,
+        "levels": {"rsi": 85.0, "recent_support": 1.5},
+    },
+    "dead": {"data": None, "momentum": 0.0, "whale": 0.0, "levels": None},
+}
+
+
+def test_market_factors_fetched_once_per_token():
+    detector = _Detector(MARKET)
+    positions = [_position(i, "hot", 1.0) for i in range(5)] + [_position(9, "dead", 1.0)]
+
+    signals = asyncio.run(ExitCohortEvaluator(detector).evaluate(positions))
+
+    assert detector.fetches.count("hot") == 1
+    assert detector.position_tracker.preference_lookups == 1
+    assert signals[-1] == ("no_data", 9)
+    assert all(signal[0] == "signal" for signal in signals[:5])
+    assert detector.position_tracker.queued == {i: 2.0 for i in range(5)}
+
+
+def test_per_position_modifiers_match_scalar_rules():
+    detector = _Detector(MARKET)
+    positions = [
+        # +100% P&L, volume down 60%, holders down 10% -> all bands hit
+        _position(1, "hot", 1.0, volume_24h=1000.0, holders=100),
+        # price below entry, no entry volume, held past the 48h default
+        _position(2, "hot", 2.5, hours_held=50),
+        # profit target already reached
+        _position(3, "hot", 1.0),
+    ]
+    positions[2].profit_target = 1.8
+
+    signals = asyncio.run(ExitCohortEvaluator(detector).evaluate(positions))
+
+    _, _, score, factors = signals[0]
+    assert factors == {
+        "volume_degradation": 25.0,
+        "price_momentum": 25.0,
+        "whale_activity": 20.0,
+        "community_sentiment": 10.0,
+        "technical_indicators": 8.0,
+    }
+    base = 25 * 0.25 + 25 * 0.25 + 20 * 0.20 + 10 * 0.15 + 8 * 0.15
+    assert score == pytest.approx(base + 20.0)
+
+    _, _, score, factors = signals[1]
+    assert factors["volume_degradation"] == 0.0
+    assert score == 100.0
+
+    assert signals[2][2] == 100.0
@@ -0,0 +1,97 @@
+import asyncio
+import time
+
+import pytest
+
+from utils.hedged_requests import AllEndpointsFailed, HedgedRequester
+
+ENDPOINTS = [("primary", "p"), ("secondary", "s"), ("tertiary", "t")]
+
+
+def _attempts(behaviour, started, cancelled):
+    async def attempt(name, url):
+        started.append(name)
+        delay, result = behaviour[name]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(name)
+            raise
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return attempt
+
+
+def test_hung_primary_is_hedged_and_loser_cancelled(tmp_path):
+    requester = HedgedRequester(state_file=tmp_path / "health.json", default_hedge_delay=0.05)
+    started, cancelled = [], []
+    attempt = _attempts({"primary": (5.0, ["late"]), "secondary": (0.01, ["pools"]), "tertiary": (0.01, ["x"])},
+                        started, cancelled)
+
+    begin = time.monotonic()
+    winner, result = asyncio.run(requester.race(ENDPOINTS, attempt))
+
+    assert (winner, result) == ("secondary", ["pools"])
+    assert time.monotonic() - begin < 1.0
+    assert started == ["primary", "secondary"]
+    assert cancelled == ["primary"]
+    assert requester.stats["hedges_fired"] == 1
+
+
+def test_failures_fire_next_immediately_and_dead_endpoints_move_back(tmp_path):
+    state_file = tmp_path / "health.json"
+    requester = HedgedRequester(state_file=state_file, default_hedge_delay=5.0, dead_after_failures=2)
+    behaviour = {"primary": (0.0, RuntimeError("down")), "secondary": (0.0, []), "tertiary": (0.0, ["ok"])}
+
+    for _ in range(2):
+        winner, _ = asyncio.run(requester.race(ENDPOINTS, _attempts(behaviour, [], [])))
+        assert winner == "tertiary"
+
+    # Health is persisted: a fresh requester tries the working endpoint first
+    reloaded = HedgedRequester(state_file=state_file, dead_after_failures=2)
+    started = []
+    asyncio.run(reloaded.race(ENDPOINTS, _attempts(behaviour, started, [])))
+    assert started == ["tertiary"]
+    assert [name for name, _ in reloaded.order(ENDPOINTS)] == ["tertiary", "primary", "secondary"]
+
+
+def test_hanging_endpoint_that_keeps_losing_moves_back():
+    requester = HedgedRequester(default_hedge_delay=0.05, dead_after_failures=2)
+    behaviour = {"primary": (5.0, ["late"]), "secondary": (0.01, ["pools"]), "tertiary": (0.01, ["x"])}
+
+    for _ in range(2):
+        winner, _ = asyncio.run(requester.race(ENDPOINTS, _attempts(behaviour, [], [])))
+        assert winner == "secondary"
+    assert requester.health["primary"].consecutive_failures == 2
+
+    started = []
+    asyncio.run(requester.race(ENDPOINTS, _attempts(behaviour, started, [])))
+    assert started == ["secondary"]
+
+
+def test_hedge_attempt_cancelled_before_its_delay_is_not_penalized():
+    requester = HedgedRequester(default_hedge_delay=0.1)
+    behaviour = {"primary": (0.15, ["slow"]), "secondary": (5.0, ["late"]), "tertiary": (0.01, ["x"])}
+
+    winner, _ = asyncio.run(requester.race(ENDPOINTS, _attempts(behaviour, [], [])))
+
+    assert winner == "primary"
+    assert "secondary" not in requester.health
+
+
+def test_hedge_delay_learned_from_latencies():
+    requester = HedgedRequester(min_samples=5, min_hedge_delay=0.1, max_hedge_delay=3.0)
+    for latency in [0.2, 0.3, 0.4, 0.5, 2.0]:
+        requester.record_success("primary", latency)
+
+    assert requester.hedge_delay("primary") == 2.0
+    assert requester.hedge_delay("unknown") == requester.default_hedge_delay
+
+
+def test_all_failed_raises():
+    requester = HedgedRequester()
+    behaviour = {name: (0.0, None) for name, _ in ENDPOINTS}
+
+    with pytest.raises(AllEndpointsFailed):
+        asyncio.run(requester.race(ENDPOINTS, _attempts(behaviour, [], [])))
@@ -0,0 +1,146 @@
+import asyncio
+import json
+
+from core_local.history_store import AppendOnlyHistoryStore, TokenActivityIndex
+
+
+def test_save_appends_only_changed_records(tmp_path):
+    store = AppendOnlyHistoryStore(tmp_path / "history.json", collection_key="tokens")
+    history = store.load()
+    history["last_execution_time"] = 0
+    history["tokens"]["tokenA"] = {"consecutive_appearances": 1, "last_seen": 100}
+    store.save(history)  # First save writes the snapshot
+
+    history["tokens"]["tokenB"] = {"consecutive_appearances": 1, "last_seen": 200}
+    history["last_execution_time"] = 200
+    store.mark_dirty("tokenB")
+    store.save(history)
+
+    journal = [json.loads(line) for line in store.journal_file.read_text().splitlines()]
+    assert journal == [
+        {"op": "put", "k": "tokenB", "v": {"consecutive_appearances": 1, "last_seen": 200}},
+        {"op": "meta", "v": {"last_execution_time": 200}},
+    ]
+
+    reloaded = AppendOnlyHistoryStore(tmp_path / "history.json", collection_key="tokens").load()
+    assert reloaded == history
+
+
+def test_deletes_replay_and_compaction(tmp_path):
+    store = AppendOnlyHistoryStore(tmp_path / "history.json", collection_key="tokens", compact_after=3)
+    history = store.load()
+    store.save(history)
+
+    for i in range(4):
+        history["tokens"][f"t{i}"] = {"consecutive_appearances": i}
+        store.mark_dirty(f"t{i}")
+        store.save(history)
+
+    del history["tokens"]["t0"]
+    store.mark_deleted("t0")
+    store.save(history)
+
+    assert store.get_stats()["compactions"] >= 2
+    reloaded = AppendOnlyHistoryStore(tmp_path / "history.json", collection_key="tokens").load()
+    assert reloaded == history
+
+
+def test_truncated_journal_line_is_skipped(tmp_path):
+    store = AppendOnlyHistoryStore(tmp_path / "history.json", collection_key="tokens")
+    history = store.load()
+    store.save(history)
+    history["tokens"]["tokenA"] = {"last_seen": 1}
+    store.mark_dirty("tokenA")
+    store.save(history)
+
+    with open(store.journal_file, "a") as f:
+        f.write('{"op": "put", "k": "tok')
+
+    reloaded = AppendOnlyHistoryStore(tmp_path / "history.json", collection_key="tokens").load()
+    assert reloaded["tokens"] == {"tokenA": {"last_seen": 1}}
+
+
+def test_legacy_snapshot_loads_unchanged(tmp_path):
+    legacy = {"tokens": {"tokenA": {"consecutive_appearances": 2}}, "last_execution_time": 10}
+    (tmp_path / "legacy.json").write_text(json.dumps(legacy, indent=2))
+
+    store = AppendOnlyHistoryStore(tmp_path / "legacy.json", collection_key="tokens")
+    assert store.load() == legacy
+
+
+def test_activity_index_promising_and_expired():
+    tokens = {
+        "a": {"consecutive_appearances": 3, "last_seen": 100},
+        "b": {"consecutive_appearances": 1, "last_seen": 50},
+        "c": {"consecutive_appearances": 5, "last_seen": 10},
+    }
+    index = TokenActivityIndex()
+    index.rebuild(tokens)
+    assert sorted(index.promising(3)) == ["a", "c"]
+
+    tokens["b"]["consecutive_appearances"] = 4
+    tokens["b"]["last_seen"] = 500
+    index.update("b", tokens["b"])
+    assert sorted(index.promising(3)) == ["a", "b", "c"]
+
+    # "b" was refreshed, so its old heap entry must not expire it
+    assert index.expired(200) == ["c", "a"]
+    assert index.expired(200) == []
+
+
+def test_save_after_torn_journal_line_keeps_new_records(tmp_path):
+    store = AppendOnlyHistoryStore(tmp_path / "history.json", collection_key="tokens")
+    history = store.load()
+    store.save(history)
+    with open(store.journal_file, "a") as f:
+        f.write('{"op": "put", "k": "tok')
+
+    store = AppendOnlyHistoryStore(tmp_path / "history.json", collection_key="tokens")
+    history = store.load()
+    history["tokens"]["tokenB"] = {"last_seen": 2}
+    store.mark_dirty("tokenB")
+    store.save(history)
+
+    reloaded = AppendOnlyHistoryStore(tmp_path / "history.json", collection_key="tokens").load()
+    assert reloaded["tokens"] == {"tokenB": {"last_seen": 2}}
+
+
+def test_save_async_serializes_before_the_loop_mutates_again(tmp_path):
+    store = AppendOnlyHistoryStore(tmp_path / "history.json", collection_key="tokens")
+    history = store.load()
+    store.save(history)
+
+    async def run():
+        history["tokens"]["tokenA"] = {"last_seen": 1}
+        store.mark_dirty("tokenA")
+        saving = asyncio.ensure_future(store.save_async(history))
+        await asyncio.sleep(0)
+        history["tokens"]["tokenA"]["last_seen"] = 2
+        await saving
+
+    asyncio.run(run())
+    journal = [json.loads(line) for line in store.journal_file.read_text().splitlines()]
+    assert journal[0] == {"op": "put", "k": "tokenA", "v": {"last_seen": 1}}
+
+
+def test_strategy_save_history_async_goes_through_the_store(tmp_path):
+    from types import SimpleNamespace
+
+    from core_local.strategies.base_token_discovery_strategy import BaseTokenDiscoveryStrategy
+
+    store = AppendOnlyHistoryStore(tmp_path / "history.json", collection_key="tokens")
+    strategy = SimpleNamespace(history_store=store, token_history=store.load(), name="test",
+                               logger=SimpleNamespace(error=lambda message: None))
+    store.save(strategy.token_history)
+
+    async def run():
+        strategy.token_history["tokens"]["tokenA"] = {"last_seen": 1}
+        store.mark_dirty("tokenA")
+        saving = asyncio.ensure_future(BaseTokenDiscoveryStrategy.save_history_async(strategy))
+        await asyncio.sleep(0)
+        strategy.token_history["tokens"]["tokenA"]["last_seen"] = 2
+        await saving
+
+    asyncio.run(run())
+    journal = [json.loads(line) for line in store.journal_file.read_text().splitlines()]
+    assert journal[0] == {"op": "put", "k": "tokenA", "v": {"last_seen": 1}}
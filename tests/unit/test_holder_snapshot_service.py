@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import math
+
+import pytest
+
+from services.holder_concentration_analyzer import HolderConcentrationAnalyzer
+from services.holder_snapshot_service import HolderSnapshot, HolderSnapshotService
+
+BALANCES = [5.0, 120.0, 0.0, 40.0, 3000.0, 12.5, 800.0, 1.0]
+
+
+class FakeBirdeye:
+    def __init__(self, items=None, traders=None):
+        self.items = items
+        self.traders = traders
+        self.holder_calls = 0
+        self.trader_calls = 0
+
+    async def get_token_holders(self, token_address, offset=0, limit=100):
+        self.holder_calls += 1
+        await asyncio.sleep(0.01)
+        return {"items": self.items, "total": len(self.items or [])} if self.items is not None else None
+
+    async def get_top_traders(self, token_address):
+        self.trader_calls += 1
+        return self.traders
+
+
+def _holders(balances):
+    return [{"owner": f"wallet{i}", "ui_amount": balance} for i, balance in enumerate(balances)]
+
+
+def test_snapshot_statistics_match_reference_formulas():
+    snapshot = HolderSnapshot("token", _holders(BALANCES))
+    stats = snapshot.concentration_stats()
+
+    positive = sorted(b for b in BALANCES if b > 0)
+    n, total = len(positive), sum(positive)
+    gini = sum((2 * i - n - 1) * b for i, b in enumerate(positive, 1)) / (n * total)
+    mean = total / n
+
+    assert snapshot.holder_count == 7
+    assert snapshot.addresses[0] == "wallet4"
+    assert stats["gini"] == pytest.approx(gini)
+    assert stats["hhi"] == pytest.approx(sum((b / total) ** 2 for b in positive))
+    assert stats["top_pct"][4] == pytest.approx(sum(sorted(positive, reverse=True)[:4]) / total * 100)
+    assert stats["top_pct"][50] == pytest.approx(100.0)
+    assert stats["theil_index"] == pytest.approx(sum(b / mean * math.log(b / mean) for b in positive) / n)
+    assert snapshot.concentration_stats() is stats
+
+    # 3000/3978.5 = 75.4%, 800 = 20.1%, 120 = 3.0%: two holders at or above 5%
+    count, share = snapshot.holders_above(5.0)
+    assert count == 2
+    assert share == pytest.approx((3000 + 800) / total * 100)
+    assert snapshot.holders_above(100 * 800 / total, inclusive=False)[0] == 1
+
+
+def test_concurrent_analyzers_share_one_fetch_per_ttl():
+    birdeye = FakeBirdeye(items=_holders(BALANCES))
+    service = HolderSnapshotService(birdeye, ttl_seconds=60)
+
+    async def run():
+        first = await asyncio.gather(*(service.get_snapshot("token") for _ in range(5)))
+        again = await service.get_snapshot("token")
+        return first, again
+
+    first, again = asyncio.run(run())
+
+    assert birdeye.holder_calls == 1
+    assert all(snapshot is again for snapshot in first)
+    assert service.get_stats()["shared_fetches"] == 4
+
+    service.ttl_seconds = 0
+    asyncio.run(service.get_snapshot("token"))
+    assert birdeye.holder_calls == 2
+
+
+def test_concentration_analyzer_falls_back_to_top_traders():
+    traders = [{"address": "trader1", "volumeUsd": 900}, {"address": "trader2", "volumeUsd": 100}]
+    birdeye = FakeBirdeye(items=[], traders=traders)
+    analyzer = HolderConcentrationAnalyzer(
+        birdeye, logging.getLogger("test"), snapshot_service=HolderSnapshotService(birdeye)
+    )
+
+    analysis = asyncio.run(analyzer.analyze_holder_concentration("token"))
+
+    assert analysis["holder_data_available"]
+    assert analysis["total_holders"] == 2
+    assert analysis["concentration_metrics"]["concentration_ratio_4"] == pytest.approx(1.0)
+    assert analysis["whale_analysis"]["whales"][0]["address"] == "trader1"
+    assert analysis["holder_distribution"]["holder_count_by_size"]["whales"] == 2
+
+
+def test_snapshot_skips_holders_without_an_address():
+    holders = _holders([100.0, 50.0]) + [{"owner": "", "ui_amount": 900.0}, {"ui_amount": 400.0}]
+    snapshot = HolderSnapshot("token", holders)
+
+    assert snapshot.holder_count == 2
+    assert snapshot.addresses == ["wallet0", "wallet1"]
+    assert snapshot.top_share_pct(1) == pytest.approx(100 / 150 * 100)
+
+
+def test_snapshot_cache_evicts_least_recently_used():
+    birdeye = FakeBirdeye(items=_holders(BALANCES))
+    service = HolderSnapshotService(birdeye, max_snapshots=2)
+
+    async def run():
+        await service.get_snapshot("a")
+        await service.get_snapshot("b")
+        await service.get_snapshot("a")
+        await service.get_snapshot("c")
+        await service.get_snapshot("a")
+        await service.get_snapshot("b")
+
+    asyncio.run(run())
+
+    # "b" was least recently used when "c" arrived, so only it had to be refetched
+    assert birdeye.holder_calls == 4
+    assert service.get_stats()["cached_snapshots"] == 2
+    assert service.stats["evictions"] == 2
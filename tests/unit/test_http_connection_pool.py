@@ -0,0 +1,67 @@
+import asyncio
+
+from aiohttp import web
+
+from utils.http_client_manager import HTTPClientFactory, upstream_for_url
+
+
+async def _ping(request):
+    return web.json_response({"ok": True})
+
+
+async def _serve():
+    app = web.Application()
+    app.router.add_get("/ping", _ping)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}/ping"
+
+
+def test_sessions_share_pooled_connections_and_report_reuse():
+    async def run():
+        runner, url = await _serve()
+        try:
+            for _ in range(3):
+                # Short-lived sessions, like per-call fetchers, still reuse warm connections
+                async with HTTPClientFactory.create_session("moralis") as session:
+                    async with session.get(url) as response:
+                        assert (await response.json()) == {"ok": True}
+
+            shared = HTTPClientFactory.get_shared_session("moralis")
+            assert HTTPClientFactory.get_shared_session("moralis") is shared
+            async with shared.get(url) as response:
+                await response.read()
+
+            return HTTPClientFactory.get_pool_stats()["moralis"]
+        finally:
+            await HTTPClientFactory.close_all()
+            await runner.cleanup()
+
+    stats = asyncio.run(run())
+
+    assert stats["requests"] == 4
+    assert stats["connections_created"] == 1
+    assert stats["connections_reused"] == 3
+    assert stats["reuse_rate"] == 0.75
+
+
+def test_pool_is_rebuilt_for_a_new_event_loop():
+    async def connector():
+        pooled = HTTPClientFactory.get_connector("raydium")
+        await HTTPClientFactory.close_all()
+        return pooled
+
+    first = asyncio.run(connector())
+    second = asyncio.run(connector())
+
+    assert first is not second
+
+
+def test_upstream_for_url():
+    assert upstream_for_url("https://api.raydium.io/v2/main/pairs") == "raydium"
+    assert upstream_for_url("https://quote-api.jup.ag/v6/quote") == "jupiter"
+    assert upstream_for_url("https://api.mainnet-beta.solana.com") == "solana_rpc"
+    assert upstream_for_url("https://example.com/raydium.io") == "default"
@@ -0,0 +1,71 @@
+import asyncio
+import json
+
+import pytest
+
+from utils.json_stream import JsonArrayStream, stream_json_array
+
+
+def _chunks(payload: bytes, size: int):
+    async def gen():
+        for start in range(0, len(payload), size):
+            yield payload[start:start + size]
+    return gen()
+
+
+PAIRS = [
+    {"name": "BONK/SOL", "baseMint": "bonk", "quoteMint": "So11111111111111111111111111111111111111112", "liquidity": 12.5},
+    {"name": "USDC/USDT", "baseMint": "usdc", "quoteMint": "usdt", "tags": ["stable", "[not] a bracket"]},
+    {"name": "WIF/SOL é☃", "baseMint": "So11111111111111111111111111111111111111112", "quoteMint": "wif"},
+    7,
+    -1.5e3,
+    None,
+]
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 1 << 20])
+def test_elements_match_json_loads_for_any_chunking(size):
+    payload = json.dumps(PAIRS, ensure_ascii=False, indent=1).encode()
+
+    elements = asyncio.run(stream_json_array(_chunks(payload, size)))
+
+    assert elements == PAIRS
+
+
+def test_follows_path_through_objects_and_skips_siblings():
+    payload = json.dumps({
+        "id": "x", "meta": {"data": [1, 2]}, "success": True,
+        "data": {"count": 3, "data": PAIRS[:3], "hasNextPage": False},
+    }).encode()
+
+    elements = asyncio.run(stream_json_array(_chunks(payload, 5), path=("data", "data")))
+
+    assert elements == PAIRS[:3]
+
+
+def test_stops_reading_once_limit_is_reached():
+    payload = json.dumps(PAIRS[:3] * 1000).encode()
+    parser = JsonArrayStream()
+
+    sol_pairs = asyncio.run(stream_json_array(
+        _chunks(payload, 256),
+        predicate=lambda item: "So11111111111111111111111111111111111111112" in (item["baseMint"], item["quoteMint"]),
+        limit=4,
+        stream=parser,
+    ))
+
+    assert [pair["name"] for pair in sol_pairs] == ["BONK/SOL", "WIF/SOL é☃"] * 2
+    assert parser.bytes_consumed < 2048
+    assert not parser.done
+
+
+@pytest.mark.parametrize("payload", [b'[{"a": 1}, {"a": ', b'[1 2]', b'{"data": 5}', b''])
+def test_malformed_or_truncated_payload_raises(payload):
+    with pytest.raises(json.JSONDecodeError):
+        asyncio.run(stream_json_array(_chunks(payload, 4), path=("data",)))
+
+
+def test_missing_path_yields_nothing():
+    payload = b'{"success": false, "msg": "busy"}'
+
+    assert asyncio.run(stream_json_array(_chunks(payload, 4), path=("data", "data"))) == []
@@ -0,0 +1,56 @@
+import os
+
+from core_local.popularity_sketch import PopularitySketch
+
+
+def test_counts_are_never_underestimated():
+    sketch = PopularitySketch(width=64, depth=4, sample_size=10**9)
+    expected = {}
+    for i in range(500):
+        token = f"token{i % 150}"
+        sketch.record(token)
+        expected[token] = expected.get(token, 0) + 1
+
+    for token, count in expected.items():
+        assert sketch.estimate(token) >= count
+
+
+def test_hottest_tracks_frequent_tokens_within_bound():
+    sketch = PopularitySketch(width=1024, top_k=5, sample_size=10**9)
+    for cycle in range(10):
+        sketch.record_many(["hot1", "hot2", "hot2"])  # duplicates within a cycle count once
+        sketch.record_many(f"cold{cycle}_{i}" for i in range(20))
+
+    hottest = sketch.hottest(2)
+    assert {token for token, _ in hottest} == {"hot1", "hot2"}
+    assert all(count == 10 for _, count in hottest)
+    assert sketch.get_stats()["tracked_candidates"] <= 5
+
+
+def test_decay_halves_counts():
+    sketch = PopularitySketch(width=256, sample_size=8)
+    for _ in range(7):
+        sketch.record("token")
+    assert sketch.estimate("token") == 7
+
+    sketch.record("token")  # 8th event triggers the periodic decay
+    assert sketch.estimate("token") == 4
+    assert sketch.get_stats()["decays"] == 1
+
+
+def test_estimates_do_not_depend_on_the_hash_seed():
+    import subprocess
+    import sys
+
+    script = (
+        "from core_local.popularity_sketch import PopularitySketch\n"
+        "s = PopularitySketch(width=8, depth=2, sample_size=10**9)\n"
+        "[s.record(f't{i}') for i in range(40)]\n"
+        "print(s._indexes('token'), s.estimate('t0'))"
+    )
+    outputs = {
+        subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                       env={**os.environ, "PYTHONHASHSEED": seed}).stdout
+        for seed in ("1", "2", "3")
+    }
+    assert len(outputs) == 1
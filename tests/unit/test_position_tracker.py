@@ -0,0 +1,69 @@
+import sqlite3
+
+from services.position_tracker import PositionTracker
+
+
+def _tracker(tmp_path, **kwargs):
+    kwargs.setdefault("flush_interval_seconds", 3600)
+    return PositionTracker(db_path=str(tmp_path / "positions.db"), **kwargs)
+
+
+def test_uses_wal_journal(tmp_path):
+    tracker = _tracker(tmp_path)
+    with tracker._get_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    tracker.close()
+
+
+def test_bulk_price_update_skips_closed_positions(tmp_path):
+    tracker = _tracker(tmp_path)
+    first = tracker.add_position("u1", "tokenA", "A", "Token A", 1.0)
+    second = tracker.add_position("u1", "tokenB", "B", "Token B", 2.0)
+    tracker.close_position(second)
+
+    assert tracker.update_position_prices({first: 1.5, second: 3.0}) == 1
+    assert tracker.get_position(first).current_price == 1.5
+    assert tracker.get_position(second).current_price == 2.0
+    tracker.close()
+
+
+def test_queued_writes_are_batched_and_read_back(tmp_path):
+    tracker = _tracker(tmp_path)
+    position_id = tracker.add_position("u1", "tokenA", "A", "Token A", 1.0)
+
+    tracker.queue_price_update(position_id, 1.1)
+    tracker.queue_price_update(position_id, 1.2)
+    tracker.queue_alert(position_id, "exit_signal", 75.0, "Exit signal: EXIT")
+
+    # Nothing written until a flush, which reads trigger implicitly
+    raw = sqlite3.connect(tracker.db_path)
+    assert raw.execute("SELECT current_price FROM positions").fetchone()[0] == 1.0
+    raw.close()
+
+    assert tracker.get_position(position_id).current_price == 1.2
+    assert [alert.alert_type for alert in tracker.get_position_alerts(position_id)] == ["exit_signal"]
+    assert tracker.write_stats == {"flushes": 1, "prices_flushed": 1, "alerts_flushed": 1}
+    tracker.close()
+
+
+def test_queue_flushes_when_full(tmp_path):
+    tracker = _tracker(tmp_path, max_pending_writes=3)
+    ids = [tracker.add_position("u1", f"token{i}", f"T{i}", f"Token {i}", 1.0) for i in range(3)]
+
+    for position_id in ids:
+        tracker.queue_price_update(position_id, 2.0)
+
+    assert tracker.write_stats["prices_flushed"] == 3
+    assert tracker.flush() == 0
+    tracker.close()
+
+
+def test_close_flushes_pending_writes(tmp_path):
+    tracker = _tracker(tmp_path)
+    position_id = tracker.add_position("u1", "tokenA", "A", "Token A", 1.0)
+    tracker.queue_price_update(position_id, 4.0)
+    tracker.close()
+
+    reopened = _tracker(tmp_path)
+    assert reopened.get_position(position_id).current_price == 4.0
+    reopened.close()
@@ -0,0 +1,105 @@
+import logging
+
+from services.pump_dump_detector import EnhancedPumpDumpDetector, PumpDumpResult
+
+TOKENS = [
+    {"token_symbol": "MEGA", "price_change_1h_percent": 320, "price_change_4h_percent": 90,
+     "price_change_24h_percent": 1500, "volume_24h": 2_400_000, "volume_1h": 1_200_000,
+     "market_cap": 80_000, "unique_trader_count": 3},
+    {"token_symbol": "CRASH", "price_change_1h_percent": -75, "price_change_4h_percent": -20,
+     "price_change_24h_percent": 600, "volume_24h": 120_000, "volume_1h": 40_000,
+     "market_cap": 500_000, "unique_trader_count": 40},
+    {"token_symbol": "CALM", "price_change_1h_percent": 2, "price_change_4h_percent": 5,
+     "price_change_24h_percent": 8, "volume_24h": 50_000, "volume_1h": 2_000,
+     "market_cap": 1_000_000, "unique_trader_count": 300},
+    {"token_symbol": "BROKEN", "volume_24h": "n/a"},
+]
+
+
+def quiet_logger(level=logging.WARNING):
+    logger = logging.getLogger(f"test_pump_dump_batch.{level}")
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
+
+
+def test_batch_matches_single_token_analysis():
+    detector = EnhancedPumpDumpDetector(quiet_logger())
+
+    results = detector.analyze_batch(TOKENS)
+
+    assert [result.token_symbol for result in results] == ["MEGA", "CRASH", "CALM", "BROKEN"]
+    for result, token in zip(results, TOKENS):
+        assert result.analysis == detector.analyze_token(token)
+    assert [result.risk_level for result in results] == ["CRITICAL", "CRITICAL", "MINIMAL", "UNKNOWN"]
+    assert results[0].current_phase == "EXTREME_PUMP"
+    assert results[1].current_phase == "DUMP_START"
+    assert "VOLUME_MANIPULATION" in results[0].warning_flags
+    assert results[1].analysis["dump_indicators"]["details"]["extreme_crash"] == "EXTREME CRASH: -75.0% in 1 hour"
+    assert results[3].analysis["warning_flags"] == ["ANALYSIS_ERROR"]
+
+
+def test_details_are_formatted_only_when_needed(monkeypatch):
+    detector = EnhancedPumpDumpDetector(quiet_logger(logging.CRITICAL))
+    formatted = []
+    original = PumpDumpResult._build_analysis
+
+    def counting(self):
+        formatted.append(self.token_symbol)
+        return original(self)
+
+    monkeypatch.setattr(PumpDumpResult, "_build_analysis", counting)
+
+    results = detector.analyze_batch(TOKENS[:3])
+    for result in results:
+        result.log_diagnostics(detector.logger)
+    assert formatted == []
+    assert results[0].total_score > results[2].total_score
+
+    analysis = results[0].analysis
+    assert results[0].analysis is analysis
+    assert formatted == ["MEGA"]
+
+
+def test_triage_screens_all_candidates_in_one_batch():
+    import asyncio
+    from types import SimpleNamespace
+
+    from services.early_token_detection import EarlyTokenDetector
+
+    detector = EarlyTokenDetector.__new__(EarlyTokenDetector)
+    detector.logger = quiet_logger()
+    detector.api_call_metrics = {"total_tokens_analyzed": 0}
+    pump_dump = EnhancedPumpDumpDetector(logger=quiet_logger())
+    batches = []
+    original_batch = pump_dump.analyze_batch
+    pump_dump.analyze_batch = lambda tokens: batches.append(tokens) or original_batch(tokens)
+    pump_dump.analyze_token = lambda token: (_ for _ in ()).throw(AssertionError("screened one at a time"))
+    detector.pump_dump_detector = pump_dump
+
+    overviews = {
+        "mega": {"priceChange1h": 320, "priceChange4h": 90, "priceChange24h": 1500,
+                 "volume": {"h24": 2_400_000, "h1": 1_200_000}, "marketCap": 80_000},
+        "calm": {"priceChange1h": 2, "priceChange4h": 5, "priceChange24h": 8,
+                 "volume": {"h24": 50_000, "h1": 2_000}, "marketCap": 1_000_000},
+    }
+
+    async def get_full_analysis_data(address):
+        return {"overview": overviews[address], "top_traders": [{}] * 3}
+
+    detector.data_manager = SimpleNamespace(get_full_analysis_data=get_full_analysis_data)
+    built = {}
+
+    async def build(token, full_data, basic_metrics, security_data, pump_dump_result=None):
+        built[token["address"]] = pump_dump_result
+        return {"address": token["address"]}
+
+    detector._build_token_analysis = build
+    tokens = [{"address": "mega", "symbol": "MEGA"}, {"address": "calm", "symbol": "CALM"}]
+
+    results = asyncio.run(detector._full_token_analysis_individual(tokens, {}, {}))
+
+    assert [r["address"] for r in results] == ["mega", "calm"]
+    assert len(batches) == 1 and [t["token_symbol"] for t in batches[0]] == ["MEGA", "CALM"]
+    assert built["mega"].risk_score > built["calm"].risk_score
+    assert built["mega"].token_symbol == "MEGA"
@@ -0,0 +1,160 @@
+import base64
+import struct
+
+from services.pump_fun_account_decoder import (
+    BONDING_CURVE_DISCRIMINATOR,
+    INITIAL_REAL_TOKEN_RESERVES,
+    b58encode,
+    decode_bonding_curve,
+    decode_bonding_curves,
+)
+
+CREATOR = bytes(range(1, 33))
+
+
+def _curve_account(real_token_reserves, real_sol_reserves=0, complete=False, creator=CREATOR):
+    return (
+        BONDING_CURVE_DISCRIMINATOR
+        + struct.pack(
+            "<5Q?",
+            1_073_000_000_000_000,
+            30_000_000_000,
+            real_token_reserves,
+            real_sol_reserves,
+            1_000_000_000_000_000,
+            complete,
+        )
+        + creator
+    )
+
+
+def test_decodes_reserves_and_progress():
+    sold = INITIAL_REAL_TOKEN_RESERVES // 4
+    state = decode_bonding_curve(_curve_account(INITIAL_REAL_TOKEN_RESERVES - sold, 21_000_000_000), "curve1")
+
+    assert state.account == "curve1"
+    assert state.creator == b58encode(CREATOR)
+    assert state.graduation_progress == 25.0
+    assert state.sol_in_curve == 21.0
+    assert abs(state.price_sol - 30 / 1_073_000_000) < 1e-15
+    assert state.to_dict(sol_price_usd=100)["market_cap"] == state.market_cap_sol * 100
+
+
+def test_complete_curve_is_fully_graduated():
+    state = decode_bonding_curve(_curve_account(0, complete=True))
+    assert state.complete
+    assert state.graduation_progress == 100.0
+
+
+def test_legacy_layout_without_creator():
+    state = decode_bonding_curve(_curve_account(INITIAL_REAL_TOKEN_RESERVES, creator=b""))
+    assert state.creator is None
+    assert state.graduation_progress == 0.0
+
+
+def test_rejects_other_account_types():
+    data = _curve_account(INITIAL_REAL_TOKEN_RESERVES)
+    assert decode_bonding_curve(b"\x00" * 8 + data[8:]) is None
+    assert decode_bonding_curve(data[:20]) is None
+
+
+def test_decode_burst_skips_non_curve_payloads():
+    burst = [
+        ("a", base64.b64encode(_curve_account(INITIAL_REAL_TOKEN_RESERVES // 2)).decode()),
+        ("b", base64.b64encode(b"\x01" * 165).decode()),
+        ("c", ""),
+        ("d", base64.b64encode(_curve_account(0, complete=True)).decode()),
+    ]
+    decoded = decode_bonding_curves(burst)
+    assert [state.account for state in decoded] == ["a", "d"]
+    assert decoded[0].graduation_progress == 50.0
+
+
+def test_monitor_does_not_report_sol_values_as_usd():
+    import asyncio
+    import logging
+
+    from services.pump_fun_rpc_monitor import PumpFunRPCMonitor
+
+    state = decode_bonding_curve(_curve_account(INITIAL_REAL_TOKEN_RESERVES // 2), "curve1")
+    event = {"bonding_curve": state}
+
+    without_price = PumpFunRPCMonitor(logger=logging.getLogger("test"), debug_mode=False)
+    token = asyncio.run(without_price._fetch_token_data("curve1", event))
+    assert "market_cap" not in token and "price" not in token
+    assert token["market_cap_sol"] == state.market_cap_sol
+    assert PumpFunRPCMonitor._format_market_cap(token).endswith(" SOL")
+
+    with_price = PumpFunRPCMonitor(logger=logging.getLogger("test"), debug_mode=False, sol_price_usd=150)
+    token = asyncio.run(with_price._fetch_token_data("curve1", event))
+    assert token["market_cap"] == state.market_cap_sol * 150
+
+
+class _FakeResponse:
+    status = 200
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    async def json(self):
+        return self._payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeRPCSession:
+    def __init__(self, mint):
+        self.mint = mint
+        self.calls = []
+
+    def post(self, url, json):
+        self.calls.append(json)
+        owner, program = json["params"][0], json["params"][1]["programId"]
+        accounts = []
+        if program.startswith("Tokenkeg"):
+            accounts = [{
+                "pubkey": "vault",
+                "account": {"data": {"parsed": {"info": {"mint": self.mint, "owner": owner}}}},
+            }]
+        return _FakeResponse({"jsonrpc": "2.0", "id": 1, "result": {"value": accounts}})
+
+
+def test_monitor_reports_the_mint_not_the_curve_account():
+    import asyncio
+    import logging
+
+    from services.pump_fun_rpc_monitor import PumpFunRPCMonitor
+
+    raw = _curve_account(INITIAL_REAL_TOKEN_RESERVES // 2)
+    event = {
+        "event_type": "token_creation",
+        "timestamp": 1_700_000_000,
+        "account_pubkey": "curve1",
+        "bonding_curve": decode_bonding_curve(raw, "curve1"),
+        "raw_data": raw,
+    }
+    monitor = PumpFunRPCMonitor(logger=logging.getLogger("test"), debug_mode=False)
+    monitor.session = _FakeRPCSession("mint1")
+    reported = []
+
+    async def on_new_token(token):
+        reported.append(token)
+
+    monitor.set_callbacks(on_new_token=on_new_token)
+    asyncio.run(monitor._handle_token_creation(event))
+    asyncio.run(monitor._handle_token_creation(event))
+
+    assert [token["token_address"] for token in reported] == ["mint1", "mint1"]
+    assert reported[0]["bonding_curve_address"] == "curve1"
+    assert list(monitor.detected_tokens) == ["curve1"]
+    # The resolved mint is cached per curve
+    assert len(monitor.session.calls) == 1
+
+    # Without a way to resolve the mint nothing is reported under the curve address
+    unresolved = PumpFunRPCMonitor(logger=logging.getLogger("test"), debug_mode=False)
+    asyncio.run(unresolved._handle_token_creation(event))
+    assert unresolved.detected_tokens == {}
@@ -0,0 +1,114 @@
+import asyncio
+
+from aiohttp import web
+
+from api.solana_rpc_client import SolanaRPCClient
+from utils.http_client_manager import HTTPClientFactory
+
+
+async def _serve(handler):
+    app = web.Application()
+    app.router.add_post("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}/"
+
+
+def _rpc_node(received):
+    async def handler(request):
+        body = await request.json()
+        received.append(body)
+        if not isinstance(body, list):
+            return web.json_response({"jsonrpc": "2.0", "id": None, "error": {"code": -32600}})
+        responses = []
+        for call in reversed(body):  # Batch responses may come back in any order
+            if call["method"] == "getMultipleAccounts":
+                value = [None if key.startswith("missing") else {"lamports": 1, "data": [key, "base64"]}
+                         for key in call["params"][0]]
+                responses.append({"jsonrpc": "2.0", "id": call["id"], "result": {"context": {"slot": 7}, "value": value}})
+            elif call["method"] == "getBalance":
+                responses.append({"jsonrpc": "2.0", "id": call["id"], "result": 5})
+            else:
+                responses.append({"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32601}})
+        return web.json_response(responses)
+    return handler
+
+
+async def _down(request):
+    return web.Response(status=503)
+
+
+def test_multiple_accounts_are_packed_into_one_batch_round_trip():
+    async def run():
+        received = []
+        runner, url = await _serve(_rpc_node(received))
+        try:
+            client = SolanaRPCClient([url])
+            addresses = [f"acct{i}" for i in range(250)] + ["missing1", "acct0"]
+            accounts = await client.get_multiple_accounts(addresses)
+            return client, received, accounts
+        finally:
+            await HTTPClientFactory.close_all()
+            await runner.cleanup()
+
+    client, received, accounts = asyncio.run(run())
+
+    # 251 unique keys -> 3 getMultipleAccounts calls, sent as one JSON-RPC batch
+    assert len(received) == 1
+    assert [len(call["params"][0]) for call in received[0]] == [100, 100, 51]
+    assert len(accounts) == 251
+    assert accounts["acct249"] == {"context": {"slot": 7}, "value": {"lamports": 1, "data": ["acct249", "base64"]}}
+    assert accounts["missing1"]["value"] is None
+    assert client.get_stats()["round_trips"] == 1
+
+
+def test_batch_matches_results_by_id_and_fails_over_unhealthy_endpoint():
+    async def run():
+        received = []
+        bad_runner, bad_url = await _serve(_down)
+        good_runner, good_url = await _serve(_rpc_node(received))
+        try:
+            client = SolanaRPCClient([bad_url, good_url], hedge_delay=5.0)
+            results = await client.batch([("getBalance", ["a"]), ("getSlot", []), ("getBalance", ["b"])])
+            return client, results
+        finally:
+            await HTTPClientFactory.close_all()
+            await bad_runner.cleanup()
+            await good_runner.cleanup()
+
+    client, results = asyncio.run(run())
+
+    assert results == [5, None, 5]
+    stats = client.get_stats()
+    assert stats["call_errors"] == 1
+    endpoints = stats["endpoints"]
+    assert [health["failures"] for health in endpoints.values()] == [1, 0]
+
+
+def test_pool_analysis_stays_bounded_when_the_prefetch_fails():
+    from services.accurate_sol_bonding_analyzer import AccurateSolBondingAnalyzer
+
+    analyzer = AccurateSolBondingAnalyzer()
+    analyzer.MAX_CONCURRENT = 2
+    running, peak = 0, 0
+
+    async def failed_prefetch(addresses):
+        return {}
+
+    async def analyze(pool):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return pool
+
+    analyzer.get_multiple_account_info = failed_prefetch
+    analyzer.analyze_pool_accurate = analyze
+
+    results = asyncio.run(analyzer.analyze_multiple_pools([{"pool_id": f"pool{i}"} for i in range(6)]))
+    assert len(results) == 6
+    assert peak == 2
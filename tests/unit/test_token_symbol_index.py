@@ -0,0 +1,94 @@
+import asyncio
+import logging
+
+from services.telegram_bot_handler import TelegramBotHandler
+from services.token_symbol_index import TokenSymbolIndex
+
+BONK = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+BONK_COPY = "BoNkCoPy1111111111111111111111111111111111111"
+WIF = "EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm"
+
+
+def build_index(**kwargs):
+    index = TokenSymbolIndex(**kwargs)
+    index.record_tokens([
+        {"address": BONK, "symbol": "BONK", "name": "Bonk", "liquidity": 5_000_000},
+        {"address": BONK_COPY, "symbol": "BONK", "name": "Bonk Inu", "liquidity": 1_200},
+        {"address": WIF, "symbol": "WIF", "name": "dogwifhat", "liquidity": "2500000"},
+        {"address": "no-symbol"},
+        "not a token",
+    ])
+    return index
+
+
+def test_exact_prefix_and_fuzzy_resolution():
+    index = build_index()
+
+    assert len(index) == 3
+    assert index.resolve(WIF).symbol == "WIF"
+    # The most liquid token wins a shared symbol
+    assert index.resolve("bonk").address == BONK
+    assert index.resolve("DogWifHat").address == WIF
+    assert index.resolve("BON") is None
+
+    assert [entry.address for entry in index.search("bon")] == [BONK, BONK_COPY]
+    assert [entry.address for entry in index.search("bonk inu")] == [BONK_COPY]
+    assert [entry.address for entry in index.search("dogwifaht")] == [WIF]
+    assert index.search("dogwifaht", fuzzy=False) == []
+    assert index.get_stats()["fuzzy_hits"] == 1
+
+
+def test_refresh_renames_and_eviction_update_keys():
+    index = build_index(max_tokens=3)
+
+    index.record(WIF, symbol="WIFF")
+    assert index.resolve("wif") is None
+    assert index.resolve("wiff").name == "dogwifhat"
+
+    # Adding a fourth token evicts the least recently seen one (BONK)
+    index.record("NEW111", symbol="NEW", name="New Token")
+    assert BONK not in index
+    assert index.resolve("bonk").address == BONK_COPY
+    assert [entry.address for entry in index.search("new")] == ["NEW111"]
+    assert index.get_stats()["evicted"] == 1
+
+
+class _FakeSearch:
+    def __init__(self, results):
+        self.results = results
+        self.queries = []
+
+    async def search_token_by_symbol(self, symbol):
+        self.queries.append(symbol)
+        return self.results
+
+
+def build_handler(index, search_results):
+    handler = TelegramBotHandler.__new__(TelegramBotHandler)
+    handler.logger = logging.getLogger("test")
+    handler.symbol_index = index
+    handler.cross_platform_analyzer = _FakeSearch(search_results)
+    return handler
+
+
+def test_track_resolves_symbols_live_and_only_suggests_local_matches():
+    index = TokenSymbolIndex()
+    # A copycat indexed from search results (no liquidity) shares the canonical symbol
+    index.record_tokens([{"address": BONK_COPY, "symbol": "BONK", "name": "Bonk Inu"}])
+    handler = build_handler(index, [{"address": BONK, "symbol": "BONK", "name": "Bonk"}])
+
+    # An exact index symbol hit does not skip the live lookup
+    assert asyncio.run(handler._resolve_token("BONK")) == (BONK, "BONK", "Bonk")
+    assert handler.cross_platform_analyzer.queries == ["BONK"]
+
+    # Exact addresses resolve locally
+    assert asyncio.run(handler._resolve_token(BONK_COPY)) == (BONK_COPY, "BONK", "Bonk Inu")
+    assert handler.cross_platform_analyzer.queries == ["BONK"]
+
+    # Nothing found live: close matches are offered for confirmation, not tracked
+    handler.cross_platform_analyzer.results = []
+    assert asyncio.run(handler._resolve_token("BONKK")) == (None, None, None)
+    reply = asyncio.run(handler._handle_track_command("user", ["BONKK", "0.001"]))
+    assert "Did you mean" in reply
+    assert BONK in reply and BONK_COPY in reply
+    assert "Could not find token" in asyncio.run(handler._handle_track_command("user", ["ZZZZ", "0.001"]))
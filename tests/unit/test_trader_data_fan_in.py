@@ -0,0 +1,78 @@
+import asyncio
+
+from services.trader_data_fan_in import RequestFanIn
+from services.trader_performance_analyzer import PerformanceTimeframe, TraderPerformanceAnalyzer
+
+
+class FakeBirdeyeAPI:
+    def __init__(self):
+        self.portfolio_calls = []
+        self.transaction_calls = []
+        self.token_list_calls = 0
+
+    async def get_wallet_portfolio(self, address):
+        self.portfolio_calls.append(address)
+        await asyncio.sleep(0.01)
+        return {"success": True, "data": {"totalValueUsd": 250000, "items": [{"address": "TOKEN"}]}}
+
+    async def get_token_list(self, **kwargs):
+        self.token_list_calls += 1
+        tokens = [{"address": f"token{i}"} for i in range(12)]
+        return {"success": True, "data": {"tokens": tokens}}
+
+    async def get_token_transactions(self, token_address, limit=20):
+        self.transaction_calls.append(token_address)
+        return [{"owner": f"wallet{index}"} for index in range(3)] + [{"user": f"{token_address}_user"}]
+
+
+def test_fan_in_dedups_shares_in_flight_and_retries_failures():
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return None if key == "bad" else key.upper()
+
+    fan_in = RequestFanIn(fetch, max_concurrency=2)
+
+    async def run():
+        first, second = await asyncio.gather(fan_in.gather(["a", "b", "a", "bad"]), fan_in.gather(["b", "c"]))
+        third = await fan_in.gather(["a", "c", "bad"])
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+
+    assert first == {"a": "A", "b": "B", "bad": None}
+    assert second == {"b": "B", "c": "C"}
+    assert third == {"a": "A", "c": "C", "bad": None}
+    assert sorted(calls) == ["a", "b", "bad", "bad", "c"]
+    stats = fan_in.get_stats()
+    assert stats["duplicates"] == 1
+    assert stats["shared_fetches"] == 1
+    assert stats["hits"] == 2
+
+
+def test_discovery_fetches_each_wallet_and_token_once_across_timeframes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    api = FakeBirdeyeAPI()
+    analyzer = TraderPerformanceAnalyzer(api)
+
+    async def run():
+        results = {}
+        for timeframe in (PerformanceTimeframe.HOUR_24, PerformanceTimeframe.DAYS_7):
+            traders = await analyzer._get_traders_from_top_tokens(timeframe)
+            addresses = sorted(traders) + sorted(traders)[:3]
+            results[timeframe] = (traders, await analyzer._analyze_traders_batched(addresses, timeframe))
+        return results
+
+    results = asyncio.run(run())
+
+    traders_24h, profiles_24h = results[PerformanceTimeframe.HOUR_24]
+    traders_7d, profiles_7d = results[PerformanceTimeframe.DAYS_7]
+    assert traders_24h == traders_7d
+    assert len(traders_24h) == 3 + 10
+    assert sorted(api.transaction_calls) == sorted(f"token{i}" for i in range(10))
+    assert sorted(api.portfolio_calls) == sorted(traders_24h)
+    for profile in profiles_24h + profiles_7d:
+        assert profile.address in traders_24h
+        assert profile.discovery_score >= 60
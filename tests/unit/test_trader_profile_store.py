@@ -0,0 +1,56 @@
+import asyncio
+import json
+
+from services.trader_alert_system import TraderAlertSystem, TraderAlertType
+from services.trader_performance_analyzer import PerformanceTimeframe, TraderProfile, TraderTier
+
+
+def profile(address, tier=TraderTier.ELITE, score=90.0, risk=20.0):
+    return TraderProfile(
+        address=address, name=f"Trader {address}", tier=tier, performance_24h=None,
+        performance_7d=None, performance_30d=None, tokens_traded=[], favorite_tokens=[],
+        discovery_score=score, risk_score=risk, confidence=0.9, last_updated=0, tags=[]
+    )
+
+
+class FakeAnalyzer:
+    def __init__(self):
+        self.traders = {}
+        self.calls = 0
+
+    async def discover_top_traders(self, timeframe, limit):
+        self.calls += 1
+        return self.traders.get(timeframe, [])
+
+
+def test_alerts_only_for_changed_profiles_and_state_survives_restart(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    analyzer = FakeAnalyzer()
+    analyzer.traders = {
+        PerformanceTimeframe.HOUR_24: [profile("w1"), profile("w2", TraderTier.ADVANCED, 60)],
+        PerformanceTimeframe.DAYS_7: [profile("w1", TraderTier.PROFESSIONAL, 80)],
+    }
+    system = TraderAlertSystem(analyzer)
+
+    first = asyncio.run(system.monitor_trader_performance())
+    assert sorted((a.alert_type.value, a.trader_address) for a in first) == sorted([
+        (TraderAlertType.NEW_ELITE_DISCOVERY.value, "w1"),
+        (TraderAlertType.CONSISTENT_PERFORMER.value, "w1"),
+    ])
+    assert system.profile_store.timeframes_for("w1") == {"24h", "7d"}
+
+    # An unchanged scan produces no alerts and journals no profile records
+    journal = system.profile_store.history_store.journal_file
+    assert asyncio.run(system.monitor_trader_performance()) == []
+    assert not [line for line in journal.read_text().splitlines() if json.loads(line)["op"] == "put"]
+
+    analyzer.traders[PerformanceTimeframe.HOUR_24] = [profile("w1"), profile("w2", TraderTier.ELITE, 95, risk=60)]
+    third = asyncio.run(system.monitor_trader_performance())
+    assert sorted(a.alert_type.value for a in third) == ["performance_spike", "risk_change", "tier_upgrade"]
+    assert {a.trader_address for a in third} == {"w2"}
+
+    restarted = TraderAlertSystem(FakeAnalyzer())
+    assert restarted.trader_history["w2_24h"]["tier"] == "elite"
+    assert restarted.profile_store.addresses_in("7d") == {"w1"}
+    assert "consistent_w1" in restarted.last_alert_times
+    assert restarted.get_alert_stats()["tracked_traders"] == 3
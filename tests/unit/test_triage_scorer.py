@@ -0,0 +1,95 @@
+import random
+
+from src.scoring.triage_scorer import TriageScorer
+
+ADDRESS = "A" * 44
+
+
+def legacy_priority(candidate):
+    """Reference implementation of the original hand-written Stage 1 ladders."""
+    score = 0
+    source = candidate.get("source", "unknown")
+    if source == "moralis_graduated":
+        hours = candidate.get("hours_since_graduation", 999)
+        mc = candidate.get("market_cap", 0)
+        liq = candidate.get("liquidity", 0)
+        score += 40 if hours <= 1 else 25 if hours <= 6 else 15 if hours <= 12 else 0
+        if 50000 <= mc <= 2000000:
+            score += 20
+        elif 10000 <= mc <= 50000:
+            score += 15
+        elif mc > 2000000:
+            score += 5
+        score += 15 if liq > 50000 else 10 if liq > 10000 else 5 if liq > 1000 else 0
+    elif source == "moralis_bonding":
+        progress = candidate.get("bonding_curve_progress", 0)
+        mc = candidate.get("market_cap", 0)
+        for bound, points in ((95, 50), (90, 35), (85, 25), (75, 15), (50, 10)):
+            if progress >= bound:
+                score += points
+                break
+        if 5000 <= mc <= 500000:
+            score += 15
+        elif 0 < mc < 5000:
+            score += 10
+    elif source == "birdeye_trending":
+        score += 30
+    elif source == "sol_bonding_detector":
+        score += 20
+    if candidate.get("address") and len(candidate.get("address", "")) == 44:
+        score += 5
+    symbol = candidate.get("symbol", "")
+    if symbol and symbol != "Unknown" and len(symbol) <= 10:
+        score += 3
+    age = candidate.get("estimated_age_minutes", 999)
+    score += 8 if age <= 60 else 5 if age <= 360 else 2 if age <= 1440 else 0
+    return score
+
+
+def test_default_rules_match_legacy_ladders():
+    rng = random.Random(7)
+    sources = ["moralis_graduated", "moralis_bonding", "birdeye_trending", "sol_bonding_detector", "other"]
+    edges = [0, 1, 6, 12, 50, 75, 85, 90, 95, 1000, 5000, 10000, 50000, 500000, 2000000, 2000001]
+    candidates = []
+    for i in range(500):
+        candidate = {
+            "source": rng.choice(sources),
+            "address": ADDRESS if rng.random() < 0.7 else "short",
+            "symbol": rng.choice(["GEM", "Unknown", "", "VERYLONGSYMBOL"]),
+        }
+        for field in ("market_cap", "liquidity", "bonding_curve_progress",
+                      "hours_since_graduation", "estimated_age_minutes"):
+            if rng.random() < 0.8:
+                candidate[field] = rng.choice(edges + [rng.uniform(0, 3000000)])
+        candidates.append(candidate)
+
+    scores, _, errors = TriageScorer().score_batch(candidates)
+
+    assert not errors.any()
+    assert list(scores) == [legacy_priority(c) for c in candidates]
+
+
+def test_triage_filters_ranks_and_keeps_unscorable():
+    scorer = TriageScorer({"max_candidates": 2})
+    candidates = [
+        {"source": "birdeye_trending", "symbol": "LOW"},  # 30 + 3 = 33 passes 30
+        {"source": "moralis_bonding", "symbol": "NOPE", "bonding_curve_progress": 10},  # 3 < 30
+        {"source": "moralis_bonding", "symbol": "TOP", "address": ADDRESS,
+         "bonding_curve_progress": 96, "market_cap": 10000, "estimated_age_minutes": 30},
+        {"source": "moralis_graduated", "symbol": "BAD", "liquidity": None},
+    ]
+
+    result = scorer.triage(candidates)
+
+    assert [c["symbol"] for c in result] == ["TOP", "LOW"]
+    assert candidates[3]["triage_stage"] == "smart_triage_error"
+    assert candidates[3]["discovery_priority_score"] == 20
+    assert TriageScorer().triage(candidates)[-1]["symbol"] == "BAD"
+
+
+def test_config_override_replaces_ladder():
+    scorer = TriageScorer({"sources": {"birdeye_trending": {"base_points": 0, "threshold": 1,
+                                                            "ladders": {"liquidity": [{"gte": 100, "points": 7}]}}}})
+    scores, thresholds, _ = scorer.score_batch([{"source": "birdeye_trending", "liquidity": 100}])
+    assert scores[0] == 7 + 2  # ladder points + default age (999 minutes) bonus
+    assert thresholds[0] == 1
@@ -0,0 +1,145 @@
+import asyncio
+import logging
+
+from services.wallet_token_graph import WalletTokenGraph
+from services.whale_discovery_service import WhaleDiscoveryService
+
+
+def _trader(owner, volume, trades=20):
+    return {"owner": owner, "volume": volume, "trade": trades}
+
+
+class _FakeBirdeye:
+    def __init__(self, traders_by_token):
+        self.traders_by_token = traders_by_token
+        self.fetched = []
+
+    async def get_token_list(self, **kwargs):
+        return {"data": {"tokens": [{"address": token} for token in self.traders_by_token]}}
+
+    async def get_top_traders_optimized(self, token_address, time_frame="24h", limit=50):
+        self.fetched.append(token_address)
+        await asyncio.sleep(0)
+        return self.traders_by_token[token_address]
+
+
+def test_service_keeps_an_empty_injected_graph(tmp_path):
+    graph = WalletTokenGraph(tmp_path / "graph.json")
+    service = WhaleDiscoveryService(_FakeBirdeye({}), logging.getLogger("test"), wallet_graph=graph)
+    assert service.wallet_graph is graph
+
+
+def test_graph_reports_only_changed_edges_and_persists(tmp_path):
+    graph = WalletTokenGraph(tmp_path / "graph.json")
+    first = graph.update_token_traders("tokenA", [{"address": "w1", "volume": 10, "trades": 2},
+                                                  {"address": "w2", "volume": 5, "trades": 1}])
+    graph.save()
+    revision = graph.revision
+
+    second = graph.update_token_traders("tokenA", [{"address": "w1", "volume": 10, "trades": 2},
+                                                   {"address": "w2", "volume": 7, "trades": 2}])
+    graph.save()
+
+    assert first == {"w1", "w2"}
+    assert second == {"w2"}
+    assert graph.changed_since(revision) == {"w2"}
+
+    reloaded = WalletTokenGraph(tmp_path / "graph.json")
+    assert reloaded.load() == 2
+    assert reloaded.trading_data("w2") == [
+        {"token": "tokenA", "volume": 7.0, "trades": 2, "updated": graph.wallets["w2"]["tokenA"]["updated"]}
+    ]
+    assert reloaded.changed_since(0) == {"w1", "w2"}
+
+
+def test_discovery_requalifies_only_changed_wallets(tmp_path):
+    whale = [_trader("whaleWallet", 400_000, trades=15)]
+    birdeye = _FakeBirdeye({"a": whale, "b": whale, "c": whale + [_trader("fish", 10, trades=1)]})
+    graph = WalletTokenGraph(tmp_path / "graph.json")
+    service = WhaleDiscoveryService(birdeye, logging.getLogger("test"), wallet_graph=graph)
+
+    analyzed = []
+    original = service._analyze_trader_for_whale_qualification
+
+    async def track(address, trading_data):
+        analyzed.append(address)
+        return await original(address, trading_data)
+
+    service._analyze_trader_for_whale_qualification = track
+
+    session = asyncio.run(service.discover_whales_from_trending_tokens())
+    assert session.success and session.whales_qualified == 1
+    assert sorted(analyzed) == ["fish", "whaleWallet"]
+    whales = service.get_whale_database_for_analyzer()
+    assert whales["whaleWallet"]["tier"] == 2
+
+    # Same data again: tokens are fresh, nothing is fetched or re-qualified
+    analyzed.clear()
+    session = asyncio.run(service.discover_whales_from_trending_tokens())
+    assert session.api_calls_used == 0 and analyzed == []
+
+    # A changed edge re-qualifies that wallet, a wallet that left the top list
+    # loses its edge, and the view reflects it without being reloaded
+    birdeye.traders_by_token["c"] = [_trader("whaleWallet", 10, trades=1)]
+    service.cache_ttl = 0  # let the hour-long freshness window lapse
+    asyncio.run(service.discover_whales_from_trending_tokens())
+    assert sorted(analyzed) == ["fish", "whaleWallet"]
+    assert "whaleWallet" not in whales
+    assert "fish" not in graph.wallets
+
+
+def test_refresh_drops_missing_wallets_and_old_edges_expire(tmp_path):
+    graph = WalletTokenGraph(tmp_path / "graph.json")
+    graph.update_token_traders("tokenA", [{"address": "w1", "volume": 10, "trades": 2},
+                                          {"address": "w2", "volume": 5, "trades": 1}], now=1000)
+    graph.update_token_traders("tokenB", [{"address": "w1", "volume": 3, "trades": 1}], now=5000)
+
+    # w2 fell off tokenA's top list; w1's unchanged edge is re-stamped, not reported
+    assert graph.update_token_traders("tokenA", [{"address": "w1", "volume": 10, "trades": 2}], now=6000) == {"w2"}
+    assert "w2" not in graph.wallets
+    assert graph.wallets["w1"]["tokenA"]["updated"] == 6000
+    graph.save()
+
+    # tokenB was not refreshed within the window: its edge and refresh stamp go
+    assert graph.expire(2000, now=7500) == {"w1"}
+    assert set(graph.wallets["w1"]) == {"tokenA"}
+    assert set(graph.history["token_refreshed_at"]) == {"tokenA"}
+    graph.save()
+
+    reloaded = WalletTokenGraph(tmp_path / "graph.json")
+    assert reloaded.load() == 1
+    assert set(reloaded.wallets["w1"]) == {"tokenA"}
+    assert reloaded.trading_data("w1", max_age_seconds=60) == []
+
+
+def test_failed_fetch_keeps_edges_and_refresh_time(tmp_path):
+    whale = [_trader("whaleWallet", 400_000, trades=15)]
+    birdeye = _FakeBirdeye({"a": whale})
+    graph = WalletTokenGraph(tmp_path / "graph.json")
+    service = WhaleDiscoveryService(birdeye, logging.getLogger("test"), wallet_graph=graph)
+    asyncio.run(service.discover_whales_from_trending_tokens())
+    refreshed_at = graph.history["token_refreshed_at"]["a"]
+
+    # The API answers a failure with an empty list: nothing is dropped or stamped
+    birdeye.traders_by_token["a"] = []
+    service.cache_ttl = 0
+    asyncio.run(service.discover_whales_from_trending_tokens())
+    assert "a" in graph.wallets["whaleWallet"]
+    assert graph.history["token_refreshed_at"]["a"] == refreshed_at
+
+
+def test_change_log_is_bounded_and_stale_readers_get_every_wallet(tmp_path):
+    graph = WalletTokenGraph(tmp_path / "graph.json", max_change_log=3)
+    for volume in (1, 2, 3):
+        graph.update_token_traders("tokenA", [{"address": "w1", "volume": volume, "trades": 1}])
+    # Repeated changes to one wallet take a single log entry
+    assert len(graph._change_log) == 1
+
+    reader = graph.revision
+    for i in range(2, 6):
+        graph.update_token_traders(f"token{i}", [{"address": f"w{i}", "volume": 1, "trades": 1}])
+
+    assert len(graph._change_log) == 3
+    assert graph.changed_since(graph.revision - 1) == {"w5"}
+    # The reader's cursor is older than the trimmed entries, so it re-checks the whole graph
+    assert graph.changed_since(reader) == {"w1", "w2", "w3", "w4", "w5"}
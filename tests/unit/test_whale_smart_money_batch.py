@@ -0,0 +1,82 @@
+import asyncio
+import logging
+
+from services.smart_money_detector import SmartMoneyDetector
+from services.whale_shark_movement_tracker import WhaleSharkMovementTracker
+
+
+def _trader(owner, volume, trades=20, buy_share=0.8):
+    return {
+        "owner": owner,
+        "volume": volume,
+        "trade": trades,
+        "volumeBuy": volume * buy_share,
+        "volumeSell": volume * (1 - buy_share),
+    }
+
+
+class _FakeBirdeye:
+    def __init__(self, traders_by_token, delay=0.05):
+        self.traders_by_token = traders_by_token
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.overview_calls = []
+
+    async def get_top_traders_optimized(self, token_address, time_frame="24h", **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return self.traders_by_token[token_address]
+
+    async def batch_get_token_overviews(self, addresses):
+        # The multi-token metadata endpoint has no volume fields
+        return {address: {"address": address, "name": address.title(), "symbol": address.upper(),
+                          "decimals": 6, "logo_uri": ""} for address in addresses}
+
+    async def get_token_overview(self, address):
+        self.overview_calls.append(address)
+        return {"address": address, "volume": {"h24": 2_000_000 if address == "big" else 1000}}
+
+
+def _tracker(birdeye):
+    tracker = WhaleSharkMovementTracker(birdeye, logger=logging.getLogger("test"))
+    tracker.enhanced_discovery_service = None
+    return tracker
+
+
+def test_batch_fetches_concurrently_and_prioritizes_from_token_overviews():
+    shared_whale = _trader("whaleWallet", 250_000)
+    birdeye = _FakeBirdeye({
+        "big": [shared_whale, _trader("shark1", 20_000)],
+        "small": [shared_whale],
+        "tiny": [_trader("fish", 50)],
+    })
+    tracker = _tracker(birdeye)
+
+    results = asyncio.run(tracker.batch_analyze_whale_shark_movements(["big", "small", "tiny", "big"]))
+
+    assert list(results) == ["big", "small", "tiny"]
+    assert sorted(birdeye.overview_calls) == ["big", "small", "tiny"]
+    assert birdeye.max_in_flight > 1
+    # "big" is high priority: 24h and 6h traders are fetched together
+    assert results["big"]["api_efficiency"]["timeframes_analyzed"] == ["24h", "6h"]
+    assert results["small"]["whale_analysis"]["count"] == 1
+    assert results["tiny"]["analysis_valid"] is False
+
+
+def test_smart_money_batch_analyzes_each_trader_once():
+    shared_shark = _trader("sharkWallet", 40_000, trades=10, buy_share=0.9)
+    birdeye = _FakeBirdeye({"a": [shared_shark], "b": [shared_shark]})
+    detector = SmartMoneyDetector(_tracker(birdeye), logger=logging.getLogger("test"))
+
+    calls = []
+    original = detector._analyze_individual_trader_skill
+    detector._analyze_individual_trader_skill = lambda trader: calls.append(trader["address"]) or original(trader)
+
+    results = asyncio.run(detector.batch_analyze_smart_money(["a", "b"]))
+
+    assert calls == ["sharkWallet"]
+    assert results["a"]["skill_metrics"]["average_skill_score"] == results["b"]["skill_metrics"]["average_skill_score"]
+    assert results["a"]["skill_metrics"]["total_analyzed"] == 1
@@ -0,0 +1,273 @@
+"""
+Hedged requests across ordered fallback endpoints.
+
+Instead of trying fallbacks strictly one after another (so a hanging primary
+costs a full timeout before the next endpoint is even contacted), the next
+endpoint is fired once the in-flight ones have run longer than a latency
+percentile learned for the endpoint being waited on. The first valid response
+wins and the remaining attempts are cancelled.
+
+Per-endpoint health (recent latencies, failure streaks) is persisted to a small
+JSON file so endpoints that keep failing start at the back of the order in the
+next process as well.
+"""
+
+import os
+import json
+import math
+import time
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+Endpoint = Tuple[str, str]  # (name, url)
+
+
+class AllEndpointsFailed(Exception):
+    """No endpoint returned a valid response"""
+
+
+@dataclass
+class EndpointHealth:
+    """Rolling health record for one endpoint"""
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=50))
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_failure: float = 0.0
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Nearest-rank latency percentile, or None without samples"""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, math.ceil(percentile * len(ordered)) - 1))
+        return ordered[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "latencies": [round(latency, 4) for latency in self.latencies],
+            "successes": self.successes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "last_failure": self.last_failure
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EndpointHealth":
+        health = cls(
+            successes=int(data.get("successes", 0)),
+            failures=int(data.get("failures", 0)),
+            consecutive_failures=int(data.get("consecutive_failures", 0)),
+            last_failure=float(data.get("last_failure", 0.0))
+        )
+        health.latencies.extend(float(latency) for latency in data.get("latencies", []))
+        return health
+
+
+class HedgedRequester:
+    """Races ordered fallback endpoints with learned hedge delays"""
+
+    def __init__(
+        self,
+        state_file: Optional[Path] = None,
+        hedge_percentile: float = 0.9,
+        default_hedge_delay: float = 2.0,
+        min_hedge_delay: float = 0.25,
+        max_hedge_delay: float = 10.0,
+        dead_after_failures: int = 3,
+        dead_retry_seconds: float = 600.0,
+        min_samples: int = 5
+    ):
+        """
+        Initialize the requester.
+
+        Args:
+            state_file: JSON file for endpoint health (None keeps it in memory)
+            hedge_percentile: Latency percentile after which the next endpoint is fired
+            default_hedge_delay: Hedge delay until an endpoint has ``min_samples`` latencies
+            min_hedge_delay: Lower bound for learned hedge delays
+            max_hedge_delay: Upper bound for learned hedge delays
+            dead_after_failures: Consecutive failures that move an endpoint to the back
+            dead_retry_seconds: How long a dead endpoint stays at the back after its last failure
+            min_samples: Latency samples needed before the learned delay is used
+        """
+        self.state_file = Path(state_file) if state_file else None
+        self.hedge_percentile = hedge_percentile
+        self.default_hedge_delay = default_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.max_hedge_delay = max_hedge_delay
+        self.dead_after_failures = dead_after_failures
+        self.dead_retry_seconds = dead_retry_seconds
+        self.min_samples = min_samples
+
+        self.health: Dict[str, EndpointHealth] = {}
+        self.stats = {
+            "races": 0,
+            "hedges_fired": 0,
+            "attempts_cancelled": 0,
+            "all_failed": 0
+        }
+        self._load()
+
+    def _load(self) -> None:
+        if not self.state_file or not self.state_file.exists():
+            return
+        try:
+            with open(self.state_file, 'r') as f:
+                data = json.load(f)
+            self.health = {name: EndpointHealth.from_dict(record) for name, record in data.items()}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable endpoint health file {self.state_file}: {e}")
+
+    def _save(self) -> None:
+        if not self.state_file:
+            return
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.state_file.with_suffix(".tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump({name: health.to_dict() for name, health in self.health.items()}, f)
+            os.replace(tmp_file, self.state_file)
+        except OSError as e:
+            logger.debug(f"Could not save endpoint health: {e}")
+
+    def _health(self, name: str) -> EndpointHealth:
+        return self.health.setdefault(name, EndpointHealth())
+
+    def is_dead(self, name: str, now: Optional[float] = None) -> bool:
+        """Whether an endpoint failed repeatedly and recently"""
+        health = self.health.get(name)
+        if health is None or health.consecutive_failures < self.dead_after_failures:
+            return False
+        now = now if now is not None else time.time()
+        return now - health.last_failure < self.dead_retry_seconds
+
+    def order(self, endpoints: Sequence[Endpoint]) -> List[Endpoint]:
+        """Preference order with dead endpoints moved to the back (stable otherwise)"""
+        now = time.time()
+        return sorted(endpoints, key=lambda endpoint: self.is_dead(endpoint[0], now))
+
+    def hedge_delay(self, name: str) -> float:
+        """How long to wait on an endpoint before firing the next one"""
+        health = self.health.get(name)
+        if health is None or len(health.latencies) < self.min_samples:
+            return self.default_hedge_delay
+        delay = health.latency_percentile(self.hedge_percentile)
+        return min(self.max_hedge_delay, max(self.min_hedge_delay, delay))
+
+    def record_success(self, name: str, latency: float) -> None:
+        health = self._health(name)
+        health.latencies.append(latency)
+        health.successes += 1
+        health.consecutive_failures = 0
+
+    def record_failure(self, name: str) -> None:
+        health = self._health(name)
+        health.failures += 1
+        health.consecutive_failures += 1
+        health.last_failure = time.time()
+
+    def _record_overdue_losers(self, running: Dict[asyncio.Task, Tuple[str, float]]) -> None:
+        """
+        Count attempts that lost the race after overrunning their hedge delay as failures.
+
+        Without this a hanging endpoint never completes, so it is never penalized
+        and stays first in the order, costing every race its full hedge delay.
+        """
+        now = time.monotonic()
+        for task, (name, started) in running.items():
+            if not task.done() and now - started >= self.hedge_delay(name):
+                logger.debug(f"Endpoint {name} lost after {now - started:.2f}s, counting it as failed")
+                self.record_failure(name)
+
+    async def race(
+        self,
+        endpoints: Sequence[Endpoint],
+        attempt: Callable[[str, str], Awaitable[Any]],
+        is_valid: Callable[[Any], bool] = bool
+    ) -> Tuple[str, Any]:
+        """
+        Get the first valid response, hedging across endpoints.
+
+        ``attempt(name, url)`` performs one request and should enforce its own
+        timeout. An exception or an invalid result counts as a failure and
+        immediately fires the next endpoint; otherwise the next endpoint is fired
+        once the most recently started one exceeds its hedge delay. Attempts still
+        running past their hedge delay when another endpoint wins also count as
+        failures, so a hanging endpoint moves to the back like a failing one.
+
+        Returns:
+            (endpoint name, result) of the winning attempt
+
+        Raises:
+            AllEndpointsFailed: If every endpoint failed
+        """
+        self.stats["races"] += 1
+        pending_endpoints = self.order(endpoints)
+        running: Dict[asyncio.Task, Tuple[str, float]] = {}
+
+        def launch() -> None:
+            name, url = pending_endpoints.pop(0)
+            task = asyncio.ensure_future(attempt(name, url))
+            running[task] = (name, time.monotonic())
+
+        try:
+            launch()
+            while running:
+                # Wait on the newest attempt's hedge delay; older ones keep running meanwhile
+                newest_name, newest_start = list(running.values())[-1]
+                wait_for = None
+                if pending_endpoints:
+                    wait_for = max(0.0, self.hedge_delay(newest_name) - (time.monotonic() - newest_start))
+
+                done, _ = await asyncio.wait(running, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    self.stats["hedges_fired"] += 1
+                    logger.debug(f"Hedging: {newest_name} slower than {self.hedge_delay(newest_name):.2f}s")
+                    launch()
+                    continue
+
+                for task in done:
+                    name, started = running.pop(task)
+                    result = None if task.exception() else task.result()
+                    if task.exception() is None and is_valid(result):
+                        self.record_success(name, time.monotonic() - started)
+                        self._record_overdue_losers(running)
+                        return name, result
+                    if task.exception() is not None:
+                        logger.debug(f"Endpoint {name} failed: {task.exception()}")
+                    self.record_failure(name)
+                    if pending_endpoints:
+                        launch()
+
+            self.stats["all_failed"] += 1
+            raise AllEndpointsFailed(f"All {len(endpoints)} endpoints failed to return valid data")
+        finally:
+            for task in running:
+                task.cancel()
+            self.stats["attempts_cancelled"] += len(running)
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            self._save()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get race statistics and per-endpoint health"""
+        return {
+            **self.stats,
+            "endpoints": {
+                name: {
+                    "successes": health.successes,
+                    "failures": health.failures,
+                    "consecutive_failures": health.consecutive_failures,
+                    "dead": self.is_dead(name),
+                    "hedge_delay": round(self.hedge_delay(name), 3)
+                }
+                for name, health in self.health.items()
+            }
+        }
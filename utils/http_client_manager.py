@@ -9,10 +9,41 @@ import asyncio
 import logging
 from typing import Dict, Any, Optional, Union
 from contextlib import asynccontextmanager
+from urllib.parse import urlparse
 import json
 from utils.api_config_manager import get_api_config
 
 
+# Connection pool tuning per upstream. Each upstream gets its own pooled
+# TCPConnector so keep-alive and per-host limits match how it is used: few,
+# long-lived connections for large list downloads, more for chatty RPC.
+UPSTREAM_POOL_PROFILES: Dict[str, Dict[str, Any]] = {
+    'default':    {'limit': 100, 'limit_per_host': 30, 'keepalive_timeout': 30, 'ttl_dns_cache': 300},
+    'raydium':    {'limit': 20,  'limit_per_host': 5,  'keepalive_timeout': 60, 'ttl_dns_cache': 600},
+    'jupiter':    {'limit': 40,  'limit_per_host': 10, 'keepalive_timeout': 60, 'ttl_dns_cache': 600},
+    'moralis':    {'limit': 40,  'limit_per_host': 10, 'keepalive_timeout': 60, 'ttl_dns_cache': 600},
+    'solana_rpc': {'limit': 60,  'limit_per_host': 20, 'keepalive_timeout': 90, 'ttl_dns_cache': 600},
+}
+
+# Hostname suffix -> upstream profile, for fetchers that talk to several upstreams
+UPSTREAM_HOSTS: Dict[str, str] = {
+    'raydium.io': 'raydium',
+    'jup.ag': 'jupiter',
+    'moralis.io': 'moralis',
+    'solana.com': 'solana_rpc',
+    'helius-rpc.com': 'solana_rpc',
+}
+
+
+def upstream_for_url(url: str) -> str:
+    """Map a request URL to its connection pool profile"""
+    host = (urlparse(url).hostname or '').lower()
+    for suffix, upstream in UPSTREAM_HOSTS.items():
+        if host == suffix or host.endswith('.' + suffix):
+            return upstream
+    return 'default'
+
+
 class StandardHTTPClient:
     """
     Standardized HTTP client that wraps aiohttp with consistent interface
@@ -56,21 +87,10 @@ class StandardHTTPClient:
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session"""
         if self._session is None:
-            # Create new session with optimized settings
-            connector = aiohttp.TCPConnector(
-                limit=100,  # Total connection pool size
-                limit_per_host=30,  # Max connections per host
-                ttl_dns_cache=300,  # DNS cache TTL
-                use_dns_cache=True,
-                keepalive_timeout=30,
-                enable_cleanup_closed=True
-            )
-            
-            timeout = aiohttp.ClientTimeout(total=self.default_timeout)
-            
-            self._session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout,
+            # Sessions are cheap; the pooled connector underneath keeps connections warm
+            self._session = HTTPClientFactory.create_session(
+                self.service_name,
+                timeout=aiohttp.ClientTimeout(total=self.default_timeout),
                 json_serialize=json.dumps
             )
             
@@ -249,11 +269,23 @@ class StandardHTTPClient:
 class HTTPClientFactory:
     """
     Factory for creating standardized HTTP clients for different services
+    
+    Also owns the process-wide connection pool: one TCPConnector per upstream
+    profile (see ``UPSTREAM_POOL_PROFILES``), shared by every session created
+    here, so TLS handshakes and DNS lookups are paid once per connection rather
+    than once per fetch. Connectors are bound to an event loop and are rebuilt
+    when a new loop starts using the factory.
     """
     
     _clients: Dict[str, StandardHTTPClient] = {}
     _shared_session: Optional[aiohttp.ClientSession] = None
     
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _connectors: Dict[str, aiohttp.TCPConnector] = {}
+    _upstream_sessions: Dict[str, aiohttp.ClientSession] = {}
+    _trace_configs: Dict[str, aiohttp.TraceConfig] = {}
+    _pool_stats: Dict[str, Dict[str, int]] = {}
+    
     @classmethod
     async def get_client(cls, service_name: str, shared_session: bool = True) -> StandardHTTPClient:
         """
@@ -266,6 +298,7 @@ class HTTPClientFactory:
         Returns:
             StandardHTTPClient instance
         """
+        cls._bind_loop()
         if service_name not in cls._clients:
             session = None
             
@@ -281,23 +314,120 @@ class HTTPClientFactory:
     @classmethod
     async def _create_shared_session(cls) -> aiohttp.ClientSession:
         """Create optimized shared session"""
-        connector = aiohttp.TCPConnector(
-            limit=200,  # Higher limit for shared session
-            limit_per_host=50,
-            ttl_dns_cache=600,  # Longer DNS cache
-            use_dns_cache=True,
-            keepalive_timeout=60,
-            enable_cleanup_closed=True
-        )
+        return cls.create_session('default', json_serialize=json.dumps)
+    
+    @classmethod
+    def _bind_loop(cls) -> None:
+        """Forget pooled objects that belong to a different (finished) event loop"""
+        loop = asyncio.get_running_loop()
+        if cls._loop is not loop:
+            cls._loop = loop
+            cls._connectors = {}
+            cls._upstream_sessions = {}
+            cls._clients = {}
+            cls._shared_session = None
+    
+    @classmethod
+    def get_connector(cls, upstream: str) -> aiohttp.TCPConnector:
+        """
+        Get the pooled connector for an upstream (must be called inside a running loop)
         
+        Unknown upstream names share the ``default`` pool.
+        """
+        cls._bind_loop()
+        profile_name = upstream if upstream in UPSTREAM_POOL_PROFILES else 'default'
+        connector = cls._connectors.get(profile_name)
+        if connector is None or connector.closed:
+            profile = UPSTREAM_POOL_PROFILES[profile_name]
+            connector = aiohttp.TCPConnector(
+                limit=profile['limit'],
+                limit_per_host=profile['limit_per_host'],
+                ttl_dns_cache=profile['ttl_dns_cache'],
+                use_dns_cache=True,
+                keepalive_timeout=profile['keepalive_timeout'],
+                enable_cleanup_closed=True
+            )
+            cls._connectors[profile_name] = connector
+        return connector
+    
+    @classmethod
+    def create_session(cls, upstream: str, **session_kwargs) -> aiohttp.ClientSession:
+        """
+        Create a session drawing connections from the upstream's pool
+        
+        Closing the session does not close the pooled connector, so callers can
+        keep per-session headers and timeouts without losing warm connections.
+        
+        Args:
+            upstream: Pool profile name (e.g. 'raydium', 'moralis', 'jupiter')
+            **session_kwargs: Extra ``aiohttp.ClientSession`` arguments (headers, timeout, ...)
+        """
+        profile_name = upstream if upstream in UPSTREAM_POOL_PROFILES else 'default'
         return aiohttp.ClientSession(
-            connector=connector,
-            json_serialize=json.dumps
+            connector=cls.get_connector(profile_name),
+            connector_owner=False,
+            trace_configs=[cls._get_trace_config(profile_name)],
+            **session_kwargs
         )
     
+    @classmethod
+    def get_shared_session(cls, upstream: str) -> aiohttp.ClientSession:
+        """Get a long-lived plain session for an upstream, for ad-hoc fetchers"""
+        cls._bind_loop()
+        profile_name = upstream if upstream in UPSTREAM_POOL_PROFILES else 'default'
+        session = cls._upstream_sessions.get(profile_name)
+        if session is None or session.closed:
+            session = cls.create_session(profile_name)
+            cls._upstream_sessions[profile_name] = session
+        return session
+    
+    @classmethod
+    def _get_trace_config(cls, upstream: str) -> aiohttp.TraceConfig:
+        """Trace hooks counting connection reuse and DNS cache hits for an upstream"""
+        trace_config = cls._trace_configs.get(upstream)
+        if trace_config is not None:
+            return trace_config
+        
+        stats = cls._pool_stats.setdefault(upstream, {
+            'requests': 0,
+            'connections_created': 0,
+            'connections_reused': 0,
+            'dns_cache_hits': 0,
+            'dns_cache_misses': 0
+        })
+        
+        def counter(key: str):
+            async def increment(session, trace_config_ctx, params):
+                stats[key] += 1
+            return increment
+        
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(counter('requests'))
+        trace_config.on_connection_create_end.append(counter('connections_created'))
+        trace_config.on_connection_reuseconn.append(counter('connections_reused'))
+        trace_config.on_dns_cache_hit.append(counter('dns_cache_hits'))
+        trace_config.on_dns_cache_miss.append(counter('dns_cache_misses'))
+        cls._trace_configs[upstream] = trace_config
+        return trace_config
+    
+    @classmethod
+    def get_pool_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """Get per-upstream connection reuse and DNS cache statistics"""
+        report = {}
+        for upstream, stats in cls._pool_stats.items():
+            acquired = stats['connections_created'] + stats['connections_reused']
+            lookups = stats['dns_cache_hits'] + stats['dns_cache_misses']
+            report[upstream] = {
+                **stats,
+                'reuse_rate': stats['connections_reused'] / acquired if acquired else 0.0,
+                'dns_cache_hit_rate': stats['dns_cache_hits'] / lookups if lookups else 0.0,
+                'profile': UPSTREAM_POOL_PROFILES[upstream]
+            }
+        return report
+    
     @classmethod
     async def close_all(cls):
-        """Close all clients and shared session"""
+        """Close all clients, shared sessions and pooled connectors"""
         # Close individual clients
         for client in cls._clients.values():
             await client.close()
@@ -307,6 +437,14 @@ class HTTPClientFactory:
         if cls._shared_session:
             await cls._shared_session.close()
             cls._shared_session = None
+        
+        for session in cls._upstream_sessions.values():
+            await session.close()
+        cls._upstream_sessions.clear()
+        
+        for connector in cls._connectors.values():
+            await connector.close()
+        cls._connectors.clear()
 
 
 # Convenience functions for common usage patterns
@@ -0,0 +1,245 @@
+"""
+Incremental JSON array streaming.
+
+Large list endpoints (Raydium pairs/pools) return multi-megabyte JSON arrays.
+Parsing them with ``response.json()`` buffers and decodes the whole payload
+before a single element can be inspected. ``JsonArrayStream`` is fed raw byte
+chunks and yields array elements as soon as each one is complete, so callers
+can filter per element and stop reading the socket once they have enough.
+
+Each element is decoded with the C-accelerated ``json`` decoder; only the
+framing (locating the array and the element boundaries) is done here.
+"""
+
+import codecs
+import json
+from typing import Any, AsyncIterator, Callable, List, Optional, Sequence
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_ELEMENT_BYTES = 8 * 1024 * 1024
+
+_WHITESPACE = " \t\n\r"
+_SCALAR_TERMINATORS = _WHITESPACE + ",]}"
+
+
+class _NeedMoreData(Exception):
+    """The buffered text ends before the next token is complete"""
+
+
+class JsonArrayStream:
+    """
+    Push parser yielding the elements of one JSON array.
+
+    The array is either the top-level value or, when the top-level value is an
+    object, the value reached by following ``path`` through nested object keys
+    (e.g. ``("data", "data")`` for ``{"data": {"data": [...]}}``). A payload
+    without that array produces no elements.
+    """
+
+    def __init__(self, path: Sequence[str] = (), max_element_bytes: int = DEFAULT_MAX_ELEMENT_BYTES):
+        """
+        Args:
+            path: Object keys leading to the array when the payload is an object
+            max_element_bytes: Largest single element (or skipped value) to buffer
+        """
+        self.path = tuple(path)
+        self.max_element_bytes = max_element_bytes
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0               # Path keys matched so far
+        self._state = "value"         # value -> object_key/object_value ... -> array -> done
+        self._expect_separator = False
+        self.elements_parsed = 0
+        self.bytes_consumed = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether the target array has been fully read (or is known to be absent)"""
+        return self._state == "done"
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Feed raw bytes and return the array elements completed by them.
+
+        Raises:
+            json.JSONDecodeError: On malformed input or an oversized element
+        """
+        self.bytes_consumed += len(chunk)
+        self._buffer += self._utf8.decode(chunk)
+        return self._drain()
+
+    def close(self) -> None:
+        """
+        Signal end of input.
+
+        Raises:
+            json.JSONDecodeError: If the stream ended inside the target array
+        """
+        self._buffer += self._utf8.decode(b"", final=True)
+        self._drain()
+        if self._state != "done":
+            raise json.JSONDecodeError("Unexpected end of JSON stream", self._buffer, len(self._buffer))
+
+    def _drain(self) -> List[Any]:
+        elements: List[Any] = []
+        start = self._pos
+        try:
+            while self._state != "done":
+                start = self._pos
+                self._step(elements)
+        except _NeedMoreData:
+            # Steps only commit state once complete, so rewinding the cursor retries cleanly
+            self._pos = start
+            if len(self._buffer) - self._pos > self.max_element_bytes:
+                raise json.JSONDecodeError(
+                    f"JSON element exceeds {self.max_element_bytes} bytes", self._buffer, self._pos
+                )
+        # Drop consumed text so the buffer only ever holds the current element
+        if self._pos:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        return elements
+
+    def _skip_whitespace(self) -> str:
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        if pos >= len(buffer):
+            raise _NeedMoreData()
+        return buffer[pos]
+
+    def _decode_value(self) -> Any:
+        """Decode the complete value at the cursor, or signal that it is still arriving"""
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            raise _NeedMoreData()
+        # A number may continue in the next chunk ("-1.5" of "-1.5e3"); scalars must end at a delimiter
+        if not isinstance(value, (dict, list, str)) and (
+                end >= len(self._buffer) or self._buffer[end] not in _SCALAR_TERMINATORS):
+            raise _NeedMoreData()
+        self._pos = end
+        return value
+
+    def _step(self, elements: List[Any]) -> None:
+        """Consume one token, raising _NeedMoreData if it is not fully buffered yet"""
+        char = self._skip_whitespace()
+
+        if self._state == "value":
+            # The value reached by the path so far: an array to stream or an object to descend
+            if char == "[":
+                self._pos += 1
+                self._state = "array"
+                self._expect_separator = False
+            elif char == "{" and self._depth < len(self.path):
+                self._pos += 1
+                self._state = "object_key"
+                self._expect_separator = False
+            else:
+                self._fail(f"Expected JSON array at path {self.path[:self._depth]}")
+            return
+
+        if self._state == "object_key":
+            if char == "}":
+                self._state = "done"  # Path key not present
+                return
+            if self._expect_separator:
+                if char != ",":
+                    self._fail("Expected ',' between object members")
+                self._pos += 1
+                self._expect_separator = False
+                return
+            if char != '"':
+                self._fail("Expected object key")
+            key = self._decode_value()
+            if self._skip_whitespace() != ":":
+                self._fail("Expected ':' after object key")
+            self._pos += 1
+            if key == self.path[self._depth]:
+                self._depth += 1
+                self._state = "value"
+            else:
+                self._state = "object_value"
+            return
+
+        if self._state == "object_value":
+            # Skip a sibling value we do not need
+            self._decode_value()
+            self._state = "object_key"
+            self._expect_separator = True
+            return
+
+        # Inside the target array
+        if char == "]":
+            self._pos += 1
+            self._state = "done"
+            return
+        if self._expect_separator:
+            if char != ",":
+                self._fail("Expected ',' between array elements")
+            self._pos += 1
+            self._expect_separator = False
+            return
+        elements.append(self._decode_value())
+        self.elements_parsed += 1
+        self._expect_separator = True
+
+    def _fail(self, message: str) -> None:
+        raise json.JSONDecodeError(message, self._buffer, self._pos)
+
+
+async def stream_json_array(
+    chunks: AsyncIterator[bytes],
+    predicate: Optional[Callable[[Any], bool]] = None,
+    limit: Optional[int] = None,
+    path: Sequence[str] = (),
+    stream: Optional[JsonArrayStream] = None
+) -> List[Any]:
+    """
+    Collect array elements from a byte stream, stopping early at ``limit``.
+
+    Args:
+        chunks: Async iterator of raw bytes (e.g. ``response.content.iter_chunked(n)``)
+        predicate: Keep only elements for which this returns True
+        limit: Stop reading once this many elements have been kept
+        path: Object keys leading to the array when the payload is an object
+        stream: Parser to use (pass one in to read its counters afterwards)
+
+    Returns:
+        Kept elements in document order
+
+    Raises:
+        json.JSONDecodeError: On malformed input
+    """
+    parser = stream or JsonArrayStream(path)
+    kept: List[Any] = []
+    async for chunk in chunks:
+        for element in parser.feed(chunk):
+            if predicate is None or predicate(element):
+                kept.append(element)
+                if limit is not None and len(kept) >= limit:
+                    return kept
+        if parser.done:
+            return kept
+    parser.close()
+    return kept
+
+
+async def stream_response_array(
+    response,
+    predicate: Optional[Callable[[Any], bool]] = None,
+    limit: Optional[int] = None,
+    path: Sequence[str] = (),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    stream: Optional[JsonArrayStream] = None
+) -> List[Any]:
+    """
+    Stream a JSON array out of an aiohttp response body.
+
+    Returning before the body is exhausted leaves the rest unread; aiohttp then
+    closes the connection when the response is released instead of draining it.
+    """
+    return await stream_json_array(response.content.iter_chunked(chunk_size), predicate, limit, path, stream)